@@ -7,6 +7,8 @@ Usage:
     python main.py --config config/config.yml
     python main.py --config config/config.yml --validate-only
     python main.py --config config/config.yml --test-mode
+    python main.py --config config/config.yml --chunked
+    python main.py --config config/config.yml --resume
 """
 
 import sys
@@ -18,9 +20,8 @@ import traceback
 # Add project root to path
 sys.path.append(str(Path(__file__).parent))
 
-from processors.cad_data_processor import CADDataProcessor
-from validators.validation_harness import ValidationHarness
-from validators.validate_full_pipeline import PipelineValidator
+# Processors and validators pull in pandas; they are imported by the step
+# that needs them so `python main.py --help` starts instantly.
 from utils.logger import setup_logger
 
 
@@ -38,17 +39,26 @@ def run_validation_harness(config_path: str) -> bool:
     print("STEP 1: PRE-PROCESSING VALIDATION")
     print("=" * 80)
 
+    from validators.validation_harness import ValidationHarness
+
     harness = ValidationHarness(config_path)
     return harness.run_all_validations()
 
 
-def run_correction_pipeline(config_path: str, test_mode: bool = False) -> bool:
+def run_correction_pipeline(
+    config_path: str,
+    test_mode: bool = False,
+    chunked: bool = False,
+    resume: bool = False
+) -> bool:
     """
     Run the main correction pipeline.
 
     Args:
         config_path: Path to configuration file
         test_mode: If True, process only a subset of data
+        chunked: If True, stream the input in chunks (bounded memory)
+        resume: If True, skip stages that have a valid checkpoint
 
     Returns:
         True if pipeline completed successfully
@@ -57,26 +67,42 @@ def run_correction_pipeline(config_path: str, test_mode: bool = False) -> bool:
     print("STEP 2: RUNNING CORRECTION PIPELINE")
     print("=" * 80)
 
+    from processors.cad_data_processor import CADDataProcessor
+
     try:
         # Initialize processor
         processor = CADDataProcessor(config_path)
 
-        # Load data
-        processor.load_data()
+        chunked = chunked or processor.config['processing'].get('chunked', False)
+        if chunked and test_mode:
+            print("\nTEST MODE: chunked processing disabled")
+            chunked = False
 
-        # If test mode, sample the data
-        if test_mode:
-            sample_size = processor.config['development']['test_sample_size']
-            random_seed = processor.config['development']['test_random_seed']
+        if chunked and resume:
+            print("\nWARNING: --resume ignored, processing.chunked runs do not use stage checkpoints")
+
+        if chunked:
+            # Stream input, process chunks in parallel, write output incrementally
+            processor.run_chunked()
+        else:
+            # Load data (or the latest valid stage checkpoint when resuming)
+            processor.load_data(resume=resume and not test_mode)
 
-            print(f"\nTEST MODE: Processing {sample_size:,} random records")
-            processor.df = processor.df.sample(n=min(sample_size, len(processor.df)), random_state=random_seed)
+            # If test mode, sample the data
+            if test_mode:
+                # Sampled data must not overwrite full-run checkpoints
+                processor.config.setdefault('checkpoints', {})['enabled'] = False
+                sample_size = processor.config['development']['test_sample_size']
+                random_seed = processor.config['development']['test_random_seed']
 
-        # Run all corrections
-        processor.run_all_corrections()
+                print(f"\nTEST MODE: Processing {sample_size:,} random records")
+                processor.df = processor.df.sample(n=min(sample_size, len(processor.df)), random_state=random_seed)
 
-        # Export corrected data
-        processor.export_corrected_data()
+            # Run all corrections
+            processor.run_all_corrections(resume=resume and not test_mode)
+
+            # Export corrected data
+            processor.export_corrected_data()
 
         # Print summary
         summary = processor.get_processing_summary()
@@ -115,6 +141,8 @@ def run_post_validation(config_path: str) -> bool:
     print("=" * 80)
 
     import yaml
+    from validators.validate_full_pipeline import PipelineValidator
+
     with open(config_path, 'r', encoding='utf-8') as f:
         config = yaml.safe_load(f)
 
@@ -151,6 +179,12 @@ Examples:
   # Skip post-validation
   python main.py --skip-post-validation
 
+  # Process in bounded memory (chunk_size / n_workers / use_dask from config)
+  python main.py --chunked
+
+  # Resume from the last valid stage checkpoint
+  python main.py --resume
+
 For more information, see README.md
         """
     )
@@ -186,6 +220,20 @@ For more information, see README.md
         help='Skip post-processing validation'
     )
 
+    # Chunked runs stream the input and write no stage checkpoints to resume from
+    run_mode = parser.add_mutually_exclusive_group()
+    run_mode.add_argument(
+        '--chunked',
+        action='store_true',
+        help='Stream input in chunks across workers (processing.chunk_size / n_workers)'
+    )
+
+    run_mode.add_argument(
+        '--resume',
+        action='store_true',
+        help='Skip pipeline stages whose checkpoint is still valid (not with --chunked)'
+    )
+
     args = parser.parse_args()
 
     # Print header
@@ -226,7 +274,8 @@ For more information, see README.md
 
     # Step 2: Run correction pipeline (unless validate-only mode)
     if not args.validate_only:
-        pipeline_success = run_correction_pipeline(str(config_path), test_mode=args.test_mode)
+        pipeline_success = run_correction_pipeline(str(config_path), test_mode=args.test_mode, chunked=args.chunked,
+                                                   resume=args.resume)
 
         if not pipeline_success:
             print("\n" + "!" * 80)
@@ -274,6 +323,8 @@ For more information, see README.md
 
         if config['export']['export_flagged_records']:
             print(f"  Manual Review: {config['paths']['manual_review_file']}")
+            if config['paths'].get('merge_artifact_file'):
+                print(f"  Merge Artifacts: {config['paths']['merge_artifact_file']}")
 
     print("\n" + "=" * 80)
 
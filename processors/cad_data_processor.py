@@ -26,6 +26,36 @@ sys.path.append(str(Path(__file__).parent.parent))
 from utils.logger import setup_logger, log_processing_step, log_correction_summary
 from utils.hash_utils import FileHashManager
 from utils.validate_schema import SchemaValidator
+from utils.typed_reader import read_cad_file
+from utils.datetime_parser import cached_datetimes
+from utils.time_fields import derive_time_fields
+from utils.audit_store import AuditStore
+from utils.checkpoint import CheckpointManager, compute_config_hash
+from utils.pattern_standardizer import PatternStandardizer
+from utils.merge_artifact_scanner import MergeArtifactScanner
+from utils.excel_writer import write_excel
+from utils.column_profile import get_column_profile, invalidate
+from utils.unique_values import factorize_column
+from processors.correction_engine import CorrectionPatchSet, CORRECTION_SPECS
+
+
+# Quality score components: (quality_weights key, column, missing-value test)
+QUALITY_FIELDS = [
+    ('case_number_present', 'ReportNumberNew', 'empty'),
+    ('address_present', 'FullAddress2', 'empty'),
+    ('call_time_present', 'Time of Call', 'null'),
+    ('dispatch_time_present', 'Time Dispatched', 'null'),
+    ('officer_present', 'Officer', 'empty'),
+    ('disposition_present', 'Disposition', 'empty'),
+    ('incident_type_present', 'Incident', 'empty'),
+]
+
+
+def _score_dtype(weights: List) -> np.dtype:
+    """Smallest dtype that holds the maximum quality score (uint8 for the default weights)."""
+    if all(isinstance(w, (int, np.integer)) and w >= 0 for w in weights) and sum(weights) <= 255:
+        return np.dtype(np.uint8)
+    return np.result_type(np.int64, *[np.asarray(w).dtype for w in weights])
 
 
 class CADDataProcessor:
@@ -44,6 +74,7 @@ class CADDataProcessor:
             config_path: Path to YAML configuration file
         """
         # Load configuration
+        self.config_path = config_path
         self.config = self._load_config(config_path)
 
         # Setup logging
@@ -66,7 +97,15 @@ class CADDataProcessor:
 
         # Initialize data containers
         self.df = None
-        self.audit_trail = []
+        self.audit_trail = AuditStore()
+        self.compiled_corrections: Optional[CorrectionPatchSet] = None
+        # Patch rows applied per field by the last keyed correction pass
+        self.keyed_patch_hits: Dict[str, np.ndarray] = {}
+        # Row, case number, pattern and column of each merge artifact flagged
+        self.merge_artifacts: Optional[pd.DataFrame] = None
+        self.input_hash: Optional[str] = None
+        self.resume_stage: Optional[str] = None
+        self.quality_metrics = {}
         self.processing_stats = {
             'records_input': 0,
             'records_output': 0,
@@ -84,12 +123,14 @@ class CADDataProcessor:
         with open(config_path, 'r', encoding='utf-8') as f:
             return yaml.safe_load(f)
 
-    def load_data(self, file_path: Optional[str] = None) -> pd.DataFrame:
+    def load_data(self, file_path: Optional[str] = None, resume: bool = False) -> pd.DataFrame:
         """
         Load CAD data from file.
 
         Args:
             file_path: Path to input file (uses config if not provided)
+            resume: If True and a valid stage checkpoint exists for this input
+                and config, load the latest checkpoint instead of the file
 
         Returns:
             Loaded DataFrame
@@ -102,21 +143,22 @@ class CADDataProcessor:
             "Format": Path(file_path).suffix
         })
 
-        # Record input file hash
-        input_hash = self.hash_manager.record_file_hash(
-            file_path,
-            stage="input",
-            metadata={"description": "Raw CAD export"}
-        )
-
-        # Load data
-        if file_path.endswith('.xlsx'):
-            self.df = pd.read_excel(file_path)
-        elif file_path.endswith('.csv'):
-            self.df = pd.read_csv(file_path, encoding='utf-8-sig')
-        else:
+        if not file_path.endswith(('.xlsx', '.csv')):
             raise ValueError(f"Unsupported file format: {file_path}")
 
+        if resume:
+            # Checkpoints are keyed by the input hash, so hash before deciding
+            self.input_hash = self._record_input_hash(file_path)
+            if self._resume_from_checkpoint():
+                return self.df
+
+        # Load data (schema-driven dtypes: categoricals, Arrow strings, parsed
+        # datetimes), hashing the bytes as they are parsed
+        with self.hash_manager.hashing_reader(file_path) as stream:
+            self.df = read_cad_file(file_path, stage="processor", logger=self.logger, stream=stream)
+        if not resume:
+            self.input_hash = self._record_input_hash(file_path, stream.raw.hexdigest())
+
         self.processing_stats['records_input'] = len(self.df)
 
         self.logger.info(f"Loaded {len(self.df):,} records from {Path(file_path).name}")
@@ -154,15 +196,11 @@ class CADDataProcessor:
 
         corrections_applied = 0
 
-        # Apply address corrections
-        if 'address' in self.config['paths']['corrections']:
-            corrections_applied += self._apply_address_corrections()
+        # Apply keyed corrections (address, disposition, How Reported, case number)
+        # as one compiled patch set
+        corrections_applied += self._apply_keyed_corrections()
 
-        # Apply disposition corrections
-        if 'disposition' in self.config['paths']['corrections']:
-            corrections_applied += self._apply_disposition_corrections()
-
-        # Apply How Reported corrections
+        # Apply How Reported standardization
         if 'how_reported' in self.config['paths']['corrections']:
             corrections_applied += self._apply_how_reported_corrections()
 
@@ -173,92 +211,64 @@ class CADDataProcessor:
         self.processing_stats['corrections_applied'] = corrections_applied
         log_correction_summary(self.logger, "Total Manual Corrections", corrections_applied)
 
-    def _apply_address_corrections(self) -> int:
-        """Apply address corrections from CSV."""
-        correction_file = self.config['paths']['corrections']['address']
-
-        if not Path(correction_file).exists():
-            self.logger.warning(f"Address corrections file not found: {correction_file}")
-            return 0
-
-        self.logger.info(f"Applying address corrections from {Path(correction_file).name}")
+    def _apply_keyed_corrections(self, sources: Optional[List[str]] = None) -> int:
+        """
+        Apply ReportNumberNew-keyed corrections from CSV.
 
-        try:
-            corrections_df = pd.read_csv(correction_file, encoding='utf-8-sig')
+        All configured correction files are compiled into a single patch set
+        and applied with one hash join on ReportNumberNew.
 
-            if 'ReportNumberNew' not in corrections_df.columns or 'FullAddress2_corrected' not in corrections_df.columns:
-                self.logger.error("Corrections file missing required columns")
-                return 0
+        Args:
+            sources: Correction names to apply (defaults to all configured
+                entries in CORRECTION_SPECS)
 
-            count = 0
-            for _, row in corrections_df.iterrows():
-                case_num = row['ReportNumberNew']
-                corrected_address = row['FullAddress2_corrected']
-
-                mask = self.df['ReportNumberNew'] == case_num
-                if mask.any():
-                    old_value = self.df.loc[mask, 'FullAddress2'].iloc[0]
-                    self.df.loc[mask, 'FullAddress2'] = corrected_address
-                    count += 1
-
-                    # Record in audit trail
-                    self._record_audit(
-                        case_number=case_num,
-                        field='FullAddress2',
-                        old_value=old_value,
-                        new_value=corrected_address,
-                        correction_type='manual_address'
-                    )
-
-            self.logger.info(f"Applied {count:,} address corrections")
-            return count
+        Returns:
+            Number of corrections applied
+        """
+        self.keyed_patch_hits = {}
+        if sources is None and self.compiled_corrections is not None:
+            patch_set = self.compiled_corrections
+        else:
+            patch_set = self.compile_corrections(sources)
+        if len(patch_set) == 0:
+            return 0
 
+        try:
+            applied, changes = patch_set.apply(self.df, patch_hits=self.keyed_patch_hits)
         except Exception as e:
-            self.logger.error(f"Error applying address corrections: {e}")
+            self.logger.error(f"Error applying keyed corrections: {e}")
             return 0
 
-    def _apply_disposition_corrections(self) -> int:
-        """Apply disposition corrections from CSV."""
-        correction_file = self.config['paths']['corrections']['disposition']
+        self._record_audit_bulk(changes)
+        return sum(applied.values())
 
-        if not Path(correction_file).exists():
-            self.logger.warning(f"Disposition corrections file not found: {correction_file}")
-            return 0
+    def compile_corrections(self, sources: Optional[List[str]] = None) -> CorrectionPatchSet:
+        """
+        Compile the configured keyed correction CSVs into one patch set.
 
-        self.logger.info(f"Applying disposition corrections from {Path(correction_file).name}")
+        Args:
+            sources: Correction names to compile (defaults to all configured
+                entries in CORRECTION_SPECS)
 
-        try:
-            corrections_df = pd.read_csv(correction_file, encoding='utf-8-sig')
+        Returns:
+            Compiled CorrectionPatchSet
+        """
+        corrections_config = self.config['paths']['corrections']
+        if sources is None:
+            sources = [name for name in CORRECTION_SPECS if name in corrections_config]
 
-            if 'ReportNumberNew' not in corrections_df.columns or 'Disposition_corrected' not in corrections_df.columns:
-                self.logger.error("Corrections file missing required columns")
-                return 0
+        return CorrectionPatchSet.from_files(
+            {name: corrections_config.get(name) for name in sources},
+            logger=self.logger
+        )
 
-            count = 0
-            for _, row in corrections_df.iterrows():
-                case_num = row['ReportNumberNew']
-                corrected_disposition = row['Disposition_corrected']
-
-                mask = self.df['ReportNumberNew'] == case_num
-                if mask.any():
-                    old_value = self.df.loc[mask, 'Disposition'].iloc[0]
-                    self.df.loc[mask, 'Disposition'] = corrected_disposition
-                    count += 1
-
-                    self._record_audit(
-                        case_number=case_num,
-                        field='Disposition',
-                        old_value=old_value,
-                        new_value=corrected_disposition,
-                        correction_type='manual_disposition'
-                    )
-
-            self.logger.info(f"Applied {count:,} disposition corrections")
-            return count
+    def _apply_address_corrections(self) -> int:
+        """Apply address corrections from CSV."""
+        return self._apply_keyed_corrections(['address'])
 
-        except Exception as e:
-            self.logger.error(f"Error applying disposition corrections: {e}")
-            return 0
+    def _apply_disposition_corrections(self) -> int:
+        """Apply disposition corrections from CSV."""
+        return self._apply_keyed_corrections(['disposition'])
 
     def _apply_how_reported_corrections(self) -> int:
         """Apply How Reported standardization."""
@@ -268,30 +278,32 @@ class CADDataProcessor:
 
         self.logger.info("Standardizing How Reported field")
 
-        count = 0
         patterns = self.config['field_mappings']['how_reported']['patterns']
+        standardizer = PatternStandardizer(patterns)
 
-        for standard_value, variations in patterns.items():
-            for variation in variations:
-                mask = self.df['How Reported'].astype(str).str.contains(
-                    variation, case=False, na=False, regex=False
-                )
+        col_idx = self.df.columns.get_loc('How Reported')
+        rows, new_values = standardizer.standardize(self.df['How Reported'])
+        count = len(rows)
 
-                if mask.any():
-                    old_values = self.df.loc[mask, 'How Reported'].copy()
-                    self.df.loc[mask, 'How Reported'] = standard_value
-                    count += mask.sum()
-
-                    # Record audit for changed records
-                    for idx in self.df[mask].index:
-                        if pd.notna(self.df.loc[idx, 'ReportNumberNew']):
-                            self._record_audit(
-                                case_number=self.df.loc[idx, 'ReportNumberNew'],
-                                field='How Reported',
-                                old_value=old_values.loc[idx],
-                                new_value=standard_value,
-                                correction_type='how_reported_standardization'
-                            )
+        if count:
+            old_values = self.df.iloc[rows, col_idx].copy()
+            if isinstance(self.df['How Reported'].dtype, pd.CategoricalDtype):
+                self.df['How Reported'] = self.df['How Reported'].cat.add_categories(
+                    [v for v in pd.unique(new_values) if v not in self.df['How Reported'].cat.categories]
+                )
+            self.df.iloc[rows, col_idx] = new_values
+            invalidate(self.df, 'How Reported')
+
+            # Record audit for changed records
+            case_numbers = self.df['ReportNumberNew'].iloc[rows]
+            self.audit_trail.record_batch(
+                case_numbers,
+                field='How Reported',
+                old_values=old_values,
+                new_values=new_values,
+                correction_type='how_reported_standardization',
+                mask=case_numbers.notna().to_numpy()
+            )
 
         self.logger.info(f"Standardized {count:,} How Reported values")
         return count
@@ -320,7 +332,8 @@ class CADDataProcessor:
 
                     if mask.any():
                         self.df.loc[mask, 'FullAddress2'] = replacement
-                        count += mask.sum()
+                        invalidate(self.df, 'FullAddress2')
+                        count += int(mask.sum())
 
             self.logger.info(f"Applied {count:,} FullAddress2 corrections")
             return count
@@ -342,10 +355,11 @@ class CADDataProcessor:
             return
 
         # Ensure Time of Call is datetime
-        self.df['Time of Call'] = pd.to_datetime(self.df['Time of Call'], errors='coerce')
+        self.df['Time of Call'] = cached_datetimes(self.df, 'Time of Call')
 
-        # Extract HH:mm format
-        self.df['Hour'] = self.df['Time of Call'].dt.strftime('%H:%M')
+        # Extract HH:mm format (categorical over the 1440 minutes of the day)
+        self.df['Hour'] = derive_time_fields(self.df['Time of Call']).hour_minute()
+        invalidate(self.df, ['Time of Call', 'Hour'])
 
         # Count successful extractions
         extracted_count = self.df['Hour'].notna().sum()
@@ -376,8 +390,14 @@ class CADDataProcessor:
         except Exception as e:
             self.logger.error(f"Error mapping call types: {e}")
 
-    def detect_duplicates(self):
-        """Detect and flag duplicate records and merge artifacts."""
+    def detect_duplicates(self, duplicate_keys: Optional[set] = None):
+        """
+        Detect and flag duplicate records and merge artifacts.
+
+        Args:
+            duplicate_keys: Precomputed set of duplicated case numbers (used
+                when processing in chunks); computed from self.df if omitted
+        """
         if not self.config['processing']['detect_duplicates']:
             self.logger.info("Skipping duplicate detection (disabled)")
             return
@@ -388,68 +408,61 @@ class CADDataProcessor:
         self.df['duplicate_flag'] = False
 
         # Check for exact duplicate case numbers
-        duplicate_cases = self.df['ReportNumberNew'].duplicated(keep=False)
+        if duplicate_keys is None:
+            duplicate_cases = self.df['ReportNumberNew'].duplicated(keep=False)
+        else:
+            duplicate_cases = self.df['ReportNumberNew'].isin(duplicate_keys)
         duplicate_count = duplicate_cases.sum()
 
         if duplicate_count > 0:
             self.df.loc[duplicate_cases, 'duplicate_flag'] = True
             self.logger.warning(f"Found {duplicate_count:,} duplicate case numbers")
 
-        # Check for merge artifact patterns
-        merge_patterns = self.config['duplicate_detection']['merge_artifact_patterns']
+        # Check for merge artifact patterns (one compiled scan per column)
+        dup_config = self.config['duplicate_detection']
+        scanner = MergeArtifactScanner(
+            dup_config['merge_artifact_patterns'],
+            columns=dup_config.get('merge_artifact_columns'),
+            exclude_columns=dup_config.get('merge_artifact_exclude_columns'),
+            low_cardinality_ratio=dup_config.get('merge_artifact_low_cardinality_ratio', 0.5)
+        )
+        artifacts = scanner.scan(self.df)
+        # Matched pattern/column go to the artifact report; only the flag is exported
+        artifact_mask = artifacts['merge_artifact_pattern'].notna().to_numpy()
+        flagged = artifacts[artifact_mask]
+        self.merge_artifacts = pd.DataFrame({
+            'row': flagged.index,
+            'ReportNumberNew': self.df['ReportNumberNew'].to_numpy()[artifact_mask],
+            'pattern': flagged['merge_artifact_pattern'].astype(str).to_numpy(),
+            'column': flagged['merge_artifact_column'].astype(str).to_numpy()
+        })
 
-        for pattern in merge_patterns:
-            for col in self.df.columns:
-                if self.df[col].dtype == 'object':
-                    mask = self.df[col].astype(str).str.contains(pattern, case=False, na=False, regex=True)
-                    if mask.any():
-                        self.df.loc[mask, 'duplicate_flag'] = True
-                        self.logger.info(f"Flagged {mask.sum():,} merge artifacts (pattern: {pattern})")
+        if artifact_mask.any():
+            self.df.loc[artifact_mask, 'duplicate_flag'] = True
+            for pattern, count in scanner.summary(artifacts).items():
+                self.logger.info(f"Flagged {count:,} merge artifacts (pattern: {pattern})")
 
+        invalidate(self.df, 'duplicate_flag')
         self.processing_stats['duplicates_flagged'] = self.df['duplicate_flag'].sum()
 
     def calculate_quality_scores(self):
         """Calculate quality score for each record."""
         log_processing_step(self.logger, "Calculating Quality Scores")
 
-        # Initialize quality score
-        self.df['quality_score'] = 0
-
         weights = self.config['quality_weights']
-
-        # Case number present
-        if 'ReportNumberNew' in self.df.columns:
-            has_case = self.df['ReportNumberNew'].notna() & (self.df['ReportNumberNew'] != '')
-            self.df.loc[has_case, 'quality_score'] += weights['case_number_present']
-
-        # Address present
-        if 'FullAddress2' in self.df.columns:
-            has_address = self.df['FullAddress2'].notna() & (self.df['FullAddress2'] != '')
-            self.df.loc[has_address, 'quality_score'] += weights['address_present']
-
-        # Time fields present
-        if 'Time of Call' in self.df.columns:
-            has_call_time = self.df['Time of Call'].notna()
-            self.df.loc[has_call_time, 'quality_score'] += weights['call_time_present']
-
-        if 'Time Dispatched' in self.df.columns:
-            has_dispatch = self.df['Time Dispatched'].notna()
-            self.df.loc[has_dispatch, 'quality_score'] += weights['dispatch_time_present']
-
-        # Officer present
-        if 'Officer' in self.df.columns:
-            has_officer = self.df['Officer'].notna() & (self.df['Officer'] != '')
-            self.df.loc[has_officer, 'quality_score'] += weights['officer_present']
-
-        # Disposition present
-        if 'Disposition' in self.df.columns:
-            has_disposition = self.df['Disposition'].notna() & (self.df['Disposition'] != '')
-            self.df.loc[has_disposition, 'quality_score'] += weights['disposition_present']
-
-        # Incident type present
-        if 'Incident' in self.df.columns:
-            has_incident = self.df['Incident'].notna() & (self.df['Incident'] != '')
-            self.df.loc[has_incident, 'quality_score'] += weights['incident_type_present']
+        profile = get_column_profile(self.df)
+
+        # Weighted sum of presence bitmaps (cached per column)
+        fields = [
+            (weights[key], column, kind) for key, column, kind in QUALITY_FIELDS
+            if column in self.df.columns
+        ]
+        score_dtype = _score_dtype([weight for weight, _, _ in fields])
+        scores = np.zeros(len(self.df), dtype=score_dtype)
+        for weight, column, kind in fields:
+            scores += profile.present(column, kind).astype(score_dtype) * score_dtype.type(weight)
+        self.df['quality_score'] = scores
+        invalidate(self.df, 'quality_score')
 
         avg_score = self.df['quality_score'].mean()
         self.processing_stats['quality_scores_computed'] = len(self.df)
@@ -470,15 +483,14 @@ class CADDataProcessor:
         config_criteria = self.config['manual_review_criteria']
 
         # Flag unknown addresses
-        if config_criteria['flag_unknown_addresses']:
-            address_patterns = config_criteria['address_patterns_to_flag']
-            for pattern in address_patterns:
-                mask = self.df['FullAddress2'].astype(str).str.contains(pattern, case=False, na=False)
-                self.df.loc[mask, 'manual_review_flag'] = True
+        if config_criteria['flag_unknown_addresses'] and 'FullAddress2' in self.df.columns:
+            # Patterns are literal text ("N/A", "?"), matched case-insensitively
+            unknown_address = self._match_address_patterns(config_criteria['address_patterns_to_flag'])
+            self.df.loc[unknown_address, 'manual_review_flag'] = True
 
         # Flag missing case numbers
         if config_criteria['flag_missing_case_numbers']:
-            missing_case = self.df['ReportNumberNew'].isna() | (self.df['ReportNumberNew'] == '')
+            missing_case = get_column_profile(self.df).mask('ReportNumberNew', 'empty')
             self.df.loc[missing_case, 'manual_review_flag'] = True
 
         # Flag low quality scores
@@ -495,54 +507,144 @@ class CADDataProcessor:
             except Exception as e:
                 self.logger.error(f"Error applying custom criteria: {e}")
 
+        invalidate(self.df, 'manual_review_flag')
         flagged_count = self.df['manual_review_flag'].sum()
         self.processing_stats['manual_review_flagged'] = flagged_count
 
         self.logger.info(f"Flagged {flagged_count:,} records for manual review")
 
+    def _match_address_patterns(self, patterns: List[str]) -> np.ndarray:
+        """Return rows whose FullAddress2 text contains any pattern (case-insensitive)."""
+        address = self.df['FullAddress2']
+        patterns = [str(pattern).upper() for pattern in patterns]
+        codes, uniques = factorize_column(address)
+
+        def matches(text: str) -> bool:
+            text = text.upper()
+            return any(pattern in text for pattern in patterns)
+
+        unique_match = np.array([matches(str(value)) for value in uniques], dtype=bool)
+        result = np.append(unique_match, False)[codes]
+        missing = np.flatnonzero(codes < 0)
+        if len(missing):
+            # Missing values are matched on their text form, as astype(str) did
+            result[missing] = [matches(text) for text in address.iloc[missing].astype(str)]
+        return result
+
     def _record_audit(self, case_number: str, field: str, old_value, new_value, correction_type: str):
         """Record a change in the audit trail."""
-        self.audit_trail.append({
-            'timestamp': datetime.now().isoformat(),
-            'case_number': case_number,
-            'field': field,
-            'old_value': str(old_value),
-            'new_value': str(new_value),
-            'correction_type': correction_type
-        })
+        self.audit_trail.record(case_number, field, old_value, new_value, correction_type)
+
+    def _record_audit_bulk(self, changes: pd.DataFrame):
+        """Record a batch of changes (case_number, field, old_value, new_value, correction_type)."""
+        self.audit_trail.record_frame(changes)
+
+    def _pipeline_stages(self) -> List[Tuple[str, callable]]:
+        """Return checkpointed pipeline stages in execution order."""
+        return [
+            ('manual_corrections', self.apply_manual_corrections),
+            ('hour_field', self.extract_hour_field),
+            ('call_types', self.map_call_types),
+            ('duplicates', self.detect_duplicates),
+            ('quality_scores', self.calculate_quality_scores),
+            ('manual_review', self.flag_for_manual_review),
+        ]
+
+    def _record_input_hash(self, file_path: str, file_hash: Optional[str] = None) -> str:
+        """Record the input file hash in the manifest."""
+        return self.hash_manager.record_file_hash(
+            file_path,
+            stage="input",
+            metadata={"description": "Raw CAD export"},
+            file_hash=file_hash
+        )
 
-    def run_all_corrections(self):
+    def _checkpoint_manager(self, resume: bool = False) -> Optional[CheckpointManager]:
+        """
+        Create the checkpoint manager for the current input.
+
+        Args:
+            resume: Resuming was requested (checkpoints are used even if
+                checkpoints.enabled is off)
+
+        Returns:
+            CheckpointManager, or None if checkpoints are off or the input hash is unknown
+        """
+        checkpoint_config = self.config.get('checkpoints', {})
+        if not (checkpoint_config.get('enabled', False) or resume) or self.input_hash is None:
+            return None
+        return CheckpointManager(
+            checkpoint_config.get('dir', 'data/checkpoints'),
+            input_hash=self.input_hash,
+            config_hash=compute_config_hash(self.config)
+        )
+
+    def _checkpoint_state(self) -> Dict:
+        """State restored together with a stage checkpoint."""
+        return {
+            'processing_stats': self.processing_stats.copy(),
+            'audit': self.audit_trail.to_frame()
+        }
+
+    def _resume_from_checkpoint(self) -> bool:
+        """
+        Restore the latest valid stage checkpoint.
+
+        Returns:
+            True if a checkpoint was loaded
+        """
+        checkpoints = self._checkpoint_manager(resume=True)
+        if checkpoints is None:
+            self.logger.warning("Resume requested but the input hash is unknown")
+            return False
+
+        stage = checkpoints.latest([name for name, _ in self._pipeline_stages()])
+        if stage is None:
+            self.logger.info("No valid checkpoint found - running all stages")
+            return False
+
+        self.df, state = checkpoints.load(stage)
+        if state:
+            self.processing_stats.update(state.get('processing_stats', {}))
+            self.audit_trail = AuditStore()
+            self.audit_trail.record_frame(state.get('audit'))
+        self.resume_stage = stage
+        self.logger.info(f"Resuming after stage '{stage}'")
+        return True
+
+    def run_all_corrections(self, resume: bool = False):
         """
         Execute full correction pipeline.
 
         This is the main orchestration method that runs all processing steps.
+        Each step writes a checkpoint when checkpoints.enabled is set or when resuming.
+
+        Args:
+            resume: If True, skip every stage up to the latest valid checkpoint
         """
         self.logger.info("=" * 80)
         self.logger.info("STARTING CAD DATA CORRECTION PIPELINE")
         self.logger.info("=" * 80)
 
         try:
-            # Step 1: Validate schema
-            if self.config['validation']['validate_schema']:
-                self.validate_schema()
-
-            # Step 2: Apply manual corrections
-            self.apply_manual_corrections()
-
-            # Step 3: Extract hour field
-            self.extract_hour_field()
+            if resume and self.resume_stage is None:
+                self._resume_from_checkpoint()
 
-            # Step 4: Map call types
-            self.map_call_types()
+            stages = self._pipeline_stages()
+            stage_names = [name for name, _ in stages]
+            start = stage_names.index(self.resume_stage) + 1 if self.resume_stage in stage_names else 0
+            checkpoints = self._checkpoint_manager(resume)
 
-            # Step 5: Detect duplicates
-            self.detect_duplicates()
-
-            # Step 6: Calculate quality scores
-            self.calculate_quality_scores()
+            # Step 1: Validate schema
+            if start == 0 and self.config['validation']['validate_schema']:
+                self.validate_schema()
 
-            # Step 7: Flag for manual review
-            self.flag_for_manual_review()
+            # Steps 2-7: corrections, hour field, call types, duplicates,
+            # quality scores, manual review flags
+            for name, step in stages[start:]:
+                step()
+                if checkpoints is not None:
+                    checkpoints.save(name, self.df, self._checkpoint_state())
 
             self.processing_stats['records_output'] = len(self.df)
 
@@ -555,6 +657,30 @@ class CADDataProcessor:
             self.logger.error(f"Pipeline failed: {e}")
             raise
 
+    def run_chunked(self, input_path: Optional[str] = None, output_path: Optional[str] = None) -> Dict:
+        """
+        Execute the correction pipeline in bounded memory.
+
+        Streams the input in processing.chunk_size row chunks, runs the
+        row-local steps per chunk across processing.n_workers workers, and
+        writes the output, audit trail and flagged records incrementally.
+        Duplicate case numbers are found in a separate key-only pass.
+
+        Args:
+            input_path: Path to input file (uses config if not provided)
+            output_path: Path to output file (uses config if not provided)
+
+        Returns:
+            Processing statistics
+        """
+        from processors.chunked_runner import ChunkedRunner
+
+        runner = ChunkedRunner(self)
+        return runner.run(
+            input_path or self.config['paths']['input_file'],
+            output_path or self.config['paths']['output_file']
+        )
+
     def _log_processing_stats(self):
         """Log processing statistics summary."""
         self.logger.info("\nProcessing Statistics:")
@@ -580,22 +706,21 @@ class CADDataProcessor:
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
         # Export based on format
+        output_hash = None
         if output_path.endswith('.xlsx'):
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                self.df.to_excel(writer, index=False, sheet_name='CAD_Data')
-
-                # Add UTF-8 BOM if configured
-                if self.config['export']['excel']['include_utf8_bom']:
-                    # This would be handled by pandas/openpyxl
-                    pass
+            # Streamed through a write-only workbook (constant memory)
+            write_excel(self.df, output_path, sheet_name='CAD_Data', **self._excel_options())
 
         elif output_path.endswith('.csv'):
-            self.df.to_csv(
-                output_path,
-                index=False,
-                encoding=self.config['export']['csv']['encoding'],
-                sep=self.config['export']['csv']['sep']
-            )
+            # Hash the bytes while they are written instead of re-reading the file
+            with self.hash_manager.hashing_writer(output_path) as stream:
+                self.df.to_csv(
+                    stream,
+                    index=False,
+                    encoding=self.config['export']['csv']['encoding'],
+                    sep=self.config['export']['csv']['sep']
+                )
+            output_hash = stream.raw.hexdigest()
 
         # Record output file hash
         self.hash_manager.record_file_hash(
@@ -605,7 +730,8 @@ class CADDataProcessor:
                 "description": "Corrected CAD data",
                 "records": len(self.df),
                 "corrections_applied": self.processing_stats['corrections_applied']
-            }
+            },
+            file_hash=output_hash
         )
 
         self.logger.info(f"Data exported successfully to {output_path}")
@@ -617,16 +743,24 @@ class CADDataProcessor:
         # Export flagged records if configured
         if self.config['export']['export_flagged_records']:
             self._export_flagged_records()
+            self._export_merge_artifacts()
+
+    def _excel_options(self) -> Dict:
+        """Formula-guard options for Excel exports from export.excel config."""
+        excel_config = self.config['export'].get('excel', {})
+        return {
+            'escape_formulas': excel_config.get('escape_formulas', False),
+            'guard_columns': excel_config.get('guard_columns') or []
+        }
 
     def _export_audit_trail(self):
-        """Export audit trail to CSV."""
+        """Export audit trail to CSV (or Parquet for a .parquet audit_file)."""
         audit_path = self.config['paths']['audit_file']
         Path(audit_path).parent.mkdir(parents=True, exist_ok=True)
 
-        audit_df = pd.DataFrame(self.audit_trail)
-        audit_df.to_csv(audit_path, index=False, encoding='utf-8-sig')
+        written = self.audit_trail.export(audit_path)
 
-        self.logger.info(f"Audit trail exported: {len(self.audit_trail):,} changes recorded")
+        self.logger.info(f"Audit trail exported: {written:,} changes recorded")
 
     def _export_flagged_records(self):
         """Export flagged records to Excel for manual review."""
@@ -642,10 +776,29 @@ class CADDataProcessor:
         output_path = self.config['paths']['manual_review_file']
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
-        flagged_df.to_excel(output_path, index=False)
+        write_excel(flagged_df, output_path, **self._excel_options())
 
         self.logger.info(f"Flagged records exported: {len(flagged_df):,} records")
 
+    def _export_merge_artifacts(self):
+        """Export which pattern and column flagged each merge artifact (paths.merge_artifact_file)."""
+        output_path = self.config['paths'].get('merge_artifact_file')
+        if not output_path or self.merge_artifacts is None or len(self.merge_artifacts) == 0:
+            return
+
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        if output_path.endswith('.csv'):
+            self.merge_artifacts.to_csv(
+                output_path,
+                index=False,
+                encoding=self.config['export']['csv']['encoding'],
+                sep=self.config['export']['csv']['sep']
+            )
+        else:
+            write_excel(self.merge_artifacts, output_path, sheet_name='Merge_Artifacts', **self._excel_options())
+
+        self.logger.info(f"Merge artifact report exported: {len(self.merge_artifacts):,} records")
+
     def get_processing_summary(self) -> Dict:
         """
         Get comprehensive processing summary.
@@ -653,6 +806,15 @@ class CADDataProcessor:
         Returns:
             Dictionary with processing statistics and quality metrics
         """
+        if self.df is None:
+            # Chunked run: quality metrics were aggregated per chunk
+            return {
+                'processing_stats': self.processing_stats.copy(),
+                'quality_metrics': dict(self.quality_metrics),
+                'audit_trail_entries': len(self.audit_trail),
+                'timestamp': datetime.now().isoformat()
+            }
+
         return {
             'processing_stats': self.processing_stats.copy(),
             'quality_metrics': {
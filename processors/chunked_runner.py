@@ -0,0 +1,403 @@
+"""
+Chunked Runner - Bounded-memory execution of the CAD correction pipeline
+
+Streams the input workbook/CSV in row chunks and runs the row-local
+processing steps (manual corrections, hour extraction, merge artifact
+scan, quality scores, manual review flags) per chunk across
+processing.n_workers worker processes. The only global step, duplicate
+case number detection, runs once on a key-only pass before the chunks are
+processed. Output, audit trail and flagged records are written as chunks
+complete, so peak memory depends on chunk_size * n_workers rather than the
+input size. The shared run state (config, compiled corrections, duplicate
+keys) is sent to each worker once, when the pool starts; tasks carry only
+their chunk.
+"""
+
+import numpy as np
+import pandas as pd
+import logging
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterator, List, Optional
+
+from processors.correction_engine import KEY_FIELD, CorrectionPatchSet
+from utils.audit_store import AuditStore
+from utils.excel_writer import StreamingExcelWriter
+from utils.logger import log_processing_step
+from utils.typed_reader import STAGE_COLUMNS, iter_cad_chunks
+
+try:
+    import dask
+    DASK_AVAILABLE = True
+except ImportError:
+    DASK_AVAILABLE = False
+
+
+STAT_KEYS = [
+    'records_output', 'corrections_applied', 'duplicates_flagged',
+    'quality_scores_computed', 'manual_review_flagged'
+]
+
+# Processor reused by each worker process across chunks
+_WORKER_PROCESSORS = {}
+
+# (config path, run state) installed in each worker process by _init_worker
+_WORKER_STATE = {}
+
+
+def iter_input_chunks(
+    file_path: str,
+    chunk_size: int,
+    usecols: Optional[List[str]] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream an input file in row chunks.
+
+    Chunks are read through utils.typed_reader with the processor stage's
+    schema-driven dtypes, so every chunk matches the corresponding rows of a
+    whole-file ``read_cad_file`` (text case numbers and zones, categoricals,
+    parsed datetimes). Chunks carry a continuous RangeIndex across the file.
+
+    Args:
+        file_path: Path to .csv or .xlsx input
+        chunk_size: Rows per chunk
+        usecols: Optional subset of columns to read
+
+    Yields:
+        DataFrame chunks
+    """
+    if usecols is None:
+        usecols = STAGE_COLUMNS.get('processor')
+    return iter_cad_chunks(file_path, chunk_size, columns=usecols)
+
+
+def _process_chunk(config_path: str, state: Dict, chunk: pd.DataFrame) -> Dict:
+    """
+    Run the row-local pipeline steps on one chunk (executed in a worker).
+
+    Args:
+        config_path: Path to configuration file
+        state: Shared run state (config, compiled corrections, duplicate keys,
+            run timestamp)
+        chunk: Input rows
+
+    Returns:
+        Dictionary with processed rows, audit changes and chunk statistics
+    """
+    from processors.cad_data_processor import CADDataProcessor
+
+    processor = _WORKER_PROCESSORS.get(config_path)
+    if processor is None:
+        processor = CADDataProcessor(config_path)
+        _WORKER_PROCESSORS[config_path] = processor
+
+    # Per-step logging is summarized by the parent process
+    level = processor.logger.level
+    processor.logger.setLevel(logging.WARNING)
+    try:
+        processor.config = state['config']
+        processor.df = chunk
+        processor.audit_trail = AuditStore(run_timestamp=state['run_timestamp'])
+        processor.compiled_corrections = state['corrections']
+        processor.processing_stats = {key: 0 for key in processor.processing_stats}
+        processor.keyed_patch_hits = {}
+
+        processor.apply_manual_corrections()
+        processor.extract_hour_field()
+        processor.map_call_types()
+        processor.detect_duplicates(duplicate_keys=state['duplicate_keys'])
+        processor.calculate_quality_scores()
+        processor.flag_for_manual_review()
+        processor.processing_stats['records_output'] = len(processor.df)
+
+        scores = processor.df['quality_score']
+        return {
+            'df': processor.df,
+            'audit': processor.audit_trail.to_frame(),
+            'stats': {key: int(processor.processing_stats.get(key, 0)) for key in STAT_KEYS},
+            # Keyed corrections count distinct patches, so the parent merges these
+            # instead of summing per-chunk counts
+            'patch_hits': processor.keyed_patch_hits,
+            'merge_artifacts': processor.merge_artifacts,
+            'quality': {
+                'score_sum': float(scores.sum()),
+                'high_quality': int((scores >= 80).sum()),
+                'low_quality': int((scores < 50).sum())
+            }
+        }
+    finally:
+        processor.logger.setLevel(level)
+        processor.df = None
+
+
+def _init_worker(config_path: str, state: Dict):
+    """Pool initializer: keep the run state in the worker for all its chunks."""
+    _WORKER_STATE['config_path'] = config_path
+    _WORKER_STATE['state'] = state
+
+
+def _process_worker_chunk(chunk: pd.DataFrame) -> Dict:
+    """Process one chunk with the state installed by _init_worker."""
+    return _process_chunk(_WORKER_STATE['config_path'], _WORKER_STATE['state'], chunk)
+
+
+class ChunkedRunner:
+    """Runs CADDataProcessor steps chunk by chunk with bounded memory."""
+
+    def __init__(self, processor):
+        """
+        Initialize chunked runner.
+
+        Args:
+            processor: Configured CADDataProcessor (provides config, logger,
+                audit trail and statistics)
+        """
+        self.processor = processor
+        self.config = processor.config
+        self.logger = processor.logger
+
+        processing = self.config['processing']
+        self.chunk_size = int(processing.get('chunk_size', 10000))
+        self.n_workers = max(1, int(processing.get('n_workers', 1)))
+        self.use_dask = bool(processing.get('use_dask', False)) and DASK_AVAILABLE
+
+    def collect_duplicate_keys(self, input_path: str, corrections: Optional[CorrectionPatchSet]) -> set:
+        """
+        Find duplicated case numbers with a key-only pass over the input.
+
+        Case number corrections are applied to the keys first so duplicates
+        reflect the corrected numbers.
+
+        Args:
+            input_path: Path to input file
+            corrections: Compiled corrections (case number patches are used)
+
+        Returns:
+            Set of case numbers that occur more than once
+        """
+        key_chunks = [
+            chunk[[KEY_FIELD]]
+            for chunk in iter_input_chunks(input_path, max(self.chunk_size, 100_000), usecols=[KEY_FIELD])
+        ]
+        if not key_chunks:
+            return set()
+        keys = pd.concat(key_chunks, ignore_index=True)
+
+        if corrections is not None and KEY_FIELD in corrections.fields:
+            corrections.subset([KEY_FIELD]).apply(keys)
+
+        duplicated = keys[KEY_FIELD].duplicated(keep=False)
+        duplicate_keys = set(keys.loc[duplicated, KEY_FIELD])
+        self.logger.info(f"Key pass: {len(keys):,} records, {len(duplicate_keys):,} duplicated case numbers")
+        return duplicate_keys
+
+    def _map_window(self, executor, config_path: str, state: Dict, window: List[pd.DataFrame]) -> List[Dict]:
+        """Process one window of chunks, preserving chunk order."""
+        if executor is None:
+            return [_process_chunk(config_path, state, chunk) for chunk in window]
+        if self.use_dask:
+            tasks = [dask.delayed(_process_worker_chunk)(chunk) for chunk in window]
+            return list(dask.compute(*tasks, scheduler='processes', pool=executor))
+        return list(executor.map(_process_worker_chunk, window))
+
+    def run(self, input_path: str, output_path: str) -> Dict:
+        """
+        Run the pipeline over ``input_path`` and write ``output_path``.
+
+        Args:
+            input_path: Path to .csv or .xlsx input
+            output_path: Path to .csv or .xlsx output
+
+        Returns:
+            Processing statistics
+        """
+        processor = self.processor
+        log_processing_step(self.logger, "Chunked Processing", {
+            "Input file": input_path,
+            "Output file": output_path,
+            "Chunk size": f"{self.chunk_size:,}",
+            "Workers": self.n_workers,
+            "Scheduler": "dask" if self.use_dask else ("processes" if self.n_workers > 1 else "serial")
+        })
+
+        processor.hash_manager.record_file_hash(
+            input_path, stage="input", metadata={"description": "Raw CAD export"}
+        )
+
+        corrections = None
+        if self.config['processing']['apply_address_corrections']:
+            corrections = processor.compile_corrections()
+        duplicate_keys = set()
+        if self.config['processing']['detect_duplicates']:
+            duplicate_keys = self.collect_duplicate_keys(input_path, corrections)
+
+        export_audit = self.config['export']['export_audit_trail']
+        audit_path = self.config['paths']['audit_file']
+        processor.audit_trail = AuditStore(
+            run_timestamp=processor.audit_trail.run_timestamp,
+            spill_path=audit_path if export_audit else None
+        )
+
+        state = {
+            'config': self.config,
+            'corrections': corrections,
+            'duplicate_keys': duplicate_keys,
+            'run_timestamp': processor.audit_trail.run_timestamp
+        }
+        config_path = processor.config_path
+
+        writer = _ChunkWriter(output_path, self.config, self.logger, processor._excel_options())
+        # Flagged rows are appended to their own file as chunks complete
+        flagged_writer = None
+        flagged_path = self.config['paths']['manual_review_file']
+        artifact_writer = None
+        artifact_path = self.config['paths'].get('merge_artifact_file')
+        stats = {key: 0 for key in STAT_KEYS}
+        quality = {'score_sum': 0.0, 'high_quality': 0, 'low_quality': 0}
+        patch_hits = {}
+        records_input = 0
+        chunks = iter_input_chunks(input_path, self.chunk_size)
+
+        executor = None
+        if self.n_workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=self.n_workers, initializer=_init_worker, initargs=(config_path, state)
+            )
+        try:
+            first = True
+            while True:
+                window = list(islice(chunks, self.n_workers))
+                if not window:
+                    break
+                records_input += sum(len(chunk) for chunk in window)
+
+                if first and self.config['validation']['validate_schema']:
+                    processor.df = window[0]
+                    processor.validate_schema()
+                    processor.df = None
+                first = False
+
+                for result in self._map_window(executor, config_path, state, window):
+                    writer.write(result['df'])
+                    processor.audit_trail.record_frame(result['audit'])
+                    for key in STAT_KEYS:
+                        stats[key] += result['stats'][key]
+                    for field, hits in result['patch_hits'].items():
+                        stats['corrections_applied'] -= len(hits)
+                        patch_hits[field] = np.union1d(patch_hits.get(field, hits[:0]), hits)
+                    for key in quality:
+                        quality[key] += result['quality'][key]
+                    if self.config['export']['export_flagged_records']:
+                        flagged = result['df'][result['df']['manual_review_flag'] == True]
+                        if len(flagged):
+                            if flagged_writer is None:
+                                flagged_writer = _ChunkWriter(
+                                    flagged_path, self.config, self.logger, processor._excel_options(),
+                                    sheet_name='Sheet1'
+                                )
+                            flagged_writer.write(flagged)
+                        artifacts = result['merge_artifacts']
+                        if artifact_path and artifacts is not None and len(artifacts):
+                            if artifact_writer is None:
+                                artifact_writer = _ChunkWriter(
+                                    artifact_path, self.config, self.logger, processor._excel_options(),
+                                    sheet_name='Merge_Artifacts'
+                                )
+                            artifact_writer.write(artifacts)
+
+                self.logger.info(f"Processed {records_input:,} records")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            writer.close()
+            if flagged_writer is not None:
+                flagged_writer.close()
+            if artifact_writer is not None:
+                artifact_writer.close()
+
+        stats['corrections_applied'] += sum(len(hits) for hits in patch_hits.values())
+        processor.processing_stats.update(stats)
+        processor.processing_stats['records_input'] = records_input
+        total = stats['records_output']
+        processor.quality_metrics = {
+            'average_quality_score': quality['score_sum'] / total if total else 0,
+            'high_quality_pct': quality['high_quality'] / total * 100 if total else 0,
+            'low_quality_pct': quality['low_quality'] / total * 100 if total else 0
+        }
+
+        processor.hash_manager.record_file_hash(
+            output_path,
+            stage="output",
+            metadata={
+                "description": "Corrected CAD data",
+                "records": total,
+                "corrections_applied": stats['corrections_applied']
+            }
+        )
+
+        if export_audit:
+            processor._export_audit_trail()
+
+        if flagged_writer is not None:
+            self.logger.info(f"Flagged records exported: {flagged_writer.rows_written:,} records")
+        if artifact_writer is not None:
+            self.logger.info(f"Merge artifact report exported: {artifact_writer.rows_written:,} records")
+
+        self.logger.info(f"Chunked processing complete: {total:,} records written to {output_path}")
+        processor._log_processing_stats()
+        return processor.processing_stats
+
+
+class _ChunkWriter:
+    """Appends processed chunks to the output file."""
+
+    def __init__(self, output_path: str, config: Dict, logger: logging.Logger, excel_options: Optional[Dict] = None,
+                 sheet_name: str = 'CAD_Data'):
+        self.output_path = str(output_path)
+        self.config = config
+        self.logger = logger
+        self.columns = None
+        self.rows_written = 0
+        self._excel = None
+        Path(self.output_path).parent.mkdir(parents=True, exist_ok=True)
+
+        if self.output_path.endswith('.xlsx'):
+            self._excel = StreamingExcelWriter(self.output_path, sheet_name=sheet_name, **(excel_options or {}))
+        elif not self.output_path.endswith('.csv'):
+            raise ValueError(f"Unsupported output format: {self.output_path}")
+
+    def write(self, df: pd.DataFrame):
+        """Append one processed chunk (columns fixed by the first chunk)."""
+        if self.columns is None:
+            self.columns = list(df.columns)
+        elif list(df.columns) != self.columns:
+            extra = [col for col in df.columns if col not in self.columns]
+            if extra:
+                self.logger.warning(f"Dropping columns not present in first chunk: {', '.join(extra)}")
+            df = df.reindex(columns=self.columns)
+
+        if self._excel is not None:
+            self._excel.write(df)
+            self.rows_written += len(df)
+            return
+
+        csv_config = self.config['export']['csv']
+        first = self.rows_written == 0
+        encoding = csv_config['encoding']
+        if not first and encoding.lower() == 'utf-8-sig':
+            encoding = 'utf-8'  # BOM only at the start of the file
+        df.to_csv(
+            self.output_path,
+            mode='w' if first else 'a',
+            header=first,
+            index=False,
+            encoding=encoding,
+            sep=csv_config['sep']
+        )
+        self.rows_written += len(df)
+
+    def close(self):
+        """Finish writing the output file."""
+        if self._excel is not None:
+            self._excel.close()
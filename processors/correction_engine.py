@@ -0,0 +1,245 @@
+"""
+Correction Engine - Compiled manual-correction patch sets
+
+Compiles the keyed manual correction CSVs (address, disposition,
+How Reported, case number) into a single patch set keyed on
+ReportNumberNew and applies it to a CAD DataFrame with one hash join,
+instead of scanning the full dataset once per correction row.
+"""
+
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import logging
+
+from utils.column_profile import invalidate
+
+
+KEY_FIELD = 'ReportNumberNew'
+
+
+@dataclass(frozen=True)
+class CorrectionSpec:
+    """Describes how one correction CSV maps onto a CAD field."""
+    field: str
+    value_columns: Tuple[str, ...]
+    correction_type: str
+
+
+# Known correction sources. Each CSV must contain ReportNumberNew plus one of
+# the value columns; the first column found wins. The '*_corrected' columns
+# are the framework's format, 'Corrected_Value' is the manual_corrections/
+# review sheet format.
+CORRECTION_SPECS = {
+    'address': CorrectionSpec('FullAddress2', ('FullAddress2_corrected', 'Corrected_Value'), 'manual_address'),
+    'disposition': CorrectionSpec('Disposition', ('Disposition_corrected', 'Corrected_Value'), 'manual_disposition'),
+    'how_reported': CorrectionSpec('How Reported', ('How Reported_corrected', 'Corrected_Value'), 'manual_how_reported'),
+    'case_number': CorrectionSpec(KEY_FIELD, ('ReportNumberNew_corrected', 'Corrected_Value'), 'manual_case_number'),
+}
+
+AUDIT_COLUMNS = ['case_number', 'field', 'old_value', 'new_value', 'correction_type']
+
+
+def normalize_case_key(values: pd.Series) -> pd.Series:
+    """Normalize case numbers for matching (strip whitespace and embedded newlines)."""
+    return (
+        values.astype(str)
+        .str.replace('\r', '', regex=False)
+        .str.replace('\n', '', regex=False)
+        .str.strip()
+    )
+
+
+class CorrectionPatchSet:
+    """
+    Keyed patch set compiled from one or more correction CSVs.
+
+    The patch table is wide: one row per case number, one column per
+    corrected field. Applying it is a single ``Index.get_indexer`` hash
+    join against the CAD case numbers followed by one positional write
+    per field.
+    """
+
+    def __init__(self, patches: pd.DataFrame, correction_types: Dict[str, str],
+                 source_counts: Optional[Dict[str, int]] = None):
+        """
+        Initialize patch set.
+
+        Args:
+            patches: DataFrame indexed by normalized case number, one column per field
+            correction_types: Mapping of field -> audit correction type
+            source_counts: Number of usable corrections loaded per source
+        """
+        self.patches = patches
+        self.correction_types = correction_types
+        self.source_counts = source_counts or {}
+        self.logger = logging.getLogger(__name__)
+
+    def __len__(self) -> int:
+        return int(self.patches.notna().sum().sum())
+
+    @property
+    def fields(self) -> List[str]:
+        return list(self.patches.columns)
+
+    def subset(self, fields: List[str]) -> 'CorrectionPatchSet':
+        """Return a patch set restricted to ``fields``."""
+        fields = [f for f in fields if f in self.patches.columns]
+        patches = self.patches[fields].dropna(how='all')
+        return CorrectionPatchSet(
+            patches,
+            {f: self.correction_types[f] for f in fields},
+            self.source_counts
+        )
+
+    @classmethod
+    def from_files(
+        cls,
+        sources: Dict[str, str],
+        keep: str = 'last',
+        logger: Optional[logging.Logger] = None
+    ) -> 'CorrectionPatchSet':
+        """
+        Compile correction CSVs into a single patch set.
+
+        Args:
+            sources: Mapping of correction name (see CORRECTION_SPECS) -> CSV path
+            keep: Which correction wins when a case number appears more than
+                once in the same file ('first' or 'last')
+            logger: Optional logger (defaults to module logger)
+
+        Returns:
+            Compiled CorrectionPatchSet
+        """
+        logger = logger or logging.getLogger(__name__)
+        columns = {}
+        correction_types = {}
+        source_counts = {}
+
+        for name, path in sources.items():
+            spec = CORRECTION_SPECS.get(name)
+            if spec is None:
+                logger.warning(f"Unknown correction source '{name}' - skipping")
+                continue
+            if not path or not Path(path).exists():
+                logger.warning(f"{name} corrections file not found: {path}")
+                continue
+
+            try:
+                corrections_df = pd.read_csv(path, dtype=str, encoding='utf-8-sig')
+            except Exception as e:
+                logger.error(f"Error reading {name} corrections from {path}: {e}")
+                continue
+
+            value_col = next((c for c in spec.value_columns if c in corrections_df.columns), None)
+            if KEY_FIELD not in corrections_df.columns or value_col is None:
+                logger.error(f"{Path(path).name} missing required columns "
+                             f"({KEY_FIELD} and one of {', '.join(spec.value_columns)})")
+                continue
+
+            keys = normalize_case_key(corrections_df[KEY_FIELD])
+            values = corrections_df[value_col].str.strip()
+            usable = corrections_df[KEY_FIELD].notna() & values.notna() & (values != '')
+
+            series = pd.Series(values[usable].to_numpy(), index=keys[usable].to_numpy(), dtype=object)
+            series = series[~series.index.duplicated(keep=keep)]
+
+            if spec.field in columns:
+                # Later sources override earlier ones for the same field
+                series = series.combine_first(columns[spec.field])
+            columns[spec.field] = series
+            correction_types[spec.field] = spec.correction_type
+            source_counts[name] = len(series)
+            logger.info(f"Compiled {len(series):,} {name} corrections from {Path(path).name}")
+
+        patches = pd.DataFrame(columns) if columns else pd.DataFrame(index=pd.Index([], dtype=object))
+        return cls(patches, correction_types, source_counts)
+
+    def apply(self, df: pd.DataFrame,
+              patch_hits: Optional[Dict[str, np.ndarray]] = None) -> Tuple[Dict[str, int], pd.DataFrame]:
+        """
+        Apply the patch set to ``df`` in place.
+
+        Patches are matched on the row's original case number; rows whose
+        case number is itself corrected also match patches keyed on the
+        corrected number.
+
+        Args:
+            df: CAD DataFrame with a ReportNumberNew column
+            patch_hits: If given, filled with the patch rows applied per field
+                (lets chunked runs count each correction once across chunks)
+
+        Returns:
+            Tuple of (corrections applied per field, audit changes DataFrame)
+        """
+        applied = {}
+        audit_frames = []
+
+        if self.patches.empty or KEY_FIELD not in df.columns or len(df) == 0:
+            return applied, pd.DataFrame(columns=AUDIT_COLUMNS)
+
+        row_keys = normalize_case_key(df[KEY_FIELD]).to_numpy()
+        row_keys = np.where(df[KEY_FIELD].isna().to_numpy(), None, row_keys)
+        positions = self.patches.index.get_indexer(row_keys)
+
+        # Resolve case-number patches first so that other fields may be keyed
+        # on either the original or the corrected case number.
+        field_order = sorted(self.patches.columns, key=lambda f: f != KEY_FIELD)
+        fallback = None
+
+        for field in field_order:
+            patch_values = self.patches[field].to_numpy(dtype=object)
+            field_positions = positions
+            if fallback is not None:
+                # Use the corrected-number patch where the original has none for this field
+                has_original = positions >= 0
+                has_original[has_original] = pd.notna(patch_values[positions[has_original]])
+                field_positions = np.where(has_original, positions, fallback)
+
+            matched_rows = np.flatnonzero(field_positions >= 0)
+            if len(matched_rows) == 0:
+                applied[field] = 0
+                continue
+            new_values = patch_values[field_positions[matched_rows]]
+            has_patch = pd.notna(new_values)
+            matched_rows = matched_rows[has_patch]
+            new_values = new_values[has_patch]
+
+            if field not in df.columns:
+                df[field] = pd.Series(pd.NA, index=df.index, dtype=object)
+            col_idx = df.columns.get_loc(field)
+            old_values = df.iloc[matched_rows, col_idx].to_numpy(dtype=object)
+
+            if isinstance(df[field].dtype, pd.CategoricalDtype):
+                missing = pd.Index(pd.unique(new_values)).difference(df[field].cat.categories)
+                if len(missing):
+                    df[field] = df[field].cat.add_categories(missing)
+            df.iloc[matched_rows, col_idx] = new_values
+            invalidate(df, field)
+            hits = np.unique(field_positions[matched_rows])
+            applied[field] = int(len(hits))
+            if patch_hits is not None:
+                patch_hits[field] = hits
+
+            if field == KEY_FIELD:
+                # Later fields also match patches keyed on the corrected number
+                fallback = self.patches.index.get_indexer(normalize_case_key(df[KEY_FIELD]).to_numpy())
+
+            changed = pd.Series(old_values).astype(str).to_numpy() != new_values.astype(str)
+            if changed.any():
+                audit_frames.append(pd.DataFrame({
+                    'case_number': df.iloc[matched_rows[changed], df.columns.get_loc(KEY_FIELD)].to_numpy(dtype=object)
+                    if field != KEY_FIELD else old_values[changed],
+                    'field': field,
+                    'old_value': pd.Series(old_values[changed]).astype(str).to_numpy(),
+                    'new_value': new_values[changed].astype(str),
+                    'correction_type': self.correction_types.get(field, 'manual')
+                }))
+
+            self.logger.info(f"Applied {applied[field]:,} {field} corrections "
+                             f"({len(matched_rows):,} rows, {int(changed.sum()):,} changed)")
+
+        audit_df = pd.concat(audit_frames, ignore_index=True) if audit_frames else pd.DataFrame(columns=AUDIT_COLUMNS)
+        return applied, audit_df
@@ -6,25 +6,34 @@ import re
 import json
 import glob
 import os
+import sys
+import time
 from datetime import datetime
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from sklearn.model_selection import train_test_split
 from typing import Dict, Any
-import dask.dataframe as dd
-from dask import delayed
-import dask.diagnostics as diagnostics
-import psutil
-from pydantic import BaseModel, ValidationError
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import pytest
+from functools import lru_cache
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.lazy_import import lazy_import
+from utils.text_normalizer import normalize_text, normalize_unique
+from utils.unique_values import factorize_column
+from utils.address_features import address_completeness, count_issues
+from utils.column_profile import invalidate
+from utils.zone_index import ZoneIndex, ZONE_CACHE_DIR
+from utils.reservoir_sampler import StratifiedReservoirSampler
+from utils.datetime_parser import cached_datetimes
+from utils.time_fields import derive_time_fields
+from utils.validation_rules import RuleFrame, RuleSet, VALIDATION_RULES_PATH, load_rule_file
 
 # --- Setup ---
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Only the parallel cleaning path needs dask
+dask = lazy_import('dask')
+
 
 # --- Path expansion helpers ---
 def expand_config_paths(config: dict) -> dict:
@@ -77,6 +86,8 @@ def fix_mojibake(text):
     if pd.isna(text):
         return text
     s = str(text)
+    if s.isascii():
+        return s  # Mis-decoded UTF-8 always contains non-ASCII characters
     try:
         s_round = s.encode("latin1").decode("utf-8")
         s = s_round
@@ -168,72 +179,119 @@ def normalize_incident_key(value: object) -> str:
     return _norm_txt(value)
 
 
-# --- Zone backfill helpers ---
-def merge_zone_data(df: pd.DataFrame, zone_master_path: str) -> pd.DataFrame:
-    """Merge zone/grid data from master lookup into CAD DataFrame.
-
-    Args:
-        df: CAD DataFrame with FullAddress2 column.
-        zone_master_path: Path to zone master Excel file.
+class IncidentRemapper:
+    """Incident key -> (Incident_Norm, Response_Type) lookup compiled from the call-type mapping.
 
-    Returns:
-        DataFrame with PDZone and Grid columns backfilled where possible.
+    Remapping works on the distinct values of the Incident column (the
+    categories of a categorical column) and broadcasts the result through
+    the row codes, so row count, order and index never change. When the
+    mapping repeats a key, its first row wins.
     """
-    try:
-        # Load zone lookup
-        zone_df = pd.read_excel(zone_master_path)
-        zone_df = (
-            zone_df[["CrossStreetName", "Grid", "PDZone"]]
-            .drop_duplicates()
-            .rename(columns={"CrossStreetName": "LookupAddress"})
-        )
 
-        # Address normalization for matching
-        SUFFIX_MAP = {
-            "Street": "St", "Avenue": "Ave", "Road": "Rd", "Place": "Pl",
-            "Drive": "Dr", "Court": "Ct", "Boulevard": "Blvd"
-        }
+    def __init__(self, mapping: pd.DataFrame):
+        self.lookup: Dict[str, tuple] = {}
+        if not mapping.empty:
+            for key, norm, response in zip(mapping['Incident_key'], mapping['Incident_Norm'], mapping['Response_Type']):
+                self.lookup.setdefault(key, (norm, response))
+
+    def __len__(self):
+        return len(self.lookup)
+
+    def _resolve(self, value) -> tuple:
+        return self.lookup.get(normalize_incident_key(value), (np.nan, np.nan))
+
+    def remap(
+        self,
+        incidents: pd.Series,
+        response: pd.Series | None,
+        unmapped: set,
+        prefer_mapped_response: bool = False
+    ) -> tuple[pd.Series, pd.Series, int]:
+        """Remap incidents and backfill response types.
+
+        Each incident is looked up by its normalized key and replaced with its
+        Incident_Norm; the normalized value is then looked up again and its
+        response type fills blank responses. With ``prefer_mapped_response``
+        a first lookup replaces the incident and its response type wins over
+        the existing response before that second lookup (the cleaning path).
 
-        def normalize_address_for_zone(addr):
-            """Normalize address for zone lookup matching."""
-            if pd.isna(addr):
-                return addr
-            s = str(addr).replace(" & ", " / ")
-            for full, abbr in SUFFIX_MAP.items():
-                s = re.sub(rf"\b{full}\b", abbr, s, flags=re.IGNORECASE)
-            return s.title().strip()
-
-        # Create normalized lookup column
-        df["_CleanAddress"] = df["FullAddress2"].apply(normalize_address_for_zone)
-        zone_df["LookupAddress"] = zone_df["LookupAddress"].apply(normalize_address_for_zone)
-
-        # Merge in zone/grid data (only backfill where null)
-        merged = df.merge(
-            zone_df,
-            left_on="_CleanAddress",
-            right_on="LookupAddress",
-            how="left",
-            suffixes=('', '_zone')
-        )
+        Args:
+            incidents (pd.Series): Incident column (object or categorical).
+            response (pd.Series | None): Existing Response Type column.
+            unmapped (set): Receives incidents without a mapping.
+            prefer_mapped_response (bool): Apply the overriding first lookup.
 
-        # Backfill PDZone and Grid where null
-        if 'PDZone' not in df.columns:
-            merged['PDZone'] = merged['PDZone_zone']
+        Returns:
+            tuple: (remapped incidents, response types, rows changed by the first lookup)
+        """
+        codes, uniques = factorize_column(incidents)
+        values = list(uniques) + [np.nan]
+        final = np.empty(len(values), dtype=object)
+        first_response = np.full(len(values), np.nan, dtype=object)
+        backfill_response = np.empty(len(values), dtype=object)
+        first_mapped = np.zeros(len(values), dtype=bool)
+
+        for i, value in enumerate(values):
+            if prefer_mapped_response:
+                norm, first_response[i] = self._resolve(value)
+                first_mapped[i] = pd.notna(norm)
+                if not first_mapped[i] and pd.notna(value):
+                    unmapped.add(value)
+                value = norm if first_mapped[i] else value
+            norm, backfill_response[i] = self._resolve(value)
+            if pd.isna(norm) and pd.notna(value):
+                unmapped.add(value)
+            final[i] = norm if pd.notna(norm) else value
+
+        if isinstance(incidents.dtype, pd.CategoricalDtype):
+            # Remap the categories; rows keep their position through the codes
+            category_codes, categories = pd.factorize(final)
+            remapped = pd.Series(
+                pd.Categorical.from_codes(category_codes[codes], categories),
+                index=incidents.index, name=incidents.name
+            )
         else:
-            merged['PDZone'] = merged['PDZone'].fillna(merged['PDZone_zone'])
+            result = final[codes]
+            missing = codes < 0
+            if missing.any() and pd.isna(final[-1]):
+                # Unmapped missing values stay as they were (None stays None)
+                result[missing] = incidents.to_numpy(dtype=object)[missing]
+            remapped = pd.Series(result, index=incidents.index, name=incidents.name)
+
+        if response is None:
+            response = pd.Series(pd.NA, index=incidents.index, dtype=object)
+        elif isinstance(response.dtype, pd.CategoricalDtype):
+            response = response.astype(object)
+        if prefer_mapped_response:
+            first = first_response[codes]
+            response = response.where(pd.isna(first), first)
+        response_codes, response_values = factorize_column(response)
+        blank_values = np.array([str(value).strip() == '' for value in response_values], dtype=bool)
+        blank = np.append(blank_values, True)[response_codes]
+        response = response.where(~blank, backfill_response[codes])
+        return remapped, response, int(first_mapped[codes].sum())
 
-        if 'Grid' not in df.columns:
-            merged['Grid'] = merged['Grid_zone']
-        else:
-            merged['Grid'] = merged['Grid'].fillna(merged['Grid_zone'])
 
-        # Drop temporary columns
-        merged = merged.drop(columns=['_CleanAddress', 'LookupAddress', 'PDZone_zone', 'Grid_zone'], errors='ignore')
+# --- Zone backfill helpers ---
+def merge_zone_data(df: pd.DataFrame, zone_master_path: str, cache_dir=ZONE_CACHE_DIR) -> pd.DataFrame:
+    """Backfill zone/grid data from the master lookup into the CAD DataFrame.
+
+    Uses the persisted zone index (rebuilt only when the zone master changes)
+    and fills missing PDZone/Grid in place.
 
-        backfilled = (df['PDZone'].isna() if 'PDZone' in df.columns else pd.Series([True]*len(df))) & merged['PDZone'].notna()
-        logger.info(f"Zone backfill: {backfilled.sum():,} records updated")
+    Args:
+        df: CAD DataFrame with FullAddress2 column.
+        zone_master_path: Path to zone master Excel file.
+        cache_dir: Directory for the persisted zone index (None disables caching).
 
-        return merged
+    Returns:
+        DataFrame with PDZone and Grid columns backfilled where possible.
+    """
+    try:
+        index = ZoneIndex.load(zone_master_path, cache_dir=cache_dir)
+        backfilled = index.backfill(df, "FullAddress2")
+        logger.info(f"Zone backfill: {backfilled:,} records updated")
+        return df
 
     except FileNotFoundError:
         logger.warning(f"Zone master file not found: {zone_master_path}")
@@ -243,43 +301,54 @@ def merge_zone_data(df: pd.DataFrame, zone_master_path: str) -> pd.DataFrame:
         return df
 
 
-def _clean_partition(part, config, incident_mapping):
+def _clean_partition(part: pd.DataFrame, validator: "CADDataValidator") -> pd.DataFrame:
     """Clean a single partition of the DataFrame.
 
+    Runs the full serial cleaning logic on one row slice; module-level so it
+    can be shipped to worker processes.
+
     Args:
         part (pd.DataFrame): DataFrame partition to clean.
-        config (dict): Configuration dictionary.
-        incident_mapping (pd.DataFrame): Incident mapping DataFrame.
+        validator (CADDataValidator): Validator carrying config, incident mapping and corrections.
+
+    Returns:
+        pd.DataFrame: Cleaned partition with modification stats in attrs['stats'].
+    """
+    return validator._clean_frame(part)
+
+
+def _merge_partition_stats(stats: list[dict]) -> dict:
+    """Combine per-partition cleaning stats.
+
+    Args:
+        stats (list[dict]): attrs['stats'] of each cleaned partition.
 
     Returns:
-        pd.DataFrame: Cleaned partition with modification stats in attrs.
+        dict: Summed rows_modified and the union of unmapped_incidents.
     """
-    part = part.copy()
-    stats = {'rows_modified': 0}
-    for col in ['Incident', 'How Reported', 'Response Type', 'Disposition', 'Officer']:
-        if col in part.columns:
-            original = part[col].copy()
-            part[col] = part[col].astype(str).str.upper().str.strip()
-            stats['rows_modified'] += (part[col] != original).sum()
-    if 'FullAddress2' in part.columns:
-        original = part['FullAddress2'].copy()
-        abbreviations = config.get('address_abbreviations', {})
-        for abbr, full in abbreviations.items():
-            part['FullAddress2'] = part['FullAddress2'].astype(str).str.replace(abbr, full, case=False, regex=True)
-        part['FullAddress2'] = part['FullAddress2'].str.upper()
-        stats['rows_modified'] += (part['FullAddress2'] != original).sum()
-    if 'Incident' in part.columns and not incident_mapping.empty:
-        part = part.merge(incident_mapping, on='Incident', how='left')
-        part['Incident'] = part['Incident_Norm'].fillna(part['Incident'])
-        part['Response Type'] = part['Response Type_x'].fillna(part['Response Type_y'])
-        stats['rows_modified'] += part['Incident_Norm'].notna().sum()
-    part.attrs['stats'] = stats
-    return part
-
-class ConfigSchema(BaseModel):
-    """Pydantic schema for validating configuration."""
-    address_abbreviations: Dict[str, str]
-    validation_lists: Dict[str, list[str]]
+    merged = {'rows_modified': 0, 'unmapped_incidents': set()}
+    for part_stats in stats:
+        merged['rows_modified'] += int(part_stats.get('rows_modified', 0))
+        merged['unmapped_incidents'].update(part_stats.get('unmapped_incidents', ()))
+    return merged
+
+
+@lru_cache(maxsize=None)
+def _config_schema():
+    """Pydantic schema for validating configuration, built on first use (None without pydantic)."""
+    try:
+        from pydantic import BaseModel
+    except ImportError:
+        logger.warning("pydantic not installed; skipping config schema validation.")
+        return None
+
+    class ConfigSchema(BaseModel):
+        """Pydantic schema for validating configuration."""
+        address_abbreviations: Dict[str, str]
+        validation_lists: Dict[str, list[str]]
+
+    return ConfigSchema
+
 
 class CADDataValidator:
     """A robust class for cleaning, validating, and analyzing CAD data with parallel processing.
@@ -303,9 +372,11 @@ class CADDataValidator:
         self.config = self._load_config(config_path)
         self.incident_mapping = self._load_incident_mapping()
         self.validation_rules = self._initialize_validation_rules()
+        self.rule_set = self._compile_rule_set()
         self.sampling_config = {
             'stratified_sample_size': 1000,
             'systematic_interval': 100,
+            'sample_chunk_rows': 100_000,
             'quality_thresholds': {'critical': 0.95, 'important': 0.85, 'optional': 0.70}
         }
         self.validation_results = {
@@ -359,9 +430,9 @@ class CADDataValidator:
             return default_config
 
         try:
-            if "ConfigSchema" in globals():
-                from pydantic import ValidationError  # type: ignore
-                ConfigSchema(**cfg)  # type: ignore[name-defined]
+            config_schema = _config_schema()
+            if config_schema is not None:
+                config_schema(**cfg)
         except Exception as e:
             logger.error(f"Invalid config schema: {e}. Using defaults.")
             return default_config
@@ -388,6 +459,7 @@ class CADDataValidator:
         self.config = self._load_config(path)
         self.config_path = path
         self.validation_rules = self._initialize_validation_rules()
+        self.rule_set = self._compile_rule_set()
         # Reload any config-dependent lookups
         self.fulladdress2_corrections = self._load_fulladdress2_corrections()
         return self.config
@@ -495,11 +567,17 @@ class CADDataValidator:
         logger.warning("Incident mapping file not found in any expected location. Using empty mapping.")
         return pd.DataFrame(columns=['Incident', 'Incident_Norm', 'Response_Type', 'Incident_key'])
 
-    def clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
+    def clean_data(self, df: pd.DataFrame, workers: int = 1, partition_rows: int | None = None) -> pd.DataFrame:
         """Apply cleaning operations to the DataFrame.
 
+        With ``workers > 1`` the frame is split into row partitions that are
+        cleaned on a local process pool (Dask processes scheduler) and
+        concatenated in order; the result is identical to the serial path.
+
         Args:
             df (pd.DataFrame): Input DataFrame to clean.
+            workers (int): Number of worker processes. Defaults to 1 (serial).
+            partition_rows (int | None): Rows per partition. Defaults to an even split across workers.
 
         Returns:
             pd.DataFrame: Cleaned DataFrame with standardized text and addresses.
@@ -509,7 +587,40 @@ class CADDataValidator:
             return df
         logger.info("Starting data cleaning process...")
 
+        if workers > 1 and len(df) > 1:
+            partition_rows = partition_rows or -(-len(df) // workers)
+            parts = [df.iloc[start:start + partition_rows] for start in range(0, len(df), partition_rows)]
+        else:
+            parts = [df]
+
+        if len(parts) == 1:
+            cleaned_df = _clean_partition(df, self)
+            stats = cleaned_df.attrs['stats']
+        else:
+            logger.info(f"Cleaning {len(parts)} partitions of up to {partition_rows:,} rows on {workers} workers...")
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                tasks = [dask.delayed(_clean_partition)(part, self) for part in parts]
+                cleaned_parts = list(dask.compute(*tasks, scheduler='processes', pool=executor))
+            stats = _merge_partition_stats([part.attrs.get('stats', {}) for part in cleaned_parts])
+            # Cleaning keeps each partition's rows and index, so the parts line up in order
+            cleaned_df = pd.concat(cleaned_parts)
+            cleaned_df.attrs['stats'] = stats
+
+        self.unmapped_incidents.update(stats['unmapped_incidents'])
+        logger.info(f"Cleaned {stats['rows_modified']:,} rows in total.")
+        return cleaned_df
+
+    def _clean_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Run the cleaning steps on one frame (or partition) without touching validator state.
+
+        Args:
+            df (pd.DataFrame): Input DataFrame (or row partition) to clean.
+
+        Returns:
+            pd.DataFrame: Cleaned frame; attrs['stats'] holds rows_modified and unmapped_incidents.
+        """
         cleaned_df = df.copy()
+        unmapped = set()
         total_modified = 0
 
         # Apply manual FullAddress2 corrections before generic normalization
@@ -517,33 +628,45 @@ class CADDataValidator:
             updated_count = self._apply_fulladdress2_corrections(cleaned_df)
             total_modified += updated_count
 
+        # Text normalization runs once per distinct value (mojibake repair only
+        # for non-ASCII text) and is broadcast back to the rows
         def _normalize_text(value, uppercase: bool = True):
-            if pd.isna(value):
-                return value
-            text = fix_mojibake(str(value)).strip()
-            text = re.sub(r'\s+', ' ', text)
-            return text.upper() if uppercase else text
+            return normalize_text(value, uppercase=uppercase, fix=fix_mojibake)
         
         # Clean text fields
         for col in ['Incident', 'How Reported', 'Response Type', 'Disposition', 'Officer', 'CADNotes']:
             if col in cleaned_df.columns:
                 original = cleaned_df[col].copy()
                 uppercase = col not in {'Incident'}
-                cleaned_df[col] = cleaned_df[col].apply(lambda v: _normalize_text(v, uppercase=uppercase))
+                cleaned_df[col] = normalize_unique(cleaned_df[col], lambda v: _normalize_text(v, uppercase=uppercase))
                 total_modified += (cleaned_df[col] != original).sum()
 
         if 'How Reported' in cleaned_df.columns:
             original = cleaned_df['How Reported'].copy()
-            cleaned_df['How Reported'] = cleaned_df['How Reported'].apply(normalize_how_reported_value)
+            cleaned_df['How Reported'] = normalize_unique(
+                cleaned_df['How Reported'], normalize_how_reported_value, apply_missing=True
+            )
             total_modified += (cleaned_df['How Reported'] != original).sum()
         
         # Clean addresses
         if 'FullAddress2' in cleaned_df.columns:
             original = cleaned_df['FullAddress2'].copy()
-            abbreviations = self.config.get('address_abbreviations', {})
-            for abbr, full in abbreviations.items():
-                cleaned_df['FullAddress2'] = cleaned_df['FullAddress2'].astype(str).str.replace(abbr, full, case=False, regex=True)
-            cleaned_df['FullAddress2'] = cleaned_df['FullAddress2'].apply(_normalize_text)
+            abbreviations = [
+                (re.compile(abbr, flags=re.IGNORECASE), full)
+                for abbr, full in self.config.get('address_abbreviations', {}).items()
+            ]
+
+            def _expand_address(value):
+                # Same as chaining astype(str).str.replace(abbr, full, case=False, regex=True)
+                text = str(value)
+                for pattern, full in abbreviations:
+                    text = pattern.sub(full, text)
+                return _normalize_text(text)
+
+            if abbreviations:
+                cleaned_df['FullAddress2'] = normalize_unique(cleaned_df['FullAddress2'], _expand_address, apply_missing=True)
+            else:
+                cleaned_df['FullAddress2'] = normalize_unique(cleaned_df['FullAddress2'], _normalize_text)
             total_modified += (cleaned_df['FullAddress2'] != original).sum()
 
         # Backfill zone data from master lookup
@@ -555,31 +678,13 @@ class CADDataValidator:
             else:
                 logger.warning(f"Zone master file not found: {zone_master_path}")
 
-        # Apply incident mapping
-        if 'Incident' in cleaned_df.columns and not self.incident_mapping.empty:
-            cleaned_df['Incident_key'] = cleaned_df['Incident'].apply(normalize_incident_key)
-            cleaned_df = cleaned_df.merge(
-                self.incident_mapping,
-                on='Incident_key',
-                how='left',
-                suffixes=('', '_mapping')
-            )
-            original_incidents = cleaned_df['Incident'].copy()
-            normalized = cleaned_df['Incident_Norm']
-            unmapped_mask = normalized.isna() & original_incidents.notna()
-            if unmapped_mask.any():
-                self.unmapped_incidents.update(original_incidents.loc[unmapped_mask].dropna().unique().tolist())
-            cleaned_df['Incident'] = normalized.fillna(original_incidents)
-            if 'Response_Type' in cleaned_df.columns:
-                cleaned_df['Response Type'] = cleaned_df['Response_Type'].fillna(cleaned_df.get('Response Type'))
-            if 'Response Type_mapping' in cleaned_df.columns:
-                cleaned_df['Response Type'] = cleaned_df['Response Type_mapping'].fillna(cleaned_df['Response Type'])
-            total_modified += cleaned_df['Incident_Norm'].notna().sum()
-            drop_cols = [c for c in ['Incident_Norm', 'Response_Type', 'Response Type_mapping', 'Incident_key'] if c in cleaned_df.columns]
-            cleaned_df = cleaned_df.drop(columns=drop_cols)
-        
-        logger.info(f"Cleaned {total_modified:,} rows in total.")
-        return self._apply_incident_mapping(cleaned_df)
+        # Apply incident mapping (mapped response types win, then blanks are backfilled)
+        cleaned_df, mapped_rows = self._apply_incident_mapping(
+            cleaned_df, unmapped=unmapped, prefer_mapped_response=True, return_count=True
+        )
+        total_modified += mapped_rows
+        cleaned_df.attrs['stats'] = {'rows_modified': int(total_modified), 'unmapped_incidents': unmapped}
+        return cleaned_df
 
     def _apply_fulladdress2_corrections(self, df: pd.DataFrame) -> int:
         """Apply manual FullAddress2 corrections from the loaded rules.
@@ -615,58 +720,73 @@ class CADDataValidator:
             updated_total += affected
 
         if updated_total:
+            invalidate(df, 'FullAddress2')
             logger.info("Applied FullAddress2 corrections to %d records", updated_total)
         return updated_total
 
-    def _apply_incident_mapping(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Apply incident normalization and response-type backfill."""
+    def _incident_remapper(self) -> IncidentRemapper:
+        """Compiled lookup for ``self.incident_mapping`` (rebuilt when the mapping is replaced)."""
+        if getattr(self, '_remapper_source', None) is not self.incident_mapping:
+            self._remapper = IncidentRemapper(self.incident_mapping)
+            self._remapper_source = self.incident_mapping
+        return self._remapper
+
+    def _apply_incident_mapping(
+        self,
+        df: pd.DataFrame,
+        unmapped: set | None = None,
+        prefer_mapped_response: bool = False,
+        return_count: bool = False
+    ):
+        """Apply incident normalization and response-type backfill.
+
+        Unmapped incidents are collected into ``unmapped`` (defaults to
+        ``self.unmapped_incidents``). Rows are never added, dropped or
+        reordered.
+
+        Args:
+            df (pd.DataFrame): Frame with an Incident column.
+            unmapped (set | None): Receives incidents without a mapping.
+            prefer_mapped_response (bool): Let the mapped response type replace
+                existing values before blanks are backfilled (cleaning path).
+            return_count (bool): Also return the number of remapped rows.
+
+        Returns:
+            pd.DataFrame: Remapped frame (with the remapped row count if ``return_count``).
+        """
+        if unmapped is None:
+            unmapped = self.unmapped_incidents
+        mapped_rows = 0
         if df.empty or 'Incident' not in df.columns:
             if 'Incident_Norm' not in df.columns:
                 df['Incident_Norm'] = df.get('Incident', pd.Series([], dtype=object))
-            return df
+            return (df, mapped_rows) if return_count else df
 
         df = df.copy()
-        df['Incident_key'] = df['Incident'].apply(normalize_incident_key)
-
-        if self.incident_mapping.empty:
+        remapper = self._incident_remapper()
+        if not len(remapper):
             df['Incident_Norm'] = df['Incident']
-            df.drop(columns=['Incident_key'], inplace=True, errors='ignore')
-            return df
-
-        mapping = self.incident_mapping[['Incident_key', 'Incident_Norm', 'Response_Type']].rename(
-            columns={
-                'Incident_Norm': '__Incident_Norm_map',
-                'Response_Type': '__Response_Type_map'
-            }
-        )
-
-        df = df.merge(mapping, on='Incident_key', how='left')
-
-        mapped_incident = df['__Incident_Norm_map']
-        original_incident = df['Incident']
-        unmapped_mask = mapped_incident.isna() & original_incident.notna()
-        if unmapped_mask.any():
-            self.unmapped_incidents.update(original_incident.loc[unmapped_mask].dropna().unique().tolist())
-
-        df.loc[~mapped_incident.isna(), 'Incident'] = mapped_incident.dropna()
-        df['Incident_Norm'] = df['Incident']
-
-        if 'Response Type' not in df.columns:
-            df['Response Type'] = pd.NA
-
-        if '__Response_Type_map' in df.columns:
-            mask = df['Response Type'].isna() | (df['Response Type'].astype(str).str.strip() == '')
-            df.loc[mask, 'Response Type'] = df.loc[mask, '__Response_Type_map']
-
-        df.drop(columns=['Incident_key', '__Incident_Norm_map', '__Response_Type_map'], inplace=True, errors='ignore')
-        return df
-
-    def validate_cad_dataset(self, df: pd.DataFrame, sampling_method: str = 'stratified') -> dict:
+        else:
+            df['Incident'], df['Response Type'], mapped_rows = remapper.remap(
+                df['Incident'], df.get('Response Type'), unmapped, prefer_mapped_response
+            )
+            df['Incident_Norm'] = df['Incident']
+        return (df, mapped_rows) if return_count else df
+
+    def validate_cad_dataset(
+        self,
+        df: pd.DataFrame,
+        sampling_method: str = 'stratified',
+        workers: int = 1,
+        partition_rows: int | None = None
+    ) -> dict:
         """Validate CAD dataset with cleaning and sampling.
 
         Args:
             df (pd.DataFrame): Input DataFrame to validate.
             sampling_method (str): Sampling method ('stratified', 'systematic', 'random'). Defaults to 'stratified'.
+            workers (int): Worker processes for cleaning. Defaults to 1 (serial).
+            partition_rows (int | None): Rows per cleaning partition. Defaults to an even split.
 
         Returns:
             dict: Validation results including quality score and recommendations.
@@ -676,7 +796,7 @@ class CADDataValidator:
 
         self.unmapped_incidents = set()
         self.address_issue_summary = Counter()
-        cleaned_df = self.clean_data(df)
+        cleaned_df = self.clean_data(df, workers=workers, partition_rows=partition_rows)
         logger.info(f"Starting CAD dataset validation with {sampling_method} sampling...")
         self.validation_results['total_records'] = len(cleaned_df)
         if self.current_dataset_label:
@@ -691,8 +811,7 @@ class CADDataValidator:
 
         self._export_sample(sample_df)
 
-        sample_results = self._validate_sample(sample_df)
-        full_results = self._extrapolate_results(sample_results, cleaned_df)
+        full_results = self._validate_full(cleaned_df)
         recommendations = self._generate_validation_recommendations(full_results)
 
         self.validation_results.update(full_results)
@@ -724,35 +843,27 @@ class CADDataValidator:
             raise ValueError(f"Unknown sampling method: {method}")
 
     def _stratified_sampling(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Create a stratified sample using incident-based strata only."""
+        """Create a stratified sample using incident-based strata only.
+
+        Rows are streamed through a seeded stratified reservoir sampler in
+        chunks, so the frame is never copied; incidents seen more than 50
+        times form their own stratum and the rest share 'Other'.
+        """
         logger.info("Creating stratified sample...")
-        df_with_strata = df.copy()
-
-        if 'Incident' in df.columns:
-            incident_counts = df['Incident'].value_counts()
-            top_incidents = incident_counts[incident_counts > 50].index
-            df_with_strata['incident_stratum'] = df_with_strata['Incident'].apply(
-                lambda x: x if x in top_incidents else 'Other')
-            unique_strata = df_with_strata['incident_stratum'].nunique()
-            logger.info("Using %d incident strata (min size > 50).", unique_strata)
-        else:
+        if 'Incident' not in df.columns:
             logger.warning("Incident column missing; assigning all records to 'Unknown' stratum.")
-            df_with_strata['incident_stratum'] = 'Unknown'
 
         sample_size = min(self.sampling_config['stratified_sample_size'], len(df))
 
         try:
-            sample_df, _ = train_test_split(
-                df_with_strata, test_size=1 - (sample_size / len(df)),
-                stratify=df_with_strata[['incident_stratum']],
-                random_state=42
-            )
+            sampler = StratifiedReservoirSampler(sample_size, stratum_column='Incident', min_stratum_size=50, seed=42)
+            sampler.update_frame(df, self.sampling_config.get('sample_chunk_rows', 100_000))
+            sample_df = sampler.sample()
+            stratum_dist = sample_df.attrs['stratum_distribution']
+            if 'Incident' in df.columns:
+                logger.info("Using %d incident strata (min size > 50).", len(stratum_dist))
             logger.info("Created stratified sample (incident_stratum): %s records", f"{len(sample_df):,}")
-
-            stratum_dist = df_with_strata['incident_stratum'].value_counts().to_dict()
             logger.info("Stratum distribution: %s", stratum_dist)
-            sample_df.attrs['stratum_distribution'] = stratum_dist
-            sample_df.attrs['stratification_method'] = 'incident_stratum'
 
         except Exception as e:
             logger.warning(f"Stratified sampling failed: {e}. Falling back to random.")
@@ -786,18 +897,22 @@ class CADDataValidator:
         esri_df['PDZone'] = pd.to_numeric(get_series('PDZone'), errors='coerce')
         esri_df['Grid'] = get_series('Grid')
 
-        time_of_call = pd.to_datetime(get_series('Time of Call'), errors='coerce')
+        def get_datetimes(column):
+            # Parsed once per frame and shared with the validation rules
+            return cached_datetimes(df, column)
+
+        time_of_call = get_datetimes('Time of Call')
         esri_df['Time of Call'] = time_of_call
-        esri_df['cYear'] = pd.to_numeric(get_series('cYear'), errors='coerce')
-        esri_df['cMonth'] = get_series('cMonth')
-        if len(time_of_call) > 0:
-            esri_df['Hour_Calc'] = time_of_call.dt.hour.astype('float64')
-        else:
-            esri_df['Hour_Calc'] = pd.Series(dtype='float64')
-        esri_df['DayofWeek'] = get_series('DayofWeek')
-        esri_df['Time Dispatched'] = pd.to_datetime(get_series('Time Dispatched'), errors='coerce')
-        esri_df['Time Out'] = pd.to_datetime(get_series('Time Out'), errors='coerce')
-        esri_df['Time In'] = pd.to_datetime(get_series('Time In'), errors='coerce')
+        # Derived from Time of Call where it parsed; the source columns fill the rest
+        derived = derive_time_fields(time_of_call)
+        valid = derived.valid
+        esri_df['cYear'] = pd.to_numeric(get_series('cYear'), errors='coerce').mask(valid, derived.year)
+        esri_df['cMonth'] = get_series('cMonth').mask(valid, derived.cmonth().astype(object))
+        esri_df['Hour_Calc'] = derived.hour()
+        esri_df['DayofWeek'] = get_series('DayofWeek').mask(valid, derived.day_of_week().astype(object))
+        esri_df['Time Dispatched'] = get_datetimes('Time Dispatched')
+        esri_df['Time Out'] = get_datetimes('Time Out')
+        esri_df['Time In'] = get_datetimes('Time In')
 
         time_spent = get_series('Time Spent')
         esri_df['Time Spent'] = time_spent.apply(lambda x: None if pd.isna(x) else str(x))
@@ -917,6 +1032,15 @@ class CADDataValidator:
         except:
             return 'Unknown'
 
+    # Rule id -> handler; every handler takes (df, result, ctx)
+    # Rules declared without a 'check' in the rule file are evaluated in Python
+    RULE_HANDLERS = {
+        'CRIT_002': '_validate_case_number_uniqueness',
+        'IMP_001': '_validate_address_completeness',
+        'OPT_001': '_validate_how_reported',
+        'OPT_003': '_validate_response_type_consistency',
+    }
+
     def _validate_sample(self, sample_df: pd.DataFrame) -> dict:
         """Run validation rules on sample.
 
@@ -927,16 +1051,56 @@ class CADDataValidator:
             dict: Validation results for each rule category.
         """
         logger.info("Running validation rules on sample...")
+        return self._run_validation_rules(sample_df)
+
+    def _validate_full(self, df: pd.DataFrame) -> dict:
+        """Run all validation rules on the entire dataset in one fused pass.
+
+        Args:
+            df (pd.DataFrame): Full DataFrame to validate.
+
+        Returns:
+            dict: Exact results in the ``_extrapolate_results`` schema (estimates equal actual counts),
+                plus per-rule run times in 'rule_timings'.
+        """
+        logger.info(f"Running validation rules on all {len(df):,} records...")
+        rule_results = self._run_validation_rules(df)
+        full_results = self._extrapolate_results(rule_results, df)
+        full_results['validation_scope'] = 'full_population'
+        full_results['rule_timings'] = rule_results['rule_timings']
+        slowest = ", ".join(f"{rule_id} {seconds:.3f}s" for rule_id, seconds in list(rule_results['rule_timings'].items())[:3])
+        logger.info(f"Slowest validation rules: {slowest}")
+        return full_results
+
+    def _run_validation_rules(self, df: pd.DataFrame) -> dict:
+        """Evaluate every rule against ``df``, sharing parsed intermediates between rules.
+
+        Declarative rules run first, grouped by the columns they read; rules
+        implemented in Python run after them on the same shared intermediates.
+
+        Args:
+            df (pd.DataFrame): DataFrame to validate.
+
+        Returns:
+            dict: Validation results for each rule category, plus 'rule_timings'
+                (rule name -> seconds, slowest first).
+        """
         results = {
             'critical_rules': {},
             'important_rules': {},
             'optional_rules': {},
-            'sample_size': len(sample_df)
+            'sample_size': len(df)
         }
 
+        ctx = RuleFrame(df)
+        outcomes = self.rule_set.evaluate(df, frame=ctx, lists=self.config['validation_lists'])
+        timings = {}
         for category, rules in self.validation_rules.items():
             for rule_id, rule in rules.items():
-                result = self._apply_validation_rule(sample_df, rule)
+                start = time.perf_counter()
+                outcome = outcomes.get(rule['rule_id'])
+                result = self._apply_validation_rule(df, rule, ctx, outcome=outcome)
+                timings[rule_id] = time.perf_counter() - start + (outcome.elapsed if outcome else 0.0)
                 result.update({
                     'rule_id': rule_id,
                     'description': rule['description'],
@@ -945,14 +1109,23 @@ class CADDataValidator:
                 })
                 results[category][rule_id] = result
 
+        results['rule_timings'] = dict(sorted(timings.items(), key=lambda item: item[1], reverse=True))
         return results
 
-    def _apply_validation_rule(self, df: pd.DataFrame, rule: dict) -> dict:
+    def _apply_validation_rule(
+        self,
+        df: pd.DataFrame,
+        rule: dict,
+        ctx: RuleFrame | None = None,
+        outcome=None
+    ) -> dict:
         """Apply a single validation rule to a DataFrame partition.
 
         Args:
             df (pd.DataFrame): DataFrame partition to validate.
             rule (dict): Validation rule configuration.
+            ctx (RuleFrame | None): Shared intermediates for ``df``.
+            outcome (RuleOutcome | None): Already evaluated result of a declarative rule.
 
         Returns:
             dict: Validation result for the rule.
@@ -970,312 +1143,250 @@ class CADDataValidator:
             result.update({'error': f"Missing fields: {missing_fields}", 'failed': len(df)})
             return result
 
-        if rule_id == 'CRIT_001': result = self._validate_case_number_format(df, result)
-        elif rule_id == 'CRIT_002': result = self._validate_case_number_uniqueness(df, result)
-        elif rule_id == 'CRIT_003': result = self._validate_call_datetime(df, result)
-        elif rule_id == 'CRIT_004': result = self._validate_incident_type_presence(df, result)
-        elif rule_id == 'IMP_001': result = self._validate_address_completeness(df, result)
-        elif rule_id == 'IMP_002': result = self._validate_officer_assignment(df, result)
-        elif rule_id == 'IMP_003': result = self._validate_disposition_consistency(df, result)
-        elif rule_id == 'IMP_004': result = self._validate_time_sequence(df, result)
-        elif rule_id == 'IMP_005': result = self._validate_datetime_duration(df, result)
-        elif rule_id == 'IMP_006': result = self._validate_time_spent(df, result)
-        elif rule_id == 'OPT_001': result = self._validate_how_reported(df, result)
-        elif rule_id == 'OPT_002': result = self._validate_zone_validity(df, result)
-        elif rule_id == 'OPT_003': result = self._validate_response_type_consistency(df, result)
-        
+        if rule_id in self.rule_set:
+            result = self._apply_check(rule_id, df, result, ctx, outcome)
+        else:
+            handler = self.RULE_HANDLERS.get(rule_id)
+            if handler is not None:
+                result = getattr(self, handler)(df, result, ctx)
+
         result['pass_rate'] = result['passed'] / result['sample_size'] if result['sample_size'] > 0 else 0.0
         return result
 
-    def _validate_case_number_format(self, df: pd.DataFrame, result: dict) -> dict:
-        """Validate case number format (YY-XXXXXX or YY-XXXXXX[A-Z] for supplements).
+    def _apply_check(
+        self,
+        rule_id: str,
+        df: pd.DataFrame,
+        result: dict,
+        ctx: RuleFrame | None = None,
+        outcome=None
+    ) -> dict:
+        """Fill a rule result from its compiled declarative check.
+
+        Single-column rules report the most common failing values; rules over
+        several columns report the first failing rows.
 
         Args:
+            rule_id (str): Rule to evaluate.
             df (pd.DataFrame): DataFrame partition to validate.
             result (dict): Initial result dictionary.
+            ctx (RuleFrame | None): Shared intermediates for ``df``.
+            outcome (RuleOutcome | None): Already evaluated result, if any.
 
         Returns:
             dict: Updated result with pass/fail counts and failed records.
         """
-        field, pattern = 'ReportNumberNew', r'^\d{2,4}-\d{6}[A-Z]?$'
-        valid = df[field].astype(str).str.match(pattern, na=False)
+        if outcome is None:
+            outcome = self.rule_set.evaluate(
+                df, frame=ctx, lists=self.config['validation_lists'], rule_ids=[rule_id]
+            )[rule_id]
+        if outcome.valid is None:
+            result.update({'passed': 0, 'failed': len(df), 'failed_records': {}, 'error': outcome.error})
+            return result
+
+        valid = outcome.valid
         result.update({'passed': valid.sum(), 'failed': (~valid).sum()})
-        result['failed_records'] = df[~valid][field].value_counts().head(10).to_dict()
+        columns = list(outcome.rule.columns)
+        if len(columns) == 1:
+            result['failed_records'] = df[~valid][columns[0]].value_counts().head(10).to_dict()
+        elif (~valid).any():
+            result['failed_records'] = df[~valid][columns].head(10).to_dict(orient='records')
         return result
 
-    def _validate_case_number_uniqueness(self, df: pd.DataFrame, result: dict) -> dict:
+    def _validate_case_number_format(self, df: pd.DataFrame, result: dict, ctx: RuleFrame | None = None) -> dict:
+        """Validate case number format (YY-XXXXXX or YY-XXXXXX[A-Z] for supplements).
+
+        Args:
+            df (pd.DataFrame): DataFrame partition to validate.
+            result (dict): Initial result dictionary.
+            ctx (RuleFrame | None): Shared intermediates for ``df``.
+
+        Returns:
+            dict: Updated result with pass/fail counts and failed records.
+        """
+        return self._apply_check('CRIT_001', df, result, ctx)
+
+    def _validate_case_number_uniqueness(self, df: pd.DataFrame, result: dict, ctx: RuleFrame | None = None) -> dict:
         """Validate uniqueness of case numbers.
 
         Args:
             df (pd.DataFrame): DataFrame partition to validate.
             result (dict): Initial result dictionary.
+            ctx (RuleFrame | None): Shared intermediates for ``df``.
 
         Returns:
             dict: Updated result with pass/fail counts and duplicate records.
         """
         field = 'ReportNumberNew'
-        unique_count = df[field].nunique()
-        result.update({'passed': unique_count, 'failed': len(df) - unique_count})
         duplicates = df[field].value_counts()
+        unique_count = len(duplicates)
+        result.update({'passed': unique_count, 'failed': len(df) - unique_count})
         result['failed_records'] = duplicates[duplicates > 1].head(10).to_dict()
         return result
 
-    def _validate_call_datetime(self, df: pd.DataFrame, result: dict) -> dict:
+    def _validate_call_datetime(self, df: pd.DataFrame, result: dict, ctx: RuleFrame | None = None) -> dict:
         """Validate 'Time of Call' datetime within reasonable range.
 
         Args:
             df (pd.DataFrame): DataFrame partition to validate.
             result (dict): Initial result dictionary.
+            ctx (RuleFrame | None): Shared intermediates for ``df``.
 
         Returns:
             dict: Updated result with pass/fail counts and failed records.
         """
-        field = 'Time of Call'
-        parsed = pd.to_datetime(df[field], errors='coerce')
-        valid = parsed.notna() & (parsed >= '2020-01-01') & (parsed <= '2030-12-31')
-        result.update({'passed': valid.sum(), 'failed': (~valid).sum()})
-        result['failed_records'] = df[~valid][field].value_counts().head(10).to_dict()
-        return result
+        return self._apply_check('CRIT_003', df, result, ctx)
 
-    def _validate_incident_type_presence(self, df: pd.DataFrame, result: dict) -> dict:
+    def _validate_incident_type_presence(self, df: pd.DataFrame, result: dict, ctx: RuleFrame | None = None) -> dict:
         """Validate presence of non-empty incident type.
 
         Args:
             df (pd.DataFrame): DataFrame partition to validate.
             result (dict): Initial result dictionary.
+            ctx (RuleFrame | None): Shared intermediates for ``df``.
 
         Returns:
             dict: Updated result with pass/fail counts and failed records.
         """
-        field = 'Incident'
-        valid = df[field].notna() & (df[field].astype(str).str.strip() != '')
-        result.update({'passed': valid.sum(), 'failed': (~valid).sum()})
-        result['failed_records'] = df[~valid][field].value_counts().head(10).to_dict()
-        return result
+        return self._apply_check('CRIT_004', df, result, ctx)
 
-    def _validate_address_completeness(self, df: pd.DataFrame, result: dict) -> dict:
+    def _validate_address_completeness(self, df: pd.DataFrame, result: dict, ctx: RuleFrame | None = None) -> dict:
         """Validate presence and non-generic addresses.
 
+        Features are computed once per distinct address (utils.address_features).
+
         Args:
             df (pd.DataFrame): DataFrame partition to validate.
             result (dict): Initial result dictionary.
+            ctx (RuleFrame | None): Shared intermediates for ``df``.
 
         Returns:
             dict: Updated result with pass/fail counts and failed records.
         """
         field = 'FullAddress2'
-        generic = {'UNKNOWN', 'NOT PROVIDED', 'N/A', 'NONE', '', 'TBD', 'TO BE DETERMINED'}
-        suffix_pattern = re.compile(r'( STREET| AVENUE| ROAD| PLACE| DRIVE| COURT| BOULEVARD| LANE| WAY| HWY| HIGHWAY| ROUTE| AVE| ST| RD| BLVD| DR| CT| PL)')
-
-        def evaluate_address(value):
-            if pd.isna(value):
-                return False, ['missing_address']
-            text = str(value).upper().strip()
-            text = re.sub(r'\s+', ' ', text)
-            if text in generic:
-                return False, ['generic_placeholder']
-            issues = []
-            has_city_zip = text.endswith(', HACKENSACK, NJ, 07601')
-            if not has_city_zip:
-                issues.append('missing_city_state_zip')
-            is_intersection = ' & ' in text
-            if not is_intersection and not re.match(r'^\d+ ', text):
-                issues.append('missing_house_number')
-            if not suffix_pattern.search(text):
-                issues.append('missing_street_suffix')
-            if is_intersection and '&' not in text:
-                issues.append('invalid_intersection_format')
-            if issues:
-                return False, issues
-            return True, []
-
-        passes = []
-        issue_counter = Counter()
-        for addr in df[field]:
-            is_valid, issues = evaluate_address(addr)
-            passes.append(is_valid)
-            if not is_valid:
-                if not issues:
-                    issue_counter['unknown_format'] += 1
-                else:
-                    issue_counter.update(issues)
+        flags = address_completeness(df[field])
+        issue_counter = count_issues(flags)
 
-        valid_series = pd.Series(passes, index=df.index)
+        valid_series = flags['valid']
         result.update({'passed': valid_series.sum(), 'failed': (~valid_series).sum()})
         result['failed_records'] = dict(issue_counter.most_common(10))
         self.address_issue_summary.update(issue_counter)
         return result
 
-    def _validate_officer_assignment(self, df: pd.DataFrame, result: dict) -> dict:
+    def _validate_officer_assignment(self, df: pd.DataFrame, result: dict, ctx: RuleFrame | None = None) -> dict:
         """Validate officer assignment for dispatched calls.
 
         Args:
             df (pd.DataFrame): DataFrame partition to validate.
             result (dict): Initial result dictionary.
+            ctx (RuleFrame | None): Shared intermediates for ``df``.
 
         Returns:
             dict: Updated result with pass/fail counts and failed records.
         """
-        dispatched = df['Time Dispatched'].notna() if 'Time Dispatched' in df.columns else pd.Series([True] * len(df))
-        has_officer = df['Officer'].notna() & (df['Officer'].astype(str).str.strip() != '')
-        valid = ~(dispatched & ~has_officer)
-        result.update({'passed': valid.sum(), 'failed': (~valid).sum()})
-        result['failed_records'] = df[~valid]['Officer'].value_counts().head(10).to_dict()
-        return result
+        return self._apply_check('IMP_002', df, result, ctx)
 
-    def _validate_disposition_consistency(self, df: pd.DataFrame, result: dict) -> dict:
+    def _validate_disposition_consistency(self, df: pd.DataFrame, result: dict, ctx: RuleFrame | None = None) -> dict:
         """Validate disposition against approved list.
 
         Args:
             df (pd.DataFrame): DataFrame partition to validate.
             result (dict): Initial result dictionary.
+            ctx (RuleFrame | None): Shared intermediates for ``df``.
 
         Returns:
             dict: Updated result with pass/fail counts and failed records.
         """
-        field = 'Disposition'
-        valid_list = self.config['validation_lists']['valid_dispositions']
-        valid = df[field].astype(str).str.strip().isin(valid_list)
-        result.update({'passed': valid.sum(), 'failed': (~valid).sum()})
-        result['failed_records'] = df[~valid][field].value_counts().head(10).to_dict()
-        return result
+        return self._apply_check('IMP_003', df, result, ctx)
 
-    def _validate_time_sequence(self, df: pd.DataFrame, result: dict) -> dict:
+    def _validate_time_sequence(self, df: pd.DataFrame, result: dict, ctx: RuleFrame | None = None) -> dict:
         """Validate logical time sequence (Call -> Dispatch -> Out -> In).
 
         Args:
             df (pd.DataFrame): DataFrame partition to validate.
             result (dict): Initial result dictionary.
+            ctx (RuleFrame | None): Shared intermediates for ``df``.
 
         Returns:
             dict: Updated result with pass/fail counts and failed records.
         """
-        fields = ['Time of Call', 'Time Dispatched', 'Time Out', 'Time In']
-        times = {f: pd.to_datetime(df.get(f), errors='coerce') for f in fields}
-        valid_sequence = pd.Series([True] * len(df), index=df.index)
-        if 'Time of Call' in df and 'Time Dispatched' in df:
-            valid_sequence &= (times['Time of Call'] <= times['Time Dispatched']) | times['Time of Call'].isna() | times['Time Dispatched'].isna()
-        if 'Time Dispatched' in df and 'Time Out' in df:
-            valid_sequence &= (times['Time Dispatched'] <= times['Time Out']) | times['Time Dispatched'].isna() | times['Time Out'].isna()
-        if 'Time Out' in df and 'Time In' in df:
-            valid_sequence &= (times['Time Out'] <= times['Time In']) | times['Time Out'].isna() | times['Time In'].isna()
-        result.update({'passed': valid_sequence.sum(), 'failed': (~valid_sequence).sum()})
-        if (~valid_sequence).any():
-            failed_df = df[~valid_sequence][fields].head(10)
-            result['failed_records'] = failed_df[fields].to_dict(orient='records')
-        return result
+        return self._apply_check('IMP_004', df, result, ctx)
 
-    def _validate_datetime_duration(self, df: pd.DataFrame, result: dict) -> dict:
+    def _validate_datetime_duration(self, df: pd.DataFrame, result: dict, ctx: RuleFrame | None = None) -> dict:
         """Validate duration between datetime fields.
 
         Args:
             df (pd.DataFrame): DataFrame partition to validate.
             result (dict): Initial result dictionary.
+            ctx (RuleFrame | None): Shared intermediates for ``df``.
 
         Returns:
             dict: Updated result with pass/fail counts and failed records.
         """
-        fields = ['Time of Call', 'Time Dispatched', 'Time Out', 'Time In']
-        
-        # Parse datetime fields first
-        parsed_times = {}
-        for field in fields:
-            if field in df.columns:
-                parsed_times[field] = pd.to_datetime(df[field], errors='coerce')
-            else:
-                parsed_times[field] = pd.Series([pd.NaT] * len(df), index=df.index)
-        
-        # Calculate durations only if we have valid datetime columns
-        valid = pd.Series([True] * len(df), index=df.index)
-        
-        if 'Time of Call' in df.columns and 'Time Dispatched' in df.columns:
-            response_duration = parsed_times['Time Dispatched'] - parsed_times['Time of Call']
-            valid &= (response_duration >= pd.Timedelta(0)) | response_duration.isna()
-        
-        if 'Time Dispatched' in df.columns and 'Time Out' in df.columns:
-            out_duration = parsed_times['Time Out'] - parsed_times['Time Dispatched']
-            valid &= (out_duration >= pd.Timedelta(0)) | out_duration.isna()
-        
-        if 'Time Out' in df.columns and 'Time In' in df.columns:
-            in_duration = parsed_times['Time In'] - parsed_times['Time Out']
-            valid &= (in_duration >= pd.Timedelta(0)) | in_duration.isna()
-        
-        result.update({'passed': valid.sum(), 'failed': (~valid).sum()})
-        if (~valid).any():
-            failed_df = df[~valid][fields].head(10)
-            result['failed_records'] = failed_df[fields].to_dict(orient='records')
-        return result
+        return self._apply_check('IMP_005', df, result, ctx)
 
-    def _validate_time_spent(self, df: pd.DataFrame, result: dict) -> dict:
+    def _validate_time_spent(self, df: pd.DataFrame, result: dict, ctx: RuleFrame | None = None) -> dict:
         """Validate Time Spent as a positive duration.
 
         Args:
             df (pd.DataFrame): DataFrame partition to validate.
             result (dict): Initial result dictionary.
+            ctx (RuleFrame | None): Shared intermediates for ``df``.
 
         Returns:
             dict: Updated result with pass/fail counts and failed records.
         """
-        field = 'Time Spent'
-        if field in df.columns:
-            durations = pd.to_timedelta(df[field], errors='coerce')
-            valid = durations.notna() & (durations >= pd.Timedelta(0)) & (durations <= pd.Timedelta(days=1))
-            result.update({'passed': valid.sum(), 'failed': (~valid).sum()})
-            result['failed_records'] = df[~valid][field].value_counts().head(10).to_dict()
-        else:
-            result.update({'passed': 0, 'failed': len(df), 'failed_records': {}})
-        return result
+        return self._apply_check('IMP_006', df, result, ctx)
 
-    def _validate_how_reported(self, df: pd.DataFrame, result: dict) -> dict:
+    def _validate_how_reported(self, df: pd.DataFrame, result: dict, ctx: RuleFrame | None = None) -> dict:
         """Validate standardization of 'How Reported' field.
 
         Args:
             df (pd.DataFrame): DataFrame partition to validate.
             result (dict): Initial result dictionary.
+            ctx (RuleFrame | None): Shared intermediates for ``df``.
 
         Returns:
             dict: Updated result with pass/fail counts and failed records.
         """
         field = 'How Reported'
         valid_list = set(self.config['validation_lists']['how_reported'])
-        normalized = df[field].apply(normalize_how_reported_value)
+        normalized = normalize_unique(df[field], normalize_how_reported_value, apply_missing=True)
         is_valid = normalized.isin(valid_list)
         result.update({'passed': is_valid.sum(), 'failed': (~is_valid).sum()})
         if (~is_valid).any():
             result['failed_records'] = normalized[~is_valid].value_counts().head(10).to_dict()
         return result
 
-    def _validate_zone_validity(self, df: pd.DataFrame, result: dict) -> dict:
+    def _validate_zone_validity(self, df: pd.DataFrame, result: dict, ctx: RuleFrame | None = None) -> dict:
         """Validate PD Zone against valid identifiers.
 
         Args:
             df (pd.DataFrame): DataFrame partition to validate.
             result (dict): Initial result dictionary.
+            ctx (RuleFrame | None): Shared intermediates for ``df``.
 
         Returns:
             dict: Updated result with pass/fail counts and failed records.
         """
-        field = 'PDZone'
-        valid_zones = self.config['validation_lists']['valid_zones']
-        valid = df[field].astype(str).str.strip().isin(valid_zones)
-        result.update({'passed': valid.sum(), 'failed': (~valid).sum()})
-        result['failed_records'] = df[~valid][field].value_counts().head(10).to_dict()
-        return result
+        return self._apply_check('OPT_002', df, result, ctx)
 
-    def _validate_response_type_consistency(self, df: pd.DataFrame, result: dict) -> dict:
+    def _validate_response_type_consistency(self, df: pd.DataFrame, result: dict, ctx: RuleFrame | None = None) -> dict:
         """Validate response type consistency with incident severity.
 
         Args:
             df (pd.DataFrame): DataFrame partition to validate.
             result (dict): Initial result dictionary.
+            ctx (RuleFrame | None): Shared intermediates for ``df``.
 
         Returns:
             dict: Updated result with pass/fail counts and failed records.
         """
+        ctx = ctx or RuleFrame(df)
         emergency_incidents = self.config['validation_lists']['emergency_incidents']
         non_emergency_incidents = self.config['validation_lists']['non_emergency_incidents']
-        incident = df['Incident'].astype(str).str.upper()
-        response = df['Response Type'].astype(str).str.upper()
+        incident = ctx.upper('Incident')
+        response = ctx.upper('Response Type')
         is_emergency_incident = incident.isin(emergency_incidents)
         is_emergency_response = response.isin(['EMERGENCY', 'PRIORITY'])
         is_non_emergency_incident = incident.isin(non_emergency_incidents)
@@ -1446,116 +1557,37 @@ class CADDataValidator:
         return output_path
 
     def _initialize_validation_rules(self) -> dict:
-        """Initialize comprehensive validation rules for CAD data.
+        """Load the validation rules declared in the rule file.
+
+        The file is config['paths']['validation_rules'] if set, otherwise
+        config/validation_rules.yml; rules come from its 'cad_validation' section.
 
         Returns:
             dict: Dictionary of validation rules organized by severity.
         """
+        rules_path = self.config.get('paths', {}).get('validation_rules') or VALIDATION_RULES_PATH
+        rules = load_rule_file(rules_path, section='cad_validation')
         return {
-            'critical_rules': {
-                'case_number_format': {
-                    'rule_id': 'CRIT_001',
-                    'description': 'Case number must follow format: YY-XXXXXX or YY-XXXXXX[A-Z] for supplements',
-                    'field': 'ReportNumberNew',
-                    'pattern': r'^\d{2,4}-\d{6}[A-Z]?$',
-                    'severity': 'critical',
-                    'fix_suggestion': 'Standardize case number format, pad with zeros if needed'
-                },
-                'case_number_uniqueness': {
-                    'rule_id': 'CRIT_002',
-                    'description': 'Case numbers must be unique within dataset',
-                    'field': 'ReportNumberNew',
-                    'severity': 'critical',
-                    'fix_suggestion': 'Remove duplicates, investigate duplicate sources'
-                },
-                'call_datetime_validity': {
-                    'rule_id': 'CRIT_003',
-                    'description': 'Time of Call must be valid datetime within reasonable range',
-                    'field': 'Time of Call',
-                    'severity': 'critical',
-                    'fix_suggestion': 'Validate datetime parsing, check for timezone issues'
-                },
-                'incident_type_presence': {
-                    'rule_id': 'CRIT_004',
-                    'description': 'Incident type must not be null or empty',
-                    'field': 'Incident',
-                    'severity': 'critical',
-                    'fix_suggestion': 'Map null values to "Unknown" or investigate missing data'
-                }
-            },
-            'important_rules': {
-                'address_completeness': {
-                    'rule_id': 'IMP_001',
-                    'description': 'Address should be present and not generic',
-                    'field': 'FullAddress2',
-                    'severity': 'important',
-                    'fix_suggestion': 'Validate address completeness, flag generic addresses'
-                },
-                'officer_assignment': {
-                    'rule_id': 'IMP_002',
-                    'description': 'Officer field should not be null for dispatched calls',
-                    'field': 'Officer',
-                    'severity': 'important',
-                    'fix_suggestion': 'Check officer assignment logic, validate against roster'
-                },
-                'disposition_consistency': {
-                    'rule_id': 'IMP_003',
-                    'description': 'Disposition should be from approved list',
-                    'field': 'Disposition',
-                    'severity': 'important',
-                    'fix_suggestion': 'Standardize disposition values, create lookup table'
-                },
-                'time_sequence_validity': {
-                    'rule_id': 'IMP_004',
-                    'description': 'Time sequence should be logical (Call -> Dispatch -> Out -> In)',
-                    'fields': ['Time of Call', 'Time Dispatched', 'Time Out', 'Time In'],
-                    'severity': 'important',
-                    'fix_suggestion': 'Validate time sequence logic, flag outliers'
-                },
-                'datetime_duration_validity': {
-                    'rule_id': 'IMP_005',
-                    'description': 'Durations between datetime fields must be non-negative',
-                    'fields': ['Time of Call', 'Time Dispatched', 'Time Out', 'Time In'],
-                    'severity': 'important',
-                    'fix_suggestion': 'Correct negative durations or investigate data entry errors'
-                },
-                'time_spent_validity': {
-                    'rule_id': 'IMP_006',
-                    'description': 'Time Spent must be a positive duration',
-                    'field': 'Time Spent',
-                    'severity': 'important',
-                    'fix_suggestion': 'Validate duration format and ensure positive values'
-                }
-            },
-            'optional_rules': {
-                'how_reported_standardization': {
-                    'rule_id': 'OPT_001',
-                    'description': 'How Reported should be from standardized list',
-                    'field': 'How Reported',
-                    'severity': 'optional',
-                    'fix_suggestion': 'Map variations to standard values (9-1-1, Phone, Walk-in, etc.)'
-                },
-                'zone_validity': {
-                    'rule_id': 'OPT_002',
-                    'description': 'PD Zone should be valid zone identifier',
-                    'field': 'PDZone',
-                    'severity': 'optional',
-                    'fix_suggestion': 'Validate against zone master list'
-                },
-                'response_type_consistency': {
-                    'rule_id': 'OPT_003',
-                    'description': 'Response Type should align with incident severity',
-                    'fields': ['Response Type', 'Incident'],
-                    'severity': 'optional',
-                    'fix_suggestion': 'Create response type validation matrix'
-                }
-            }
+            category: dict(rules.get(category) or {})
+            for category in ('critical_rules', 'important_rules', 'optional_rules')
         }
 
+    def _compile_rule_set(self) -> RuleSet:
+        """Compile the declarative rules (those with a 'check') into vectorized masks.
+
+        Returns:
+            RuleSet: Compiled rules keyed by rule_id.
+        """
+        return RuleSet.from_spec({
+            name: rule for rules in self.validation_rules.values() for name, rule in rules.items()
+        })
+
 def validate_cad_dataset_with_sampling(
     config: Dict[str, Any],
     sampling_method: str = 'stratified',
-    validator: CADDataValidator | None = None
+    validator: CADDataValidator | None = None,
+    workers: int = 1,
+    partition_rows: int | None = None
 ):
     """Validate CAD dataset with specified sampling method.
 
@@ -1563,6 +1595,8 @@ def validate_cad_dataset_with_sampling(
         config (Dict[str, Any]): Configuration dictionary with 'file_path' and optional 'config_path'.
         sampling_method (str): Sampling method ('stratified', 'systematic', 'random'). Defaults to 'stratified'.
         validator (CADDataValidator | None): Existing validator instance to reuse.
+        workers (int): Worker processes for cleaning. Defaults to 1 (serial).
+        partition_rows (int | None): Rows per cleaning partition. Defaults to an even split.
 
     Returns:
         tuple: Validation results and path to the saved report.
@@ -1584,175 +1618,97 @@ def validate_cad_dataset_with_sampling(
     dataset_label = os.path.basename(cad_file)
     validator.current_dataset_label = dataset_label
     validator.validation_results['source_dataset'] = dataset_label
-    results = validator.validate_cad_dataset(df, sampling_method)
+    results = validator.validate_cad_dataset(df, sampling_method, workers=workers, partition_rows=partition_rows)
     report_path = validator.create_validation_report()
     return results, report_path
 
-# --- Unit Tests ---
-
-@pytest.fixture
-def sample_data():
-    """Provide sample data for testing, including edge cases."""
-    return pd.DataFrame({
-        'ReportNumberNew': ['25-123456', '25-987654A', '25-123457', '25-123456B', None, 'invalid', '25-123456AB'],
-        'Incident': ['Noise Complaint', 'ROBBERY', 'Task Assignment', 'ASSAULT', '', None, 'UNKNOWN'],
-        'How Reported': ['PHONE', '9-1-1', 'INVALID', 'RADIO', None, '2024-01-01', 'EMAIL'],
-        'FullAddress2': ['123 Main Street, Hackensack, NJ, 07601', 'INVALID', '456 Elm St, Hackensack, NJ, 07601', 'Main & Atlantic, Hackensack, NJ, 07601', None, '123 Main St', '123 Main Street, Other City, NJ, 00000'],
-        'PDZone': ['7', '5', '10', '6', None, '4', '9'],
-        'Time of Call': ['2025-10-17 17:00:00', '2025-10-17 17:05:00', '2025-10-17 17:10:00', '2025-10-17 17:15:00', '2035-01-01 00:00:00', None, '2019-01-01 00:00:00'],
-        'Time Dispatched': ['2025-10-17 17:02:00', '2025-10-17 17:06:00', '2025-10-17 17:12:00', '2025-10-17 17:14:00', None, '2025-10-17 16:59:00', '2025-10-17 17:16:00'],
-        'Time Out': ['2025-10-17 17:03:00', '2025-10-17 17:07:00', '2025-10-17 17:13:00', '2025-10-17 17:16:00', None, '2025-10-17 17:00:00', '2025-10-17 17:15:00'],
-        'Time In': ['2025-10-17 17:04:00', '2025-10-17 17:08:00', '2025-10-17 17:14:00', '2025-10-17 17:17:00', None, '2025-10-17 16:58:00', '2025-10-17 17:18:00'],
-        'Time Spent': ['0 days 00:04:00', '0 days 00:03:00', '-0 days 00:01:00', '0 days 25:00:00', None, 'invalid', '0 days 00:00:00'],
-        'Officer': ['P.O. John Doe', None, 'P.O. Jane Doe', 'P.O. John Doe', '', 'P.O. Invalid', None],
-        'Disposition': ['COMPLETE', 'ADVISED', 'INVALID', 'COMPLETE', None, 'COMPLETE', 'ADVISED'],
-        'Response Type': ['ROUTINE', 'EMERGENCY', 'ROUTINE', 'URGENT', None, 'EMERGENCY', 'ROUTINE']
-    })
-
-@pytest.fixture
-def validator():
-    """Provide a test instance of CADDataValidator."""
-    return CADDataValidator()
-
-def test_validate_case_number_format(validator, sample_data):
-    result = validator._validate_case_number_format(sample_data, {'rule_id': 'CRIT_001', 'field': 'ReportNumberNew', 'severity': 'critical'})
-    assert result['passed'] == 4
-    assert result['failed'] == 3
-
-def test_validate_case_number_uniqueness(validator, sample_data):
-    result = validator._validate_case_number_uniqueness(sample_data, {'rule_id': 'CRIT_002', 'field': 'ReportNumberNew', 'severity': 'critical'})
-    assert result['passed'] == 6
-    assert result['failed'] == 1
-
-def test_validate_call_datetime(validator, sample_data):
-    result = validator._validate_call_datetime(sample_data, {'rule_id': 'CRIT_003', 'field': 'Time of Call', 'severity': 'critical'})
-    assert result['passed'] == 4
-    assert result['failed'] == 3
-
-def test_validate_incident_type_presence(validator, sample_data):
-    result = validator._validate_incident_type_presence(sample_data, {'rule_id': 'CRIT_004', 'field': 'Incident', 'severity': 'critical'})
-    assert result['passed'] == 5
-    assert result['failed'] == 2
-
-def test_validate_address_completeness(validator, sample_data):
-    result = validator._validate_address_completeness(sample_data, {'rule_id': 'IMP_001', 'field': 'FullAddress2', 'severity': 'important'})
-    assert result['passed'] == 2
-    assert result['failed'] == 5
-
-def test_validate_officer_assignment(validator, sample_data):
-    result = validator._validate_officer_assignment(sample_data, {'rule_id': 'IMP_002', 'field': 'Officer', 'severity': 'important'})
-    assert result['passed'] == 5
-    assert result['failed'] == 2
-
-def test_validate_disposition_consistency(validator, sample_data):
-    result = validator._validate_disposition_consistency(sample_data, {'rule_id': 'IMP_003', 'field': 'Disposition', 'severity': 'important'})
-    assert result['passed'] == 5
-    assert result['failed'] == 2
-
-def test_validate_time_sequence(validator, sample_data):
-    result = validator._validate_time_sequence(sample_data, {'rule_id': 'IMP_004', 'fields': ['Time of Call', 'Time Dispatched', 'Time Out', 'Time In'], 'severity': 'important'})
-    assert result['passed'] == 4
-    assert result['failed'] == 3
-
-def test_validate_datetime_duration(validator, sample_data):
-    result = validator._validate_datetime_duration(sample_data, {'rule_id': 'IMP_005', 'fields': ['Time of Call', 'Time Dispatched', 'Time Out', 'Time In'], 'severity': 'important'})
-    assert result['passed'] == 4
-    assert result['failed'] == 3
-
-def test_validate_time_spent(validator, sample_data):
-    result = validator._validate_time_spent(sample_data, {'rule_id': 'IMP_006', 'field': 'Time Spent', 'severity': 'important'})
-    assert result['passed'] == 4
-    assert result['failed'] == 3
-
-def test_validate_how_reported(validator, sample_data):
-    result = validator._validate_how_reported(sample_data, {'rule_id': 'OPT_001', 'field': 'How Reported', 'severity': 'optional'})
-    assert result['passed'] == 4
-    assert result['failed'] == 3
-
-def test_validate_zone_validity(validator, sample_data):
-    result = validator._validate_zone_validity(sample_data, {'rule_id': 'OPT_002', 'field': 'PDZone', 'severity': 'optional'})
-    assert result['passed'] == 4
-    assert result['failed'] == 3
-
-def test_validate_response_type_consistency(validator, sample_data):
-    result = validator._validate_response_type_consistency(sample_data, {'rule_id': 'OPT_003', 'fields': ['Response Type', 'Incident'], 'severity': 'optional'})
-    assert result['passed'] == 6
-    assert result['failed'] == 1
-
-def test_clean_data_incident_mapping(validator, sample_data):
-    cleaned = validator.clean_data(sample_data)
-    assert cleaned['Incident'].iloc[0] == 'Noise Complaint'
-    assert cleaned['Response Type'].iloc[0] == 'Routine'
-
-def test_fix_mojibake_replaces_encoded_dash():
-    text = "MOTOR VEHICLE CRASH â€“ PEDESTRIAN STRUCK"
-    fixed = fix_mojibake(text)
-    assert 'â€“' not in fixed
-    assert '–' in fixed
-
-def test_how_reported_normalization_variants():
-    variants = ['911', '9/1/1', '9 1 1', 'EMERGENCY 911', '2001-09-01']
-    normalized = {normalize_how_reported_value(v) for v in variants}
-    assert normalized == {'9-1-1'}
-
-def test_apply_incident_mapping_backfills(validator):
-    mapping_df = pd.DataFrame({
-        'Incident': ['MOTOR VEHICLE CRASH – PEDESTRIAN STRUCK'],
-        'Incident_Norm': ['TRAFFIC CRASH'],
-        'Response_Type': ['EMERGENCY RESPONSE']
-    })
-    mapping_df['Incident'] = mapping_df['Incident'].apply(fix_mojibake)
-    mapping_df['Incident_Norm'] = mapping_df['Incident_Norm'].apply(fix_mojibake)
-    mapping_df['Response_Type'] = mapping_df['Response_Type'].apply(fix_mojibake)
-    mapping_df['Incident_key'] = mapping_df['Incident'].apply(normalize_incident_key)
-    validator.incident_mapping = mapping_df
-
-    df = pd.DataFrame({
-        'Incident': ['MOTOR VEHICLE CRASH â€“ PEDESTRIAN STRUCK', 'MOTOR VEHICLE CRASH â€“ PEDESTRIAN STRUCK'],
-        'Response Type': ['', 'ROUTINE'],
-        'How Reported': ['911', 'PHONE']
-    })
-
-    result = validator._apply_incident_mapping(df)
-    assert result.loc[0, 'Incident'] == 'TRAFFIC CRASH'
-    assert result.loc[0, 'Response Type'] == 'EMERGENCY RESPONSE'
-    assert result.loc[1, 'Response Type'] == 'ROUTINE'
-
-def test_validate_empty_dataframe(validator):
-    empty_df = pd.DataFrame()
-    cleaned = validator.clean_data(empty_df)
-    assert cleaned.empty
-    results = validator.validate_cad_dataset(empty_df)
-    assert results['total_records'] == 0
-    assert results['data_quality_score'] == 0.0
-
-def test_validate_missing_columns(validator):
-    df_missing = pd.DataFrame({'InvalidColumn': [1, 2]})
-    results = validator.validate_cad_dataset(df_missing)
-    for category, rules in results.items():
-        if isinstance(rules, dict):
-            for rule in rules.values():
-                if isinstance(rule, dict):
-                    assert 'error' in rule or rule.get('passed', 0) == 0
-
-def test_config_reload(tmp_path):
-    cfg = {
-        "address_abbreviations": {" ST ": " STREET "},
-        "validation_lists": {
-            "valid_dispositions": ["COMPLETE", "ADVISED"],
-            "valid_zones": ["5", "6", "7", "8", "9"],
-            "emergency_incidents": ["ROBBERY"],
-            "non_emergency_incidents": ["NOISE COMPLAINT"],
-            "how_reported": ["9-1-1", "PHONE"]
-        }
+def _validate_file(
+    cad_file_path: str,
+    config_path: str,
+    sampling_method: str = 'stratified',
+    reload_config: bool = False,
+    workers: int = 1,
+    partition_rows: int | None = None,
+    validator: CADDataValidator | None = None
+) -> Dict[str, Any]:
+    """Validate one CAD file and summarize it for the cross-file summary.
+
+    Runs in a pool worker for ``--jobs``; a fresh validator is created per
+    file unless one is passed in.
+
+    Args:
+        cad_file_path (str): CAD file to validate.
+        config_path (str): Path to configuration JSON file.
+        sampling_method (str): Sampling method to apply.
+        reload_config (bool): Reload configuration before processing.
+        workers (int): Worker processes for cleaning.
+        partition_rows (int | None): Rows per cleaning partition.
+        validator (CADDataValidator | None): Existing validator instance to reuse.
+
+    Returns:
+        dict: Per-file summary (quality score, report path, unmapped incidents, address issues).
+    """
+    if validator is None:
+        validator = CADDataValidator(config_path=config_path)
+        if reload_config:
+            validator.reload_config(config_path)
+    results, report_file = validate_cad_dataset_with_sampling(
+        {
+            'file_path': cad_file_path,
+            'config_path': config_path
+        },
+        sampling_method,
+        validator=validator,
+        workers=workers,
+        partition_rows=partition_rows
+    )
+    return {
+        'source_dataset': os.path.basename(cad_file_path),
+        'total_records': results.get('total_records', 0),
+        'overall_quality_score': results.get('overall_quality_score', 0),
+        'report_file': report_file,
+        'unmapped_incidents': sorted(validator.unmapped_incidents),
+        'address_issue_summary': dict(validator.address_issue_summary)
+    }
+
+
+def combine_file_summaries(summaries: list[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine per-file summaries into one cross-file summary.
+
+    Args:
+        summaries (list[Dict[str, Any]]): Results of ``_validate_file``, in file order.
+
+    Returns:
+        dict: Per-file quality scores, the union of unmapped incidents and
+        address issue counts summed across files.
+    """
+    unmapped = set()
+    address_issues = Counter()
+    for summary in summaries:
+        unmapped.update(summary['unmapped_incidents'])
+        address_issues.update(summary['address_issue_summary'])
+    total_records = sum(summary['total_records'] for summary in summaries)
+    weighted_score = (
+        sum(summary['overall_quality_score'] * summary['total_records'] for summary in summaries) / total_records
+        if total_records else 0.0
+    )
+    return {
+        'timestamp': datetime.now().isoformat(),
+        'files_processed': len(summaries),
+        'total_records': total_records,
+        'overall_quality_score': round(weighted_score, 2),
+        'files': [
+            {
+                'source_dataset': summary['source_dataset'],
+                'total_records': summary['total_records'],
+                'overall_quality_score': summary['overall_quality_score'],
+                'report_file': summary['report_file']
+            }
+            for summary in summaries
+        ],
+        'unmapped_incidents': sorted(unmapped),
+        'address_issue_summary': dict(address_issues.most_common())
     }
-    config_path = tmp_path / "config_enhanced.json"
-    config_path.write_text(json.dumps(cfg))
-    validator = CADDataValidator(config_path=str(config_path))
-    cfg["validation_lists"]["valid_dispositions"].append("REFERRED")
-    config_path.write_text(json.dumps(cfg))
-    validator.reload_config(str(config_path))
-    assert "REFERRED" in validator.config["validation_lists"]["valid_dispositions"]
 
 
 def main():
@@ -1779,6 +1735,24 @@ def main():
         action="store_true",
         help="Reload configuration before processing."
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for parallel cleaning (1 = serial)."
+    )
+    parser.add_argument(
+        "--partition-rows",
+        type=int,
+        default=None,
+        help="Rows per cleaning partition (default: split evenly across workers)."
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Files validated concurrently, one process and validator per file (1 = serial)."
+    )
     args = parser.parse_args()
 
     validator = CADDataValidator(config_path=args.config)
@@ -1796,20 +1770,42 @@ def main():
     all_cad_files = sorted(glob.glob(os.path.join(raw_dir, "*.xlsx")))
     print(f"Found {len(all_cad_files)} files to process.")
 
-    for cad_file_path in all_cad_files:
-        print(f"\n{'='*60}\nPROCESSING: {os.path.basename(cad_file_path)}\n{'='*60}")
-        validator.current_dataset_label = os.path.basename(cad_file_path)
-        validator.validation_results['source_dataset'] = validator.current_dataset_label
-        results, report_file = validate_cad_dataset_with_sampling(
-            {
-                'file_path': cad_file_path,
-                'config_path': args.config
-            },
-            args.sampling_method,
-            validator=validator
-        )
-        print(f"  - Overall Quality Score: {results.get('overall_quality_score', 0):.1f}/100")
-        print(f"  - Full report saved to: {report_file}")
+    def print_file_result(summary):
+        print(f"  - Overall Quality Score: {summary['overall_quality_score']:.1f}/100")
+        print(f"  - Full report saved to: {summary['report_file']}")
+
+    summaries = []
+    if args.jobs > 1 and len(all_cad_files) > 1:
+        # Each worker builds its own validator; files are independent
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(all_cad_files))) as pool:
+            futures = [
+                pool.submit(
+                    _validate_file, cad_file_path, args.config, args.sampling_method,
+                    args.reload_config, args.workers, args.partition_rows
+                )
+                for cad_file_path in all_cad_files
+            ]
+            for future in futures:
+                summaries.append(future.result())
+                print(f"\n{'='*60}\nPROCESSED: {summaries[-1]['source_dataset']}\n{'='*60}")
+                print_file_result(summaries[-1])
+    else:
+        for cad_file_path in all_cad_files:
+            print(f"\n{'='*60}\nPROCESSING: {os.path.basename(cad_file_path)}\n{'='*60}")
+            summaries.append(_validate_file(
+                cad_file_path, args.config, args.sampling_method,
+                workers=args.workers, partition_rows=args.partition_rows, validator=validator
+            ))
+            print_file_result(summaries[-1])
+
+    if summaries:
+        summary = combine_file_summaries(summaries)
+        summary_path = f"cad_validation_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, default=str)
+        print(f"\nCombined quality score: {summary['overall_quality_score']:.1f}/100 across {summary['files_processed']} files")
+        print(f"Unmapped incidents: {len(summary['unmapped_incidents'])}")
+        print(f"Cross-file summary saved to: {summary_path}")
 
     print("\nAll files processed successfully!")
 
@@ -8,12 +8,15 @@ Author: Claude Code
 Date: 2025-11-18
 """
 
+import sys
 import pandas as pd
-import re
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.address_features import categorize_addresses
+
 # Configuration
 BASE_DIR = Path(r"C:\Users\carucci_r\OneDrive - City of Hackensack\02_ETL_Scripts\CAD_Data_Cleaning_Engine")
 DATA_DIR = BASE_DIR / "data"
@@ -23,135 +26,26 @@ REPORTS_DIR = DATA_DIR / "02_reports"
 INPUT_FILE = DATA_DIR / "ESRI_CADExport" / "CAD_ESRI_Final_20251117_v2.xlsx"
 OUTPUT_REPORT = REPORTS_DIR / "address_quality_report.md"
 
-# Street types for validation
-STREET_TYPES = [
-    'STREET', 'ST', 'AVENUE', 'AVE', 'ROAD', 'RD', 'DRIVE', 'DR', 'LANE', 'LN',
-    'BOULEVARD', 'BLVD', 'COURT', 'CT', 'PLACE', 'PL', 'CIRCLE', 'CIR',
-    'TERRACE', 'TER', 'WAY', 'PARKWAY', 'PKWY', 'HIGHWAY', 'HWY', 'PLAZA',
-    'SQUARE', 'SQ', 'TRAIL', 'TRL', 'PATH', 'ALLEY', 'WALK', 'EXPRESSWAY',
-    'TURNPIKE', 'TPKE', 'ROUTE', 'RT'
-]
-
-# Generic location terms
-GENERIC_TERMS = [
-    'HOME', 'VARIOUS', 'UNKNOWN', 'PARKING GARAGE', 'REAR LOT', 'PARKING LOT',
-    'LOT', 'GARAGE', 'REAR', 'FRONT', 'SIDE', 'BEHIND', 'ACROSS', 'NEAR',
-    'BETWEEN', 'AREA', 'LOCATION', 'SCENE', 'UNDETERMINED', 'N/A', 'NA',
-    'NONE', 'BLANK', 'PARK'
-]
-
-
-def categorize_address(address):
-    """
-    Categorize an address into quality categories
-    Returns: (category, reason)
-    """
-    if pd.isna(address) or str(address).strip() == '':
-        return 'blank', 'Null or empty address'
-
-    addr = str(address).strip()
-    addr_upper = addr.upper()
-
-    # Check for PO BOX
-    if re.search(r'P\.?O\.?\s*BOX', addr_upper):
-        return 'po_box', 'PO Box address'
-
-    # Check for generic location terms at start
-    for term in GENERIC_TERMS:
-        if addr_upper.startswith(term) or f' {term} ' in addr_upper:
-            # Special case: if it's a park name with a valid street (like "Columbus Park & Main Street")
-            if term == 'PARK' and '&' in addr:
-                parts = addr.split('&')
-                if len(parts) == 2 and has_street_type(parts[1]):
-                    continue
-            return 'generic_location', f'Generic term: {term}'
-
-    # Check if it's an intersection (has &)
-    if '&' in addr:
-        parts = addr.split('&')
-        if len(parts) == 2:
-            part1 = parts[0].strip()
-            part2 = parts[1].strip()
-
-            # Check for incomplete intersection (empty second part or just city/state)
-            if not part2 or part2.startswith(',') or re.match(r'^,?\s*(Hackensack|NJ|07601)', part2, re.IGNORECASE):
-                return 'incomplete_intersection', 'Missing second street in intersection'
-
-            # Valid intersection should have street types in both parts
-            has_type1 = has_street_type(part1)
-            has_type2 = has_street_type(part2)
-
-            if has_type1 and has_type2:
-                return 'valid_intersection', 'Valid intersection format'
-            elif not has_type1 and not has_type2:
-                return 'missing_street_type', 'Both streets missing type'
-            elif not has_type1:
-                return 'missing_street_type', f'First street missing type: {part1}'
-            else:
-                return 'missing_street_type', f'Second street missing type: {part2}'
-
-    # Standard address - should start with number
-    if re.match(r'^\d+', addr):
-        # Has street number, check for street type
-        if has_street_type(addr):
-            # Check for city/state/zip
-            if has_city_state_zip(addr):
-                return 'valid_standard', 'Valid standard address'
-            else:
-                return 'incomplete', 'Missing city/state/zip'
-        else:
-            return 'missing_street_type', 'No street type suffix'
-    else:
-        # No street number - check if it might be a valid named location
-        if has_street_type(addr):
-            return 'missing_street_number', 'Street name without number'
-        else:
-            # Could be city only or incomplete
-            if re.match(r'^(Hackensack|NJ|07601)', addr, re.IGNORECASE):
-                return 'incomplete', 'City/state only'
-            return 'missing_street_number', 'No street number'
-
-
-def has_street_type(text):
-    """Check if text contains a valid street type"""
-    text_upper = text.upper()
-    for st_type in STREET_TYPES:
-        # Match street type as whole word
-        if re.search(rf'\b{st_type}\b', text_upper):
-            return True
-    return False
-
-
-def has_city_state_zip(text):
-    """Check if address has city, state, and zip"""
-    # Look for pattern: City, State, Zip or City, State Zip
-    return bool(re.search(r'Hackensack.*NJ.*07601', text, re.IGNORECASE))
-
 
 def analyze_addresses(df):
     """Analyze all addresses and categorize them"""
-    results = defaultdict(list)
-    category_counts = defaultdict(int)
-
     print(f"Analyzing {len(df):,} addresses...")
 
-    for idx, row in df.iterrows():
-        address = row['FullAddress2']
-        report_num = row['ReportNumberNew']
+    # Categories are computed once per distinct address
+    categorized = categorize_addresses(df['FullAddress2'])
+    categories = categorized['category']
+    counts = categories.value_counts()
+    category_counts = defaultdict(int, {cat: int(counts[cat]) for cat in pd.unique(categories)})
 
-        category, reason = categorize_address(address)
-        category_counts[category] += 1
-
-        # Store samples (up to 100 per category for sampling)
-        if len(results[category]) < 100:
-            results[category].append({
-                'ReportNumberNew': report_num,
-                'FullAddress2': address,
-                'Reason': reason
-            })
-
-        if (idx + 1) % 100000 == 0:
-            print(f"  Processed {idx + 1:,} records...")
+    # Store samples (up to 100 per category for sampling)
+    results = defaultdict(list)
+    records = pd.DataFrame({
+        'ReportNumberNew': df['ReportNumberNew'],
+        'FullAddress2': df['FullAddress2'],
+        'Reason': categorized['reason'],
+    })
+    for category, group in records.groupby(categories, sort=False):
+        results[category] = group.head(100).to_dict('records')
 
     return category_counts, results
 
@@ -4,139 +4,55 @@ Apply manual corrections from CSV files to the ESRI final export.
 """
 
 import pandas as pd
+import sys
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from processors.correction_engine import CorrectionPatchSet
+from utils.excel_writer import write_excel
+
 BASE_DIR = Path(r"C:\Users\carucci_r\OneDrive - City of Hackensack\02_ETL_Scripts\CAD_Data_Cleaning_Engine")
 ESRI_FILE = BASE_DIR / "data" / "ESRI_CADExport" / "CAD_ESRI_Final_20251117_v2.xlsx"
 CORRECTIONS_DIR = BASE_DIR / "manual_corrections"
 OUTPUT_DIR = BASE_DIR / "data" / "ESRI_CADExport"
 
-def apply_how_reported_corrections(df, corrections_file):
-    """Apply How Reported corrections."""
-    if not corrections_file.exists():
-        print(f"  Skipping: {corrections_file.name} (file not found)")
-        return df, 0
-    
-    corrections = pd.read_csv(corrections_file)
-    corrections = corrections[corrections['Corrected_Value'].notna() & (corrections['Corrected_Value'] != '')]
-    
-    if len(corrections) == 0:
-        print(f"  No corrections to apply in {corrections_file.name}")
-        return df, 0
-    
-    # Merge corrections
-    df = df.merge(
-        corrections[['ReportNumberNew', 'Corrected_Value']].rename(columns={'Corrected_Value': 'How Reported'}),
-        on='ReportNumberNew',
-        how='left',
-        suffixes=('', '_new')
-    )
-    
-    # Apply corrections where new value exists
-    mask = df['How Reported_new'].notna()
-    count = mask.sum()
-    df.loc[mask, 'How Reported'] = df.loc[mask, 'How Reported_new']
-    df = df.drop(columns=['How Reported_new'])
-    
-    return df, count
+# TimeOfCall formats tried when the value has no HH:mm to extract
+TIMEOFCALL_FORMATS = ['%m/%d/%Y %H:%M', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%m/%d/%Y %H:%M:%S']
 
-def apply_disposition_corrections(df, corrections_file):
-    """Apply Disposition corrections."""
-    if not corrections_file.exists():
-        print(f"  Skipping: {corrections_file.name} (file not found)")
-        return df, 0
-    
-    corrections = pd.read_csv(corrections_file)
-    corrections = corrections[corrections['Corrected_Value'].notna() & (corrections['Corrected_Value'] != '')]
-    
-    if len(corrections) == 0:
-        print(f"  No corrections to apply in {corrections_file.name}")
-        return df, 0
-    
-    # Merge corrections
-    df = df.merge(
-        corrections[['ReportNumberNew', 'Corrected_Value']].rename(columns={'Corrected_Value': 'Disposition'}),
-        on='ReportNumberNew',
-        how='left',
-        suffixes=('', '_new')
-    )
-    
-    # Apply corrections where new value exists
-    mask = df['Disposition_new'].notna()
-    count = mask.sum()
-    df.loc[mask, 'Disposition'] = df.loc[mask, 'Disposition_new']
-    df = df.drop(columns=['Disposition_new'])
-    
-    return df, count
+# Keyed correction files, compiled into one patch set and applied in one join
+CORRECTION_FILES = {
+    'how_reported': "how_reported_corrections.csv",
+    'disposition': "disposition_corrections.csv",
+    'case_number': "case_number_corrections.csv",
+    'address': "address_corrections.csv",
+}
 
-def apply_case_number_corrections(df, corrections_file):
-    """Apply ReportNumberNew corrections."""
-    if not corrections_file.exists():
-        print(f"  Skipping: {corrections_file.name} (file not found)")
-        return df, 0
-    
-    corrections = pd.read_csv(corrections_file)
-    corrections = corrections[corrections['Corrected_Value'].notna() & (corrections['Corrected_Value'] != '')]
-    
-    if len(corrections) == 0:
-        print(f"  No corrections to apply in {corrections_file.name}")
-        return df, 0
-    
-    # Clean case numbers - remove newlines, whitespace, and normalize
-    corrections['ReportNumberNew_clean'] = corrections['ReportNumberNew'].astype(str).str.strip().str.replace('\n', '').str.replace('\r', '')
-    corrections['Corrected_Value_clean'] = corrections['Corrected_Value'].astype(str).str.strip()
-    
-    # Create mapping from old to new case numbers
-    case_map = dict(zip(corrections['ReportNumberNew_clean'], corrections['Corrected_Value_clean']))
-    
-    # Clean ReportNumberNew in the dataframe for matching
-    df['ReportNumberNew_clean'] = df['ReportNumberNew'].astype(str).str.strip().str.replace('\n', '').str.replace('\r', '')
-    
-    # Apply corrections
-    mask = df['ReportNumberNew_clean'].isin(case_map.keys())
-    count = mask.sum()
-    df.loc[mask, 'ReportNumberNew'] = df.loc[mask, 'ReportNumberNew_clean'].map(case_map)
-    
-    # Drop temporary column
-    df = df.drop(columns=['ReportNumberNew_clean'])
-    
-    return df, count
+def apply_keyed_corrections(df, corrections_dir):
+    """Apply How Reported, Disposition, case number and address corrections."""
+    sources = {}
+    for name, filename in CORRECTION_FILES.items():
+        corrections_file = corrections_dir / filename
+        if not corrections_file.exists():
+            print(f"  Skipping: {corrections_file.name} (file not found)")
+            continue
+        sources[name] = str(corrections_file)
 
-def apply_address_corrections(df, corrections_file):
-    """Apply FullAddress2 corrections."""
-    if not corrections_file.exists():
-        print(f"  Skipping: {corrections_file.name} (file not found)")
-        return df, 0
-    
-    corrections = pd.read_csv(corrections_file, dtype=str).fillna('')
-    corrections = corrections[corrections['Corrected_Value'].astype(str).str.strip() != '']
-    
-    if len(corrections) == 0:
-        print(f"  No corrections to apply in {corrections_file.name}")
+    # keep='first' per ReportNumberNew, matching the previous address handling
+    patch_set = CorrectionPatchSet.from_files(sources, keep='first')
+    for name, count in patch_set.source_counts.items():
+        print(f"  {CORRECTION_FILES[name]}: {count:,} unique corrections")
+
+    if len(patch_set) == 0:
+        print("  No corrections to apply")
         return df, 0
-    
-    # Remove duplicates from corrections - keep first occurrence per ReportNumberNew
-    corrections = corrections.drop_duplicates(subset=['ReportNumberNew'], keep='first')
-    print(f"  Unique corrections to apply: {len(corrections):,}")
-    
-    # Create a mapping dictionary for faster lookup
-    correction_map = dict(zip(
-        corrections['ReportNumberNew'].astype(str).str.strip(),
-        corrections['Corrected_Value'].astype(str).str.strip()
-    ))
-    
-    # Apply corrections using map (faster and avoids merge duplicates)
-    df['ReportNumberNew_stripped'] = df['ReportNumberNew'].astype(str).str.strip()
-    df['FullAddress2_new'] = df['ReportNumberNew_stripped'].map(correction_map)
-    
-    # Apply corrections where new value exists
-    mask = df['FullAddress2_new'].notna() & (df['FullAddress2_new'] != '')
-    count = mask.sum()
-    df.loc[mask, 'FullAddress2'] = df.loc[mask, 'FullAddress2_new']
-    df = df.drop(columns=['FullAddress2_new', 'ReportNumberNew_stripped'])
-    
-    return df, count
+
+    applied, changes = patch_set.apply(df)
+    for field, count in applied.items():
+        print(f"  {field}: applied {count:,} corrections")
+    print(f"  Changed values: {len(changes):,}")
+
+    return df, sum(applied.values())
 
 def fix_hour_field(df):
     """Extract HH:mm from TimeOfCall and populate Hour field without rounding."""
@@ -150,39 +66,23 @@ def fix_hour_field(df):
         print("  WARNING: Hour column not found. Creating Hour column.")
         df['Hour'] = ''
     
-    def extract_time_from_timeofcall(timeofcall_str):
-        """Extract HH:mm from TimeOfCall (format: MM/dd/YYYY HH:mm)."""
-        if pd.isna(timeofcall_str):
-            return ''
-        
-        timeofcall_str = str(timeofcall_str).strip()
-        
-        # Try to parse MM/dd/YYYY HH:mm format
-        import re
-        # Pattern: MM/dd/YYYY HH:mm or similar datetime formats
-        time_match = re.search(r'(\d{1,2}):(\d{2})', timeofcall_str)
-        if time_match:
-            hour = time_match.group(1).zfill(2)  # Pad to 2 digits
-            minute = time_match.group(2)
-            return f"{hour}:{minute}"
-        
-        # Try parsing as datetime if it's in a different format
-        try:
-            from datetime import datetime
-            # Try common formats
-            for fmt in ['%m/%d/%Y %H:%M', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%m/%d/%Y %H:%M:%S']:
-                try:
-                    dt = datetime.strptime(timeofcall_str, fmt)
-                    return f"{dt.hour:02d}:{dt.minute:02d}"
-                except:
-                    continue
-        except:
-            pass
-        
-        return ''
-    
-    # Extract time from TimeOfCall for all records
-    df['Hour'] = df['TimeOfCall'].apply(extract_time_from_timeofcall)
+    times = df['TimeOfCall']
+    if pd.api.types.is_datetime64_any_dtype(times):
+        df['Hour'] = times.dt.strftime('%H:%M').fillna('')
+    else:
+        # First H:MM / HH:MM in the text (format: MM/dd/YYYY HH:mm), zero-padded
+        text = times.where(times.isna(), times.astype(str).str.strip())
+        parts = text.str.extract(r'(\d{1,2}):(\d{2})')
+        hour = (parts[0].str.zfill(2) + ':' + parts[1]).where(parts[0].notna())
+
+        # Anything else: the first common CAD format that parses it
+        for fmt in TIMEOFCALL_FORMATS:
+            leftover = text.notna() & hour.isna()
+            if not leftover.any():
+                break
+            parsed = pd.to_datetime(text[leftover], format=fmt, errors='coerce')
+            hour[leftover] = parsed.dt.strftime('%H:%M')
+        df['Hour'] = hour.fillna('')
     
     # Count how many were populated
     count = (df['Hour'] != '').sum()
@@ -206,32 +106,14 @@ def main():
     # Apply corrections
     print("Applying corrections...")
     
-    # 1. How Reported
-    print("\n1. How Reported corrections:")
-    df, count = apply_how_reported_corrections(df, CORRECTIONS_DIR / "how_reported_corrections.csv")
-    print(f"  Applied {count:,} corrections")
-    total_corrections += count
-    
-    # 2. Disposition
-    print("\n2. Disposition corrections:")
-    df, count = apply_disposition_corrections(df, CORRECTIONS_DIR / "disposition_corrections.csv")
-    print(f"  Applied {count:,} corrections")
-    total_corrections += count
-    
-    # 3. Case Numbers
-    print("\n3. Case Number corrections:")
-    df, count = apply_case_number_corrections(df, CORRECTIONS_DIR / "case_number_corrections.csv")
-    print(f"  Applied {count:,} corrections")
-    total_corrections += count
-    
-    # 4. Addresses
-    print("\n4. Address corrections:")
-    df, count = apply_address_corrections(df, CORRECTIONS_DIR / "address_corrections.csv")
+    # 1. How Reported, Disposition, Case Number and Address corrections
+    print("\n1. Keyed corrections (How Reported, Disposition, Case Number, Address):")
+    df, count = apply_keyed_corrections(df, CORRECTIONS_DIR)
     print(f"  Applied {count:,} corrections")
     total_corrections += count
     
-    # 5. Hour Field (automated fix)
-    print("\n5. Hour field format fix:")
+    # 2. Hour Field (automated fix)
+    print("\n2. Hour field format fix:")
     df, count = fix_hour_field(df)
     print(f"  Fixed {count:,} records")
     total_corrections += count
@@ -239,13 +121,13 @@ def main():
     # Save corrected file - update the production file directly
     print(f"\nSaving corrected file...")
     print(f"  Updating production file: {ESRI_FILE.name}")
-    df.to_excel(ESRI_FILE, index=False)
+    write_excel(df, ESRI_FILE)
     print(f"  Saved to: {ESRI_FILE}")
     
     # Also save a timestamped backup
     timestamp = datetime.now().strftime('%Y%m%d')
     backup_file = OUTPUT_DIR / f"CAD_ESRI_Final_{timestamp}_corrected.xlsx"
-    df.to_excel(backup_file, index=False)
+    write_excel(df, backup_file)
     print(f"  Backup saved to: {backup_file}")
     
     print("\n" + "="*60)
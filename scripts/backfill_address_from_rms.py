@@ -19,12 +19,16 @@ Output
 - data/02_reports/address_backfill_from_rms_report.md
 """
 
+import sys
 import pandas as pd
 import re
 from pathlib import Path
 from datetime import datetime
 from collections import Counter
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.address_features import GENERIC_TERMS, STREET_REGEX, categorize_addresses
+
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -50,115 +54,14 @@ REPORT_FILE = REPORTS_DIR / "address_backfill_from_rms_report.md"
 # Address classification helpers
 # ---------------------------------------------------------------------------
 
-STREET_TYPES = [
-    "STREET", "ST", "AVENUE", "AVE", "ROAD", "RD", "DRIVE", "DR", "LANE", "LN",
-    "BOULEVARD", "BLVD", "COURT", "CT", "PLACE", "PL", "CIRCLE", "CIR",
-    "TERRACE", "TER", "WAY", "PARKWAY", "PKWY", "HIGHWAY", "HWY", "PLAZA",
-    "SQUARE", "SQ", "TRAIL", "TRL", "PATH", "ALLEY", "WALK", "EXPRESSWAY",
-    "TURNPIKE", "TPKE", "ROUTE", "RT"
-]
-
-GENERIC_TERMS = [
-    "HOME", "VARIOUS", "UNKNOWN", "PARKING GARAGE", "REAR LOT", "PARKING LOT",
-    "LOT", "GARAGE", "REAR", "FRONT", "SIDE", "BEHIND", "ACROSS", "NEAR",
-    "BETWEEN", "AREA", "LOCATION", "SCENE", "UNDETERMINED", "N/A", "NA",
-    "NONE", "BLANK", "PARK"
-]
-
-STREET_REGEX = r"\b(?:" + "|".join(STREET_TYPES) + r")\b"
-CITY_STATE_ZIP_REGEX = r"Hackensack.*NJ.*0760"
-
-
-def has_street_type(text: str) -> bool:
-    text_upper = str(text).upper()
-    for st_type in STREET_TYPES:
-        if re.search(rf"\b{st_type}\b", text_upper):
-            return True
-    return False
-
-
-def has_city_state_zip(text: str) -> bool:
-    return bool(re.search(CITY_STATE_ZIP_REGEX, str(text), re.IGNORECASE))
-
-
-def categorize_address(address):
-    """
-    Categorize an address into quality buckets.
-    Returns: (category, reason)
-    """
-    if pd.isna(address) or str(address).strip() == "":
-        return "blank", "Null or empty address"
-
-    addr = str(address).strip()
-    addr_upper = addr.upper()
-
-    # PO Box
-    if re.search(r"P\.?O\.?\s*BOX", addr_upper):
-        return "po_box", "PO Box address"
-
-    # Generic location terms
-    for term in GENERIC_TERMS:
-        if addr_upper.startswith(term) or f" {term} " in addr_upper:
-            # Park special case with intersection
-            if term == "PARK" and "&" in addr:
-                parts = addr.split("&")
-                if len(parts) == 2 and has_street_type(parts[1]):
-                    break
-            return "generic_location", f"Generic term: {term}"
-
-    # Intersection
-    if "&" in addr:
-        parts = addr.split("&")
-        if len(parts) == 2:
-            part1 = parts[0].strip()
-            part2 = parts[1].strip()
-
-            if (
-                not part2
-                or part2.startswith(",")
-                or re.match(
-                    r"^,?\s*(Hackensack|NJ|0760)", part2, re.IGNORECASE
-                )
-            ):
-                return "incomplete_intersection", "Missing second street in intersection"
-
-            has_type1 = has_street_type(part1)
-            has_type2 = has_street_type(part2)
-
-            if has_type1 and has_type2:
-                return "valid_intersection", "Valid intersection format"
-            if not has_type1 and not has_type2:
-                return "missing_street_type", "Both streets missing type"
-            if not has_type1:
-                return "missing_street_type", f"First street missing type: {part1}"
-            return "missing_street_type", f"Second street missing type: {part2}"
-
-    # Standard address starting with a number
-    if re.match(r"^\d+", addr):
-        if has_street_type(addr):
-            if has_city_state_zip(addr):
-                return "valid_standard", "Valid standard address"
-            return "incomplete", "Missing city/state/zip"
-        return "missing_street_type", "No street type suffix"
-
-    # No number, possible named location
-    if has_street_type(addr):
-        return "missing_street_number", "Street name without number"
-
-    if re.match(r"^(Hackensack|NJ|0760)", addr, re.IGNORECASE):
-        return "incomplete", "City/state only"
-
-    return "missing_street_number", "No street number"
+# City/state/zip tails accept any 0760x ZIP
+ZIP_PREFIX = "0760"
+CITY_STATE_ZIP_REGEX = rf"Hackensack.*NJ.*{ZIP_PREFIX}"
 
 
 def classify_series(addr_series: pd.Series):
-    cats = []
-    reasons = []
-    for val in addr_series:
-        c, r = categorize_address(val)
-        cats.append(c)
-        reasons.append(r)
-    return pd.Series(cats), pd.Series(reasons)
+    categorized = categorize_addresses(addr_series, zip_code=ZIP_PREFIX)
+    return categorized["category"], categorized["reason"]
 
 
 def add_quality_metrics(df: pd.DataFrame, addr_col: str = "FullAddress2", suffix: str = ""):
@@ -326,18 +229,10 @@ def main():
     cad_df["RMS_Address"] = cad_df["join_key"].map(rms_lookup)
 
     # Classify RMS addresses only where present
-    rms_cats = []
-    rms_reasons = []
-    for addr in cad_df["RMS_Address"]:
-        if pd.isna(addr) or str(addr).strip() == "":
-            rms_cats.append("none")
-            rms_reasons.append("No RMS address")
-        else:
-            c, r = categorize_address(addr)
-            rms_cats.append(c)
-            rms_reasons.append(r)
-    cad_df["RMS_Address_Category"] = rms_cats
-    cad_df["RMS_Address_Reason"] = rms_reasons
+    rms_cats, rms_reasons = classify_series(cad_df["RMS_Address"])
+    no_rms = rms_cats.eq("blank")
+    cad_df["RMS_Address_Category"] = rms_cats.mask(no_rms, "none")
+    cad_df["RMS_Address_Reason"] = rms_reasons.mask(no_rms, "No RMS address")
 
     # Backfill rule:
     # If CAD address is in invalid_focus AND RMS address category is valid_standard or valid_intersection
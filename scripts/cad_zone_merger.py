@@ -1,11 +1,15 @@
 import os
 import glob
-import re
+import sys
 import json
 import argparse
 from pathlib import Path
+from typing import Optional
 import pandas as pd
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.zone_index import ZoneIndex
+
 # ── 1) LOAD CONFIG ──────────────────────────────────────────────────────────
 def load_config(config_path: str = None) -> dict:
     """Load configuration from JSON file.
@@ -43,53 +47,25 @@ def load_config(config_path: str = None) -> dict:
     return config
 
 # ── 2) ZONE MERGE FUNCTION ──────────────────────────────────────────────────
-def merge_zones(df: pd.DataFrame, zone_master_path: str) -> pd.DataFrame:
-    """Merge zone/grid data into CAD DataFrame.
+def merge_zones(df: pd.DataFrame, zone_master_path: str, index: Optional[ZoneIndex] = None) -> pd.DataFrame:
+    """Backfill zone/grid data into CAD DataFrame.
+
+    Addresses are normalized (" & " -> " / ", street suffixes abbreviated,
+    title case) once per distinct value and looked up in the persisted zone
+    index; missing Grid/PDZone values are filled in place.
 
     Args:
         df: CAD DataFrame with FullAddress2 column.
         zone_master_path: Path to zone master Excel file.
+        index: Already-loaded zone index (loaded from zone_master_path if None).
 
     Returns:
-        DataFrame with Grid and PDZone columns merged in.
+        DataFrame with Grid and PDZone columns filled in.
     """
-    # Load zone lookup
-    zone_df = pd.read_excel(zone_master_path)
-    zone_df = (
-        zone_df[["CrossStreetName","Grid","PDZone"]]
-        .drop_duplicates()
-        .rename(columns={"CrossStreetName":"LookupAddress"})
-    )
-
-    # ── 3) ADDRESS NORMALIZATION ───────────────────────────────────────────────
-    # Map full street words → abbreviations
-    SUFFIX_MAP = {
-        "Street":"St","Avenue":"Ave","Road":"Rd","Place":"Pl",
-        "Drive":"Dr","Court":"Ct","Boulevard":"Blvd"
-    }
-
-    def normalize_address(addr):
-        if pd.isna(addr):
-            return addr
-        s = addr.replace(" & ", " / ")
-        for full, abbr in SUFFIX_MAP.items():
-            # word‑boundary replace
-            s = re.sub(rf"\b{full}\b", abbr, s, flags=re.IGNORECASE)
-        return s.title().strip()
-
-    # Normalize address for joining
-    df["CleanAddress"] = df["FullAddress2"].apply(normalize_address)
-
-    # Merge in zone/grid
-    merged = pd.merge(
-        df,
-        zone_df,
-        left_on="CleanAddress",
-        right_on="LookupAddress",
-        how="left"
-    )
-
-    return merged
+    if index is None:
+        index = ZoneIndex.load(zone_master_path)
+    index.backfill(df, "FullAddress2")
+    return df
 
 
 # ── 4) MAIN FUNCTION ────────────────────────────────────────────────────────
@@ -148,13 +124,16 @@ def main():
 
     print(f"🔍 Found {len(cad_files)} CAD exports to process.")
 
+    # Load the zone index once for all files
+    zone_index = ZoneIndex.load(zone_master)
+
     # Process each file
     for cad_path in cad_files:
         # Load
         df = pd.read_excel(cad_path)
 
         # Merge in zone/grid
-        merged = merge_zones(df, zone_master)
+        merged = merge_zones(df, zone_master, index=zone_index)
 
         # Write out
         out_path = cad_path.replace(".xlsx", "_zoned.xlsx")
@@ -6,12 +6,15 @@ Compares current state to raw data baseline.
 
 import pandas as pd
 import numpy as np
-import re
+import sys
 from pathlib import Path
 from datetime import datetime
 from collections import Counter
 
 BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from utils.address_features import invalid_address_flags
 
 # File paths
 ESRI_FILE = BASE_DIR / "data" / "ESRI_CADExport" / "CAD_ESRI_Final_20251124_corrected.xlsx"
@@ -20,77 +23,15 @@ OUTPUT_DIR = BASE_DIR / "data" / "02_reports"
 
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-# Street types for validation
-STREET_TYPES = [
-    "STREET", "ST", "AVENUE", "AVE", "ROAD", "RD", "DRIVE", "DR", "LANE", "LN",
-    "BOULEVARD", "BLVD", "COURT", "CT", "PLACE", "PL", "CIRCLE", "CIR",
-    "TERRACE", "TER", "WAY", "PARKWAY", "PKWY", "HIGHWAY", "HWY", "PLAZA",
-    "SQUARE", "SQ", "TRAIL", "TRL", "PATH", "ALLEY", "WALK", "EXPRESSWAY",
-    "TURNPIKE", "TPKE", "ROUTE", "RT"
-]
-
-STREET_REGEX = r"\b(?:" + "|".join(STREET_TYPES) + r")\b"
-
-def is_invalid_address(address):
-    """Check if address is invalid/incomplete."""
-    if pd.isna(address) or str(address).strip() == "":
-        return True, "blank"
-    
-    addr = str(address).strip()
-    addr_upper = addr.upper()
-    
-    # Check for incomplete intersection (contains " & ," - missing second street)
-    if re.search(r'&\s*,', addr_upper):
-        return True, "incomplete_intersection"
-    
-    # Check for generic terms
-    generic_terms = ["HOME", "VARIOUS", "UNKNOWN", "PARKING GARAGE", "REAR LOT", 
-                     "PARKING LOT", "LOT", "GARAGE", "AREA", "LOCATION", "SCENE",
-                     "N/A", "NA", "TBD", "TO BE DETERMINED", "CANCELED CALL"]
-    for term in generic_terms:
-        if re.search(rf'\b{re.escape(term)}\b', addr_upper):
-            return True, "generic_location"
-    
-    # Check for complete intersection (has " & " with both streets)
-    if " & " in addr_upper and not re.search(r'&\s*,', addr_upper):
-        parts = addr_upper.split("&")
-        if len(parts) == 2:
-            part1 = parts[0].strip()
-            part2 = parts[1].strip()
-            # If both parts have street types, it's likely valid
-            if re.search(STREET_REGEX, part1, re.IGNORECASE) and re.search(STREET_REGEX, part2, re.IGNORECASE):
-                return False, "valid"
-    
-    # For standard addresses (not intersections), check if it starts with a number
-    if " & " not in addr_upper:
-        # Standard address should start with a number
-        if not re.match(r'^\d+', addr):
-            # Check if it has a street type (might be a named location like "Park")
-            if not re.search(STREET_REGEX, addr_upper, re.IGNORECASE):
-                return True, "missing_street_number"
-    
-    # Check for missing street type (has number but no street type)
-    if re.match(r'^\d+', addr):
-        if not re.search(STREET_REGEX, addr_upper, re.IGNORECASE):
-            return True, "missing_street_type"
-    
-    return False, "valid"
-
 def analyze_address_quality(df):
     """Analyze address quality."""
     print("\nAnalyzing address quality...")
     
-    issue_counter = Counter()
-    invalid_count = 0
-    valid_count = 0
-    
-    for addr in df['FullAddress2']:
-        is_invalid, issue_type = is_invalid_address(addr)
-        if is_invalid:
-            invalid_count += 1
-            issue_counter[issue_type] += 1
-        else:
-            valid_count += 1
+    flags = invalid_address_flags(df['FullAddress2'])
+    invalid = flags['is_invalid']
+    invalid_count = int(invalid.sum())
+    valid_count = len(df) - invalid_count
+    issue_counter = Counter(flags.loc[invalid, 'issue_type'])
     
     total = len(df)
     valid_pct = (valid_count / total * 100) if total > 0 else 0
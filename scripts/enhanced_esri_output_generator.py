@@ -19,8 +19,13 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Set, Tuple
 import logging
+import sys
 import warnings
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.column_profile import get_column_profile
+from utils.excel_writer import write_excel
+
 warnings.filterwarnings('ignore')
 
 # Configure logging
@@ -181,14 +186,13 @@ class EnhancedESRIOutputGenerator:
             Dictionary mapping column names to DataFrames of records with nulls in that column
         """
         null_reports = {}
+        profile = get_column_profile(df)
         
         for col in df.columns:
-            # Check for null or blank values
-            is_null = df[col].isna()
-            is_blank = df[col].astype(str).str.strip().isin(['', 'nan', 'None'])
-            has_null_or_blank = is_null | is_blank
+            # Null or blank ('', 'nan', 'None' after strip) - cached per column
+            has_null_or_blank = profile.mask(col, 'blank')
             
-            null_count = has_null_or_blank.sum()
+            null_count = int(has_null_or_blank.sum())
             
             if null_count > 0:
                 # Extract records with null/blank values (include ALL columns for context)
@@ -479,7 +483,7 @@ class EnhancedESRIOutputGenerator:
             draft_df.to_csv(draft_path, index=False, encoding='utf-8-sig')
         else:
             draft_path = output_dir / f"{draft_filename}.xlsx"
-            draft_df.to_excel(draft_path, index=False, engine='openpyxl')
+            write_excel(draft_df, draft_path)
         
         outputs['draft'] = draft_path
         logger.info(f"  Draft output: {draft_path} ({len(draft_df):,} rows, {len(draft_df.columns)} columns)")
@@ -496,7 +500,7 @@ class EnhancedESRIOutputGenerator:
             polished_df.to_csv(polished_path, index=False, encoding='utf-8-sig')
         else:
             polished_path = output_dir / f"{polished_filename}.xlsx"
-            polished_df.to_excel(polished_path, index=False, engine='openpyxl')
+            write_excel(polished_df, polished_path)
         
         outputs['polished'] = polished_path
         logger.info(f"  Polished output: {polished_path} ({len(polished_df):,} rows, {len(polished_df.columns)} columns)")
@@ -27,6 +27,12 @@ import re
 from datetime import datetime
 from pathlib import Path
 import logging
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.column_profile import get_column_profile
+from utils.datetime_parser import cached_datetimes
+from utils.validation_rules import RuleSet, load_rule_file
 
 # Configure logging
 logging.basicConfig(
@@ -39,8 +45,8 @@ logger = logging.getLogger(__name__)
 class ESRIFinalValidator:
     """Comprehensive ESRI final export validator."""
 
-    def __init__(self, input_file: str, output_dir: str = "data/02_reports"):
-        """Initialize validator with file paths."""
+    def __init__(self, input_file: str, output_dir: str = "data/02_reports", rules_path: str = None):
+        """Initialize validator with file paths and the declarative esri_export rules."""
         self.input_file = input_file
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -73,6 +79,13 @@ class ESRIFinalValidator:
             'I1': '9', 'I2': '9', 'I3': '9', 'I4': '9A', 'I5': '9', 'I6': '9'
         }
 
+        # Declarative rules (config/validation_rules.yml, esri_export section)
+        try:
+            self.rule_set = RuleSet.from_spec(load_rule_file(rules_path, section='esri_export'))
+        except (FileNotFoundError, KeyError) as e:
+            logger.warning(f"No declarative ESRI rules loaded: {e}")
+            self.rule_set = RuleSet([])
+
         # Validation results
         self.validation_results = {}
         self.invalid_records = {}
@@ -106,14 +119,15 @@ class ESRIFinalValidator:
     def validate_timeofcall(self, df: pd.DataFrame) -> dict:
         """Validate TimeOfCall field and derived fields."""
         logger.info("Validating TimeOfCall and derived fields...")
+        profile = get_column_profile(df)
 
         # Check for null values
-        null_count = df['TimeOfCall'].isna().sum()
+        null_count = profile.count('TimeOfCall', 'null')
 
         # Validate format
         valid_format_count = 0
         if 'TimeOfCall' in df.columns:
-            valid_format_count = df['TimeOfCall'].notna().sum()
+            valid_format_count = profile.present('TimeOfCall', 'null').sum()
 
         # Validate derived fields
         cyear_issues = 0
@@ -121,29 +135,27 @@ class ESRIFinalValidator:
         hour_issues = 0
         dayofweek_issues = 0
 
+        # Derived fields are checked against TimeOfCall parsed once (text or datetime cells)
+        if any(col in df.columns for col in ('cYear', 'cMonth', 'Hour', 'DayofWeek')):
+            present = profile.present('TimeOfCall', 'null')
+            times = cached_datetimes(df, 'TimeOfCall')[present]
+            df_check = df[present]
+
         # Check cYear
         if 'cYear' in df.columns:
-            df_check = df[df['TimeOfCall'].notna()].copy()
-            df_check['expected_year'] = df_check['TimeOfCall'].dt.year.astype(str)
-            cyear_issues = (df_check['cYear'] != df_check['expected_year']).sum()
+            cyear_issues = (df_check['cYear'] != times.dt.year.astype(str)).sum()
 
         # Check cMonth
         if 'cMonth' in df.columns:
-            df_check = df[df['TimeOfCall'].notna()].copy()
-            df_check['expected_month'] = df_check['TimeOfCall'].dt.strftime('%B')
-            cmonth_issues = (df_check['cMonth'] != df_check['expected_month']).sum()
+            cmonth_issues = (df_check['cMonth'] != times.dt.strftime('%B')).sum()
 
         # Check Hour
         if 'Hour' in df.columns:
-            df_check = df[df['TimeOfCall'].notna()].copy()
-            df_check['expected_hour'] = df_check['TimeOfCall'].dt.strftime('%H:00')
-            hour_issues = (df_check['Hour'] != df_check['expected_hour']).sum()
+            hour_issues = (df_check['Hour'] != times.dt.strftime('%H:00')).sum()
 
         # Check DayofWeek
         if 'DayofWeek' in df.columns:
-            df_check = df[df['TimeOfCall'].notna()].copy()
-            df_check['expected_dayofweek'] = df_check['TimeOfCall'].dt.strftime('%A')
-            dayofweek_issues = (df_check['DayofWeek'] != df_check['expected_dayofweek']).sum()
+            dayofweek_issues = (df_check['DayofWeek'] != times.dt.strftime('%A')).sum()
 
         result = {
             'status': 'PASS' if null_count == 0 and cyear_issues == 0 and cmonth_issues == 0 and hour_issues == 0 and dayofweek_issues == 0 else 'FAIL',
@@ -161,14 +173,15 @@ class ESRIFinalValidator:
     def validate_response_type(self, df: pd.DataFrame) -> dict:
         """Validate Response_Type field."""
         logger.info("Validating Response_Type...")
+        profile = get_column_profile(df)
 
         total = len(df)
-        null_count = df['Response_Type'].isna().sum()
+        null_count = profile.count('Response_Type', 'null')
 
         # Check for valid values
         valid_mask = df['Response_Type'].isin(self.valid_response_types)
         valid_count = valid_mask.sum()
-        invalid_count = (~valid_mask & df['Response_Type'].notna()).sum()
+        invalid_count = (~valid_mask & profile.present('Response_Type', 'null')).sum()
 
         coverage = ((total - null_count) / total * 100) if total > 0 else 0
 
@@ -190,17 +203,18 @@ class ESRIFinalValidator:
     def validate_how_reported(self, df: pd.DataFrame) -> dict:
         """Validate How Reported field."""
         logger.info("Validating How Reported...")
+        profile = get_column_profile(df)
 
         total = len(df)
-        null_count = df['How Reported'].isna().sum()
+        null_count = profile.count('How Reported', 'null')
 
         # Check for valid values
         valid_mask = df['How Reported'].isin(self.valid_how_reported)
         valid_count = valid_mask.sum()
-        invalid_count = (~valid_mask & df['How Reported'].notna()).sum()
+        invalid_count = (~valid_mask & profile.present('How Reported', 'null')).sum()
 
         # Get invalid values
-        invalid_values = df.loc[~valid_mask & df['How Reported'].notna(), 'How Reported'].value_counts().to_dict()
+        invalid_values = df.loc[~valid_mask & profile.present('How Reported', 'null'), 'How Reported'].value_counts().to_dict()
 
         result = {
             'status': 'PASS' if null_count == 0 and invalid_count == 0 else 'FAIL',
@@ -216,9 +230,10 @@ class ESRIFinalValidator:
     def validate_fulladdress2(self, df: pd.DataFrame) -> dict:
         """Validate FullAddress2 field."""
         logger.info("Validating FullAddress2...")
+        profile = get_column_profile(df)
 
         total = len(df)
-        null_count = df['FullAddress2'].isna().sum()
+        null_count = profile.count('FullAddress2', 'null')
 
         # Define patterns for valid addresses
         # Standard address: starts with number, has street type, city, state, zip
@@ -228,7 +243,7 @@ class ESRIFinalValidator:
         intersection_pattern = r'^[A-Z\s]+\s+(STREET|AVENUE|ROAD|DRIVE|COURT|LANE|BOULEVARD|PLACE|PARKWAY|WAY|TERRACE|CIRCLE)\s*&\s*[A-Z\s]+\s+(STREET|AVENUE|ROAD|DRIVE|COURT|LANE|BOULEVARD|PLACE|PARKWAY|WAY|TERRACE|CIRCLE)\s*,?\s*[A-Z\s]+,\s*[A-Z]{2}\s+\d{5}'
 
         # Check valid addresses
-        df_check = df[df['FullAddress2'].notna()].copy()
+        df_check = df[profile.present('FullAddress2', 'null')].copy()
         df_check['addr_upper'] = df_check['FullAddress2'].astype(str).str.upper().str.strip()
 
         standard_valid = df_check['addr_upper'].str.contains(standard_pattern, regex=True, na=False)
@@ -267,14 +282,15 @@ class ESRIFinalValidator:
     def validate_reportnumbernew(self, df: pd.DataFrame) -> dict:
         """Validate ReportNumberNew field."""
         logger.info("Validating ReportNumberNew...")
+        profile = get_column_profile(df)
 
         total = len(df)
-        null_count = df['ReportNumberNew'].isna().sum()
+        null_count = profile.count('ReportNumberNew', 'null')
 
         # Define valid pattern: YY-XXXXXX or YY-XXXXXXA
         valid_pattern = r'^\d{2}-\d{6}[A-Z]?$'
 
-        df_check = df[df['ReportNumberNew'].notna()].copy()
+        df_check = df[profile.present('ReportNumberNew', 'null')].copy()
         valid_mask = df_check['ReportNumberNew'].astype(str).str.match(valid_pattern, na=False)
         valid_count = valid_mask.sum()
         invalid_count = (~valid_mask).sum()
@@ -304,14 +320,15 @@ class ESRIFinalValidator:
     def validate_officer(self, df: pd.DataFrame) -> dict:
         """Validate Officer field."""
         logger.info("Validating Officer...")
+        profile = get_column_profile(df)
 
         total = len(df)
-        null_count = df['Officer'].isna().sum()
+        null_count = profile.count('Officer', 'null')
 
         # Define valid pattern: RANK FirstName LastName BadgeNumber
         valid_pattern = r'^([A-Z]{2,4}\.)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?)\s+([A-Za-z]+(?:-[A-Za-z]+)*(?:\s[A-Za-z]+(?:-[A-Za-z]+)*)*)\s+(\d{2,4})$'
 
-        df_check = df[df['Officer'].notna()].copy()
+        df_check = df[profile.present('Officer', 'null')].copy()
         valid_mask = df_check['Officer'].astype(str).str.match(valid_pattern, na=False)
         valid_count = valid_mask.sum()
         invalid_count = (~valid_mask).sum()
@@ -336,9 +353,10 @@ class ESRIFinalValidator:
     def validate_disposition(self, df: pd.DataFrame) -> dict:
         """Validate Disposition field."""
         logger.info("Validating Disposition...")
+        profile = get_column_profile(df)
 
         total = len(df)
-        null_count = df['Disposition'].isna().sum()
+        null_count = profile.count('Disposition', 'null')
 
         # Get distribution
         distribution = df['Disposition'].value_counts(dropna=False).head(20).to_dict()
@@ -356,24 +374,25 @@ class ESRIFinalValidator:
     def validate_grid_pdzone(self, df: pd.DataFrame) -> dict:
         """Validate Grid and PDZone fields."""
         logger.info("Validating Grid and PDZone...")
+        profile = get_column_profile(df)
 
         total = len(df)
-        grid_null = df['Grid'].isna().sum()
-        pdzone_null = df['PDZone'].isna().sum()
+        grid_null = profile.count('Grid', 'null')
+        pdzone_null = profile.count('PDZone', 'null')
 
         # Check valid Grid values (Beat values)
         valid_grids = list(self.beat_to_pdzone.keys())
         grid_valid = df['Grid'].isin(valid_grids).sum()
-        grid_invalid = (~df['Grid'].isin(valid_grids) & df['Grid'].notna()).sum()
+        grid_invalid = (~df['Grid'].isin(valid_grids) & profile.present('Grid', 'null')).sum()
 
         # Check valid PDZone values
         valid_pdzones = ['5', '6', '7', '8', '9', '9A']
         pdzone_valid = df['PDZone'].isin(valid_pdzones).sum()
-        pdzone_invalid = (~df['PDZone'].isin(valid_pdzones) & df['PDZone'].notna()).sum()
+        pdzone_invalid = (~df['PDZone'].isin(valid_pdzones) & profile.present('PDZone', 'null')).sum()
 
         # Check Grid to PDZone mapping
         mapping_issues = 0
-        df_check = df[(df['Grid'].notna()) & (df['PDZone'].notna())].copy()
+        df_check = df[(profile.present('Grid', 'null')) & (profile.present('PDZone', 'null'))].copy()
         for idx, row in df_check.iterrows():
             expected_pdzone = self.beat_to_pdzone.get(str(row['Grid']), None)
             if expected_pdzone and str(row['PDZone']) != expected_pdzone:
@@ -396,12 +415,13 @@ class ESRIFinalValidator:
     def validate_incident(self, df: pd.DataFrame) -> dict:
         """Validate Incident field."""
         logger.info("Validating Incident...")
+        profile = get_column_profile(df)
 
         total = len(df)
-        null_count = df['Incident'].isna().sum()
+        null_count = profile.count('Incident', 'null')
 
         # Check for mojibake characters
-        df_check = df[df['Incident'].notna()].copy()
+        df_check = df[profile.present('Incident', 'null')].copy()
         mojibake_pattern = r'[^\x00-\x7F]+'
         mojibake_count = df_check['Incident'].astype(str).str.contains(mojibake_pattern, regex=True, na=False).sum()
 
@@ -428,13 +448,14 @@ class ESRIFinalValidator:
     def validate_coordinates(self, df: pd.DataFrame) -> dict:
         """Validate Latitude and Longitude fields."""
         logger.info("Validating Latitude and Longitude...")
+        profile = get_column_profile(df)
 
         total = len(df)
-        lat_null = df['Latitude'].isna().sum()
-        lon_null = df['Longitude'].isna().sum()
+        lat_null = profile.count('Latitude', 'null')
+        lon_null = profile.count('Longitude', 'null')
 
         # Check valid ranges
-        df_check = df[(df['Latitude'].notna()) & (df['Longitude'].notna())].copy()
+        df_check = df[(profile.present('Latitude', 'null')) & (profile.present('Longitude', 'null'))].copy()
 
         lat_valid = ((df_check['Latitude'] >= -90) & (df_check['Latitude'] <= 90)).sum()
         lon_valid = ((df_check['Longitude'] >= -180) & (df_check['Longitude'] <= 180)).sum()
@@ -488,6 +509,34 @@ class ESRIFinalValidator:
 
         return result
 
+    def validate_declarative_rules(self, df: pd.DataFrame) -> dict:
+        """Run the declarative esri_export rules (informational, not scored)."""
+        logger.info(f"Validating {len(self.rule_set)} declarative rules...")
+        outcomes = self.rule_set.evaluate(df)
+
+        rules = {}
+        for rule_id, outcome in outcomes.items():
+            rules[rule_id] = {
+                'description': outcome.rule.spec.get('description', outcome.rule.name),
+                'passed': outcome.passed,
+                'failed': outcome.failed,
+                'seconds': round(outcome.elapsed, 4),
+                'error': outcome.error
+            }
+            # Store failing rows for CSV output
+            if outcome.valid is not None and outcome.failed:
+                columns = [col for col in ['ReportNumberNew', 'TimeOfCall'] if col in df.columns]
+                columns += [col for col in outcome.rule.columns if col not in columns]
+                self.invalid_records[f'rule_{rule_id}'] = df.loc[~outcome.valid, columns].head(1000)
+
+        result = {
+            'status': 'INFO',
+            'total_records': len(df),
+            'rules': rules
+        }
+
+        return result
+
     def calculate_overall_score(self) -> dict:
         """Calculate overall data quality score."""
         logger.info("Calculating overall data quality score...")
@@ -614,6 +663,9 @@ class ESRIFinalValidator:
         # 12. Data Quality Flags
         report += self._format_data_quality_flags_section()
 
+        # 13. Declarative Rules
+        report += self._format_declarative_rules_section()
+
         # Recommendations
         report += self._format_recommendations_section()
 
@@ -884,6 +936,27 @@ class ESRIFinalValidator:
         section += "\n"
         return section
 
+    def _format_declarative_rules_section(self) -> str:
+        """Format declarative rules section."""
+        result = self.validation_results.get('declarative_rules', {})
+
+        section = f"""### 13. Declarative Rules ℹ️
+
+**Status:** {result.get('status', 'N/A')} (Informational, config/validation_rules.yml)
+
+| Rule | Description | Passed | Failed | Time (s) |
+|------|-------------|--------|--------|----------|
+"""
+
+        for rule_id, rule in result.get('rules', {}).items():
+            if rule.get('error'):
+                section += f"| {rule_id} | {rule['description']} | - | - | skipped: {rule['error']} |\n"
+            else:
+                section += f"| {rule_id} | {rule['description']} | {rule['passed']:,} | {rule['failed']:,} | {rule['seconds']:.3f} |\n"
+
+        section += "\n"
+        return section
+
     def _format_recommendations_section(self) -> str:
         """Format recommendations section."""
         section = "## Recommendations\n\n"
@@ -919,6 +992,7 @@ class ESRIFinalValidator:
     def save_reports(self, df: pd.DataFrame):
         """Save all validation reports and CSV files."""
         logger.info("Saving validation reports...")
+        profile = get_column_profile(df)
 
         # Save markdown report
         report = self.generate_markdown_report()
@@ -935,7 +1009,7 @@ class ESRIFinalValidator:
 
         # Save null critical fields CSV
         critical_fields = ['Incident', 'How Reported', 'Disposition', 'ReportNumberNew']
-        null_mask = df[critical_fields].isna().any(axis=1)
+        null_mask = np.logical_or.reduce([profile.mask(field, 'null') for field in critical_fields])
         if null_mask.any():
             null_df = df[null_mask][['ReportNumberNew', 'TimeOfCall'] + critical_fields].head(1000)
             csv_path = self.output_dir / f"null_critical_fields_{self.timestamp}.csv"
@@ -962,6 +1036,7 @@ class ESRIFinalValidator:
         self.validation_results['incident'] = self.validate_incident(df)
         self.validation_results['coordinates'] = self.validate_coordinates(df)
         self.validation_results['data_quality_flags'] = self.validate_data_quality_flags(df)
+        self.validation_results['declarative_rules'] = self.validate_declarative_rules(df)
 
         # Save reports
         self.save_reports(df)
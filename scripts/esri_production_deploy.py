@@ -9,9 +9,14 @@ import pandas as pd
 import numpy as np
 import re
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.excel_writer import write_excel
+from utils.text_normalizer import normalize_unique
+
 # Configuration
 BASE_DIR = Path(r"C:\Users\carucci_r\OneDrive - City of Hackensack\02_ETL_Scripts\CAD_Data_Cleaning_Engine")
 OUTPUT_DIR = BASE_DIR / "data" / "ESRI_CADExport"
@@ -47,6 +52,8 @@ def fix_mojibake(text):
     if pd.isna(text):
         return text
     text = str(text)
+    if text.isascii():
+        return text
     text = text.replace('–', '-')
     text = text.replace('—', '-')
     text = text.replace('\x96', '-')
@@ -139,7 +146,7 @@ def apply_response_type_mapping(cad_df, response_map):
     print("=" * 60)
 
     # Fix mojibake in Incident column
-    cad_df['Incident'] = cad_df['Incident'].apply(fix_mojibake)
+    cad_df['Incident'] = normalize_unique(cad_df['Incident'], fix_mojibake)
 
     # Backup original
     cad_df['Response_Type_Original'] = cad_df['Response_Type'].copy()
@@ -586,7 +593,7 @@ def generate_esri_export(cad_df):
 
     # Save
     print(f"  Writing {len(export_df):,} records to Excel...")
-    export_df.to_excel(output_file, index=False)
+    write_excel(export_df, output_file)
 
     print(f"  Output file: {output_file}")
     metrics['total_records'] = len(export_df)
@@ -35,7 +35,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Tuple
 import pandas as pd
-import pytest
 
 
 class CaseNumberGenerator:
@@ -264,125 +263,8 @@ def generate_case_numbers(
     return generator.generate_for_dataframe(df, date_col, type_col, parent_col, output_col)
 
 
-# ── Unit Tests ──────────────────────────────────────────────────────────────
-
-@pytest.fixture
-def temp_sequence_file(tmp_path):
-    """Provide a temporary sequence file for testing."""
-    return tmp_path / "test_sequences.json"
-
-
-@pytest.fixture
-def generator(temp_sequence_file):
-    """Provide a test case number generator."""
-    return CaseNumberGenerator(sequence_file=str(temp_sequence_file))
-
-
-def test_generate_new_case_number(generator):
-    """Test generating new case numbers."""
-    date1 = datetime(2025, 1, 15)
-    case1 = generator.generate_for_record(date1, 'NEW')
-    assert case1 == '25-000001'
-
-    case2 = generator.generate_for_record(date1, 'NEW')
-    assert case2 == '25-000002'
-
-
-def test_generate_supplement_case_number(generator):
-    """Test generating supplement case numbers."""
-    date1 = datetime(2025, 1, 15)
-
-    # Create parent case
-    parent = generator.generate_for_record(date1, 'NEW')
-    assert parent == '25-000001'
-
-    # Create supplements
-    supp1 = generator.generate_for_record(date1, 'SUPPLEMENT', parent_case=parent)
-    assert supp1 == '25-000001A'
-
-    supp2 = generator.generate_for_record(date1, 'SUPPLEMENT', parent_case=parent)
-    assert supp2 == '25-000001B'
-
-
-def test_year_rollover(generator):
-    """Test sequence resets on year boundary."""
-    date_2024 = datetime(2024, 12, 31)
-    date_2025 = datetime(2025, 1, 1)
-
-    case1 = generator.generate_for_record(date_2024, 'NEW')
-    assert case1 == '24-000001'
-
-    case2 = generator.generate_for_record(date_2025, 'NEW')
-    assert case2 == '25-000001'  # Sequence resets for new year
-
-
-def test_supplement_max_suffix(generator):
-    """Test that supplements stop at Z suffix."""
-    date1 = datetime(2025, 1, 15)
-    parent = generator.generate_for_record(date1, 'NEW')
-
-    # Generate 26 supplements (A-Z)
-    for i in range(26):
-        generator.generate_for_record(date1, 'SUPPLEMENT', parent_case=parent)
-
-    # 27th supplement should raise error
-    with pytest.raises(ValueError, match="Maximum supplements"):
-        generator.generate_for_record(date1, 'SUPPLEMENT', parent_case=parent)
-
-
-def test_dataframe_generation(generator):
-    """Test generating case numbers for entire DataFrame."""
-    df = pd.DataFrame({
-        'report_date': [
-            datetime(2025, 1, 1),
-            datetime(2025, 1, 2),
-            datetime(2025, 1, 3)
-        ],
-        'report_type': ['NEW', 'NEW', 'SUPPLEMENT'],
-        'parent_case': [None, None, '25-000001']
-    })
-
-    result = generator.generate_for_dataframe(
-        df,
-        date_col='report_date',
-        type_col='report_type',
-        parent_col='parent_case'
-    )
-
-    assert 'ReportNumberNew' in result.columns
-    assert result['ReportNumberNew'].iloc[0] == '25-000001'
-    assert result['ReportNumberNew'].iloc[1] == '25-000002'
-    assert result['ReportNumberNew'].iloc[2] == '25-000001A'
-
-
-def test_invalid_report_type(generator):
-    """Test that invalid report types raise errors."""
-    date1 = datetime(2025, 1, 15)
-    with pytest.raises(ValueError, match="Invalid report_type"):
-        generator.generate_for_record(date1, 'INVALID')
-
-
-def test_supplement_without_parent(generator):
-    """Test that supplements require parent case."""
-    date1 = datetime(2025, 1, 15)
-    with pytest.raises(ValueError, match="require parent_case"):
-        generator.generate_for_record(date1, 'SUPPLEMENT')
-
-
-def test_sequence_persistence(temp_sequence_file):
-    """Test that sequences persist across generator instances."""
-    gen1 = CaseNumberGenerator(sequence_file=str(temp_sequence_file))
-    date1 = datetime(2025, 1, 15)
-
-    case1 = gen1.generate_for_record(date1, 'NEW')
-    assert case1 == '25-000001'
-
-    # Create new generator instance (should load saved sequences)
-    gen2 = CaseNumberGenerator(sequence_file=str(temp_sequence_file))
-    case2 = gen2.generate_for_record(date1, 'NEW')
-    assert case2 == '25-000002'  # Should continue from where gen1 left off
-
-
 if __name__ == "__main__":
-    # Run tests if executed directly
-    pytest.main([__file__, '-v'])
+    # Run the unit tests if executed directly
+    import pytest
+    test_file = Path(__file__).resolve().parent.parent / "test" / "test_generate_case_numbers.py"
+    pytest.main([str(test_file), '-v'])
@@ -20,10 +20,15 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 import logging
+import sys
 import warnings
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.excel_writer import write_excel
+from utils.text_normalizer import normalize_unique
+
 warnings.filterwarnings('ignore')
 
 # Configure logging
@@ -137,9 +142,6 @@ class ESRIOutputGenerator:
     
     def _normalize_how_reported_vectorized(self, series: pd.Series) -> pd.Series:
         """Vectorized normalization of How Reported values."""
-        # Convert to string and uppercase for matching
-        s = series.astype(str).str.strip().str.upper()
-        
         # Direct mapping dictionary (uppercase keys)
         mapping = {
             '911': '9-1-1',
@@ -171,14 +173,17 @@ class ESRIOutputGenerator:
             'OTHER': 'Other - See Notes'
         }
         
-        # Use pandas replace (vectorized)
-        result = s.replace(mapping)
-        
-        # Handle nulls and empty strings
-        result = result.replace(['NAN', 'NONE', ''], '')
-        result = result.where(result != '', series.astype(str).str.strip())  # Keep original if no match
-        
-        return result
+        def normalize(value) -> str:
+            original = str(value).strip()
+            key = original.upper()
+            result = mapping.get(key, key)
+            # Nulls and empty strings keep the original text
+            if result in ('NAN', 'NONE', ''):
+                return original
+            return result
+        
+        # Evaluated once per distinct value and broadcast back to the rows
+        return normalize_unique(series, normalize, apply_missing=True)
     
     def _normalize_how_reported(self, value: Any) -> str:
         """Normalize How Reported value (legacy method for single values)."""
@@ -301,7 +306,7 @@ class ESRIOutputGenerator:
             draft_df.to_csv(draft_path, index=False, encoding='utf-8-sig')
         else:
             draft_path = output_dir / f"{draft_filename}.xlsx"
-            draft_df.to_excel(draft_path, index=False, engine='openpyxl')
+            write_excel(draft_df, draft_path)
         
         logger.info(f"  Draft output: {draft_path} ({len(draft_df):,} rows, {len(draft_df.columns)} columns)")
         
@@ -315,7 +320,7 @@ class ESRIOutputGenerator:
             polished_df.to_csv(polished_path, index=False, encoding='utf-8-sig')
         else:
             polished_path = output_dir / f"{polished_filename}.xlsx"
-            polished_df.to_excel(polished_path, index=False, engine='openpyxl')
+            write_excel(polished_df, polished_path)
         
         logger.info(f"  Polished output: {polished_path} ({len(polished_df):,} rows, {len(polished_df.columns)} columns)")
         
@@ -19,6 +19,8 @@ import sys
 BASE_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(BASE_DIR))
 
+from utils.address_features import INVALID_GENERIC_TERMS, invalid_address_flags
+
 # File paths
 ESRI_FILE = BASE_DIR / "data" / "ESRI_CADExport" / "CAD_ESRI_Final_20251124_corrected.xlsx"
 RAW_CAD_FILE = BASE_DIR / "data" / "01_raw" / "2025_11_21_2019_2025_11_21_ALL_CAD_Data.xlsx"
@@ -28,67 +30,8 @@ OUTPUT_CSV = OUTPUT_DIR / f"final_address_manual_corrections_{datetime.now().str
 
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-# Address quality patterns
-STREET_TYPES = [
-    "STREET", "ST", "AVENUE", "AVE", "ROAD", "RD", "DRIVE", "DR", "LANE", "LN",
-    "BOULEVARD", "BLVD", "COURT", "CT", "PLACE", "PL", "CIRCLE", "CIR",
-    "TERRACE", "TER", "WAY", "PARKWAY", "PKWY", "HIGHWAY", "HWY", "PLAZA",
-    "SQUARE", "SQ", "TRAIL", "TRL", "PATH", "ALLEY", "WALK", "EXPRESSWAY",
-    "TURNPIKE", "TPKE", "ROUTE", "RT"
-]
-
-STREET_REGEX = r"\b(?:" + "|".join(STREET_TYPES) + r")\b"
-
-def is_invalid_address(address):
-    """
-    Check if address is invalid/incomplete:
-    - Missing street number (doesn't start with a number for standard addresses)
-    - Incomplete intersection (contains " & ," pattern - missing second street)
-    - Generic terms (home, unknown, various, etc.)
-    - Missing street type
-    """
-    if pd.isna(address) or str(address).strip() == "":
-        return True, "blank"
-    
-    addr = str(address).strip()
-    addr_upper = addr.upper()
-    
-    # Check for incomplete intersection (contains " & ," - missing second street)
-    if re.search(r'&\s*,', addr_upper):
-        return True, "incomplete_intersection"
-    
-    # Check for generic terms
-    generic_terms = ["HOME", "VARIOUS", "UNKNOWN", "PARKING GARAGE", "REAR LOT", 
-                     "PARKING LOT", "LOT", "GARAGE", "AREA", "LOCATION", "SCENE",
-                     "N/A", "NA", "TBD", "TO BE DETERMINED"]
-    for term in generic_terms:
-        if re.search(rf'\b{re.escape(term)}\b', addr_upper):
-            return True, "generic_location"
-    
-    # Check for complete intersection (has " & " with both streets)
-    if " & " in addr_upper and not re.search(r'&\s*,', addr_upper):
-        parts = addr_upper.split("&")
-        if len(parts) == 2:
-            part1 = parts[0].strip()
-            part2 = parts[1].strip()
-            # If both parts have street types, it's likely valid
-            if re.search(STREET_REGEX, part1, re.IGNORECASE) and re.search(STREET_REGEX, part2, re.IGNORECASE):
-                return False, "valid"
-    
-    # For standard addresses (not intersections), check if it starts with a number
-    if " & " not in addr_upper:
-        # Standard address should start with a number
-        if not re.match(r'^\d+', addr):
-            # Check if it has a street type (might be a named location like "Park")
-            if not re.search(STREET_REGEX, addr_upper, re.IGNORECASE):
-                return True, "missing_street_number"
-    
-    # Check for missing street type (has number but no street type)
-    if re.match(r'^\d+', addr):
-        if not re.search(STREET_REGEX, addr_upper, re.IGNORECASE):
-            return True, "missing_street_type"
-    
-    return False, "valid"
+# Generic location terms (this report does not treat CANCELED CALL as generic)
+GENERIC_TERMS = [term for term in INVALID_GENERIC_TERMS if term != "CANCELED CALL"]
 
 def validate_rms_address(address):
     """Validate that RMS address is better than CAD address."""
@@ -158,8 +101,9 @@ def main():
     
     # Identify invalid addresses
     print("\nIdentifying invalid addresses...")
-    cad_df['_is_invalid'] = cad_df['FullAddress2'].apply(lambda x: is_invalid_address(x)[0])
-    cad_df['_issue_type'] = cad_df['FullAddress2'].apply(lambda x: is_invalid_address(x)[1])
+    flags = invalid_address_flags(cad_df['FullAddress2'], generic_terms=GENERIC_TERMS)
+    cad_df['_is_invalid'] = flags['is_invalid']
+    cad_df['_issue_type'] = flags['issue_type']
     
     invalid_count = cad_df['_is_invalid'].sum()
     print(f"Found {invalid_count:,} records with invalid addresses")
@@ -205,8 +149,9 @@ def main():
     
     # Re-identify remaining invalid addresses
     print("\nRe-identifying remaining invalid addresses...")
-    cad_df['_is_invalid'] = cad_df['FullAddress2'].apply(lambda x: is_invalid_address(x)[0])
-    cad_df['_issue_type'] = cad_df['FullAddress2'].apply(lambda x: is_invalid_address(x)[1])
+    flags = invalid_address_flags(cad_df['FullAddress2'], generic_terms=GENERIC_TERMS)
+    cad_df['_is_invalid'] = flags['is_invalid']
+    cad_df['_issue_type'] = flags['issue_type']
     
     remaining_invalid = cad_df['_is_invalid'].sum()
     print(f"Remaining invalid addresses: {remaining_invalid:,}")
@@ -14,8 +14,6 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime
 import json
-import re
-from collections import Counter
 import sys
 
 # Add parent directory to path
@@ -43,6 +41,8 @@ except ImportError:
 
 import logging
 
+from utils.address_features import address_completeness, count_issues
+
 # Setup logging
 logger = setup_logger(
     name="ValidationComparison",
@@ -84,42 +84,9 @@ def validate_data_quality(df, label="Data"):
     
     # Address Completeness
     if 'FullAddress2' in df.columns:
-        generic = {'UNKNOWN', 'NOT PROVIDED', 'N/A', 'NONE', '', 'TBD', 'TO BE DETERMINED'}
-        suffix_pattern = re.compile(
-            r'( STREET| AVENUE| ROAD| PLACE| DRIVE| COURT| BOULEVARD| LANE| WAY| HWY| HIGHWAY| ROUTE| AVE| ST| RD| BLVD| DR| CT| PL)'
-        )
-        
-        def evaluate_address(value):
-            if pd.isna(value):
-                return False, ['missing_address']
-            text = str(value).upper().strip()
-            text = re.sub(r'\s+', ' ', text)
-            if text in generic:
-                return False, ['generic_placeholder']
-            issues = []
-            has_city_zip = text.endswith(', HACKENSACK, NJ, 07601')
-            if not has_city_zip:
-                issues.append('missing_city_state_zip')
-            is_intersection = ' & ' in text
-            if not is_intersection and not re.match(r'^\d+ ', text):
-                issues.append('missing_house_number')
-            if not suffix_pattern.search(text):
-                issues.append('missing_street_suffix')
-            if is_intersection and '&' not in text:
-                issues.append('invalid_intersection_format')
-            if issues:
-                return False, issues
-            return True, []
-        
-        passes = []
-        issue_counter = Counter()
-        for addr in df['FullAddress2']:
-            is_valid, issues = evaluate_address(addr)
-            passes.append(is_valid)
-            if not is_valid:
-                issue_counter.update(issues)
-        
-        valid_series = pd.Series(passes, index=df.index)
+        flags = address_completeness(df['FullAddress2'])
+        issue_counter = count_issues(flags)
+        valid_series = flags['valid']
         results['address_valid'] = valid_series.sum()
         results['address_invalid'] = (~valid_series).sum()
         results['address_pass_rate'] = valid_series.sum() / len(df) if len(df) > 0 else 0
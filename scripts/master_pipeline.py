@@ -15,11 +15,9 @@ Author: CAD Data Cleaning Engine
 Date: 2025-12-17
 """
 
-import pandas as pd
-import numpy as np
 from pathlib import Path
 from datetime import datetime
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 import logging
 import sys
 import warnings
@@ -44,24 +42,24 @@ parent_dir = scripts_dir.parent
 sys.path.insert(0, str(scripts_dir))
 sys.path.insert(0, str(parent_dir))
 
-try:
-    from unified_rms_backfill import UnifiedRMSBackfill
-    from geocode_nj_geocoder import NJGeocoder
-    from enhanced_esri_output_generator import EnhancedESRIOutputGenerator as ESRIOutputGenerator
-    # Import validator from parent directory
-    import importlib.util
-    validator_path = parent_dir / 'validate_cad_export_parallel.py'
-    if validator_path.exists():
-        spec = importlib.util.spec_from_file_location("validate_cad_export_parallel", validator_path)
-        validator_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(validator_module)
-        CADValidatorParallel = validator_module.CADValidatorParallel
-    else:
-        raise ImportError(f"Validator not found at {validator_path}")
-except ImportError as e:
-    logger.error(f"Failed to import pipeline components: {e}")
-    logger.error("Make sure all required scripts are available")
-    sys.exit(1)
+from utils.hash_utils import compute_hash
+from utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from utils.checkpoint import CheckpointManager
+
+# pandas and the pipeline components (geocoder, RMS backfill, ESRI output,
+# validator) are loaded on first use: `--help` and argument errors return
+# without importing them, and a missing component only fails the run that
+# needs it.
+pd = lazy_import('pandas')
+unified_rms_backfill = lazy_import('unified_rms_backfill')
+geocode_nj_geocoder = lazy_import('geocode_nj_geocoder')
+enhanced_esri_output_generator = lazy_import('enhanced_esri_output_generator')
+validate_cad_export_parallel = lazy_import(
+    'validate_cad_export_parallel',
+    path=parent_dir / 'validate_cad_export_parallel.py'
+)
 
 
 class CADETLPipeline:
@@ -72,7 +70,8 @@ class CADETLPipeline:
         config_path: str = None,
         rms_backfill: bool = True,
         geocode: bool = True,
-        geocode_only_missing: bool = True
+        geocode_only_missing: bool = True,
+        checkpoints: bool = False
     ):
         """
         Initialize pipeline.
@@ -82,17 +81,22 @@ class CADETLPipeline:
             rms_backfill: Whether to perform RMS backfill
             geocode: Whether to perform geocoding
             geocode_only_missing: Only geocode records with missing coordinates
+            checkpoints: Write stage checkpoints (always on when resuming)
         """
         self.base_dir = Path(__file__).resolve().parent.parent
+        self.config_path = config_path
         self.rms_backfill = rms_backfill
         self.geocode = geocode
         self.geocode_only_missing = geocode_only_missing
+        self.checkpoints = checkpoints
         
         # Initialize components
-        self.validator = CADValidatorParallel(n_jobs=-2)
-        self.rms_backfiller = UnifiedRMSBackfill(config_path=config_path) if rms_backfill else None
-        self.geocoder = NJGeocoder() if geocode else None
-        self.output_generator = ESRIOutputGenerator()
+        self.validator = validate_cad_export_parallel.CADValidatorParallel(n_jobs=-2)
+        self.rms_backfiller = (
+            unified_rms_backfill.UnifiedRMSBackfill(config_path=config_path) if rms_backfill else None
+        )
+        self.geocoder = geocode_nj_geocoder.NJGeocoder() if geocode else None
+        self.output_generator = enhanced_esri_output_generator.EnhancedESRIOutputGenerator()
         
         # Pipeline statistics
         self.stats = {
@@ -106,12 +110,68 @@ class CADETLPipeline:
             'steps_completed': []
         }
     
+    # Checkpointed stages in execution order
+    STAGES = ['load', 'validate', 'rms_backfill', 'geocode']
+    
+    def _checkpoint_manager(self, input_file: Path) -> 'CheckpointManager':
+        """Create the checkpoint manager keyed by input file and pipeline options."""
+        from utils.checkpoint import CheckpointManager, compute_config_hash
+
+        config_file = Path(self.config_path) if self.config_path else None
+        config_hash = compute_config_hash({
+            'config_file': compute_hash(config_file) if config_file and config_file.exists() else None,
+            'rms_backfill': self.rms_backfill,
+            'geocode': self.geocode,
+            'geocode_only_missing': self.geocode_only_missing
+        })
+        return CheckpointManager(
+            self.base_dir / 'data' / 'checkpoints',
+            input_hash=compute_hash(input_file),
+            config_hash=config_hash
+        )
+    
+    def _checkpoint_state(self) -> Dict:
+        """Pipeline and component statistics saved with each checkpoint."""
+        from utils.error_bitmap import ErrorBitmap
+
+        validator_stats = getattr(self.validator, 'stats', None)
+        if validator_stats is not None:
+            # Error bitmaps are stored as one boolean column per field
+            validator_stats = {
+                key: value.to_frame() if isinstance(value, ErrorBitmap) else value
+                for key, value in validator_stats.items()
+            }
+        return {
+            'stats': {k: v for k, v in self.stats.items() if k not in ('start_time', 'end_time')},
+            'validator_stats': validator_stats,
+            'rms_stats': self.rms_backfiller.stats if self.rms_backfiller else None,
+            'geocode_stats': self.geocoder.stats if self.geocoder else None
+        }
+    
+    def _restore_state(self, state: Dict):
+        """Restore statistics saved by _checkpoint_state."""
+        if not state:
+            return
+        from utils.error_bitmap import ErrorBitmap
+
+        self.stats.update(state.get('stats', {}))
+        if state.get('validator_stats') is not None:
+            self.validator.stats = {
+                key: ErrorBitmap.from_frame(value) if isinstance(value, pd.DataFrame) else value
+                for key, value in state['validator_stats'].items()
+            }
+        if self.rms_backfiller and state.get('rms_stats') is not None:
+            self.rms_backfiller.stats = state['rms_stats']
+        if self.geocoder and state.get('geocode_stats') is not None:
+            self.geocoder.stats = state['geocode_stats']
+    
     def run(
         self,
         input_file: Path,
         output_dir: Path = None,
         base_filename: str = 'CAD_ESRI',
-        format: str = 'csv'
+        format: str = 'csv',
+        resume: bool = False
     ) -> Dict[str, Path]:
         """
         Run complete ETL pipeline.
@@ -121,6 +181,7 @@ class CADETLPipeline:
             output_dir: Output directory (default: input file directory)
             base_filename: Base filename for outputs
             format: Output format ('csv' or 'excel')
+            resume: Skip stages whose checkpoint is still valid (implies checkpoints)
             
         Returns:
             Dictionary with output file paths
@@ -132,82 +193,115 @@ class CADETLPipeline:
         logger.info("="*80)
         logger.info(f"Input file: {input_file}")
         
-        # Step 1: Load data
-        logger.info("\n[STEP 1] Loading CAD data...")
-        logger.info(f"  Reading file: {input_file}")
+        # Stage checkpoints (--resume skips stages whose checkpoint is still valid);
+        # without either option the input is not hashed and nothing is written
+        checkpoints = self._checkpoint_manager(input_file) if self.checkpoints or resume else None
+        resume_stage = checkpoints.latest(self.STAGES) if resume else None
+        completed = self.STAGES[:self.STAGES.index(resume_stage) + 1] if resume_stage else []
+        df_cleaned = None
+        if resume_stage:
+            logger.info(f"\n[RESUME] Restoring checkpoint after stage '{resume_stage}'")
+            df_cleaned, state = checkpoints.load(resume_stage)
+            self._restore_state(state)
+        elif resume:
+            logger.info("\n[RESUME] No valid checkpoint found - running all stages")
         
-        start_load = datetime.now()
-        if input_file.suffix.lower() == '.csv':
-            logger.info("  Reading CSV file...")
-            df = pd.read_csv(input_file, dtype=str, encoding='utf-8-sig', low_memory=False)
+        # Step 1: Load data
+        if 'load' in completed:
+            logger.info("\n[STEP 1] Load skipped (checkpoint)")
         else:
-            # Optimize Excel reading for large files
-            logger.info("  Reading Excel file (this may take 30-90 seconds for 700K+ rows)...")
-            logger.info("  Tip: Convert to CSV for 5-10x faster loading: python scripts\\convert_excel_to_csv.py --input <file>")
-            try:
-                df = pd.read_excel(
-                    input_file,
-                    dtype=str,
-                    engine='openpyxl',
-                    sheet_name=0,  # First sheet only
-                    keep_default_na=False,  # Don't convert empty strings to NaN
-                    na_values=[]  # Don't treat any values as NaN
-                )
-            except Exception as e:
-                logger.warning(f"Error reading with dtype=str: {e}")
-                logger.info("  Trying alternative: reading without dtype specification...")
-                # Fallback: read without dtype=str (faster, but may need conversion)
-                df = pd.read_excel(input_file, engine='openpyxl', sheet_name=0)
-                # Convert all columns to string after loading
-                for col in df.columns:
-                    df[col] = df[col].astype(str).replace('nan', '').replace('None', '')
-        
-        load_time = (datetime.now() - start_load).total_seconds()
-        self.stats['input_rows'] = len(df)
-        logger.info(f"  [OK] Loaded {len(df):,} records with {len(df.columns)} columns in {load_time:.1f} seconds")
-        if load_time > 60:
-            logger.info(f"  [WARN] Slow loading detected! Consider converting to CSV for 5-10x faster loading.")
-        self.stats['steps_completed'].append('load')
+            logger.info("\n[STEP 1] Loading CAD data...")
+            logger.info(f"  Reading file: {input_file}")
+            
+            start_load = datetime.now()
+            if input_file.suffix.lower() == '.csv':
+                logger.info("  Reading CSV file...")
+                df = pd.read_csv(input_file, dtype=str, encoding='utf-8-sig', low_memory=False)
+            else:
+                # Optimize Excel reading for large files
+                logger.info("  Reading Excel file (this may take 30-90 seconds for 700K+ rows)...")
+                logger.info("  Tip: Convert to CSV for 5-10x faster loading: python scripts\\convert_excel_to_csv.py --input <file>")
+                try:
+                    df = pd.read_excel(
+                        input_file,
+                        dtype=str,
+                        engine='openpyxl',
+                        sheet_name=0,  # First sheet only
+                        keep_default_na=False,  # Don't convert empty strings to NaN
+                        na_values=[]  # Don't treat any values as NaN
+                    )
+                except Exception as e:
+                    logger.warning(f"Error reading with dtype=str: {e}")
+                    logger.info("  Trying alternative: reading without dtype specification...")
+                    # Fallback: read without dtype=str (faster, but may need conversion)
+                    df = pd.read_excel(input_file, engine='openpyxl', sheet_name=0)
+                    # Convert all columns to string after loading
+                    for col in df.columns:
+                        df[col] = df[col].astype(str).replace('nan', '').replace('None', '')
+            
+            load_time = (datetime.now() - start_load).total_seconds()
+            self.stats['input_rows'] = len(df)
+            logger.info(f"  [OK] Loaded {len(df):,} records with {len(df.columns)} columns in {load_time:.1f} seconds")
+            if load_time > 60:
+                logger.info(f"  [WARN] Slow loading detected! Consider converting to CSV for 5-10x faster loading.")
+            self.stats['steps_completed'].append('load')
+            if checkpoints is not None:
+                checkpoints.save('load', df, self._checkpoint_state())
+            df_cleaned = df
         
         # Step 2: Validate and clean
-        logger.info("\n[STEP 2] Validating and cleaning data...")
-        df_cleaned = self.validator.validate_all(df)
-        validation_errors = sum(self.validator.stats['errors_by_field'].values())
-        self.stats['validation_errors'] = validation_errors
-        logger.info(f"  Validation complete: {validation_errors:,} errors found")
-        logger.info(f"  Fixes applied: {sum(self.validator.stats['fixes_by_field'].values()):,}")
-        self.stats['steps_completed'].append('validate')
+        if 'validate' in completed:
+            logger.info("\n[STEP 2] Validation skipped (checkpoint)")
+        else:
+            logger.info("\n[STEP 2] Validating and cleaning data...")
+            df_cleaned = self.validator.validate_all(df_cleaned)
+            validation_errors = sum(self.validator.stats['errors_by_field'].values())
+            self.stats['validation_errors'] = validation_errors
+            logger.info(f"  Validation complete: {validation_errors:,} errors found")
+            logger.info(f"  Fixes applied: {sum(self.validator.stats['fixes_by_field'].values()):,}")
+            self.stats['steps_completed'].append('validate')
+            if checkpoints is not None:
+                checkpoints.save('validate', df_cleaned, self._checkpoint_state())
         
         # Step 3: RMS backfill (if enabled)
-        if self.rms_backfill and self.rms_backfiller:
+        if 'rms_backfill' in completed:
+            logger.info("\n[STEP 3] RMS backfill skipped (checkpoint)")
+        elif self.rms_backfill and self.rms_backfiller:
             logger.info("\n[STEP 3] Backfilling from RMS data...")
             df_cleaned = self.rms_backfiller.backfill_from_rms(df_cleaned)
             rms_stats = self.rms_backfiller.get_stats()
             self.stats['rms_backfilled'] = sum(rms_stats['fields_backfilled'].values())
             logger.info(f"  RMS backfill complete: {self.stats['rms_backfilled']:,} fields backfilled")
             self.stats['steps_completed'].append('rms_backfill')
+            if checkpoints is not None:
+                checkpoints.save('rms_backfill', df_cleaned, self._checkpoint_state())
         else:
             logger.info("\n[STEP 3] RMS backfill skipped (disabled)")
         
         # Step 3.5: Generate Pre-Geocoding Polished Output (NEW)
-        logger.info("\n[STEP 3.5] Generating pre-geocoding polished output...")
         if output_dir is None:
             output_dir = input_file.parent
         
-        pre_geocode_outputs = self.output_generator.generate_outputs(
-            df_cleaned,
-            output_dir,
-            base_filename=base_filename,
-            format=format,
-            pre_geocode=True,
-            validation_stats=self.validator.stats if hasattr(self, 'validator') and hasattr(self.validator, 'stats') else None,
-            rms_backfill_stats=self.rms_backfiller.get_stats() if self.rms_backfiller else None
-        )
-        logger.info(f"  Pre-geocoding polished output: {pre_geocode_outputs['polished']}")
-        self.stats['steps_completed'].append('pre_geocode_output')
+        if 'geocode' in completed:
+            logger.info("\n[STEP 3.5] Pre-geocoding output skipped (checkpoint is post-geocoding)")
+        else:
+            logger.info("\n[STEP 3.5] Generating pre-geocoding polished output...")
+            pre_geocode_outputs = self.output_generator.generate_outputs(
+                df_cleaned,
+                output_dir,
+                base_filename=base_filename,
+                format=format,
+                pre_geocode=True,
+                validation_stats=self.validator.stats if hasattr(self, 'validator') and hasattr(self.validator, 'stats') else None,
+                rms_backfill_stats=self.rms_backfiller.get_stats() if self.rms_backfiller else None
+            )
+            logger.info(f"  Pre-geocoding polished output: {pre_geocode_outputs['polished']}")
+            self.stats['steps_completed'].append('pre_geocode_output')
         
         # Step 4: Geocoding (if enabled)
-        if self.geocode and self.geocoder:
+        if 'geocode' in completed:
+            logger.info("\n[STEP 4] Geocoding skipped (checkpoint)")
+        elif self.geocode and self.geocoder:
             logger.info("\n[STEP 4] Geocoding missing coordinates...")
             
             # Check if geocoding is needed
@@ -227,6 +321,8 @@ class CADETLPipeline:
                     self.stats['geocoded'] = geocode_stats['successful']
                     logger.info(f"  Geocoding complete: {self.stats['geocoded']:,} coordinates backfilled")
                     self.stats['steps_completed'].append('geocode')
+                    if checkpoints is not None:
+                        checkpoints.save('geocode', df_cleaned, self._checkpoint_state())
                 else:
                     logger.info("  All coordinates present, skipping geocoding")
             else:
@@ -236,8 +332,6 @@ class CADETLPipeline:
         
         # Step 5: Generate ESRI outputs with data quality reports
         logger.info("\n[STEP 5] Generating ESRI outputs and data quality reports...")
-        if output_dir is None:
-            output_dir = input_file.parent
         
         # Collect statistics from all pipeline stages
         validation_stats = self.validator.stats if hasattr(self, 'validator') and hasattr(self.validator, 'stats') else None
@@ -330,15 +424,31 @@ def main():
         type=str,
         help='Path to config_enhanced.json (optional)'
     )
+    parser.add_argument(
+        '--checkpoints',
+        action='store_true',
+        help='Write a checkpoint after each stage under data/checkpoints'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Skip stages whose checkpoint (input + options unchanged) is still valid; implies --checkpoints'
+    )
     
     args = parser.parse_args()
     
     # Initialize pipeline
-    pipeline = CADETLPipeline(
-        config_path=args.config,
-        rms_backfill=not args.no_rms_backfill,
-        geocode=not args.no_geocode
-    )
+    try:
+        pipeline = CADETLPipeline(
+            config_path=args.config,
+            rms_backfill=not args.no_rms_backfill,
+            geocode=not args.no_geocode,
+            checkpoints=args.checkpoints
+        )
+    except ImportError as e:
+        logger.error(f"Failed to import pipeline components: {e}")
+        logger.error("Make sure all required scripts are available")
+        return 1
     
     # Run pipeline
     input_path = Path(args.input)
@@ -349,7 +459,8 @@ def main():
             input_path,
             output_dir=output_dir,
             base_filename=args.base_filename,
-            format=args.format
+            format=args.format,
+            resume=args.resume
         )
         
         print("\n[SUCCESS] Pipeline completed successfully!")
@@ -1,15 +1,9 @@
 from pathlib import Path
+import sys
 import pandas as pd
 
-
-def _escape_excel_formula(val):
-    """
-    Prevent Excel from treating string values as formulas.
-    Any string starting with =, +, -, or @ is prefixed with a single quote.
-    """
-    if isinstance(val, str) and val and val[0] in ("=", "+", "-", "@"):
-        return "'" + val
-    return val
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.excel_writer import write_excel
 
 
 # --- PATHS ---
@@ -91,7 +85,8 @@ else:
     output_cols = ["ReportNumberNew", "Case Number"] + cad_cols[1:] + rms_cols[1:]
     output_cols = [c for c in output_cols if c in merged.columns]
 
-    final_df = merged[output_cols].applymap(_escape_excel_formula)
+    final_df = merged[output_cols]
 
-    final_df.to_excel(output_path, index=False)
+    # Strings starting with =, +, -, or @ are prefixed with a quote during the write
+    write_excel(final_df, output_path, escape_formulas=True)
     print(f"Done. {len(final_df)} rows exported to {output_path}")
\ No newline at end of file
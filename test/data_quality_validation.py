@@ -8,11 +8,17 @@ Author: Claude Code
 Date: 2025-11-22
 """
 
+import sys
+from pathlib import Path
+
 import pandas as pd
-import re
 from collections import Counter
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.address_features import audit_address_flags
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -98,149 +104,12 @@ def validate_incidents(cad_df, valid_incidents, variant_to_correct):
 # PART 2: FULLADDRESS2 QUALITY AUDIT
 # ============================================================================
 
-# Common street types for validation
-STREET_TYPES = [
-    'Street', 'St', 'Avenue', 'Ave', 'Road', 'Rd', 'Boulevard', 'Blvd',
-    'Lane', 'Ln', 'Drive', 'Dr', 'Court', 'Ct', 'Place', 'Pl', 'Circle', 'Cir',
-    'Way', 'Terrace', 'Ter', 'Parkway', 'Pkwy', 'Highway', 'Hwy'
-]
-
-# Generic placeholders to flag
-GENERIC_PLACEHOLDERS = [
-    'Home', 'Park', 'School', 'PO Box', 'P.O. Box', 'Unknown',
-    'Not Available', 'N/A', 'NA', 'TBD', 'To Be Determined'
-]
-
-def has_street_number(address):
-    """Check if address starts with a number"""
-    if pd.isna(address) or address == '':
-        return False
-    # Check if address starts with digits
-    match = re.match(r'^\d+', str(address).strip())
-    return match is not None
-
-def has_street_type(address):
-    """Check if address contains a valid street type"""
-    if pd.isna(address) or address == '':
-        return False
-    address_str = str(address)
-    for street_type in STREET_TYPES:
-        if re.search(rf'\b{street_type}\b', address_str, re.IGNORECASE):
-            return True
-    return False
-
-def is_intersection(address):
-    """Check if address appears to be an intersection (contains &)"""
-    if pd.isna(address) or address == '':
-        return False
-    return '&' in str(address)
-
-def has_valid_intersection(address):
-    """Check if intersection has two street names (not just '& ,')"""
-    if pd.isna(address) or address == '':
-        return False
-
-    address_str = str(address).strip()
-
-    # Check for invalid patterns like "& ,", "& Hackensack", etc.
-    if re.search(r'&\s*,', address_str):
-        return False
-
-    # Split by & and check both sides have meaningful content
-    parts = address_str.split('&')
-    if len(parts) != 2:
-        return False
-
-    left = parts[0].strip()
-    right = parts[1].split(',')[0].strip()  # Get part before comma
-
-    # Both sides should have at least a street name (not just city/state)
-    if len(left) < 3 or len(right) < 3:
-        return False
-
-    return True
-
-def is_generic_placeholder(address):
-    """Check if address is a generic placeholder"""
-    if pd.isna(address) or address == '':
-        return True
-
-    address_str = str(address).strip().lower()
-
-    for placeholder in GENERIC_PLACEHOLDERS:
-        if placeholder.lower() in address_str:
-            return True
-
-    return False
-
-def is_po_box(address):
-    """Check if address is a PO Box"""
-    if pd.isna(address) or address == '':
-        return False
-    return bool(re.search(r'\bP\.?\s*O\.?\s*Box\b', str(address), re.IGNORECASE))
-
 def audit_address_quality(cad_df):
-    """Audit FullAddress2 field quality"""
-    results = []
-
-    for idx, row in cad_df.iterrows():
-        report_num = row['ReportNumberNew']
-        address = row['FullAddress2']
-
-        issues = []
-        severity = 'OK'
-        suggested_fix = None
-
-        # Check for null/empty
-        if pd.isna(address) or str(address).strip() == '':
-            issues.append('NULL/EMPTY')
-            severity = 'CRITICAL'
-            suggested_fix = 'MANUAL REVIEW - NO ADDRESS PROVIDED'
-
-        # Check for generic placeholders
-        elif is_generic_placeholder(address):
-            issues.append('GENERIC_PLACEHOLDER')
-            severity = 'CRITICAL'
-            suggested_fix = 'REPLACE WITH ACTUAL ADDRESS'
-
-        # Check for PO Box
-        elif is_po_box(address):
-            issues.append('PO_BOX')
-            severity = 'WARNING'
-            suggested_fix = 'VERIFY PHYSICAL ADDRESS NEEDED'
-
-        # Check intersections
-        elif is_intersection(address):
-            if not has_valid_intersection(address):
-                issues.append('INCOMPLETE_INTERSECTION')
-                severity = 'HIGH'
-                suggested_fix = 'MISSING CROSS STREET - NEEDS BOTH STREET NAMES'
-
-        # Check standard addresses
-        else:
-            # Must have street number
-            if not has_street_number(address):
-                issues.append('MISSING_STREET_NUMBER')
-                severity = 'HIGH'
-                suggested_fix = 'ADD STREET NUMBER'
-
-            # Should have street type
-            if not has_street_type(address):
-                issues.append('MISSING_STREET_TYPE')
-                severity = 'MEDIUM'
-                suggested_fix = 'VERIFY STREET TYPE (St, Ave, Rd, etc.)'
-
-        # Only add to results if there are issues
-        if issues:
-            results.append({
-                'ReportNumberNew': report_num,
-                'FullAddress2': address,
-                'Issue_Type': '; '.join(issues),
-                'Severity': severity,
-                'Suggested_Fix': suggested_fix
-            })
-
-    return pd.DataFrame(results)
+    """Audit FullAddress2 field quality (rows with issues only)"""
+    flags = audit_address_flags(cad_df['FullAddress2'])
+    flagged = flags['Issue_Type'] != ''
+    report = pd.concat([cad_df.loc[flagged, ['ReportNumberNew', 'FullAddress2']], flags[flagged]], axis=1)
+    return report.reset_index(drop=True)
 
 # ============================================================================
 # MAIN EXECUTION
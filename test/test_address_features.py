@@ -0,0 +1,205 @@
+"""
+Tests for utils.address_features: the vectorized helpers must agree with the
+per-row functions they replaced.
+"""
+
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.address_features import (
+    AUDIT_PLACEHOLDERS, AUDIT_STREET_TYPES, COMPLETENESS_ISSUES, GENERIC_TERMS, INVALID_GENERIC_TERMS,
+    STREET_REGEX, STREET_TYPES, address_completeness, audit_address_flags, categorize_addresses, count_issues,
+    invalid_address_flags
+)
+
+
+ADDRESSES = [
+    None,
+    np.nan,
+    '',
+    '   ',
+    '123 Main Street, Hackensack, NJ, 07601',
+    '5  OAK   AVE ,  HACKENSACK, NJ, 07601',
+    '12 Elm, Hackensack, NJ, 07601',
+    '12 Elm Ln',
+    'Main Street',
+    'Hackensack, NJ, 07601',
+    'MAIN ST & OAK AVE, HACKENSACK, NJ, 07601',
+    'Main St & , Hackensack, NJ',
+    'Main St & Hackensack, NJ',
+    'Main & Oak',
+    'Main St & Oak',
+    'Main & Oak Ave',
+    'A & B & C',
+    'Columbus Park & Main Street',
+    'School St & Park Ave',
+    'PO Box 12, Hackensack, NJ',
+    'P.O. BOX 5',
+    'UNKNOWN',
+    'Home',
+    'home of 5 Main St',
+    'Parking Lot behind 5 Main St',
+    'N/A',
+    'TBD',
+    'Canceled Call',
+    'Not Provided',
+]
+
+
+# Per-row functions as they were before the shared module
+
+def _has_street_type(text):
+    return any(re.search(rf'\b{st_type}\b', str(text).upper()) for st_type in STREET_TYPES)
+
+
+def categorize_address(address):
+    if pd.isna(address) or str(address).strip() == '':
+        return 'blank', 'Null or empty address'
+    addr = str(address).strip()
+    addr_upper = addr.upper()
+    if re.search(r'P\.?O\.?\s*BOX', addr_upper):
+        return 'po_box', 'PO Box address'
+    for term in GENERIC_TERMS:
+        if addr_upper.startswith(term) or f' {term} ' in addr_upper:
+            if term == 'PARK' and '&' in addr:
+                parts = addr.split('&')
+                if len(parts) == 2 and _has_street_type(parts[1]):
+                    continue
+            return 'generic_location', f'Generic term: {term}'
+    if '&' in addr:
+        parts = addr.split('&')
+        if len(parts) == 2:
+            part1 = parts[0].strip()
+            part2 = parts[1].strip()
+            if not part2 or part2.startswith(',') or re.match(r'^,?\s*(Hackensack|NJ|07601)', part2, re.IGNORECASE):
+                return 'incomplete_intersection', 'Missing second street in intersection'
+            has_type1 = _has_street_type(part1)
+            has_type2 = _has_street_type(part2)
+            if has_type1 and has_type2:
+                return 'valid_intersection', 'Valid intersection format'
+            elif not has_type1 and not has_type2:
+                return 'missing_street_type', 'Both streets missing type'
+            elif not has_type1:
+                return 'missing_street_type', f'First street missing type: {part1}'
+            else:
+                return 'missing_street_type', f'Second street missing type: {part2}'
+    if re.match(r'^\d+', addr):
+        if _has_street_type(addr):
+            if re.search(r'Hackensack.*NJ.*07601', addr, re.IGNORECASE):
+                return 'valid_standard', 'Valid standard address'
+            return 'incomplete', 'Missing city/state/zip'
+        return 'missing_street_type', 'No street type suffix'
+    if _has_street_type(addr):
+        return 'missing_street_number', 'Street name without number'
+    if re.match(r'^(Hackensack|NJ|07601)', addr, re.IGNORECASE):
+        return 'incomplete', 'City/state only'
+    return 'missing_street_number', 'No street number'
+
+
+def is_invalid_address(address):
+    if pd.isna(address) or str(address).strip() == '':
+        return True, 'blank'
+    addr = str(address).strip()
+    addr_upper = addr.upper()
+    if re.search(r'&\s*,', addr_upper):
+        return True, 'incomplete_intersection'
+    for term in INVALID_GENERIC_TERMS:
+        if re.search(rf'\b{re.escape(term)}\b', addr_upper):
+            return True, 'generic_location'
+    if ' & ' in addr_upper:
+        parts = addr_upper.split('&')
+        if len(parts) == 2:
+            if re.search(STREET_REGEX, parts[0].strip(), re.IGNORECASE) and \
+                    re.search(STREET_REGEX, parts[1].strip(), re.IGNORECASE):
+                return False, 'valid'
+    if ' & ' not in addr_upper:
+        if not re.match(r'^\d+', addr):
+            if not re.search(STREET_REGEX, addr_upper, re.IGNORECASE):
+                return True, 'missing_street_number'
+    if re.match(r'^\d+', addr):
+        if not re.search(STREET_REGEX, addr_upper, re.IGNORECASE):
+            return True, 'missing_street_type'
+    return False, 'valid'
+
+
+def evaluate_address(value):
+    if pd.isna(value):
+        return False, ['missing_address']
+    text = re.sub(r'\s+', ' ', str(value).upper().strip())
+    if text in {'UNKNOWN', 'NOT PROVIDED', 'N/A', 'NONE', '', 'TBD', 'TO BE DETERMINED'}:
+        return False, ['generic_placeholder']
+    issues = []
+    if not text.endswith(', HACKENSACK, NJ, 07601'):
+        issues.append('missing_city_state_zip')
+    if ' & ' not in text and not re.match(r'^\d+ ', text):
+        issues.append('missing_house_number')
+    if not re.search(r'( STREET| AVENUE| ROAD| PLACE| DRIVE| COURT| BOULEVARD| LANE| WAY| HWY| HIGHWAY| ROUTE'
+                     r'| AVE| ST| RD| BLVD| DR| CT| PL)', text):
+        issues.append('missing_street_suffix')
+    return not issues, issues
+
+
+def audit_address(address):
+    if pd.isna(address) or str(address).strip() == '':
+        return 'NULL/EMPTY', 'CRITICAL', 'MANUAL REVIEW - NO ADDRESS PROVIDED'
+    text = str(address)
+    if any(term.lower() in text.strip().lower() for term in AUDIT_PLACEHOLDERS):
+        return 'GENERIC_PLACEHOLDER', 'CRITICAL', 'REPLACE WITH ACTUAL ADDRESS'
+    if re.search(r'\bP\.?\s*O\.?\s*Box\b', text, re.IGNORECASE):
+        return 'PO_BOX', 'WARNING', 'VERIFY PHYSICAL ADDRESS NEEDED'
+    if '&' in text:
+        stripped = text.strip()
+        parts = stripped.split('&')
+        valid = (
+            not re.search(r'&\s*,', stripped) and len(parts) == 2
+            and len(parts[0].strip()) >= 3 and len(parts[1].split(',')[0].strip()) >= 3
+        )
+        if valid:
+            return '', 'OK', None
+        return 'INCOMPLETE_INTERSECTION', 'HIGH', 'MISSING CROSS STREET - NEEDS BOTH STREET NAMES'
+    issues, severity, fix = [], 'OK', None
+    if not re.match(r'^\d+', text.strip()):
+        issues, severity, fix = ['MISSING_STREET_NUMBER'], 'HIGH', 'ADD STREET NUMBER'
+    if not any(re.search(rf'\b{st}\b', text, re.IGNORECASE) for st in AUDIT_STREET_TYPES):
+        issues.append('MISSING_STREET_TYPE')
+        severity, fix = 'MEDIUM', 'VERIFY STREET TYPE (St, Ave, Rd, etc.)'
+    return '; '.join(issues), severity, fix
+
+
+@pytest.mark.parametrize('address', ADDRESSES)
+def test_vectorized_helpers_match_per_row(address):
+    # Pad with a second value so the address is not the only distinct one
+    series = pd.Series([address, '1 Main St, Hackensack, NJ, 07601'], dtype=object)
+
+    category = categorize_addresses(series).iloc[0]
+    assert (category['category'], category['reason']) == categorize_address(address)
+
+    invalid = invalid_address_flags(series).iloc[0]
+    assert (bool(invalid['is_invalid']), invalid['issue_type']) == is_invalid_address(address)
+
+    completeness = address_completeness(series)
+    valid, issues = evaluate_address(address)
+    assert bool(completeness['valid'].iloc[0]) == valid
+    assert [issue for issue in COMPLETENESS_ISSUES if completeness[issue].iloc[0]] == issues
+
+    audit = audit_address_flags(series).iloc[0]
+    assert (audit['Issue_Type'], audit['Severity'], audit['Suggested_Fix']) == audit_address(address)
+
+
+def test_issue_counts_match_row_by_row_counter():
+    series = pd.Series(ADDRESSES * 3, dtype=object)
+    expected = Counter()
+    for address in series:
+        expected.update(evaluate_address(address)[1])
+
+    counts = count_issues(address_completeness(series))
+    assert counts == expected
+    assert counts.most_common() == expected.most_common()
@@ -0,0 +1,38 @@
+"""
+Tests for utils.audit_store.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.audit_store import AUDIT_COLUMNS, AuditStore, read_audit_trail
+
+
+@pytest.mark.parametrize('name', ['audit.parquet', 'audit.csv'])
+def test_export_without_records_writes_requested_format(tmp_path, name):
+    pytest.importorskip('pyarrow')
+    for store in (AuditStore(), AuditStore(spill_path=tmp_path / f'spill_{name}')):
+        assert store.export(tmp_path / name) == 0
+        empty = read_audit_trail(tmp_path / name)
+        assert list(empty.columns) == AUDIT_COLUMNS and len(empty) == 0
+
+
+@pytest.mark.parametrize('suffix', ['.parquet', '.csv'])
+def test_export_after_close_keeps_spilled_records(tmp_path, suffix):
+    pytest.importorskip('pyarrow')
+    store = AuditStore(spill_path=tmp_path / f'spill{suffix}', flush_rows=2)
+    store.record_batch(['24-1', '24-2', '24-3'], 'PDZone', ['5', '6', '7'], ['05', '06', '07'], 'zone')
+    store.record('24-4', 'Disposition', 'GOA', 'Gone on Arrival', 'disposition')
+
+    assert len(store.to_frame()) == 4
+    with pytest.raises(ValueError):
+        store.record('24-5', 'PDZone', '8', '08', 'zone')
+
+    assert store.export(tmp_path / f'audit{suffix}') == 4
+    exported = read_audit_trail(tmp_path / f'audit{suffix}')
+    assert exported['case_number'].tolist() == ['24-1', '24-2', '24-3', '24-4']
+    assert exported['field'].astype(str).tolist() == ['PDZone'] * 3 + ['Disposition']
@@ -0,0 +1,46 @@
+"""
+Tests for utils.checkpoint.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.checkpoint import CheckpointManager
+from utils.error_bitmap import ErrorBitmap
+
+
+def test_round_trip_without_pickle(tmp_path):
+    checkpoints = CheckpointManager(tmp_path, input_hash='a' * 64, config_hash='b' * 64)
+    df = pd.DataFrame({
+        'ReportNumberNew': pd.array(['24-000001', None, '24-000003'], dtype='string'),
+        'PDZone': pd.Series([5, '6', None], dtype=object),
+        'Hour': [1.0, np.nan, 3.0],
+    })
+    errors = ErrorBitmap()
+    errors.add('PDZone', np.array([True, False, True]))
+    state = {
+        'stats': {'corrections_applied': np.int64(7), 'fields': np.array([1, 2])},
+        'audit': pd.DataFrame({'old_value': [2024, 'x'], 'new_value': ['2024', None]}),
+        'errors': errors.to_frame(),
+    }
+
+    checkpoints.save('validate', df, state)
+    assert not [path for path in tmp_path.iterdir() if path.suffix == '.pkl']
+    loaded, restored = checkpoints.load('validate')
+
+    pd.testing.assert_series_equal(loaded['ReportNumberNew'], df['ReportNumberNew'])
+    pd.testing.assert_series_equal(loaded['Hour'], df['Hour'])
+    # Mixed-type columns are kept as text, missing values stay missing
+    assert loaded['PDZone'].tolist() == ['5', '6', None]
+    assert restored['stats'] == {'corrections_applied': 7, 'fields': [1, 2]}
+    assert restored['audit']['old_value'].tolist() == ['2024', 'x']
+    assert ErrorBitmap.from_frame(restored['errors']) == errors
+
+    # Data, metadata, state JSON and the two state frames
+    assert checkpoints.clear() == 5
+    assert not checkpoints.is_valid('validate')
@@ -0,0 +1,108 @@
+"""
+Tests for processors.chunked_runner: chunked runs must match a serial run.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from processors.cad_data_processor import CADDataProcessor
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    """Small CAD export, keyed/rule corrections and a config writing into tmp_path."""
+    n = 1200
+    rng = np.random.default_rng(1)
+    keys = np.array([f'24-{i:06d}' for i in rng.integers(0, n // 2, n)], dtype=object)
+    times = pd.Series(pd.date_range('2024-01-01', periods=n, freq='7min'))
+    pd.DataFrame({
+        'ReportNumberNew': keys,
+        'Incident': rng.choice(['NOISE', 'ROBBERY', 'MERGE ARTIFACT', None], n),
+        'How Reported': rng.choice(['911', 'PHONE', 'Walk In', 'TEL', None], n),
+        'FullAddress2': rng.choice(['1 MAIN ST, Hackensack, NJ', 'UNKNOWN', '2 OAK AVE, Hackensack, NJ', None], n),
+        'PDZone': rng.choice([5, 6, 7, None], n),
+        'Time of Call': times.dt.strftime('%m/%d/%Y %H:%M'),
+        'Time Dispatched': (times + pd.Timedelta(minutes=3)).dt.strftime('%m/%d/%Y %H:%M'),
+        'Officer': rng.choice(['P.O. A', None], n),
+        'Disposition': rng.choice(['sees Report', 'GOA', None], n),
+    }).to_csv(tmp_path / 'in.csv', index=False)
+
+    # Case numbers repeat across chunks, so keyed patches hit several chunks
+    patched = pd.Series(keys).drop_duplicates().head(60)
+    pd.DataFrame({'ReportNumberNew': patched, 'Corrected_Value': '9 ELM ST, Hackensack, NJ'}).to_csv(
+        tmp_path / 'address.csv', index=False)
+    pd.DataFrame({'pattern': ['OAK AVE'], 'replacement': ['2 OAK AVENUE, Hackensack, NJ']}).to_csv(
+        tmp_path / 'fulladdress2.csv', index=False)
+
+    config = yaml.safe_load(open(ROOT / 'config' / 'config.yml'))
+    config['paths'].update({
+        'log_file': str(tmp_path / 'cad.log'),
+        'audit_file': str(tmp_path / 'audit.csv'),
+        'hash_manifest': str(tmp_path / 'manifest.json'),
+        'manual_review_file': str(tmp_path / 'flagged.xlsx'),
+        'merge_artifact_file': str(tmp_path / 'merge_artifacts.csv'),
+        'corrections': {'address': str(tmp_path / 'address.csv'), 'fulladdress2': str(tmp_path / 'fulladdress2.csv')},
+    })
+    config['processing'].update({'chunk_size': 250, 'n_workers': 1, 'use_dask': False})
+    config['logging']['console_output'] = False
+    config['checkpoints']['enabled'] = False
+    config_path = tmp_path / 'config.yml'
+    config_path.write_text(yaml.safe_dump(config))
+    return str(config_path), str(tmp_path / 'in.csv'), tmp_path
+
+
+@pytest.mark.parametrize('n_workers', [1, 2])
+def test_chunked_output_and_stats_match_serial(pipeline, n_workers):
+    config_path, input_path, tmp_path = pipeline
+    config = yaml.safe_load(open(config_path))
+    config['processing']['n_workers'] = n_workers
+    Path(config_path).write_text(yaml.safe_dump(config))
+
+    serial = CADDataProcessor(config_path)
+    serial.load_data(input_path)
+    serial.run_all_corrections()
+    serial.export_corrected_data(str(tmp_path / 'serial.csv'))
+    serial_audit = pd.read_csv(tmp_path / 'audit.csv', dtype=str)
+    serial_flagged = pd.read_excel(tmp_path / 'flagged.xlsx', dtype=str)
+    serial_artifacts = pd.read_csv(tmp_path / 'merge_artifacts.csv', dtype=str)
+
+    chunked = CADDataProcessor(config_path)
+    stats = chunked.run_chunked(input_path, str(tmp_path / 'chunked.csv'))
+    chunked_audit = pd.read_csv(tmp_path / 'audit.csv', dtype=str)
+    chunked_flagged = pd.read_excel(tmp_path / 'flagged.xlsx', dtype=str)
+    chunked_artifacts = pd.read_csv(tmp_path / 'merge_artifacts.csv', dtype=str)
+
+    pd.testing.assert_frame_equal(
+        pd.read_csv(tmp_path / 'chunked.csv', dtype=str),
+        pd.read_csv(tmp_path / 'serial.csv', dtype=str)
+    )
+    assert {key: int(value) for key, value in stats.items()} == \
+        {key: int(value) for key, value in serial.processing_stats.items()}
+    assert stats['corrections_applied'] > 0
+    # Merge artifact scan results are not exported, only duplicate_flag
+    assert 'duplicate_flag' in serial.df.columns
+    assert not [col for col in serial.df.columns if col.startswith('merge_artifact')]
+    # ...while the pattern and column per flagged row go to the artifact report
+    incidents = serial.df['Incident'].astype(object)
+    expected = incidents[incidents == 'MERGE ARTIFACT']
+    assert serial_artifacts['row'].astype(int).tolist() == expected.index.tolist()
+    assert (serial_artifacts['ReportNumberNew'] == serial.df.loc[expected.index, 'ReportNumberNew'].to_numpy()).all()
+    assert set(serial_artifacts['pattern']) == {'.*MERGE.*'}
+    assert set(serial_artifacts['column']) == {'Incident'}
+    pd.testing.assert_frame_equal(chunked_artifacts, serial_artifacts)
+    # Flagged rows are streamed per chunk into the same file a serial run writes
+    assert len(serial_flagged) > 0
+    pd.testing.assert_frame_equal(chunked_flagged, serial_flagged)
+    columns = ['case_number', 'field', 'old_value', 'new_value', 'correction_type']
+    pd.testing.assert_frame_equal(
+        chunked_audit[columns].sort_values(columns).reset_index(drop=True),
+        serial_audit[columns].sort_values(columns).reset_index(drop=True)
+    )
@@ -0,0 +1,95 @@
+"""
+Tests for utils.datetime_parser.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils import datetime_parser
+from utils.column_profile import invalidate
+from utils.datetime_parser import cached_datetimes, detect_datetime_format, parse_datetimes
+
+
+@pytest.fixture
+def call_times():
+    """CAD-style text: mostly MM/DD/YYYY HH:MM, with an ISO first value and junk."""
+    stamps = pd.Series(pd.date_range('2024-01-01 00:05', periods=500, freq='37min'))
+    text = stamps.dt.strftime('%m/%d/%Y %H:%M').astype(object)
+    text[0] = stamps[0].strftime('%Y-%m-%d %H:%M:%S')
+    text[10] = '1/2/2024 9:05'
+    text[11] = '02/30/2024 10:00'
+    text[12] = 'nan'
+    text[13] = None
+    return stamps, text
+
+
+def test_detects_dominant_format_not_first_value(call_times):
+    _, text = call_times
+    assert detect_datetime_format(text) == '%m/%d/%Y %H:%M'
+
+
+def test_parses_dominant_format_and_leftovers(call_times):
+    stamps, text = call_times
+    parsed = parse_datetimes(text)
+
+    assert parsed.dtype == 'datetime64[ns]'
+    assert parsed[0] == stamps[0]
+    assert parsed[10] == pd.Timestamp('2024-01-02 09:05')
+    assert parsed[[11, 12, 13]].isna().all()
+    expected = stamps.drop([10, 11, 12, 13])
+    pd.testing.assert_series_equal(parsed.drop([10, 11, 12, 13]), expected, check_names=False)
+
+
+def test_years_outside_datetime_range_are_nat_not_wrapped(call_times):
+    _, text = call_times
+    text = text.copy()
+    text[20] = '01/01/9999 00:00'
+    text[21] = '12/31/1500 10:00'
+    text[22] = '04/11/2262 00:00'
+    text[23] = '09/20/1677 23:59'
+    parsed = parse_datetimes(text)
+
+    assert parsed[[20, 21, 23]].isna().all()
+    assert parsed[22] == pd.Timestamp('2262-04-11')
+    expected = pd.to_datetime(text[20:24], format='%m/%d/%Y %H:%M', errors='coerce')
+    pd.testing.assert_series_equal(parsed[20:24], expected)
+
+
+def test_fallback_disabled_leaves_other_formats_unparsed(call_times):
+    _, text = call_times
+    parsed = parse_datetimes(text, fallback=False)
+    assert pd.isna(parsed[0])
+    assert parsed[10] == pd.Timestamp('2024-01-02 09:05')
+
+
+def test_cached_per_frame_until_column_invalidated(call_times, monkeypatch):
+    _, text = call_times
+    df = pd.DataFrame({'TimeOfCall': text, 'Time In': text})
+    calls = []
+    real_parse = datetime_parser.parse_datetimes
+    monkeypatch.setattr(datetime_parser, 'parse_datetimes', lambda s, f=None: calls.append(s.name) or real_parse(s, f))
+
+    first = cached_datetimes(df, 'TimeOfCall')
+    assert cached_datetimes(df, 'TimeOfCall') is first
+    cached_datetimes(df, 'Time In')
+    assert calls == ['TimeOfCall', 'Time In']
+
+    df['TimeOfCall'] = text.copy()
+    invalidate(df, 'TimeOfCall')
+    cached_datetimes(df, 'TimeOfCall')
+    assert calls == ['TimeOfCall', 'Time In', 'TimeOfCall']
+
+    # In-place edits keep the buffer; the writer's invalidate is what counts
+    df.loc[0, 'Time In'] = '03/04/2030 05:06'
+    invalidate(df, 'Time In')
+    assert cached_datetimes(df, 'Time In')[0] == pd.Timestamp('2030-03-04 05:06')
+
+    # Parsing into the column ends the caching: datetimes are returned as is
+    df['TimeOfCall'] = first
+    assert cached_datetimes(df, 'TimeOfCall') is df['TimeOfCall']
+    assert cached_datetimes(df, 'Missing').isna().all()
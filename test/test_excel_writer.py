@@ -0,0 +1,41 @@
+"""
+Tests for utils.excel_writer formula escaping.
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.excel_writer import StreamingExcelWriter, escape_excel_formulas
+
+
+@pytest.mark.parametrize('series', [
+    pd.Series([1, 2, None], dtype=object),
+    pd.Series([date(2024, 1, 1), None], dtype=object),
+    pd.Series([5, 6, 5], dtype='category'),
+])
+def test_non_string_columns_are_unchanged(series):
+    pd.testing.assert_series_equal(escape_excel_formulas(series), series)
+
+
+def test_formula_text_is_quoted():
+    series = pd.Series(['=SUM(A1)', '-5 units', 7, None, 'ok', '@x'], dtype=object)
+    assert escape_excel_formulas(series).tolist() == ["'=SUM(A1)", "'-5 units", 7, None, 'ok', "'@x"]
+    categorical = escape_excel_formulas(series.astype(str).astype('category'))
+    assert categorical.tolist()[:2] == ["'=SUM(A1)", "'-5 units"]
+
+
+def test_streaming_writer_escapes_mixed_object_columns(tmp_path):
+    df = pd.DataFrame({
+        'count': pd.Series([1, 2, None], dtype=object),
+        'note': pd.Series(['=cmd', 'fine', None], dtype=object),
+    })
+    path = tmp_path / 'out.xlsx'
+    with StreamingExcelWriter(path, escape_formulas=True) as writer:
+        writer.write(df)
+    assert pd.read_excel(path)['note'].tolist()[:2] == ["'=cmd", 'fine']
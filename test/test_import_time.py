@@ -0,0 +1,77 @@
+"""
+Startup budget for the pipeline entry points.
+
+Runs ``python -X importtime`` on main.py and scripts/master_pipeline.py in a
+fresh interpreter and fails if importing them gets slower than the budget or
+starts loading the heavy dependencies (pandas, dask, openpyxl, ...) that are
+meant to load only once a pipeline step needs them.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative import time in microseconds; pandas alone takes well over this
+IMPORT_BUDGET_US = {
+    "main": 300_000,
+    "master_pipeline": 300_000,
+}
+
+DEFERRED_MODULES = {"pandas", "numpy", "dask", "openpyxl", "pyarrow", "pydantic", "requests"}
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+def _import_profile(module: str, cwd: Path) -> dict:
+    """Import ``module`` in a fresh interpreter and return top-level module -> cumulative µs."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(REPO_ROOT), str(REPO_ROOT / "scripts")])
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, env=env, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        if "ModuleNotFoundError" in proc.stderr:
+            pytest.skip(f"{module} dependencies not installed: {proc.stderr.strip().splitlines()[-1]}")
+        raise AssertionError(f"import {module} failed:\n{proc.stderr}")
+
+    profile = {}
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            name = match.group(4)
+            profile[name] = profile.get(name, 0) + int(match.group(2))
+    return profile
+
+
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGET_US))
+def test_entry_point_import_time_within_budget(module, tmp_path):
+    # Best of three to keep a cold disk cache or a busy machine from failing the run
+    profiles = [_import_profile(module, tmp_path) for _ in range(3)]
+    elapsed = min(profile[module] for profile in profiles)
+    assert elapsed <= IMPORT_BUDGET_US[module], (
+        f"import {module} took {elapsed / 1000:.0f} ms (budget {IMPORT_BUDGET_US[module] / 1000:.0f} ms)"
+    )
+
+    loaded = DEFERRED_MODULES & set(profiles[0])
+    assert not loaded, f"import {module} eagerly loads {sorted(loaded)}"
+
+
+def test_package_exports_leave_submodules_importable():
+    import importlib
+    import types
+
+    sys.path.insert(0, str(REPO_ROOT))
+    import utils
+
+    for submodule in sorted(set(utils._EXPORTS.values()) | {"lazy_import"}):
+        module = importlib.import_module(f"utils.{submodule}")
+        assert getattr(utils, submodule) is module
+        assert isinstance(module, types.ModuleType)
+    assert callable(utils.get_column_profile) and callable(utils.compute_address_features)
@@ -0,0 +1,55 @@
+"""
+Tests for utils.pattern_standardizer: must match the per-variation str.contains loop.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.pattern_standardizer import PatternStandardizer
+
+
+def _sequential(series, patterns):
+    """The original loop: one case-insensitive substring pass per variation, in order."""
+    series = series.copy()
+    for standard, variations in patterns.items():
+        for variation in variations:
+            mask = series.astype(str).str.contains(variation, case=False, na=False, regex=False)
+            series[mask] = standard
+    return series
+
+
+def _standardized(series, patterns):
+    rows, values = PatternStandardizer(patterns).standardize(series)
+    result = series.copy()
+    result.iloc[rows] = values
+    return result
+
+
+@pytest.mark.parametrize('patterns, values', [
+    # 'ca' hides nothing: 'abc' must still see the 'C' in 'ca'
+    ({'ca': ['CA', 'B', 'a'], 'abc': ['c']}, ['aaa', 'b', 'xyz', None]),
+    ({'9-1-1': ['911', '9-1-1'], 'Phone': ['PHONE', 'TEL'], 'Walk-In': ['WALK'], 'Radio': ['RADIO']},
+     ['911', 'phone 911', 'Walk in', 'tel', 'Radio', '', None, 'other']),
+])
+def test_matches_sequential_loop(patterns, values):
+    series = pd.Series(values, dtype=object)
+    pd.testing.assert_series_equal(_standardized(series, patterns), _sequential(series, patterns))
+
+
+def test_matches_sequential_loop_on_random_patterns():
+    rng = np.random.default_rng(3)
+    letters = list('abc')
+    for _ in range(200):
+        patterns = {
+            ''.join(rng.choice(letters, rng.integers(1, 4))):
+                [''.join(rng.choice(letters, rng.integers(1, 3))) for _ in range(rng.integers(1, 4))]
+            for _ in range(rng.integers(1, 5))
+        }
+        series = pd.Series([''.join(rng.choice(letters, rng.integers(0, 5))) for _ in range(20)], dtype=object)
+        pd.testing.assert_series_equal(_standardized(series, patterns), _sequential(series, patterns))
@@ -0,0 +1,54 @@
+"""
+Tests for utils.time_fields.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.time_fields import HHMM_LABELS, derive_time_fields, match_codes, mismatched_rows
+
+
+def _times():
+    times = pd.Series(pd.date_range('1969-12-31 22:00', periods=5000, freq='1237min'))
+    times[3] = pd.NaT
+    return times
+
+
+def test_fields_match_strftime():
+    times = _times()
+    fields = derive_time_fields(times)
+
+    for derived, fmt in [(fields.cmonth(), '%B'), (fields.hour_minute(), '%H:%M'),
+                         (fields.day_of_week(), '%A'), (fields.cyear(), '%Y')]:
+        assert isinstance(derived.dtype, pd.CategoricalDtype)
+        pd.testing.assert_series_equal(derived.astype(object), times.dt.strftime(fmt).astype(object),
+                                       check_names=False)
+    pd.testing.assert_series_equal(fields.hour(), times.dt.hour.astype('float64'), check_names=False)
+    assert len(HHMM_LABELS) == 1440
+    assert fields.hour_minute().cat.codes[3] == -1
+
+
+def test_match_codes_converts_like_astype_str():
+    categories = pd.Index(['2023', '2024'])
+    values = pd.Series([2024, '2023', None, np.nan, 2024.0, ' 2024 '], dtype=object)
+
+    assert match_codes(values, categories).tolist() == [1, 0, -1, -1, -1, -1]
+    assert match_codes(values, categories, strip=True)[5] == 1
+    # A categorical already stores 2024.0 as the 2024 category
+    assert match_codes(values.astype('category'), categories).tolist() == [1, 0, -1, -1, 1, -1]
+
+
+def test_mismatched_rows_skip_missing_times():
+    times = _times()
+    fields = derive_time_fields(times)
+    stored = times.dt.strftime('%A').copy()
+    stored[[0, 3]] = 'Funday'
+
+    mismatch, expected = mismatched_rows(fields, 'DayofWeek', stored)
+    assert np.flatnonzero(mismatch).tolist() == [0]
+    assert expected[0] == times[0].strftime('%A')
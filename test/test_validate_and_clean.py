@@ -0,0 +1,316 @@
+"""
+Unit tests for scripts/01_validate_and_clean.py.
+
+Kept out of the script so importing it (or running it) does not load pytest.
+"""
+
+import importlib
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import yaml
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+# Imported by name (not exec'd from a path) so process-pool workers can unpickle its functions
+validate_and_clean = importlib.import_module("01_validate_and_clean")
+CADDataValidator = validate_and_clean.CADDataValidator
+StratifiedReservoirSampler = validate_and_clean.StratifiedReservoirSampler
+combine_file_summaries = validate_and_clean.combine_file_summaries
+fix_mojibake = validate_and_clean.fix_mojibake
+merge_zone_data = validate_and_clean.merge_zone_data
+normalize_how_reported_value = validate_and_clean.normalize_how_reported_value
+normalize_incident_key = validate_and_clean.normalize_incident_key
+
+
+@pytest.fixture
+def sample_data():
+    """Provide sample data for testing, including edge cases."""
+    return pd.DataFrame({
+        'ReportNumberNew': ['25-123456', '25-987654A', '25-123457', '25-123456B', None, 'invalid', '25-123456AB'],
+        'Incident': ['Noise Complaint', 'ROBBERY', 'Task Assignment', 'ASSAULT', '', None, 'UNKNOWN'],
+        'How Reported': ['PHONE', '9-1-1', 'INVALID', 'RADIO', None, '2024-01-01', 'EMAIL'],
+        'FullAddress2': ['123 Main Street, Hackensack, NJ, 07601', 'INVALID', '456 Elm St, Hackensack, NJ, 07601', 'Main & Atlantic, Hackensack, NJ, 07601', None, '123 Main St', '123 Main Street, Other City, NJ, 00000'],
+        'PDZone': ['7', '5', '10', '6', None, '4', '9'],
+        'Time of Call': ['2025-10-17 17:00:00', '2025-10-17 17:05:00', '2025-10-17 17:10:00', '2025-10-17 17:15:00', '2035-01-01 00:00:00', None, '2019-01-01 00:00:00'],
+        'Time Dispatched': ['2025-10-17 17:02:00', '2025-10-17 17:06:00', '2025-10-17 17:12:00', '2025-10-17 17:14:00', None, '2025-10-17 16:59:00', '2025-10-17 17:16:00'],
+        'Time Out': ['2025-10-17 17:03:00', '2025-10-17 17:07:00', '2025-10-17 17:13:00', '2025-10-17 17:16:00', None, '2025-10-17 17:00:00', '2025-10-17 17:15:00'],
+        'Time In': ['2025-10-17 17:04:00', '2025-10-17 17:08:00', '2025-10-17 17:14:00', '2025-10-17 17:17:00', None, '2025-10-17 16:58:00', '2025-10-17 17:18:00'],
+        'Time Spent': ['0 days 00:04:00', '0 days 00:03:00', '-0 days 00:01:00', '0 days 25:00:00', None, 'invalid', '0 days 00:00:00'],
+        'Officer': ['P.O. John Doe', None, 'P.O. Jane Doe', 'P.O. John Doe', '', 'P.O. Invalid', None],
+        'Disposition': ['COMPLETE', 'ADVISED', 'INVALID', 'COMPLETE', None, 'COMPLETE', 'ADVISED'],
+        'Response Type': ['ROUTINE', 'EMERGENCY', 'ROUTINE', 'URGENT', None, 'EMERGENCY', 'ROUTINE']
+    })
+
+@pytest.fixture
+def validator():
+    """Provide a test instance of CADDataValidator."""
+    return CADDataValidator()
+
+def test_validate_case_number_format(validator, sample_data):
+    result = validator._validate_case_number_format(sample_data, {'rule_id': 'CRIT_001', 'field': 'ReportNumberNew', 'severity': 'critical'})
+    assert result['passed'] == 4
+    assert result['failed'] == 3
+
+def test_validate_case_number_uniqueness(validator, sample_data):
+    result = validator._validate_case_number_uniqueness(sample_data, {'rule_id': 'CRIT_002', 'field': 'ReportNumberNew', 'severity': 'critical'})
+    assert result['passed'] == 6
+    assert result['failed'] == 1
+
+def test_validate_call_datetime(validator, sample_data):
+    result = validator._validate_call_datetime(sample_data, {'rule_id': 'CRIT_003', 'field': 'Time of Call', 'severity': 'critical'})
+    assert result['passed'] == 4
+    assert result['failed'] == 3
+
+def test_validate_incident_type_presence(validator, sample_data):
+    result = validator._validate_incident_type_presence(sample_data, {'rule_id': 'CRIT_004', 'field': 'Incident', 'severity': 'critical'})
+    assert result['passed'] == 5
+    assert result['failed'] == 2
+
+def test_validate_address_completeness(validator, sample_data):
+    result = validator._validate_address_completeness(sample_data, {'rule_id': 'IMP_001', 'field': 'FullAddress2', 'severity': 'important'})
+    assert result['passed'] == 2
+    assert result['failed'] == 5
+
+def test_validate_officer_assignment(validator, sample_data):
+    result = validator._validate_officer_assignment(sample_data, {'rule_id': 'IMP_002', 'field': 'Officer', 'severity': 'important'})
+    assert result['passed'] == 5
+    assert result['failed'] == 2
+
+def test_validate_disposition_consistency(validator, sample_data):
+    result = validator._validate_disposition_consistency(sample_data, {'rule_id': 'IMP_003', 'field': 'Disposition', 'severity': 'important'})
+    assert result['passed'] == 5
+    assert result['failed'] == 2
+
+def test_validate_time_sequence(validator, sample_data):
+    result = validator._validate_time_sequence(sample_data, {'rule_id': 'IMP_004', 'fields': ['Time of Call', 'Time Dispatched', 'Time Out', 'Time In'], 'severity': 'important'})
+    assert result['passed'] == 4
+    assert result['failed'] == 3
+
+def test_validate_datetime_duration(validator, sample_data):
+    result = validator._validate_datetime_duration(sample_data, {'rule_id': 'IMP_005', 'fields': ['Time of Call', 'Time Dispatched', 'Time Out', 'Time In'], 'severity': 'important'})
+    assert result['passed'] == 4
+    assert result['failed'] == 3
+
+def test_validate_time_spent(validator, sample_data):
+    result = validator._validate_time_spent(sample_data, {'rule_id': 'IMP_006', 'field': 'Time Spent', 'severity': 'important'})
+    assert result['passed'] == 4
+    assert result['failed'] == 3
+
+def test_validate_how_reported(validator, sample_data):
+    result = validator._validate_how_reported(sample_data, {'rule_id': 'OPT_001', 'field': 'How Reported', 'severity': 'optional'})
+    assert result['passed'] == 4
+    assert result['failed'] == 3
+
+def test_validate_zone_validity(validator, sample_data):
+    result = validator._validate_zone_validity(sample_data, {'rule_id': 'OPT_002', 'field': 'PDZone', 'severity': 'optional'})
+    assert result['passed'] == 4
+    assert result['failed'] == 3
+
+def test_validate_response_type_consistency(validator, sample_data):
+    result = validator._validate_response_type_consistency(sample_data, {'rule_id': 'OPT_003', 'fields': ['Response Type', 'Incident'], 'severity': 'optional'})
+    assert result['passed'] == 6
+    assert result['failed'] == 1
+
+def test_validate_full_counts_are_exact(validator, sample_data):
+    data = pd.concat([sample_data] * 3, ignore_index=True)
+    full = validator._validate_full(data)
+    assert full['validation_scope'] == 'full_population'
+    for category, rules in validator.validation_rules.items():
+        for rule_id, rule in rules.items():
+            single = validator._apply_validation_rule(data, rule)
+            assert full[category][rule_id]['estimated_full_passed'] == single['passed']
+            assert full[category][rule_id]['estimated_full_failed'] == single['failed']
+
+def test_clean_data_incident_mapping(validator, sample_data):
+    cleaned = validator.clean_data(sample_data)
+    assert cleaned['Incident'].iloc[0] == 'Noise Complaint'
+    assert cleaned['Response Type'].iloc[0] == 'Routine'
+
+def test_clean_data_parallel_matches_serial(validator, sample_data):
+    validator.incident_mapping = pd.DataFrame({
+        'Incident': ['Noise Complaint', 'Robbery'],
+        'Incident_Norm': ['Noise Complaint', 'Robbery'],
+        'Response_Type': ['Routine', 'Emergency'],
+        'Incident_key': ['NOISE COMPLAINT', 'ROBBERY']
+    })
+    data = pd.concat([sample_data] * 5, ignore_index=True)
+    serial = validator.clean_data(data)
+    parallel = validator.clean_data(data, workers=2, partition_rows=8)
+    pd.testing.assert_frame_equal(parallel, serial)
+    assert parallel.attrs['stats'] == serial.attrs['stats']
+
+def test_incident_remap_keeps_rows_with_duplicate_keys(validator):
+    validator.incident_mapping = pd.DataFrame({
+        'Incident': ['Noise Complaint', 'NOISE  COMPLAINT'],
+        'Incident_Norm': ['Noise Complaint', 'Disturbance'],
+        'Response_Type': ['Routine', 'Urgent'],
+        'Incident_key': ['NOISE COMPLAINT', 'NOISE COMPLAINT']
+    })
+    df = pd.DataFrame(
+        {'Incident': ['noise complaint', 'Loud Party', 'noise complaint'], 'Response Type': ['', 'ROUTINE', None]},
+        index=[10, 5, 7]
+    )
+    unmapped = set()
+    result = validator._apply_incident_mapping(df.astype({'Incident': 'category'}), unmapped=unmapped)
+    assert list(result.index) == [10, 5, 7]
+    assert result['Incident'].astype(object).tolist() == ['Noise Complaint', 'Loud Party', 'Noise Complaint']
+    assert result['Response Type'].tolist() == ['Routine', 'ROUTINE', 'Routine']
+    assert unmapped == {'Loud Party'}
+
+def test_fix_mojibake_replaces_encoded_dash():
+    text = "MOTOR VEHICLE CRASH â€“ PEDESTRIAN STRUCK"
+    fixed = fix_mojibake(text)
+    assert 'â€“' not in fixed
+    assert '–' in fixed
+
+def test_how_reported_normalization_variants():
+    variants = ['911', '9/1/1', '9 1 1', 'EMERGENCY 911', '2001-09-01']
+    normalized = {normalize_how_reported_value(v) for v in variants}
+    assert normalized == {'9-1-1'}
+
+def test_apply_incident_mapping_backfills(validator):
+    mapping_df = pd.DataFrame({
+        'Incident': ['MOTOR VEHICLE CRASH – PEDESTRIAN STRUCK'],
+        'Incident_Norm': ['TRAFFIC CRASH'],
+        'Response_Type': ['EMERGENCY RESPONSE']
+    })
+    mapping_df['Incident'] = mapping_df['Incident'].apply(fix_mojibake)
+    mapping_df['Incident_Norm'] = mapping_df['Incident_Norm'].apply(fix_mojibake)
+    mapping_df['Response_Type'] = mapping_df['Response_Type'].apply(fix_mojibake)
+    mapping_df['Incident_key'] = mapping_df['Incident'].apply(normalize_incident_key)
+    validator.incident_mapping = mapping_df
+
+    df = pd.DataFrame({
+        'Incident': ['MOTOR VEHICLE CRASH â€“ PEDESTRIAN STRUCK', 'MOTOR VEHICLE CRASH â€“ PEDESTRIAN STRUCK'],
+        'Response Type': ['', 'ROUTINE'],
+        'How Reported': ['911', 'PHONE']
+    })
+
+    result = validator._apply_incident_mapping(df)
+    assert result.loc[0, 'Incident'] == 'TRAFFIC CRASH'
+    assert result.loc[0, 'Response Type'] == 'EMERGENCY RESPONSE'
+    assert result.loc[1, 'Response Type'] == 'ROUTINE'
+
+def test_merge_zone_data_backfills_in_place(tmp_path):
+    zone_master = tmp_path / "zone_grid_master.xlsx"
+    pd.DataFrame({
+        'CrossStreetName': ['Main Street / Essex Street', '100 Main Street'],
+        'Grid': ['G1', 'G2'],
+        'PDZone': [7, 5]
+    }).to_excel(zone_master, index=False)
+    df = pd.DataFrame({
+        'FullAddress2': ['MAIN STREET & ESSEX STREET', '100 main st', '1 Nowhere Rd', None],
+        'PDZone': [None, 8, None, None]
+    })
+
+    result = merge_zone_data(df, str(zone_master), cache_dir=tmp_path / "cache")
+    assert result is df
+    assert result['Grid'].tolist()[:2] == ['G1', 'G2']
+    assert result['PDZone'].tolist()[:2] == [7, 8]
+    assert result[['Grid', 'PDZone']].iloc[2:].isna().all().all()
+    assert len(list((tmp_path / "cache").glob("zone_index_*.pkl"))) == 1
+
+    # A changed zone master invalidates the persisted index
+    pd.DataFrame({'CrossStreetName': ['1 Nowhere Road'], 'Grid': ['G9'], 'PDZone': [9]}).to_excel(zone_master, index=False)
+    rerun = merge_zone_data(pd.DataFrame({'FullAddress2': ['1 Nowhere Rd']}), str(zone_master), cache_dir=tmp_path / "cache")
+    assert rerun['PDZone'].tolist() == [9]
+
+def test_stratified_sampling_is_chunk_and_partition_invariant(validator):
+    incidents = ['NOISE'] * 400 + ['THEFT'] * 300 + ['RARE'] * 20 + [None] * 10
+    df = pd.DataFrame({'Incident': incidents, 'Row': range(len(incidents))}).sample(frac=1, random_state=1)
+    validator.sampling_config['stratified_sample_size'] = 100
+
+    sample = validator._stratified_sampling(df)
+    assert len(sample) == 100
+    assert sample.attrs['stratum_distribution'] == {'NOISE': 400, 'THEFT': 300, 'Other': 30}
+    assert sample['incident_stratum'].value_counts().to_dict() == {'NOISE': 55, 'THEFT': 41, 'Other': 4}
+
+    chunked = StratifiedReservoirSampler(100).update_frame(df, chunk_rows=37).sample()
+    left = StratifiedReservoirSampler(100).update(df.iloc[:300], offset=0)
+    right = StratifiedReservoirSampler(100).update(df.iloc[300:], offset=300)
+    merged = left.merge(right).sample()
+    assert chunked.index.equals(sample.index)
+    assert merged.index.equals(sample.index)
+
+def test_combine_file_summaries_merges_across_files():
+    summaries = [
+        {'source_dataset': '2024.xlsx', 'total_records': 100, 'overall_quality_score': 90.0, 'report_file': 'a.json',
+         'unmapped_incidents': ['B', 'A'], 'address_issue_summary': {'missing_house_number': 3}},
+        {'source_dataset': '2025.xlsx', 'total_records': 300, 'overall_quality_score': 70.0, 'report_file': 'b.json',
+         'unmapped_incidents': ['A', 'C'], 'address_issue_summary': {'missing_house_number': 1, 'generic_term': 5}},
+    ]
+    combined = combine_file_summaries(summaries)
+    assert combined['files_processed'] == 2
+    assert combined['total_records'] == 400
+    assert combined['overall_quality_score'] == 75.0
+    assert [f['source_dataset'] for f in combined['files']] == ['2024.xlsx', '2025.xlsx']
+    assert combined['unmapped_incidents'] == ['A', 'B', 'C']
+    assert combined['address_issue_summary'] == {'generic_term': 5, 'missing_house_number': 4}
+
+def test_validate_empty_dataframe(validator):
+    empty_df = pd.DataFrame()
+    cleaned = validator.clean_data(empty_df)
+    assert cleaned.empty
+    results = validator.validate_cad_dataset(empty_df)
+    assert results['total_records'] == 0
+    assert results['data_quality_score'] == 0.0
+
+def test_validate_missing_columns(validator):
+    df_missing = pd.DataFrame({'InvalidColumn': [1, 2]})
+    results = validator.validate_cad_dataset(df_missing)
+    for category, rules in results.items():
+        if isinstance(rules, dict):
+            for rule in rules.values():
+                if isinstance(rule, dict):
+                    assert 'error' in rule or rule.get('passed', 0) == 0
+
+def test_declarative_rules_from_rule_file(tmp_path, sample_data):
+    rules = validate_and_clean.load_rule_file()
+    rules['cad_validation']['optional_rules']['officer_badge_format'] = {
+        'rule_id': 'OPT_099', 'description': 'Officer starts with a rank', 'severity': 'optional',
+        'check': 'regex', 'field': 'Officer', 'pattern': r'P\.O\. '
+    }
+    rules_path = tmp_path / "validation_rules.yml"
+    rules_path.write_text(yaml.safe_dump(rules))
+    config_path = tmp_path / "config_enhanced.json"
+    config_path.write_text(json.dumps({
+        "address_abbreviations": {},
+        "validation_lists": {},
+        "paths": {"validation_rules": str(rules_path)}
+    }))
+
+    validator = CADDataValidator(config_path=str(config_path))
+    assert validator.rule_set.groups()[('Officer', 'Time Dispatched')][0].rule_id == 'IMP_002'
+    full = validator._validate_full(sample_data)
+    badge = full['optional_rules']['officer_badge_format']
+    assert (badge['estimated_full_passed'], badge['estimated_full_failed']) == (4, 3)
+    assert badge['failed_records'] == {'': 1}
+    assert set(full['rule_timings']) == {
+        rule_id for rules in validator.validation_rules.values() for rule_id in rules
+    }
+    # Declarative checks give the same counts as the rule they replaced
+    assert full['critical_rules']['case_number_format']['estimated_full_passed'] == 4
+
+def test_config_reload(tmp_path):
+    cfg = {
+        "address_abbreviations": {" ST ": " STREET "},
+        "validation_lists": {
+            "valid_dispositions": ["COMPLETE", "ADVISED"],
+            "valid_zones": ["5", "6", "7", "8", "9"],
+            "emergency_incidents": ["ROBBERY"],
+            "non_emergency_incidents": ["NOISE COMPLAINT"],
+            "how_reported": ["9-1-1", "PHONE"]
+        }
+    }
+    config_path = tmp_path / "config_enhanced.json"
+    config_path.write_text(json.dumps(cfg))
+    validator = CADDataValidator(config_path=str(config_path))
+    cfg["validation_lists"]["valid_dispositions"].append("REFERRED")
+    config_path.write_text(json.dumps(cfg))
+    validator.reload_config(str(config_path))
+    assert "REFERRED" in validator.config["validation_lists"]["valid_dispositions"]
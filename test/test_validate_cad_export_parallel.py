@@ -0,0 +1,211 @@
+"""
+Tests for the process-pool path of validate_cad_export_parallel.CADValidatorParallel.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from validate_cad_export_parallel import CADValidatorParallel
+from utils.error_bitmap import ErrorBitmap
+from utils.rule_flags import RuleFlagTable
+from utils.shared_frame import (
+    read_shared_frame, release_shared_frames, shared_frame_dir,
+    shared_frames_available, write_shared_frame
+)
+
+pytestmark = pytest.mark.skipif(not shared_frames_available(), reason="pyarrow not installed")
+
+
+@pytest.fixture
+def export_data():
+    """Small ESRI export with errors and fixes in every validated column."""
+    n = 400
+    rng = np.random.default_rng(7)
+    calls = pd.Series(pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 3e7, n), unit='s'))
+    text = lambda s: s.dt.strftime('%Y-%m-%d %H:%M:%S')
+
+    def choice(values, missing=0.15):
+        return pd.Series(rng.choice(values, n), dtype=object).where(rng.random(n) > missing)
+
+    df = pd.DataFrame({
+        'ReportNumberNew': [f'24-{i:06d}' if i % 9 else f'bad{i}' for i in range(n)],
+        'Incident': choice(['Theft - 2C:20-3', 'Noise']),
+        'How Reported': choice(['9-1-1', 'phone', 'bogus']),
+        'FullAddress2': choice(['1 Main St, Hackensack, NJ', 'Main St']),
+        'PDZone': choice(['5', '9', '12']),
+        'TimeOfCall': text(calls).where(rng.random(n) > .05, None),
+        'Time Dispatched': text(calls + pd.Timedelta('2min')),
+        'Time Out': text(calls + pd.Timedelta('5min')),
+        'Time In': text(calls - pd.Timedelta('1h')),
+        'cYear': choice(['2024', '2023'], missing=0),
+        'cMonth': choice(['January', 'May'], missing=0),
+        'Hour': choice(['00:00', '13:45'], missing=0),
+        'DayofWeek': choice(['Monday', 'Friday']),
+        'Disposition': choice(['Complete', 'complete', 'Nope']),
+        'Response_Type': choice(['Routine', 'Weird']),
+    })
+    df.index = pd.RangeIndex(1000, 1000 + 2 * n, 2)
+    return df
+
+
+def _validate(df, n_jobs):
+    validator = CADValidatorParallel(n_jobs=1, process_pool=True)
+    validator.n_jobs = n_jobs
+    validator.MIN_PARALLEL_ROWS = 0
+    return validator, validator.validate_all(df)
+
+
+def test_parallel_matches_serial(export_data):
+    serial, serial_df = _validate(export_data.copy(), n_jobs=1)
+    parallel, parallel_df = _validate(export_data.copy(), n_jobs=2)
+
+    pd.testing.assert_frame_equal(parallel_df, serial_df)
+    assert parallel.errors == serial.errors
+    assert parallel.warnings == serial.warnings
+    assert list(parallel.stats['errors_by_field'].items()) == list(serial.stats['errors_by_field'].items())
+    assert parallel.stats['fixes_by_field'] == serial.stats['fixes_by_field']
+    assert parallel.stats['rows_with_errors'] == serial.stats['rows_with_errors']
+    assert parallel.stats['rows_by_rule'] == serial.stats['rows_by_rule']
+
+
+def test_parallel_updates_input_frame_in_place(export_data):
+    df = export_data.copy()
+    _validate(df, n_jobs=2)
+    assert pd.api.types.is_datetime64_any_dtype(df['TimeOfCall'])
+    assert 'complete' not in set(df['Disposition'])
+
+
+def test_shared_frame_round_trip(export_data):
+    directory = shared_frame_dir()
+    try:
+        handle = write_shared_frame(export_data, directory / 'frame.arrow')
+        subset = read_shared_frame(handle, columns=['PDZone', 'Incident'])
+    finally:
+        release_shared_frames(directory)
+
+    assert not directory.exists()
+    pd.testing.assert_frame_equal(subset, export_data[['PDZone', 'Incident']])
+    # NaN stays NaN (not Arrow's None) so str() of a missing value is unchanged
+    assert str(subset['PDZone'][subset['PDZone'].isna()].iloc[0]) == 'nan'
+
+
+def test_shared_frame_keeps_mixed_none_and_nan(export_data):
+    df = export_data[['ReportNumberNew', 'PDZone']].copy()
+    df.loc[df.index[[0, 3]], 'ReportNumberNew'] = None
+    df.loc[df.index[[1, 5]], 'ReportNumberNew'] = np.nan
+    directory = shared_frame_dir()
+    try:
+        subset = read_shared_frame(write_shared_frame(df, directory / 'frame.arrow'))
+    finally:
+        release_shared_frames(directory)
+
+    # assert_frame_equal treats None and NaN alike; their text does not
+    assert subset['ReportNumberNew'].map(str).tolist() == df['ReportNumberNew'].map(str).tolist()
+    assert subset['PDZone'].map(str).tolist() == df['PDZone'].map(str).tolist()
+
+
+def test_shared_frame_pickles_only_mixed_type_columns(export_data):
+    df = export_data[['ReportNumberNew', 'PDZone']].copy()
+    df['PDZone'] = pd.Series([5, '6', None, 7.0] * (len(df) // 4), index=df.index, dtype=object)
+    directory = shared_frame_dir()
+    try:
+        handle = write_shared_frame(df, directory / 'frame.arrow')
+        assert list(handle['pickled']) == ['PDZone']
+        subset = read_shared_frame(handle, columns=['PDZone'])
+        whole = read_shared_frame(handle)
+    finally:
+        release_shared_frames(directory)
+
+    assert subset['PDZone'].tolist() == df['PDZone'].tolist()
+    pd.testing.assert_frame_equal(whole, df)
+
+
+def test_parallel_matches_serial_with_mixed_type_column(export_data, capsys):
+    df = export_data.copy()
+    df['PDZone'] = df['PDZone'].where(df['PDZone'] != '5', 5)
+    serial, serial_df = _validate(df.copy(), n_jobs=1)
+    parallel, parallel_df = _validate(df.copy(), n_jobs=2)
+    assert 'validating serially' not in capsys.readouterr().out
+
+    pd.testing.assert_frame_equal(parallel_df, serial_df)
+    assert parallel.errors == serial.errors
+    assert parallel.stats['rows_by_rule'] == serial.stats['rows_by_rule']
+
+
+def test_error_bitmap_counts_overlaps_and_samples():
+    index = pd.Index([f'r{i}' for i in range(20)])
+    address = pd.Series([i % 2 == 0 for i in range(20)], index=index)
+    zone = pd.Series([i % 3 == 0 for i in range(20)], index=index)
+
+    bitmap = ErrorBitmap(index)
+    bitmap.add('FullAddress2', address)
+    bitmap.add('PDZone', zone)
+
+    assert bitmap.count('FullAddress2') == 10
+    assert bitmap.overlap('FullAddress2', 'PDZone') == 4
+    assert len(bitmap) == 13
+    assert bitmap.rows('PDZone', limit=3) == ['r0', 'r3', 'r6']
+    assert bitmap.overlaps() == [('FullAddress2', 'PDZone', 4)]
+    sample = bitmap.sample(5, field='PDZone', seed=1)
+    assert len(sample) == 5 and set(sample) <= set(index[zone])
+    # Size depends on rows and fields, not on how many rows fail
+    assert bitmap.nbytes == 3 * 3
+
+
+def test_validator_tracks_failing_rows_per_field(export_data):
+    validator, _ = _validate(export_data.copy(), n_jobs=1)
+    rows = validator.stats['rows_with_errors']
+
+    assert rows.count('PDZone') == validator.stats['errors_by_field']['PDZone']
+    assert set(rows.rows('PDZone')) == set(export_data.index[export_data['PDZone'] == '12'])
+    assert 'ROWS WITH ERRORS BY FIELD' in validator.generate_report()
+
+
+def test_row_results_parquet_query(export_data, tmp_path):
+    path = tmp_path / 'row_flags.parquet'
+    validator = CADValidatorParallel(n_jobs=1)
+    validator.validate_all(export_data.copy(), row_results_path=path)
+
+    table = RuleFlagTable.read(path)
+    assert len(table) == len(export_data)
+    assert table.flags.dtype == np.uint32
+    assert table.counts()['PDZone: Invalid zone (must be 5-9)'] == (export_data['PDZone'] == '12').sum()
+
+    # "All rows failing the zone rule in 2024" straight from the flags
+    bad_zone_2024 = export_data['PDZone'].eq('12') & pd.to_datetime(export_data['TimeOfCall']).dt.year.eq(2024)
+    assert table.keys('PDZone', year=2024) == export_data.loc[bad_zone_2024, 'ReportNumberNew'].tolist()
+
+    bad_key = export_data['ReportNumberNew'].iloc[0]
+    assert any(rule.startswith('ReportNumberNew') for rule in table.rules_for(bad_key))
+    # Both ReportNumberNew rules have a bit now, so the field alone is ambiguous
+    both = table.failing('ReportNumberNew: Does not match', 'PDZone', require_all=True)
+    assert set(both['ReportNumberNew']) == set(
+        export_data.loc[export_data['PDZone'].eq('12') & export_data['ReportNumberNew'].str.startswith('bad'),
+                        'ReportNumberNew']
+    )
+
+
+def test_row_results_know_rules_without_failures(export_data, tmp_path):
+    df = export_data.copy()
+    df['PDZone'] = '5'
+    path = tmp_path / 'row_flags.parquet'
+    CADValidatorParallel(n_jobs=1).validate_all(df, row_results_path=path)
+
+    table = RuleFlagTable.read(path)
+    assert table.counts()['PDZone: Invalid zone (must be 5-9)'] == 0
+    assert table.keys('PDZone') == []
+
+
+def test_process_pool_is_opt_in():
+    rows = pd.DataFrame(index=pd.RangeIndex(CADValidatorParallel.MIN_PARALLEL_ROWS))
+    validator = CADValidatorParallel(n_jobs=1)
+    validator.n_jobs = 4
+    assert not validator._use_process_pool(rows)
+    validator.process_pool = True
+    assert validator._use_process_pool(rows)
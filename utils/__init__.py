@@ -1,20 +1,137 @@
 """
 Utility modules for CAD Data Correction Framework.
+
+Names are imported from their submodules on first use, so importing one
+light helper (e.g. ``utils.logger``) does not load openpyxl, pyarrow or the
+rest of the package.
 """
 
-from .logger import setup_logger, log_processing_step, log_correction_summary, log_validation_result
-from .hash_utils import FileHashManager, compute_hash, verify_integrity
-from .validate_schema import SchemaValidator, DataType, validate_cad_schema
+from .lazy_import import LazyModule, install_lazy_exports
+
+_EXPORTS = {
+    'setup_logger': 'logger',
+    'log_processing_step': 'logger',
+    'log_correction_summary': 'logger',
+    'log_validation_result': 'logger',
+    'FileHashManager': 'hash_utils',
+    'HashingFile': 'hash_utils',
+    'compute_hash': 'hash_utils',
+    'verify_integrity': 'hash_utils',
+    'SchemaValidator': 'validate_schema',
+    'DataType': 'validate_schema',
+    'validate_cad_schema': 'validate_schema',
+    'AuditStore': 'audit_store',
+    'read_audit_trail': 'audit_store',
+    'factorize_column': 'unique_values',
+    'broadcast_unique': 'unique_values',
+    'map_unique': 'unique_values',
+    'PatternStandardizer': 'pattern_standardizer',
+    'MergeArtifactScanner': 'merge_artifact_scanner',
+    'read_cad_file': 'typed_reader',
+    'build_read_plan': 'typed_reader',
+    'parse_datetime_column': 'typed_reader',
+    'CheckpointManager': 'checkpoint',
+    'compute_config_hash': 'checkpoint',
+    'StreamingExcelWriter': 'excel_writer',
+    'write_excel': 'excel_writer',
+    'escape_excel_formulas': 'excel_writer',
+    'guard_excel_values': 'excel_writer',
+    'ColumnProfile': 'column_profile',
+    'get_column_profile': 'column_profile',
+    'normalize_text': 'text_normalizer',
+    'normalize_unique': 'text_normalizer',
+    'compute_address_features': 'address_features',
+    'categorize_addresses': 'address_features',
+    'address_completeness': 'address_features',
+    'count_issues': 'address_features',
+    'invalid_address_flags': 'address_features',
+    'audit_address_flags': 'address_features',
+    'ZoneIndex': 'zone_index',
+    'normalize_zone_address': 'zone_index',
+    'StratifiedReservoirSampler': 'reservoir_sampler',
+    'allocate_proportional': 'reservoir_sampler',
+    'RuleFrame': 'validation_rules',
+    'RuleSet': 'validation_rules',
+    'compile_rule': 'validation_rules',
+    'load_rule_file': 'validation_rules',
+    'rule_timings': 'validation_rules',
+    'shared_frame_dir': 'shared_frame',
+    'release_shared_frames': 'shared_frame',
+    'write_shared_frame': 'shared_frame',
+    'read_shared_frame': 'shared_frame',
+    'ErrorBitmap': 'error_bitmap',
+    'RuleFlagTable': 'rule_flags',
+    'write_rule_flags': 'rule_flags',
+    'parse_datetimes': 'datetime_parser',
+    'cached_datetimes': 'datetime_parser',
+    'detect_datetime_format': 'datetime_parser',
+    'clear_datetime_cache': 'datetime_parser',
+    'TimeFields': 'time_fields',
+    'derive_time_fields': 'time_fields'
+}
+
+install_lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
+    'LazyModule',
+    'install_lazy_exports',
     'setup_logger',
     'log_processing_step',
     'log_correction_summary',
     'log_validation_result',
     'FileHashManager',
+    'HashingFile',
     'compute_hash',
     'verify_integrity',
     'SchemaValidator',
     'DataType',
-    'validate_cad_schema'
+    'validate_cad_schema',
+    'AuditStore',
+    'read_audit_trail',
+    'factorize_column',
+    'broadcast_unique',
+    'map_unique',
+    'PatternStandardizer',
+    'MergeArtifactScanner',
+    'read_cad_file',
+    'build_read_plan',
+    'parse_datetime_column',
+    'CheckpointManager',
+    'compute_config_hash',
+    'StreamingExcelWriter',
+    'write_excel',
+    'escape_excel_formulas',
+    'guard_excel_values',
+    'ColumnProfile',
+    'get_column_profile',
+    'normalize_text',
+    'normalize_unique',
+    'compute_address_features',
+    'categorize_addresses',
+    'address_completeness',
+    'count_issues',
+    'invalid_address_flags',
+    'audit_address_flags',
+    'ZoneIndex',
+    'normalize_zone_address',
+    'StratifiedReservoirSampler',
+    'allocate_proportional',
+    'RuleFrame',
+    'RuleSet',
+    'compile_rule',
+    'load_rule_file',
+    'rule_timings',
+    'shared_frame_dir',
+    'release_shared_frames',
+    'write_shared_frame',
+    'read_shared_frame',
+    'ErrorBitmap',
+    'RuleFlagTable',
+    'write_rule_flags',
+    'parse_datetimes',
+    'cached_datetimes',
+    'detect_datetime_format',
+    'clear_datetime_cache',
+    'TimeFields',
+    'derive_time_fields'
 ]
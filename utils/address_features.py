@@ -0,0 +1,428 @@
+"""
+Vectorized address-quality features for CAD data processing pipeline.
+
+Address quality is judged from a handful of features: house number,
+street suffix, intersection format, city/state/zip tail, generic
+placeholder and PO box. The functions here compute those features as
+boolean columns with pandas string methods over the distinct addresses
+only, derive each existing classification (completeness issues, quality
+categories, invalid flags, audit issues) from the columns, and broadcast
+the answers back to the rows.
+
+Each classification keeps the exact rules of the per-row function it
+replaces, so reports produced before and after agree row for row.
+"""
+
+import re
+import numpy as np
+import pandas as pd
+from collections import Counter
+from typing import Callable, Iterable, List, Tuple
+
+from .unique_values import factorize_column
+
+
+# Street types recognized as whole words (categorize_address / is_invalid_address)
+STREET_TYPES = [
+    "STREET", "ST", "AVENUE", "AVE", "ROAD", "RD", "DRIVE", "DR", "LANE", "LN",
+    "BOULEVARD", "BLVD", "COURT", "CT", "PLACE", "PL", "CIRCLE", "CIR",
+    "TERRACE", "TER", "WAY", "PARKWAY", "PKWY", "HIGHWAY", "HWY", "PLAZA",
+    "SQUARE", "SQ", "TRAIL", "TRL", "PATH", "ALLEY", "WALK", "EXPRESSWAY",
+    "TURNPIKE", "TPKE", "ROUTE", "RT"
+]
+STREET_REGEX = r"\b(?:" + "|".join(STREET_TYPES) + r")\b"
+
+# Generic location terms, checked in order (first match names the category reason)
+GENERIC_TERMS = [
+    "HOME", "VARIOUS", "UNKNOWN", "PARKING GARAGE", "REAR LOT", "PARKING LOT",
+    "LOT", "GARAGE", "REAR", "FRONT", "SIDE", "BEHIND", "ACROSS", "NEAR",
+    "BETWEEN", "AREA", "LOCATION", "SCENE", "UNDETERMINED", "N/A", "NA",
+    "NONE", "BLANK", "PARK"
+]
+
+# Generic terms that make an address invalid (matched as whole words)
+INVALID_GENERIC_TERMS = [
+    "HOME", "VARIOUS", "UNKNOWN", "PARKING GARAGE", "REAR LOT",
+    "PARKING LOT", "LOT", "GARAGE", "AREA", "LOCATION", "SCENE",
+    "N/A", "NA", "TBD", "TO BE DETERMINED", "CANCELED CALL"
+]
+
+# Completeness check (validation rule IMP_001)
+COMPLETENESS_GENERIC = {'UNKNOWN', 'NOT PROVIDED', 'N/A', 'NONE', '', 'TBD', 'TO BE DETERMINED'}
+COMPLETENESS_SUFFIX_REGEX = (
+    r'(?: STREET| AVENUE| ROAD| PLACE| DRIVE| COURT| BOULEVARD| LANE| WAY| HWY| HIGHWAY| ROUTE'
+    r'| AVE| ST| RD| BLVD| DR| CT| PL)'
+)
+COMPLETENESS_TAIL = ', HACKENSACK, NJ, 07601'
+COMPLETENESS_ISSUES = [
+    'missing_address', 'generic_placeholder', 'missing_city_state_zip',
+    'missing_house_number', 'missing_street_suffix'
+]
+
+# Address audit (mixed-case street types and placeholder substrings)
+AUDIT_STREET_TYPES = [
+    'Street', 'St', 'Avenue', 'Ave', 'Road', 'Rd', 'Boulevard', 'Blvd',
+    'Lane', 'Ln', 'Drive', 'Dr', 'Court', 'Ct', 'Place', 'Pl', 'Circle', 'Cir',
+    'Way', 'Terrace', 'Ter', 'Parkway', 'Pkwy', 'Highway', 'Hwy'
+]
+AUDIT_PLACEHOLDERS = [
+    'Home', 'Park', 'School', 'PO Box', 'P.O. Box', 'Unknown',
+    'Not Available', 'N/A', 'NA', 'TBD', 'To Be Determined'
+]
+
+PO_BOX_REGEX = r'P\.?O\.?\s*BOX'
+
+
+def _unique_values(series: pd.Series) -> Tuple[np.ndarray, pd.Series]:
+    """
+    Factorize ``series`` into row codes and its distinct values.
+
+    Missing values share one extra slot at the end, so every row code
+    indexes the returned values.
+
+    Returns:
+        Tuple of (row codes, object Series of distinct values + one NaN)
+    """
+    codes, uniques = factorize_column(series)
+    values = pd.Series(list(uniques) + [np.nan], dtype=object)
+    codes = np.where(codes < 0, len(uniques), codes)
+    return codes, values
+
+
+def _text(values: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """Return (present mask, str(value) with '' for missing values)."""
+    present = values.notna()
+    text = values.where(present, '').map(str)
+    return present, text
+
+
+def _broadcast(frame: pd.DataFrame, codes: np.ndarray, index: pd.Index) -> pd.DataFrame:
+    """Expand a per-distinct-value frame to the rows."""
+    result = frame.iloc[codes]
+    result.index = index
+    return result
+
+
+def _on_unique(series: pd.Series, build: Callable[[pd.Series], pd.DataFrame]) -> pd.DataFrame:
+    """Evaluate ``build`` over the distinct values of ``series`` and broadcast back."""
+    codes, values = _unique_values(series)
+    return _broadcast(build(values), codes, series.index)
+
+
+def _contains(text: pd.Series, pattern: str, flags: int = 0) -> pd.Series:
+    return text.str.contains(pattern, regex=True, flags=flags, na=False)
+
+
+def _matches(text: pd.Series, pattern: str, flags: int = 0) -> pd.Series:
+    return text.str.match(pattern, flags=flags, na=False)
+
+
+# ---------------------------------------------------------------------------
+# Quality categories (categorize_address)
+# ---------------------------------------------------------------------------
+
+def _category_features(values: pd.Series, zip_code: str) -> pd.DataFrame:
+    present, text = _text(values)
+    addr = text.str.strip()
+    upper = addr.str.upper()
+
+    # First generic term (in list order) that starts the address or appears as a word
+    generic_term = pd.Series(None, index=values.index, dtype=object)
+    parts = addr.str.split('&', n=1)
+    is_intersection = addr.str.count('&') == 1
+    second_raw = parts.str[1].fillna('')
+    for term in GENERIC_TERMS:
+        hit = upper.str.startswith(term) | upper.str.contains(f' {term} ', regex=False)
+        if term == 'PARK':
+            # A park named at an intersection with a real street is not generic
+            hit &= ~(is_intersection & _contains(second_raw.str.upper(), STREET_REGEX))
+        generic_term = generic_term.where(generic_term.notna() | ~hit, term)
+
+    first_street = parts.str[0].str.strip()
+    second_street = second_raw.str.strip()
+    city = rf'(?:Hackensack|NJ|{zip_code})'
+
+    return pd.DataFrame({
+        'is_blank': ~present | addr.eq(''),
+        'is_po_box': _contains(upper, PO_BOX_REGEX),
+        'is_generic_placeholder': generic_term.notna(),
+        'generic_term': generic_term,
+        'is_intersection': is_intersection,
+        'incomplete_intersection': (
+            second_street.eq('') | second_street.str.startswith(',')
+            | _matches(second_street, rf'^,?\s*{city}', re.IGNORECASE)
+        ),
+        'first_street': first_street,
+        'second_street': second_street,
+        'first_street_suffix': _contains(first_street.str.upper(), STREET_REGEX),
+        'second_street_suffix': _contains(second_street.str.upper(), STREET_REGEX),
+        'has_house_number': _matches(addr, r'^\d+'),
+        'has_street_suffix': _contains(upper, STREET_REGEX),
+        'has_city_state_zip': _contains(addr, rf'Hackensack.*NJ.*{zip_code}', re.IGNORECASE),
+        'city_state_only': _matches(addr, rf'^{city}', re.IGNORECASE),
+    }, index=values.index)
+
+
+def _categories_from_features(f: pd.DataFrame) -> pd.DataFrame:
+    intersection = f['is_intersection']
+    house = f['has_house_number']
+    street = f['has_street_suffix']
+    t1, t2 = f['first_street_suffix'], f['second_street_suffix']
+
+    rules = [
+        (f['is_blank'], 'blank', 'Null or empty address'),
+        (f['is_po_box'], 'po_box', 'PO Box address'),
+        (f['is_generic_placeholder'], 'generic_location', 'Generic term: ' + f['generic_term'].fillna('')),
+        (intersection & f['incomplete_intersection'], 'incomplete_intersection', 'Missing second street in intersection'),
+        (intersection & t1 & t2, 'valid_intersection', 'Valid intersection format'),
+        (intersection & ~t1 & ~t2, 'missing_street_type', 'Both streets missing type'),
+        (intersection & ~t1, 'missing_street_type', 'First street missing type: ' + f['first_street']),
+        (intersection, 'missing_street_type', 'Second street missing type: ' + f['second_street']),
+        (house & street & f['has_city_state_zip'], 'valid_standard', 'Valid standard address'),
+        (house & street, 'incomplete', 'Missing city/state/zip'),
+        (house, 'missing_street_type', 'No street type suffix'),
+        (street, 'missing_street_number', 'Street name without number'),
+        (f['city_state_only'], 'incomplete', 'City/state only'),
+    ]
+    conditions = [cond.to_numpy(dtype=bool) for cond, _, _ in rules]
+    category = np.select(conditions, [cat for _, cat, _ in rules], default='missing_street_number')
+    reason = np.select(
+        conditions,
+        [np.asarray(r, dtype=object) if isinstance(r, pd.Series) else r for _, _, r in rules],
+        default='No street number'
+    )
+    return pd.DataFrame({'category': category.astype(object), 'reason': reason.astype(object)}, index=f.index)
+
+
+def compute_address_features(series: pd.Series, zip_code: str = '07601') -> pd.DataFrame:
+    """
+    Compute boolean address-quality features for every row.
+
+    Args:
+        series: Address column (e.g. FullAddress2)
+        zip_code: ZIP prefix expected in the city/state/zip tail
+
+    Returns:
+        DataFrame aligned to ``series`` with is_blank, is_po_box,
+        is_generic_placeholder, is_intersection, incomplete_intersection,
+        has_house_number, has_street_suffix, has_city_state_zip (plus the
+        helper columns the categories are derived from)
+    """
+    return _on_unique(series, lambda values: _category_features(values, zip_code))
+
+
+def categorize_addresses(series: pd.Series, zip_code: str = '07601') -> pd.DataFrame:
+    """
+    Vectorized ``categorize_address``: quality category and reason per row.
+
+    Categories: blank, po_box, generic_location, incomplete_intersection,
+    valid_intersection, missing_street_type, valid_standard, incomplete,
+    missing_street_number.
+
+    Args:
+        series: Address column
+        zip_code: ZIP prefix expected in the city/state/zip tail ('07601', or
+            '0760' to accept any 0760x ZIP)
+
+    Returns:
+        DataFrame aligned to ``series`` with 'category' and 'reason' columns
+    """
+    return _on_unique(series, lambda values: _categories_from_features(_category_features(values, zip_code)))
+
+
+# ---------------------------------------------------------------------------
+# Completeness issues (validation rule IMP_001)
+# ---------------------------------------------------------------------------
+
+def _completeness(values: pd.Series) -> pd.DataFrame:
+    present, text = _text(values)
+    text = text.str.upper().str.strip().str.replace(r'\s+', ' ', regex=True)
+
+    generic = present & text.isin(COMPLETENESS_GENERIC)
+    checked = present & ~generic
+    is_intersection = text.str.contains(' & ', regex=False)
+    features = pd.DataFrame({
+        'has_house_number': _matches(text, r'^\d+ '),
+        'has_street_suffix': _contains(text, COMPLETENESS_SUFFIX_REGEX),
+        'is_intersection': is_intersection,
+        'has_city_state_zip': text.str.endswith(COMPLETENESS_TAIL),
+        'is_generic_placeholder': generic,
+    }, index=values.index)
+
+    issues = pd.DataFrame({
+        'missing_address': ~present,
+        'generic_placeholder': generic,
+        'missing_city_state_zip': checked & ~features['has_city_state_zip'],
+        'missing_house_number': checked & ~is_intersection & ~features['has_house_number'],
+        'missing_street_suffix': checked & ~features['has_street_suffix'],
+    }, index=values.index)
+    return pd.concat([pd.DataFrame({'valid': ~issues.any(axis=1)}), features, issues], axis=1)
+
+
+def address_completeness(series: pd.Series) -> pd.DataFrame:
+    """
+    Vectorized address completeness check (rule IMP_001 ``evaluate_address``).
+
+    An address passes when it is present, not a generic placeholder, ends with
+    ', HACKENSACK, NJ, 07601', has a street suffix, and has a house number
+    unless it is an intersection.
+
+    Args:
+        series: Address column
+
+    Returns:
+        DataFrame aligned to ``series`` with 'valid', the feature columns and
+        one boolean column per issue in COMPLETENESS_ISSUES
+    """
+    return _on_unique(series, _completeness)
+
+
+def count_issues(flags: pd.DataFrame, issues: Iterable[str] = COMPLETENESS_ISSUES) -> Counter:
+    """
+    Count rows per issue, in the order the issues are first seen row by row.
+
+    Matches a Counter updated row by row with each row's issue list, so
+    ``most_common`` breaks ties the same way.
+
+    Args:
+        flags: Issue columns (e.g. from address_completeness)
+        issues: Issue column names, in per-row reporting order
+
+    Returns:
+        Counter of issue -> row count
+    """
+    firsts = []
+    for order, issue in enumerate(issues):
+        column = flags[issue].to_numpy(dtype=bool)
+        count = int(column.sum())
+        if count:
+            firsts.append((int(column.argmax()), order, issue, count))
+    return Counter({issue: count for _, _, issue, count in sorted(firsts)})
+
+
+# ---------------------------------------------------------------------------
+# Invalid address flags (is_invalid_address)
+# ---------------------------------------------------------------------------
+
+def _invalid_flags(values: pd.Series, generic_terms: List[str]) -> pd.DataFrame:
+    present, text = _text(values)
+    addr = text.str.strip()
+    upper = addr.str.upper()
+
+    blank = ~present | addr.eq('')
+    dangling = _contains(upper, r'&\s*,')
+    generic_regex = r'\b(?:' + '|'.join(re.escape(term) for term in generic_terms) + r')\b'
+    generic = _contains(upper, generic_regex)
+    is_intersection = upper.str.contains(' & ', regex=False)
+    parts = upper.str.split('&')
+    two_parts = parts.str.len() == 2
+    first = parts.str[0].fillna('').str.strip()
+    second = parts.str[1].fillna('').str.strip()
+    both_streets = (
+        two_parts
+        & _contains(first, STREET_REGEX, re.IGNORECASE)
+        & _contains(second, STREET_REGEX, re.IGNORECASE)
+    )
+    house = _matches(addr, r'^\d+')
+    street = _contains(upper, STREET_REGEX, re.IGNORECASE)
+
+    rules = [
+        (blank, 'blank'),
+        (dangling, 'incomplete_intersection'),
+        (generic, 'generic_location'),
+        (is_intersection & both_streets, 'valid'),
+        (~is_intersection & ~house & ~street, 'missing_street_number'),
+        (house & ~street, 'missing_street_type'),
+    ]
+    issue = np.select([cond.to_numpy(dtype=bool) for cond, _ in rules], [name for _, name in rules], default='valid')
+    return pd.DataFrame({'is_invalid': issue != 'valid', 'issue_type': issue.astype(object)}, index=values.index)
+
+
+def invalid_address_flags(series: pd.Series, generic_terms: List[str] = INVALID_GENERIC_TERMS) -> pd.DataFrame:
+    """
+    Vectorized ``is_invalid_address``: invalid flag and issue type per row.
+
+    Issue types: blank, incomplete_intersection, generic_location,
+    missing_street_number, missing_street_type (valid rows get 'valid').
+
+    Args:
+        series: Address column
+        generic_terms: Whole-word terms that mark an address as generic
+
+    Returns:
+        DataFrame aligned to ``series`` with 'is_invalid' and 'issue_type'
+    """
+    return _on_unique(series, lambda values: _invalid_flags(values, list(generic_terms)))
+
+
+# ---------------------------------------------------------------------------
+# Address audit (audit_address_quality)
+# ---------------------------------------------------------------------------
+
+def _audit(values: pd.Series) -> pd.DataFrame:
+    present, text = _text(values)
+    stripped = text.str.strip()
+    lower = stripped.str.lower()
+
+    blank = ~present | stripped.eq('')
+    placeholder = pd.Series(False, index=values.index)
+    for term in AUDIT_PLACEHOLDERS:
+        placeholder |= lower.str.contains(term.lower(), regex=False)
+    po_box = _contains(text, r'\bP\.?\s*O\.?\s*Box\b', re.IGNORECASE)
+    is_intersection = text.str.contains('&', regex=False)
+
+    parts = stripped.str.split('&')
+    left = parts.str[0].fillna('').str.strip()
+    right = parts.str[1].fillna('').str.split(',').str[0].str.strip()
+    valid_intersection = (
+        ~_contains(stripped, r'&\s*,')
+        & (parts.str.len() == 2)
+        & (left.str.len() >= 3) & (right.str.len() >= 3)
+    )
+    street_regex = r'\b(?:' + '|'.join(AUDIT_STREET_TYPES) + r')\b'
+    house = _matches(stripped, r'^\d+')
+    street = _contains(text, street_regex, re.IGNORECASE)
+
+    standard = ~blank & ~placeholder & ~po_box & ~is_intersection
+    no_number = standard & ~house
+    no_type = standard & ~street
+
+    conditions = [
+        blank.to_numpy(dtype=bool),
+        (~blank & placeholder).to_numpy(dtype=bool),
+        (~blank & ~placeholder & po_box).to_numpy(dtype=bool),
+        (~blank & ~placeholder & ~po_box & is_intersection & ~valid_intersection).to_numpy(dtype=bool),
+        (no_number & no_type).to_numpy(dtype=bool),
+        no_type.to_numpy(dtype=bool),
+        no_number.to_numpy(dtype=bool),
+    ]
+    # (Issue_Type, Severity, Suggested_Fix); a missing street type overrides the number's severity/fix
+    outcomes = [
+        ('NULL/EMPTY', 'CRITICAL', 'MANUAL REVIEW - NO ADDRESS PROVIDED'),
+        ('GENERIC_PLACEHOLDER', 'CRITICAL', 'REPLACE WITH ACTUAL ADDRESS'),
+        ('PO_BOX', 'WARNING', 'VERIFY PHYSICAL ADDRESS NEEDED'),
+        ('INCOMPLETE_INTERSECTION', 'HIGH', 'MISSING CROSS STREET - NEEDS BOTH STREET NAMES'),
+        ('MISSING_STREET_NUMBER; MISSING_STREET_TYPE', 'MEDIUM', 'VERIFY STREET TYPE (St, Ave, Rd, etc.)'),
+        ('MISSING_STREET_TYPE', 'MEDIUM', 'VERIFY STREET TYPE (St, Ave, Rd, etc.)'),
+        ('MISSING_STREET_NUMBER', 'HIGH', 'ADD STREET NUMBER'),
+    ]
+    columns = {}
+    for i, name in enumerate(['Issue_Type', 'Severity', 'Suggested_Fix']):
+        default = {'Issue_Type': '', 'Severity': 'OK', 'Suggested_Fix': None}[name]
+        choices = [np.array([outcome[i]] * len(values), dtype=object) for outcome in outcomes]
+        columns[name] = np.select(conditions, choices, default=np.array([default] * len(values), dtype=object))
+    return pd.DataFrame(columns, index=values.index)
+
+
+def audit_address_flags(series: pd.Series) -> pd.DataFrame:
+    """
+    Vectorized address audit: issue type, severity and suggested fix per row.
+
+    Args:
+        series: Address column
+
+    Returns:
+        DataFrame aligned to ``series`` with Issue_Type ('' when the address
+        is fine), Severity ('OK' when fine) and Suggested_Fix (None when fine)
+    """
+    return _on_unique(series, _audit)
@@ -0,0 +1,313 @@
+"""
+Columnar audit trail store for CAD data processing pipeline.
+
+Collects correction audit records as typed column buffers instead of one
+dict per changed cell. Field names and correction types are stored as
+dictionary codes, the timestamp is recorded once per run, and records are
+written to CSV or Parquet in chunks.
+"""
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional, Union
+import logging
+
+
+AUDIT_COLUMNS = ['timestamp', 'case_number', 'field', 'old_value', 'new_value', 'correction_type']
+
+
+def _as_text(values) -> np.ndarray:
+    """Convert values to an object array of strings (missing -> empty string)."""
+    series = pd.Series(values, dtype=object) if not isinstance(values, pd.Series) else values
+    return series.astype(object).where(series.notna(), '').astype(str).to_numpy(dtype=object)
+
+
+def _write_empty(path: Path):
+    """Write an audit trail with no records (header only, or the Parquet schema)."""
+    if path.suffix == '.parquet':
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        schema = pa.schema([(col, pa.string()) for col in AUDIT_COLUMNS])
+        pq.write_table(schema.empty_table(), str(path))
+    else:
+        pd.DataFrame(columns=AUDIT_COLUMNS).to_csv(path, index=False, encoding='utf-8-sig')
+
+
+class AuditStore:
+    """
+    Append-only columnar audit trail.
+
+    Each batch is kept as a set of column arrays: case number, old and new
+    values as string arrays, field and correction type as int32 codes into
+    small dictionaries. When ``spill_path`` is set, buffered batches are
+    flushed to disk every ``flush_rows`` records; once the spill file is
+    closed (by ``close``, ``export`` or ``to_frame``) no more records can be
+    added.
+    """
+
+    def __init__(
+        self,
+        run_timestamp: Optional[str] = None,
+        spill_path: Optional[str] = None,
+        flush_rows: int = 100_000
+    ):
+        """
+        Initialize audit store.
+
+        Args:
+            run_timestamp: Timestamp recorded for every entry in this run
+                (defaults to now)
+            spill_path: Optional CSV/Parquet file to flush buffered batches to
+            flush_rows: Number of buffered records that triggers a flush
+        """
+        self.run_timestamp = run_timestamp or datetime.now().isoformat()
+        self.spill_path = Path(spill_path) if spill_path else None
+        self.flush_rows = flush_rows
+        self.logger = logging.getLogger(__name__)
+
+        self._fields: List[str] = []
+        self._types: List[str] = []
+        self._codes: Dict[str, Dict[str, int]] = {'field': {}, 'correction_type': {}}
+        self._batches: List[Dict[str, np.ndarray]] = []
+        self._buffered = 0
+        self._flushed = 0
+        self._type_counts = {}
+        self._writer = None
+        self._closed = False
+
+    def __len__(self) -> int:
+        return self._flushed + self._buffered
+
+    def _code(self, kind: str, value: str) -> int:
+        """Return dictionary code for a field name or correction type."""
+        codes = self._codes[kind]
+        if value not in codes:
+            codes[value] = len(codes)
+            (self._fields if kind == 'field' else self._types).append(value)
+        return codes[value]
+
+    def record(self, case_number, field: str, old_value, new_value, correction_type: str):
+        """Record a single change."""
+        self.record_batch([case_number], field, [old_value], [new_value], correction_type)
+
+    def record_batch(
+        self,
+        case_numbers,
+        field: str,
+        old_values,
+        new_values,
+        correction_type: str,
+        mask: Optional[Union[pd.Series, np.ndarray]] = None
+    ) -> int:
+        """
+        Record a vector of changes to one field.
+
+        Args:
+            case_numbers: Case numbers of the changed rows
+            field: Field that was changed
+            old_values: Values before the change
+            new_values: Values after the change (scalar or vector)
+            correction_type: Correction type label
+            mask: Optional boolean mask selecting which rows to record
+
+        Returns:
+            Number of records added
+
+        Raises:
+            ValueError: If the spill file has already been closed
+        """
+        if self._closed:
+            # A Parquet spill file cannot be reopened for appending
+            raise ValueError(f"Audit trail spilled to {self.spill_path} is closed")
+        case_numbers = pd.Series(case_numbers).reset_index(drop=True)
+        old_values = pd.Series(old_values).reset_index(drop=True)
+        if np.ndim(new_values) == 0:
+            new_values = pd.Series([new_values] * len(case_numbers), dtype=object)
+        else:
+            new_values = pd.Series(new_values).reset_index(drop=True)
+
+        if mask is not None:
+            keep = np.asarray(mask, dtype=bool)
+            case_numbers, old_values, new_values = case_numbers[keep], old_values[keep], new_values[keep]
+
+        n = len(case_numbers)
+        if n == 0:
+            return 0
+
+        field_code = self._code('field', field)
+        type_code = self._code('correction_type', correction_type)
+        self._batches.append({
+            'case_number': _as_text(case_numbers),
+            'field': np.full(n, field_code, dtype=np.int32),
+            'old_value': _as_text(old_values),
+            'new_value': _as_text(new_values),
+            'correction_type': np.full(n, type_code, dtype=np.int32),
+        })
+        self._buffered += n
+        self._type_counts[correction_type] = self._type_counts.get(correction_type, 0) + n
+
+        if self.spill_path is not None and self._buffered >= self.flush_rows:
+            self.flush()
+        return n
+
+    def record_frame(self, changes: pd.DataFrame) -> int:
+        """
+        Record a DataFrame of changes (case_number, field, old_value, new_value, correction_type).
+
+        Args:
+            changes: Changes DataFrame, e.g. from CorrectionPatchSet.apply
+
+        Returns:
+            Number of records added
+        """
+        if changes is None or len(changes) == 0:
+            return 0
+        added = 0
+        for (field, correction_type), group in changes.groupby(['field', 'correction_type'], sort=False, observed=True):
+            added += self.record_batch(
+                group['case_number'], field, group['old_value'], group['new_value'], correction_type
+            )
+        return added
+
+    def correction_type_counts(self) -> Dict[str, int]:
+        """Return number of records per correction type."""
+        return dict(self._type_counts)
+
+    def _batch_frame(self, batch: Dict[str, np.ndarray]) -> pd.DataFrame:
+        """Build a DataFrame for one batch with categorical code columns."""
+        n = len(batch['case_number'])
+        return pd.DataFrame({
+            'timestamp': np.full(n, self.run_timestamp, dtype=object),
+            'case_number': batch['case_number'],
+            'field': pd.Categorical.from_codes(batch['field'], categories=self._fields),
+            'old_value': batch['old_value'],
+            'new_value': batch['new_value'],
+            'correction_type': pd.Categorical.from_codes(batch['correction_type'], categories=self._types),
+        }, columns=AUDIT_COLUMNS)
+
+    def _chunks(self):
+        """Yield buffered records as DataFrames of at most flush_rows rows."""
+        pending = []
+        pending_rows = 0
+        for batch in self._batches:
+            pending.append(batch)
+            pending_rows += len(batch['case_number'])
+            if pending_rows >= self.flush_rows:
+                yield self._merge(pending)
+                pending, pending_rows = [], 0
+        if pending:
+            yield self._merge(pending)
+
+    def _merge(self, batches: List[Dict[str, np.ndarray]]) -> pd.DataFrame:
+        merged = {col: np.concatenate([b[col] for b in batches]) for col in batches[0]}
+        return self._batch_frame(merged)
+
+    def _write_chunks(self, path: Path, append: bool = False) -> int:
+        """Write buffered chunks to ``path`` (CSV or Parquet)."""
+        written = 0
+        if path.suffix == '.parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            for chunk in self._chunks():
+                chunk = chunk.astype({'field': str, 'correction_type': str})
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if self._writer is None:
+                    self._writer = pq.ParquetWriter(str(path), table.schema)
+                self._writer.write_table(table)
+                written += len(chunk)
+        else:
+            header = not (append and path.exists())
+            for chunk in self._chunks():
+                chunk.to_csv(path, mode='w' if header else 'a', header=header,
+                             index=False, encoding='utf-8-sig' if header else 'utf-8')
+                header = False
+                written += len(chunk)
+        return written
+
+    def flush(self):
+        """Flush buffered records to the spill file."""
+        if self.spill_path is None or not self._batches:
+            return
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+        self._flushed += self._write_chunks(self.spill_path, append=self._flushed > 0)
+        self._batches = []
+        self._buffered = 0
+
+    def close(self):
+        """Flush remaining records and close any open Parquet writer."""
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self.spill_path is not None:
+            self._closed = True
+
+    def export(self, path: str) -> int:
+        """
+        Write the full audit trail to ``path`` in chunks.
+
+        Args:
+            path: Output file (.parquet for Parquet, anything else CSV); written
+                with the audit columns even when there are no records
+
+        Returns:
+            Number of records written
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.spill_path is not None and (self._flushed or self._batches):
+            self.close()
+            if path.resolve() != self.spill_path.resolve():
+                frame = read_audit_trail(self.spill_path)
+                if path.suffix == '.parquet':
+                    frame.to_parquet(path, index=False)
+                else:
+                    frame.to_csv(path, index=False, encoding='utf-8-sig')
+            return self._flushed
+
+        if not self._batches:
+            _write_empty(path)
+            return 0
+
+        written = self._write_chunks(path)
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        return written
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the audit trail as a DataFrame (field/correction_type categorical)."""
+        if self.spill_path is not None and self._flushed:
+            self.close()
+            return read_audit_trail(self.spill_path)
+        if not self._batches:
+            return pd.DataFrame(columns=AUDIT_COLUMNS)
+        return self._merge(self._batches)
+
+
+def read_audit_trail(path: Union[str, Path], columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read an audit trail written by AuditStore (or the legacy CSV format).
+
+    Args:
+        path: Audit trail file (.parquet or CSV)
+        columns: Optional subset of columns to load
+
+    Returns:
+        Audit DataFrame with categorical field/correction_type columns
+    """
+    path = Path(path)
+    if path.suffix == '.parquet':
+        df = pd.read_parquet(path, columns=columns)
+    else:
+        dtypes = {'case_number': str, 'old_value': str, 'new_value': str,
+                  'field': 'category', 'correction_type': 'category'}
+        df = pd.read_csv(path, encoding='utf-8-sig', usecols=columns, dtype=dtypes,
+                         keep_default_na=False)
+    for col in ('field', 'correction_type', 'timestamp'):
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    return df
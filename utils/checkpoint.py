@@ -0,0 +1,269 @@
+"""
+Stage checkpointing utilities for CAD data processing pipeline.
+
+Writes the DataFrame produced by each pipeline stage to Parquet keyed by
+input file hash, config hash and stage name, so an interrupted or re-tuned
+run can resume from the last valid stage instead of reloading the source
+workbook. Stage state (statistics, audit records) is stored as JSON, with
+any DataFrames inside it written to their own Parquet files; nothing is
+restored with pickle.
+"""
+
+import hashlib
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+
+def compute_config_hash(config: Any) -> str:
+    """
+    Compute a stable hash of a configuration object.
+
+    Args:
+        config: JSON-serializable configuration (dict, list, scalars)
+
+    Returns:
+        Hexadecimal SHA256 hash
+    """
+    payload = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+# JSON object standing for a DataFrame stored next to the state file
+_FRAME_KEY = '__parquet__'
+
+
+def _write_parquet(df: pd.DataFrame, path: Path) -> List[str]:
+    """
+    Write a DataFrame to Parquet.
+
+    Object columns Arrow cannot store (mixed types such as 2024 and '2024')
+    are written as their text, missing values kept missing.
+
+    Returns:
+        Names of the columns written as text
+    """
+    try:
+        df.to_parquet(path, index=None)
+        return []
+    except (TypeError, ValueError):
+        pass
+    text_columns = [
+        col for col in df.columns
+        if df[col].dtype == object
+        and pd.api.types.infer_dtype(df[col], skipna=True) not in ('string', 'empty')
+    ]
+    out = df.copy(deep=False)
+    for col in text_columns:
+        out[col] = df[col].astype(str).where(df[col].notna(), None)
+    out.to_parquet(path, index=None)
+    return [str(col) for col in text_columns]
+
+
+class CheckpointManager:
+    """Saves and restores per-stage DataFrame checkpoints."""
+
+    def __init__(
+        self,
+        checkpoint_dir: str,
+        input_hash: str,
+        config_hash: str,
+        enabled: bool = True
+    ):
+        """
+        Initialize checkpoint manager.
+
+        Args:
+            checkpoint_dir: Directory for checkpoint files
+            input_hash: Hash of the pipeline input file
+            config_hash: Hash of the pipeline configuration
+            enabled: If False, save() is a no-op and nothing is restored
+        """
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.input_hash = input_hash
+        self.config_hash = config_hash
+        self.enabled = enabled
+        self.logger = logging.getLogger(__name__)
+
+    def _key(self, stage: str) -> str:
+        return f"{stage}_{self.input_hash[:12]}_{self.config_hash[:12]}"
+
+    def _meta_path(self, stage: str) -> Path:
+        return self.checkpoint_dir / f"{self._key(stage)}.json"
+
+    def _state_path(self, key: str) -> Path:
+        return self.checkpoint_dir / f"{key}.state.json"
+
+    def _save_state(self, key: str, state: Dict):
+        """Write stage state as JSON; DataFrames go to their own Parquet files."""
+        frames = []
+
+        def encode(value):
+            if isinstance(value, pd.DataFrame):
+                name = f"{key}.state.{len(frames)}.parquet"
+                _write_parquet(value, self.checkpoint_dir / name)
+                frames.append(name)
+                return {_FRAME_KEY: name}
+            if isinstance(value, np.generic):
+                return value.item()
+            if isinstance(value, np.ndarray):
+                return value.tolist()
+            if isinstance(value, (set, frozenset)):
+                return list(value)
+            if isinstance(value, datetime):
+                return value.isoformat()
+            raise TypeError(f"State value of type {type(value).__name__} cannot be checkpointed")
+
+        with open(self._state_path(key), 'w', encoding='utf-8') as f:
+            json.dump(state, f, default=encode)
+
+    def _load_state(self, state_path: Path) -> Dict:
+        """Read stage state written by _save_state."""
+        def decode(obj):
+            if len(obj) == 1 and _FRAME_KEY in obj:
+                return pd.read_parquet(self.checkpoint_dir / obj[_FRAME_KEY])
+            return obj
+
+        with open(state_path, 'r', encoding='utf-8') as f:
+            return json.load(f, object_hook=decode)
+
+    def save(self, stage: str, df: pd.DataFrame, state: Optional[Dict] = None) -> Optional[Path]:
+        """
+        Write a stage checkpoint.
+
+        Args:
+            stage: Stage name
+            df: DataFrame produced by the stage
+            state: Optional stage state (statistics, audit records): JSON-able
+                values, NumPy scalars/arrays and DataFrames
+
+        Returns:
+            Path of the data file, or None if checkpointing is disabled/failed
+        """
+        if not self.enabled or df is None:
+            return None
+
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        key = self._key(stage)
+        start = datetime.now()
+
+        data_path = self.checkpoint_dir / f"{key}.parquet"
+        # Parquet round-trips "string" columns with python storage; remember the original
+        string_dtypes = {
+            str(col): f"string[{dtype.storage}]"
+            for col, dtype in df.dtypes.items() if isinstance(dtype, pd.StringDtype)
+        }
+        try:
+            text_columns = _write_parquet(df, data_path)
+            if state is not None:
+                self._save_state(key, state)
+        except Exception as e:
+            self.logger.warning(f"Could not write checkpoint for stage '{stage}': {e}")
+            return None
+        if text_columns:
+            self.logger.debug(f"Checkpoint {stage}: mixed-type columns stored as text: {text_columns}")
+
+        meta = {
+            "stage": stage,
+            "input_hash": self.input_hash,
+            "config_hash": self.config_hash,
+            "format": "parquet",
+            "data_file": data_path.name,
+            "has_state": state is not None,
+            "string_dtypes": string_dtypes,
+            "text_columns": text_columns,
+            "rows": len(df),
+            "columns": len(df.columns),
+            "created": datetime.now().isoformat()
+        }
+        with open(self._meta_path(stage), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+
+        elapsed = (datetime.now() - start).total_seconds()
+        self.logger.info(f"Checkpoint saved: {stage} ({len(df):,} rows, {elapsed:.1f}s)")
+        return data_path
+
+    def is_valid(self, stage: str) -> bool:
+        """Check whether a checkpoint exists for this input/config/stage."""
+        meta_path = self._meta_path(stage)
+        if not meta_path.exists():
+            return False
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return False
+        return (
+            meta.get("input_hash") == self.input_hash
+            and meta.get("config_hash") == self.config_hash
+            and meta.get("format") == "parquet"
+            and (self.checkpoint_dir / meta.get("data_file", "")).is_file()
+        )
+
+    def latest(self, stages: List[str]) -> Optional[str]:
+        """
+        Return the last stage (in pipeline order) with a valid checkpoint.
+
+        Args:
+            stages: Stage names in execution order
+
+        Returns:
+            Stage name, or None if no stage can be resumed
+        """
+        for stage in reversed(stages):
+            if self.is_valid(stage):
+                return stage
+        return None
+
+    def load(self, stage: str) -> Optional[Tuple[pd.DataFrame, Optional[Dict]]]:
+        """
+        Load a stage checkpoint.
+
+        Args:
+            stage: Stage name
+
+        Returns:
+            Tuple of (DataFrame, state) or None if no valid checkpoint exists
+        """
+        if not self.is_valid(stage):
+            return None
+
+        with open(self._meta_path(stage), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        data_path = self.checkpoint_dir / meta["data_file"]
+        start = datetime.now()
+
+        df = pd.read_parquet(data_path)
+        string_dtypes = {col: dtype for col, dtype in meta.get("string_dtypes", {}).items() if col in df.columns}
+        if string_dtypes:
+            df = df.astype(string_dtypes)
+
+        state = None
+        state_path = self._state_path(self._key(stage))
+        if meta.get("has_state") and state_path.exists():
+            state = self._load_state(state_path)
+
+        elapsed = (datetime.now() - start).total_seconds()
+        self.logger.info(f"Checkpoint loaded: {stage} ({len(df):,} rows, {elapsed:.1f}s)")
+        return df, state
+
+    def clear(self) -> int:
+        """
+        Remove all checkpoints for this input/config.
+
+        Returns:
+            Number of files removed
+        """
+        if not self.checkpoint_dir.exists():
+            return 0
+        suffix = f"_{self.input_hash[:12]}_{self.config_hash[:12]}"
+        removed = 0
+        for path in self.checkpoint_dir.iterdir():
+            if path.name.split('.', 1)[0].endswith(suffix):
+                path.unlink()
+                removed += 1
+        return removed
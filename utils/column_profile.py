@@ -0,0 +1,192 @@
+"""
+Column profile cache for CAD data processing pipeline.
+
+Quality scoring, manual review flags, null-value reports and final
+validation all ask the same question of a column: which rows are null or
+blank. ColumnProfile answers it once per column and mask kind, keeps the
+answer as a packed bitmap (1 bit per row) and recomputes it only after the
+column was invalidated.
+
+pandas gives no notice when a column is written, so cached answers are
+keyed on a per-frame version counter: every code path that writes a
+column (``df[c] = ...``, ``df.loc[rows, c] = ...``) calls
+``invalidate(df, c)`` afterwards, which bumps the column's version and
+retires every answer cached for it (null masks here, parsed datetimes in
+``utils.datetime_parser``).
+"""
+
+import weakref
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from .unique_values import factorize_column
+
+
+# Mask kinds:
+#   null  - isna()
+#   empty - isna() or == ''
+#   blank - isna() or str(value).strip() in BLANK_TOKENS
+MASK_KINDS = ('null', 'empty', 'blank')
+
+# Text that reads as blank once stringified (str(None), str(float('nan')))
+BLANK_TOKENS = frozenset(['', 'nan', 'None'])
+
+_PROFILES: Dict[int, 'ColumnProfile'] = {}
+
+# id(DataFrame) -> (weak reference, [frame version], column -> column version)
+_VERSIONS: Dict[int, tuple] = {}
+
+
+def _is_text(series: pd.Series) -> bool:
+    return (
+        series.dtype == object
+        or isinstance(series.dtype, pd.StringDtype)
+        or isinstance(series.dtype, pd.CategoricalDtype)
+    )
+
+
+def _frame_versions(df: pd.DataFrame) -> tuple:
+    entry = _VERSIONS.get(id(df))
+    if entry is None or entry[0]() is not df:
+        entry = (weakref.ref(df), [0], {})
+        _VERSIONS[id(df)] = entry
+        weakref.finalize(df, _VERSIONS.pop, id(df), None)
+    return entry
+
+
+def column_version(df: pd.DataFrame, column: str) -> Tuple:
+    """
+    Cache key for the current contents of ``df[column]``.
+
+    Changes whenever ``invalidate`` is called for the column (or the whole
+    frame); length and dtype are included so a column replaced with another
+    type (text parsed to datetimes) never matches an older entry.
+    """
+    _, frame_version, columns = _frame_versions(df)
+    series = df[column]
+    return (frame_version[0], columns.get(column, 0), len(series), str(series.dtype))
+
+
+def invalidate(df: pd.DataFrame, columns: Optional[Union[str, Iterable[str]]] = None) -> None:
+    """
+    Record that columns of ``df`` were written; cached answers for them are dropped.
+
+    Call after every write to a column whose masks or parsed datetimes may
+    have been cached, including in-place ``.loc`` edits.
+
+    Args:
+        df: DataFrame that was written
+        columns: Column name(s) written (default: all columns)
+    """
+    _, frame_version, versions = _frame_versions(df)
+    if columns is None:
+        frame_version[0] += 1
+    else:
+        for column in [columns] if isinstance(columns, str) else columns:
+            versions[column] = versions.get(column, 0) + 1
+    profile = _PROFILES.get(id(df))
+    if profile is not None and profile._df() is df:
+        profile._drop(columns)
+
+
+class ColumnProfile:
+    """Packed null/empty/blank bitmaps for the columns of one DataFrame."""
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Initialize profile.
+
+        Args:
+            df: DataFrame to profile (held by weak reference)
+        """
+        self._df = weakref.ref(df)
+        self._bitmaps: Dict[Tuple[str, str], Tuple[Tuple, np.ndarray, int]] = {}
+
+    def _compute(self, series: pd.Series, kind: str) -> np.ndarray:
+        """Compute a boolean mask of the given kind."""
+        null = series.isna().to_numpy(dtype=bool)
+        if kind == 'null' or not _is_text(series):
+            # Non-text values are never '' and never stringify to blank
+            return null
+
+        if kind == 'empty':
+            return null | series.eq('').fillna(False).to_numpy(dtype=bool)
+
+        # blank: evaluate distinct values only, then broadcast through the codes
+        codes, uniques = factorize_column(series)
+        unique_blank = np.array([str(value).strip() in BLANK_TOKENS for value in uniques], dtype=bool)
+        return np.append(unique_blank, True)[codes] | null
+
+    def mask(self, column: str, kind: str = 'empty') -> np.ndarray:
+        """
+        Return the boolean mask of rows that are null/empty/blank in ``column``.
+
+        Args:
+            column: Column name
+            kind: 'null', 'empty' or 'blank' (see MASK_KINDS)
+
+        Returns:
+            Boolean numpy array aligned to the DataFrame rows
+        """
+        if kind not in MASK_KINDS:
+            raise ValueError(f"Unknown mask kind: {kind}")
+        df = self._df()
+        series = df[column]
+        token = column_version(df, column)
+
+        cached = self._bitmaps.get((column, kind))
+        if cached is not None and cached[0] == token:
+            return np.unpackbits(cached[1], count=len(series)).astype(bool)
+
+        result = self._compute(series, kind)
+        self._bitmaps[(column, kind)] = (token, np.packbits(result), int(result.sum()))
+        return result
+
+    def present(self, column: str, kind: str = 'empty') -> np.ndarray:
+        """Return the inverse of ``mask`` (rows with a value)."""
+        return ~self.mask(column, kind)
+
+    def count(self, column: str, kind: str = 'empty') -> int:
+        """Return the number of null/empty/blank rows in ``column``."""
+        cached = self._bitmaps.get((column, kind))
+        if cached is None or cached[0] != column_version(self._df(), column):
+            self.mask(column, kind)
+            cached = self._bitmaps[(column, kind)]
+        return cached[2]
+
+    def invalidate(self, columns: Optional[Union[str, Iterable[str]]] = None):
+        """
+        Record that columns were written (see the module-level ``invalidate``).
+
+        Args:
+            columns: Column name(s) written (default: all)
+        """
+        invalidate(self._df(), columns)
+
+    def _drop(self, columns: Optional[Union[str, Iterable[str]]]):
+        """Free cached bitmaps of the given columns (default: all)."""
+        if columns is None:
+            self._bitmaps.clear()
+            return
+        columns = {columns} if isinstance(columns, str) else set(columns)
+        for key in [key for key in self._bitmaps if key[0] in columns]:
+            del self._bitmaps[key]
+
+
+def get_column_profile(df: pd.DataFrame) -> ColumnProfile:
+    """
+    Return the shared ColumnProfile for ``df`` (created on first use).
+
+    Args:
+        df: DataFrame to profile
+
+    Returns:
+        ColumnProfile that lives as long as ``df``
+    """
+    profile = _PROFILES.get(id(df))
+    if profile is None or profile._df() is not df:
+        profile = ColumnProfile(df)
+        _PROFILES[id(df)] = profile
+        weakref.finalize(df, _PROFILES.pop, id(df), None)
+    return profile
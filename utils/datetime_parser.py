@@ -0,0 +1,302 @@
+"""
+Format-aware datetime parsing for CAD time fields.
+
+``pd.to_datetime(..., errors='coerce')`` without a format infers one from the
+first value and turns everything that does not fit into NaT. Here the
+dominant format is detected from a sample spread over the column, the column
+is parsed with that exact format, and only the leftovers go through
+pandas' per-value ``format='mixed'`` parser.
+
+``cached_datetimes`` keeps the parsed column per DataFrame, so Time of Call,
+Time Dispatched, Time Out and Time In are parsed at most once per run no
+matter how many validators ask for them.
+"""
+
+import logging
+import re
+import weakref
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .column_profile import column_version
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # pandas < 2.2: only the known formats are tried
+    guess_datetime_format = None
+
+logger = logging.getLogger(__name__)
+
+# Formats seen in CAD exports, tried in order when the schema lists none
+DEFAULT_DATETIME_FORMATS = [
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%m/%d/%Y %I:%M:%S %p",
+]
+
+# Values sampled (evenly across the column) to pick the format
+SAMPLE_SIZE = 1000
+
+# Text that means "no value" rather than an unparseable date
+NULL_TOKENS = ['', 'nan', 'NaN', 'NaT', 'None', '<NA>', 'null', 'NULL']
+
+
+# Zero-padded numeric directives the fixed-width parser understands -> width
+_FIELD_WIDTHS = {'%Y': 4, '%m': 2, '%d': 2, '%H': 2, '%M': 2, '%S': 2}
+
+# Whole years inside the datetime64[ns] range (1677-09-21 .. 2262-04-11); rows
+# outside it go to pd.to_datetime, which turns them into NaT instead of wrapping
+_MIN_YEAR, _MAX_YEAR = 1678, 2261
+
+# ISO 8601 formats pandas already parses in C (faster than the fixed-width path)
+_ISO_FORMAT = re.compile(r'^%Y-%m-%d([ T]%H(:%M(:%S(\.%f)?)?)?)?$')
+
+
+def _fixed_width_layout(fmt: str) -> Optional[tuple]:
+    """
+    Byte layout of a format made only of zero-padded numeric fields.
+
+    Returns:
+        (width, {directive: offset}, [(offset, literal char)]), or None if
+        the format is ISO 8601 or uses anything else (%I, %p, %B, ...)
+    """
+    if _ISO_FORMAT.match(fmt):
+        return None
+    fields, literals = {}, []
+    pos, i = 0, 0
+    while i < len(fmt):
+        if fmt[i] == '%':
+            directive = fmt[i:i + 2]
+            if directive not in _FIELD_WIDTHS or directive in fields:
+                return None
+            fields[directive] = pos
+            pos += _FIELD_WIDTHS[directive]
+            i += 2
+        else:
+            literals.append((pos, fmt[i]))
+            pos += 1
+            i += 1
+    if not {'%Y', '%m', '%d'} <= set(fields):
+        return None
+    return pos, fields, literals
+
+
+def _parse_fixed_width(text: pd.Series, layout: tuple) -> pd.Series:
+    """
+    Parse values laid out exactly as ``layout`` with numpy arithmetic.
+
+    Rows of another length, with non-digits in a numeric field, wrong
+    separators, out-of-range parts or a year outside the datetime64[ns]
+    range come back NaT for the caller to retry.
+    """
+    width, fields, literals = layout
+    result = np.full(len(text), np.datetime64('NaT'), dtype='datetime64[ns]')
+    try:
+        lengths = text.str.len().to_numpy(dtype=np.float64, na_value=np.nan)
+    except AttributeError:  # no strings at all (e.g. datetime objects)
+        return pd.Series(result, index=text.index, name=text.name)
+    rows = np.flatnonzero(lengths == width)
+    if len(rows) == 0:
+        return pd.Series(result, index=text.index, name=text.name)
+
+    codes = np.asarray(text.to_numpy(dtype=object)[rows].astype(f'U{width}')).view(np.uint32).reshape(-1, width)
+    ok = np.ones(len(rows), dtype=bool)
+    for offset, char in literals:
+        ok &= codes[:, offset] == ord(char)
+
+    def number(directive):
+        if directive not in fields:
+            return np.zeros(len(rows), dtype=np.int64)
+        start = fields[directive]
+        digits = codes[:, start:start + _FIELD_WIDTHS[directive]].astype(np.int64) - ord('0')
+        ok[:] &= ((digits >= 0) & (digits <= 9)).all(axis=1)
+        value = np.zeros(len(rows), dtype=np.int64)
+        for column in range(digits.shape[1]):
+            value = value * 10 + digits[:, column]
+        return value
+
+    year, month, day = number('%Y'), number('%m'), number('%d')
+    hour, minute, second = number('%H'), number('%M'), number('%S')
+    ok &= (month >= 1) & (month <= 12) & (day >= 1) & (day <= 31)
+    ok &= (hour < 24) & (minute < 60) & (second < 60)
+    ok &= (year >= _MIN_YEAR) & (year <= _MAX_YEAR)
+
+    months = ((year - 1970) * 12 + np.clip(month, 1, 12) - 1).astype('datetime64[M]')
+    dates = months.astype('datetime64[D]') + (np.clip(day, 1, 31) - 1)
+    # Day past the end of its month (e.g. 02/30) rolls into the next month
+    ok &= dates.astype('datetime64[M]') == months
+    stamps = dates.astype('datetime64[ns]') + ((hour * 60 + minute) * 60 + second) * np.timedelta64(1_000_000_000, 'ns')
+
+    result[rows[ok]] = stamps[ok]
+    return pd.Series(result, index=text.index, name=text.name)
+
+
+def _present(series: pd.Series) -> pd.Series:
+    """Rows holding a value worth parsing."""
+    present = series.notna()
+    if series.dtype == object or pd.api.types.is_string_dtype(series):
+        present &= ~series.isin(NULL_TOKENS)
+    return present
+
+
+def _candidate_formats(sample: pd.Series, formats: Sequence[str]) -> List[str]:
+    """Known formats plus any pandas guesses for a few sample values."""
+    candidates = list(formats)
+    if guess_datetime_format is None:
+        return candidates
+    for value in sample.head(5):
+        if not isinstance(value, str):
+            continue
+        guessed = guess_datetime_format(value.strip())
+        if guessed and guessed not in candidates:
+            candidates.append(guessed)
+    return candidates
+
+
+def detect_datetime_format(series: pd.Series, formats: Optional[Sequence[str]] = None,
+                           sample_size: int = SAMPLE_SIZE) -> Optional[str]:
+    """
+    Pick the format that parses the most values in a sample of the column.
+
+    Args:
+        series: Raw column (strings)
+        formats: Candidate formats (default: DEFAULT_DATETIME_FORMATS); formats
+            pandas guesses from the sample are tried after these
+        sample_size: Values sampled evenly across the column
+
+    Returns:
+        Best format, or None if no candidate parses any sampled value
+    """
+    return _detect_format(series[_present(series)], formats, sample_size)
+
+
+def _detect_format(values: pd.Series, formats: Optional[Sequence[str]], sample_size: int) -> Optional[str]:
+    """``detect_datetime_format`` on values already known to be present."""
+    if values.empty:
+        return None
+    if len(values) > sample_size:
+        values = values.iloc[np.linspace(0, len(values) - 1, sample_size).astype(np.int64)]
+
+    best_format, best_hits = None, 0
+    for fmt in _candidate_formats(values, formats or DEFAULT_DATETIME_FORMATS):
+        hits = int(pd.to_datetime(values, format=fmt, errors='coerce').notna().sum())
+        if hits > best_hits:
+            best_format, best_hits = fmt, hits
+            if hits == len(values):
+                break
+    return best_format
+
+
+def parse_datetimes(series: pd.Series, formats: Optional[Sequence[str]] = None,
+                    fallback: bool = True) -> pd.Series:
+    """
+    Parse a datetime column with its dominant format.
+
+    Args:
+        series: Raw column (strings, or already-parsed datetimes)
+        formats: Candidate formats (default: DEFAULT_DATETIME_FORMATS)
+        fallback: Parse values the dominant format misses with
+            ``format='mixed'``; if False they become NaT
+
+    Returns:
+        datetime64 Series on the same index (unparseable values -> NaT)
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+
+    present = _present(series)
+    if not present.any():
+        return pd.Series(pd.NaT, index=series.index, dtype='datetime64[ns]', name=series.name)
+
+    text = series.where(present)
+    fmt = _detect_format(series[present], formats, SAMPLE_SIZE)
+    if fmt is None:
+        if not fallback:
+            return pd.Series(pd.NaT, index=series.index, dtype='datetime64[ns]', name=series.name)
+        return pd.to_datetime(text, errors='coerce', format='mixed')
+
+    layout = _fixed_width_layout(fmt) if series.dtype == object or pd.api.types.is_string_dtype(series) else None
+    if layout is not None:
+        parsed = _parse_fixed_width(text, layout)
+        # Rows of another width (e.g. unpadded "1/2/2024 9:05") still get the exact format
+        retry = present & parsed.isna()
+        if retry.any():
+            parsed[retry] = pd.to_datetime(text[retry], format=fmt, errors='coerce')
+    else:
+        parsed = pd.to_datetime(text, format=fmt, errors='coerce')
+    leftover = present & parsed.isna()
+    n_leftover = int(leftover.sum())
+    if n_leftover and fallback:
+        leftover_text = text[leftover]
+        if leftover_text.dtype == object or pd.api.types.is_string_dtype(leftover_text):
+            leftover_text = leftover_text.astype(str).str.strip()
+        parsed[leftover] = pd.to_datetime(leftover_text, errors='coerce', format='mixed')
+    logger.debug(
+        "Parsed %s with %r (%d of %d values needed the fallback parser)",
+        series.name, fmt, n_leftover, int(present.sum())
+    )
+    return parsed
+
+
+# id(DataFrame) -> (weak reference, column -> (column version, formats, parsed))
+_FRAME_CACHES: Dict[int, tuple] = {}
+
+
+def _frame_cache(df: pd.DataFrame) -> Dict[str, tuple]:
+    entry = _FRAME_CACHES.get(id(df))
+    if entry is None or entry[0]() is not df:
+        entry = (weakref.ref(df), {})
+        _FRAME_CACHES[id(df)] = entry
+        weakref.finalize(df, _FRAME_CACHES.pop, id(df), None)
+    return entry[1]
+
+
+def cached_datetimes(df: pd.DataFrame, column: str,
+                     formats: Optional[Sequence[str]] = None) -> pd.Series:
+    """
+    Parsed datetimes for ``df[column]``, parsed once per DataFrame.
+
+    The cache entry is dropped when the DataFrame is garbage collected and
+    ignored once the column is invalidated; code that writes the raw text
+    (``df[column] = ...`` or ``.loc`` edits) must call
+    ``utils.column_profile.invalidate(df, column)``. Treat the returned
+    Series as read-only.
+
+    Args:
+        df: DataFrame holding the column
+        column: Column name
+        formats: Candidate formats (default: DEFAULT_DATETIME_FORMATS)
+
+    Returns:
+        datetime64 Series (all NaT if the column is missing)
+    """
+    if column not in df.columns:
+        return pd.Series(pd.NaT, index=df.index, dtype='datetime64[ns]', name=column)
+
+    source = df[column]
+    if pd.api.types.is_datetime64_any_dtype(source):
+        return source
+
+    cache = _frame_cache(df)
+    token = column_version(df, column)
+    formats = tuple(formats) if formats is not None else None
+    cached = cache.get(column)
+    if cached is not None and cached[0] == token and cached[1] == formats:
+        return cached[2]
+
+    parsed = parse_datetimes(source, formats)
+    cache[column] = (token, formats, parsed)
+    return parsed
+
+
+def clear_datetime_cache(df: Optional[pd.DataFrame] = None) -> None:
+    """Forget parsed columns for one DataFrame (or all of them)."""
+    if df is None:
+        for _, cache in _FRAME_CACHES.values():
+            cache.clear()
+    elif id(df) in _FRAME_CACHES:
+        _FRAME_CACHES[id(df)][1].clear()
@@ -0,0 +1,260 @@
+"""
+Packed row bitmaps for validation error bookkeeping.
+
+Validators record failing rows as one bit per row per field (``np.packbits``)
+plus a running OR of all fields, instead of sets of row labels. Memory is
+``rows / 8`` bytes per field however dirty the file is, and counts, overlaps
+("rows failing both FullAddress2 and PDZone") and samples are computed
+from the bits.
+"""
+
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Set bits in each byte value
+_POPCOUNT = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+# Packed bytes scanned at a time when looking for the first set bits
+SCAN_BYTES = 1 << 16
+
+
+def pack_mask(mask) -> np.ndarray:
+    """Pack a boolean mask (array or Series) into bits, first row in the high bit."""
+    return np.packbits(np.asarray(mask, dtype=bool))
+
+
+def popcount(bits: np.ndarray) -> int:
+    """Number of set bits in a packed bitmap."""
+    return int(_POPCOUNT[bits].sum(dtype=np.int64))
+
+
+def first_set_bits(bits: np.ndarray, limit: int) -> np.ndarray:
+    """
+    Positions of the first ``limit`` set bits.
+
+    Scans SCAN_BYTES at a time, so the result (not the number of set bits)
+    bounds the memory used.
+    """
+    found = []
+    remaining = limit
+    for start in range(0, len(bits), SCAN_BYTES):
+        if remaining <= 0:
+            break
+        chunk = bits[start:start + SCAN_BYTES]
+        nonzero = np.flatnonzero(chunk)
+        if len(nonzero) == 0:
+            continue
+        # Unpack only the bytes that hold set bits
+        unpacked = np.unpackbits(chunk[nonzero[:remaining]][:, None], axis=1)
+        byte_pos, bit_pos = np.nonzero(unpacked)
+        positions = (start + nonzero[byte_pos]) * 8 + bit_pos
+        found.append(positions[:remaining])
+        remaining -= len(found[-1])
+    return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+
+
+class ErrorBitmap:
+    """
+    Per-field failing-row bitmaps plus the OR-combined row bitmap.
+
+    ``len()`` is the number of rows with at least one error, so the object
+    can stand in for the set of failing row labels it replaces.
+    """
+
+    def __init__(self, index: Optional[pd.Index] = None):
+        """
+        Initialize bitmap.
+
+        Args:
+            index: Row labels of the validated frame; bound on first ``add``
+                if not given
+        """
+        self.index = None
+        self.n_rows = None
+        self._fields: Dict[str, np.ndarray] = {}
+        self._any = None
+        if index is not None:
+            self.bind(index)
+
+    def bind(self, index: pd.Index) -> 'ErrorBitmap':
+        """Size the bitmap for a frame with this index (labels are used for row lookups)."""
+        if self.n_rows is not None and self.n_rows != len(index):
+            raise ValueError(f"Bitmap covers {self.n_rows:,} rows, frame has {len(index):,}")
+        if self.n_rows is None:
+            self.n_rows = len(index)
+            self._any = np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+        self.index = index
+        return self
+
+    def _check(self, bits: np.ndarray):
+        if len(bits) != len(self._any):
+            raise ValueError(f"Mask covers {len(bits) * 8:,} rows, bitmap has {self.n_rows:,}")
+
+    def add(self, field: str, mask, index: Optional[pd.Index] = None) -> None:
+        """
+        Mark failing rows for a field.
+
+        Args:
+            field: Field name
+            mask: Boolean mask over the rows, or bits from ``pack_mask``
+            index: Row labels (binds the bitmap if it is not bound yet)
+        """
+        bits = mask if isinstance(mask, np.ndarray) and mask.dtype == np.uint8 else pack_mask(mask)
+        if self.n_rows is None:
+            if index is None:
+                index = mask.index if isinstance(mask, pd.Series) else pd.RangeIndex(len(mask))
+            self.bind(index)
+        self._check(bits)
+        if field in self._fields:
+            self._fields[field] |= bits
+        else:
+            self._fields[field] = bits.copy()
+        self._any |= bits
+
+    def update(self, other: 'ErrorBitmap') -> None:
+        """OR another bitmap over the same rows into this one (fields keep first-seen order)."""
+        if other.n_rows is None:
+            return
+        if self.n_rows is None:
+            self.bind(other.index if other.index is not None else pd.RangeIndex(other.n_rows))
+        for field, bits in other._fields.items():
+            self.add(field, bits)
+
+    def to_frame(self) -> pd.DataFrame:
+        """One boolean column per field over the bound rows (for storing the bitmap)."""
+        if self.n_rows is None:
+            return pd.DataFrame()
+        index = self.index if self.index is not None else pd.RangeIndex(self.n_rows)
+        return pd.DataFrame({field: self.mask(field) for field in self._fields}, index=index)
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> 'ErrorBitmap':
+        """Rebuild a bitmap from ``to_frame`` output."""
+        bitmap = cls()
+        if len(frame) or len(frame.columns):
+            bitmap.bind(frame.index)
+            for field in frame.columns:
+                bitmap.add(field, frame[field].to_numpy(dtype=bool))
+        return bitmap
+
+    @property
+    def fields(self) -> List[str]:
+        """Fields with recorded errors, in first-seen order."""
+        return list(self._fields)
+
+    def bits(self, field: Optional[str] = None) -> np.ndarray:
+        """Packed bitmap for a field (or the OR of all fields)."""
+        if self.n_rows is None:
+            return np.zeros(0, dtype=np.uint8)
+        if field is None:
+            return self._any
+        bits = self._fields.get(field)
+        return bits if bits is not None else np.zeros_like(self._any)
+
+    def count(self, field: Optional[str] = None) -> int:
+        """Rows failing a field (or any field)."""
+        return popcount(self.bits(field))
+
+    def overlap(self, *fields: str) -> int:
+        """Rows failing every one of the given fields."""
+        if not fields:
+            return self.count()
+        combined = self.bits(fields[0]).copy()
+        for field in fields[1:]:
+            combined &= self.bits(field)
+        return popcount(combined)
+
+    def overlaps(self, top: Optional[int] = None) -> List[tuple]:
+        """
+        Row counts failing each pair of fields, largest first.
+
+        Args:
+            top: Keep only this many pairs
+
+        Returns:
+            List of (field_a, field_b, rows) with rows > 0
+        """
+        fields = self.fields
+        pairs = []
+        for i, field_a in enumerate(fields):
+            for field_b in fields[i + 1:]:
+                rows = self.overlap(field_a, field_b)
+                if rows:
+                    pairs.append((field_a, field_b, rows))
+        pairs.sort(key=lambda pair: pair[2], reverse=True)
+        return pairs[:top] if top is not None else pairs
+
+    def mask(self, field: Optional[str] = None) -> np.ndarray:
+        """Boolean row mask for a field (or any field)."""
+        if self.n_rows is None:
+            return np.zeros(0, dtype=bool)
+        return np.unpackbits(self.bits(field), count=self.n_rows).astype(bool)
+
+    def _labels(self, positions: np.ndarray) -> list:
+        if self.index is None:
+            return positions.tolist()
+        return self.index[positions].tolist()
+
+    def rows(self, field: Optional[str] = None, limit: Optional[int] = None) -> list:
+        """Labels of failing rows in row order (the first ``limit`` if given)."""
+        bits = self.bits(field)
+        positions = first_set_bits(bits, limit if limit is not None else self.n_rows or 0)
+        return self._labels(positions)
+
+    def sample(self, n: int, field: Optional[str] = None, seed: Optional[int] = None) -> list:
+        """
+        Uniform random sample of failing row labels, in row order.
+
+        Args:
+            n: Sample size (all failing rows if fewer)
+            field: Field to sample from (default: rows failing any field)
+            seed: Random seed
+
+        Returns:
+            List of row labels
+        """
+        bits = self.bits(field)
+        byte_counts = _POPCOUNT[bits].cumsum(dtype=np.int64)
+        total = int(byte_counts[-1]) if len(byte_counts) else 0
+        if total == 0 or n <= 0:
+            return []
+        ranks = np.sort(np.random.default_rng(seed).choice(total, size=min(n, total), replace=False))
+        # Byte holding each ranked bit, then the bit within that byte
+        byte_pos = np.searchsorted(byte_counts, ranks, side='right')
+        before = byte_counts[byte_pos] - _POPCOUNT[bits[byte_pos]]
+        running = np.unpackbits(bits[byte_pos][:, None], axis=1).cumsum(axis=1)
+        bit_pos = np.argmax(running > (ranks - before)[:, None], axis=1)
+        return self._labels(byte_pos * 8 + bit_pos)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the bitmaps."""
+        if self.n_rows is None:
+            return 0
+        return self._any.nbytes + sum(bits.nbytes for bits in self._fields.values())
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __iter__(self) -> Iterator:
+        return iter(self.rows())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ErrorBitmap):
+            return NotImplemented
+        return (
+            self.n_rows == other.n_rows
+            and self._fields.keys() == other._fields.keys()
+            and all(np.array_equal(bits, other._fields[field]) for field, bits in self._fields.items())
+        )
+
+    def __getstate__(self):
+        # Row labels stay with the parent process; workers send back bits only
+        state = self.__dict__.copy()
+        state['index'] = None
+        return state
+
+    def __repr__(self):
+        return f"<ErrorBitmap {self.count():,} of {self.n_rows or 0:,} rows, {len(self._fields)} fields>"
@@ -0,0 +1,247 @@
+"""
+Streaming XLSX writer for CAD data processing pipeline.
+
+Writes DataFrames to .xlsx through openpyxl's write-only workbook, encoding
+rows one chunk at a time, so memory stays flat regardless of row count.
+Cell values, types and datetime formats match ``DataFrame.to_excel`` with
+the openpyxl engine. Formula guards are applied per column, vectorized,
+while each chunk is encoded.
+"""
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+import logging
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
+
+from .unique_values import factorize_column
+
+
+# Leading characters Excel interprets as the start of a formula
+FORMULA_PREFIXES = ('=', '+', '-', '@')
+
+# Number formats pandas uses for datetime and timedelta cells
+DATETIME_FORMAT = 'YYYY-MM-DD HH:MM:SS'
+TIMEDELTA_FORMAT = '0'
+
+# pandas writes missing values as empty text cells (na_rep='')
+MISSING = ''
+
+DEFAULT_CHUNK_ROWS = 50_000
+
+
+def escape_excel_formulas(series: pd.Series) -> pd.Series:
+    """
+    Prefix text values that Excel would read as formulas with a single quote.
+
+    Only non-empty strings starting with =, +, - or @ change; numbers,
+    missing values and other text are left as they are.
+
+    Args:
+        series: Column to guard
+
+    Returns:
+        Guarded Series (unchanged if no value needs escaping)
+    """
+    if not (series.dtype == object or isinstance(series.dtype, (pd.StringDtype, pd.CategoricalDtype))):
+        return series
+    # Checked once per distinct value; non-string values never need escaping
+    codes, uniques = factorize_column(series)
+    escape = np.array([isinstance(value, str) and value[:1] in FORMULA_PREFIXES for value in uniques], dtype=bool)
+    needs_escape = np.append(escape, False)[codes]
+    if not needs_escape.any():
+        return series
+    values = series.astype(object)
+    result = values.copy()
+    result[needs_escape] = "'" + values[needs_escape].astype(str)
+    return result
+
+
+def guard_excel_values(series: pd.Series, values: Iterable[str] = ('9-1-1',)) -> pd.Series:
+    """
+    Keep listed values as literal text in Excel by writing them as ="value".
+
+    Vectorized equivalent of applying ``guard_excel_text`` per cell: missing
+    values stay missing, everything else is converted to str.
+
+    Args:
+        series: Column to guard
+        values: Values Excel would otherwise reinterpret (e.g. 9-1-1 as a date)
+
+    Returns:
+        Guarded Series of strings
+    """
+    result = series.astype(object)
+    present = result.notna().to_numpy(dtype=bool)
+    text = result[present].astype(str)
+    guarded = text.isin(list(values))
+    text[guarded] = '="' + text[guarded] + '"'
+    result = result.copy()
+    result[present] = text
+    return result
+
+
+def _header_cell(ws, value) -> WriteOnlyCell:
+    """Header cell styled like pandas' to_excel header."""
+    cell = WriteOnlyCell(ws, value=value)
+    cell.font = Font(bold=True)
+    thin = Side(style='thin')
+    cell.border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    cell.alignment = Alignment(horizontal='center', vertical='top')
+    return cell
+
+
+class StreamingExcelWriter:
+    """
+    Appends DataFrame chunks to one worksheet of a write-only workbook.
+
+    Columns are fixed by the first chunk; later chunks are reindexed to it.
+    The file is written on ``close()`` (or when used as a context manager).
+    """
+
+    def __init__(
+        self,
+        output_path: Union[str, Path],
+        sheet_name: str = 'Sheet1',
+        escape_formulas: bool = False,
+        guard_columns: Optional[List[str]] = None,
+        freeze_panes: Optional[str] = None,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS
+    ):
+        """
+        Initialize writer.
+
+        Args:
+            output_path: Output .xlsx file
+            sheet_name: Worksheet name
+            escape_formulas: Prefix formula-like text (=, +, -, @) with a quote
+            guard_columns: Columns whose '9-1-1' values are written as ="9-1-1"
+            freeze_panes: Optional top-left unfrozen cell (e.g. "A2")
+            chunk_rows: Rows encoded per batch
+        """
+        self.output_path = Path(output_path)
+        self.escape_formulas = escape_formulas
+        self.guard_columns = set(guard_columns or [])
+        self.chunk_rows = chunk_rows
+        self.columns = None
+        self.rows_written = 0
+        self.logger = logging.getLogger(__name__)
+
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet(title=sheet_name)
+        if freeze_panes:
+            self._sheet.freeze_panes = freeze_panes
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+
+    def _encode_column(self, series: pd.Series) -> np.ndarray:
+        """Convert one column to Python cell values (missing -> empty text)."""
+        if series.name in self.guard_columns:
+            series = guard_excel_values(series)
+        elif self.escape_formulas:
+            series = escape_excel_formulas(series)
+
+        if pd.api.types.is_datetime64_any_dtype(series):
+            values = series.dt.tz_localize(None) if series.dt.tz is not None else series
+            return self._formatted_cells(values.astype(object).to_numpy(), values.isna(), DATETIME_FORMAT)
+        if pd.api.types.is_timedelta64_dtype(series):
+            days = (series.dt.total_seconds() / 86400).to_numpy(dtype=object)
+            return self._formatted_cells(days, series.isna(), TIMEDELTA_FORMAT)
+
+        cells = series.astype(object).to_numpy()
+        missing = pd.isna(cells)
+        if missing.any():
+            cells = cells.copy()
+            cells[missing] = MISSING
+        return cells
+
+    def _formatted_cells(self, values: np.ndarray, missing: pd.Series, number_format: str) -> np.ndarray:
+        """Wrap values in cells carrying a number format (as pandas does for dates)."""
+        result = np.full(len(values), MISSING, dtype=object)
+        sheet = self._sheet
+        for i in np.flatnonzero(~missing.to_numpy(dtype=bool)):
+            cell = WriteOnlyCell(sheet, value=values[i])
+            cell.number_format = number_format
+            result[i] = cell
+        return result
+
+    def write(self, df: pd.DataFrame) -> int:
+        """
+        Append rows to the worksheet.
+
+        Args:
+            df: Rows to write (index is not written)
+
+        Returns:
+            Number of rows written
+        """
+        if self.columns is None:
+            self.columns = list(df.columns)
+            self._sheet.append([_header_cell(self._sheet, str(col)) for col in self.columns])
+        elif list(df.columns) != self.columns:
+            df = df.reindex(columns=self.columns)
+
+        append = self._sheet.append
+        for start in range(0, len(df), self.chunk_rows):
+            chunk = df.iloc[start:start + self.chunk_rows]
+            encoded = [self._encode_column(chunk.iloc[:, i]) for i in range(len(self.columns))]
+            for row in zip(*encoded):
+                append(row)
+            self.rows_written += len(chunk)
+        return len(df)
+
+    def close(self):
+        """Write the workbook to disk."""
+        if self._workbook is None:
+            return
+        if self.columns is None:
+            self._sheet.append([])
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._workbook.save(str(self.output_path))
+        self._workbook = None
+        self.logger.debug(f"Wrote {self.rows_written:,} rows to {self.output_path}")
+
+
+def write_excel(
+    df: pd.DataFrame,
+    output_path: Union[str, Path],
+    sheet_name: str = 'Sheet1',
+    escape_formulas: bool = False,
+    guard_columns: Optional[List[str]] = None,
+    freeze_panes: Optional[str] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> Path:
+    """
+    Write a DataFrame to .xlsx in constant memory (drop-in for to_excel(index=False)).
+
+    Args:
+        df: DataFrame to write
+        output_path: Output .xlsx file
+        sheet_name: Worksheet name
+        escape_formulas: Prefix formula-like text (=, +, -, @) with a quote
+        guard_columns: Columns whose '9-1-1' values are written as ="9-1-1"
+        freeze_panes: Optional top-left unfrozen cell (e.g. "A2")
+        chunk_rows: Rows encoded per batch
+
+    Returns:
+        Path of the written file
+    """
+    with StreamingExcelWriter(
+        output_path,
+        sheet_name=sheet_name,
+        escape_formulas=escape_formulas,
+        guard_columns=guard_columns,
+        freeze_panes=freeze_panes,
+        chunk_rows=chunk_rows
+    ) as writer:
+        writer.write(df)
+    return Path(output_path)
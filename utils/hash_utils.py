@@ -6,13 +6,124 @@ track file changes throughout the processing pipeline.
 """
 
 import hashlib
+import io
 import json
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Iterator, Optional, List
 import logging
 
 
+# Read buffer for streamed hashing
+BUFFER_SIZE = 1024 * 1024
+
+# Files at least this large are hashed through mmap
+MMAP_THRESHOLD = 4 * 1024 * 1024
+
+# Manifest log entries replayed at load before the snapshot is compacted
+COMPACT_ENTRIES = 1000
+
+
+class HashingFile(io.RawIOBase):
+    """
+    Raw file that hashes bytes as the pipeline reads or writes them.
+
+    Bytes are hashed in file order as they pass through. Readers that seek
+    (e.g. zip-based .xlsx parsing) leave gaps that are filled from disk
+    by ``hexdigest()``; a writer that seeks back and overwrites hashed bytes
+    falls back to rehashing the finished file.
+    """
+
+    def __init__(self, file_path: str, mode: str = 'rb', algorithm: str = 'sha256'):
+        """
+        Open file for hashed reading ('rb') or writing ('wb').
+
+        Args:
+            file_path: Path to file
+            mode: 'rb' or 'wb'
+            algorithm: Hash algorithm (sha256, md5, sha1)
+        """
+        if mode not in ('rb', 'wb'):
+            raise ValueError(f"Unsupported mode: {mode}")
+        super().__init__()
+        self.path = Path(file_path)
+        self.mode = mode
+        self.algorithm = algorithm
+        self._file = open(self.path, mode)
+        self._hash = hashlib.new(algorithm)
+        self._pos = 0
+        self._hashed_to = 0
+        self._dirty = False
+        self._digest = None
+
+    def readable(self) -> bool:
+        return self.mode == 'rb'
+
+    def writable(self) -> bool:
+        return self.mode == 'wb'
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._pos = self._file.seek(offset, whence)
+        return self._pos
+
+    def _consume(self, start: int, data: memoryview):
+        """Hash the part of ``data`` that extends the hashed prefix."""
+        end = start + len(data)
+        if start <= self._hashed_to < end:
+            self._hash.update(data[self._hashed_to - start:])
+            self._hashed_to = end
+
+    def readinto(self, buffer) -> int:
+        n = self._file.readinto(buffer)
+        if n:
+            self._consume(self._pos, memoryview(buffer)[:n])
+            self._pos += n
+        return n
+
+    def write(self, data) -> int:
+        data = memoryview(data)
+        if self._pos < self._hashed_to:
+            self._dirty = True
+        n = self._file.write(data)
+        self._consume(self._pos, data[:n])
+        self._pos += n
+        return n
+
+    def close(self):
+        if not self.closed:
+            self._file.close()
+        super().close()
+
+    def hexdigest(self) -> Optional[str]:
+        """
+        Return the digest of the file (call after the file is fully read/written).
+
+        Returns:
+            Hexadecimal hash, or None if the bytes must be rehashed from disk
+        """
+        if self._dirty:
+            return None
+        if self._digest is None:
+            if self.mode == 'wb' and not self.closed:
+                self._file.flush()
+            # Hash whatever the consumer skipped past (e.g. unread tail)
+            with open(self.path, 'rb') as f:
+                f.seek(self._hashed_to)
+                while chunk := f.read(BUFFER_SIZE):
+                    self._hash.update(chunk)
+                    self._hashed_to += len(chunk)
+            self._digest = self._hash.hexdigest()
+        return self._digest
+
 class FileHashManager:
     """Manages file hashing and integrity verification."""
 
@@ -20,34 +131,69 @@ class FileHashManager:
         """
         Initialize hash manager.
 
+        New records are appended to a JSON-lines log next to the manifest
+        (hash_manifest.jsonl) and folded into the JSON snapshot by compact().
+
         Args:
             manifest_path: Path to JSON file storing hash manifest
         """
         self.manifest_path = Path(manifest_path)
         self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        self.manifest = self._load_manifest()
+        self.log_path = self.manifest_path.with_suffix('.jsonl')
         self.logger = logging.getLogger(__name__)
+        self._log_entries = 0
+        self.manifest = self._load_manifest()
+        if self._log_entries >= COMPACT_ENTRIES:
+            self.compact()
 
     def _load_manifest(self) -> Dict:
-        """Load existing hash manifest or create new one."""
+        """Load hash manifest snapshot and replay the append-only log."""
+        manifest = {"version": "1.0", "files": {}}
         if self.manifest_path.exists():
             try:
                 with open(self.manifest_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    manifest = json.load(f)
             except json.JSONDecodeError:
-                return {"version": "1.0", "files": {}}
-        return {"version": "1.0", "files": {}}
+                pass
+
+        if self.log_path.exists():
+            with open(self.log_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Partial line from an interrupted write
+                    manifest["files"][entry["key"]] = entry["info"]
+                    self._log_entries += 1
+        return manifest
 
     def _save_manifest(self):
-        """Save hash manifest to disk."""
+        """Save hash manifest snapshot to disk."""
         self.manifest["last_updated"] = datetime.now().isoformat()
-        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+        tmp_path = self.manifest_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(self.manifest, f, indent=2)
+        tmp_path.replace(self.manifest_path)
+
+    def _append_log(self, key: str, info: Dict):
+        """Append one manifest record to the log."""
+        with open(self.log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({"key": key, "info": info}) + "\n")
+        self._log_entries += 1
+
+    def compact(self):
+        """Fold the append-only log into the manifest snapshot."""
+        self._save_manifest()
+        self.log_path.unlink(missing_ok=True)
+        self._log_entries = 0
 
     def compute_file_hash(self, file_path: str, algorithm: str = 'sha256') -> str:
         """
         Compute hash of a file.
 
+        Large files are hashed through mmap (one update call that releases the
+        GIL), smaller ones with a large read buffer.
+
         Args:
             file_path: Path to file
             algorithm: Hash algorithm (sha256, md5, sha1)
@@ -61,19 +207,94 @@ class FileHashManager:
             raise FileNotFoundError(f"File not found: {file_path}")
 
         hash_obj = hashlib.new(algorithm)
-        chunk_size = 8192
 
         with open(file_path, 'rb') as f:
-            while chunk := f.read(chunk_size):
-                hash_obj.update(chunk)
+            size = file_path.stat().st_size
+            if size >= MMAP_THRESHOLD:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        hash_obj.update(mapped)
+                    return hash_obj.hexdigest()
+                except (OSError, ValueError):
+                    hash_obj = hashlib.new(algorithm)
+                    f.seek(0)
+
+            buffer = bytearray(BUFFER_SIZE)
+            view = memoryview(buffer)
+            while n := f.readinto(buffer):
+                hash_obj.update(view[:n])
 
         return hash_obj.hexdigest()
 
+    def compute_file_hashes(
+        self,
+        file_paths: Iterable[str],
+        algorithm: str = 'sha256',
+        max_workers: Optional[int] = None
+    ) -> Dict[str, str]:
+        """
+        Hash many files concurrently.
+
+        Args:
+            file_paths: Paths to hash
+            algorithm: Hash algorithm (sha256, md5, sha1)
+            max_workers: Thread pool size (default: executor default)
+
+        Returns:
+            Mapping of path (as given) -> hexadecimal hash
+        """
+        file_paths = [str(path) for path in file_paths]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            hashes = executor.map(lambda path: self.compute_file_hash(path, algorithm), file_paths)
+            return dict(zip(file_paths, hashes))
+
+    @contextmanager
+    def hashing_reader(self, file_path: str, algorithm: str = 'sha256') -> Iterator[io.BufferedReader]:
+        """
+        Open a file for reading while hashing the bytes consumed.
+
+        The digest is available afterwards as ``stream.raw.hexdigest()``.
+
+        Args:
+            file_path: Path to file
+            algorithm: Hash algorithm (sha256, md5, sha1)
+
+        Yields:
+            Buffered binary stream
+        """
+        stream = io.BufferedReader(HashingFile(file_path, 'rb', algorithm), buffer_size=BUFFER_SIZE)
+        try:
+            yield stream
+        finally:
+            stream.close()
+
+    @contextmanager
+    def hashing_writer(self, file_path: str, algorithm: str = 'sha256') -> Iterator[io.BufferedWriter]:
+        """
+        Open a file for writing while hashing the bytes written.
+
+        The digest is available afterwards as ``stream.raw.hexdigest()``
+        (None if the writer seeked back and the file must be rehashed).
+
+        Args:
+            file_path: Path to file
+            algorithm: Hash algorithm (sha256, md5, sha1)
+
+        Yields:
+            Buffered binary stream
+        """
+        stream = io.BufferedWriter(HashingFile(file_path, 'wb', algorithm), buffer_size=BUFFER_SIZE)
+        try:
+            yield stream
+        finally:
+            stream.close()
+
     def record_file_hash(
         self,
         file_path: str,
         stage: str = "unknown",
-        metadata: Optional[Dict] = None
+        metadata: Optional[Dict] = None,
+        file_hash: Optional[str] = None
     ) -> str:
         """
         Compute and record file hash in manifest.
@@ -82,12 +303,15 @@ class FileHashManager:
             file_path: Path to file
             stage: Processing stage (e.g., "input", "cleaned", "output")
             metadata: Optional metadata about the file
+            file_hash: SHA256 already computed while streaming the file
+                (e.g. from hashing_reader/hashing_writer); computed if None
 
         Returns:
             Hash value
         """
         file_path = Path(file_path)
-        file_hash = self.compute_file_hash(file_path)
+        if file_hash is None:
+            file_hash = self.compute_file_hash(file_path)
 
         file_info = {
             "hash": file_hash,
@@ -104,7 +328,7 @@ class FileHashManager:
         # Use relative path as key
         key = f"{file_path.name}_{stage}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         self.manifest["files"][key] = file_info
-        self._save_manifest()
+        self._append_log(key, file_info)
 
         self.logger.info(f"Recorded hash for {file_path.name} (stage: {stage})")
         self.logger.info(f"  Hash: {file_hash[:16]}...")
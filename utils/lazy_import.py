@@ -0,0 +1,128 @@
+"""
+Deferred imports for CAD data processing pipeline entry points.
+
+Entry points such as ``main.py --help`` or ``master_pipeline.py --help``
+should not pay for dask, openpyxl or the geocoder stack before they know
+they need them. ``lazy_import`` returns a stand-in that imports the real
+module on first attribute access; ``install_lazy_exports`` gives a package
+``__init__`` the same behaviour for the names it re-exports.
+"""
+
+import importlib
+import importlib.util
+import sys
+import types
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+
+class LazyModule(types.ModuleType):
+    """Module stand-in that imports the real module on first attribute access."""
+
+    def __init__(self, name: str, path: Union[str, Path, None] = None, hint: Optional[str] = None):
+        """
+        Initialize lazy module.
+
+        Args:
+            name: Module name (registered in sys.modules once loaded)
+            path: Load from this source file instead of sys.path
+            hint: Extra text for the ImportError raised when loading fails
+        """
+        super().__init__(name)
+        self.__dict__['_lazy_path'] = Path(path) if path is not None else None
+        self.__dict__['_lazy_hint'] = hint
+        self.__dict__['_lazy_module'] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__['_lazy_module']
+        if module is not None:
+            return module
+        name = self.__name__
+        path = self.__dict__['_lazy_path']
+        try:
+            if path is None:
+                module = importlib.import_module(name)
+            elif name in sys.modules:
+                module = sys.modules[name]
+            else:
+                if not path.exists():
+                    raise ImportError(f"Module file not found at {path}")
+                spec = importlib.util.spec_from_file_location(name, path)
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[name] = module
+                try:
+                    spec.loader.exec_module(module)
+                except BaseException:
+                    sys.modules.pop(name, None)
+                    raise
+        except ImportError as e:
+            hint = self.__dict__['_lazy_hint']
+            message = f"Could not import {name}: {e}"
+            raise ImportError(f"{message} ({hint})" if hint else message) from e
+        self.__dict__['_lazy_module'] = module
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the real module has been imported."""
+        return self.__dict__['_lazy_module'] is not None
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str, path: Union[str, Path, None] = None, hint: Optional[str] = None) -> LazyModule:
+    """
+    Defer importing a module until one of its attributes is used.
+
+    Args:
+        name: Module name, e.g. 'dask' or 'geocode_nj_geocoder'
+        path: Optional source file to load the module from
+        hint: Extra text for the ImportError raised when loading fails
+
+    Returns:
+        LazyModule stand-in
+    """
+    return LazyModule(name, path=path, hint=hint)
+
+
+def install_lazy_exports(package: str, exports: Dict[str, str]) -> None:
+    """
+    Make a package import its re-exported names on first access.
+
+    Installs a module-level ``__getattr__``/``__dir__`` (PEP 562). Exported
+    names must differ from submodule names, since importing a submodule
+    binds its name on the package.
+
+    Args:
+        package: Package name (``__name__`` of the package ``__init__``)
+        exports: Exported name -> submodule (relative to the package)
+
+    Raises:
+        ValueError: If an exported name is also a submodule name
+    """
+    namespace = sys.modules[package].__dict__
+    shadowed = sorted(set(exports) & set(exports.values()))
+    if shadowed:
+        raise ValueError(f"Exported names shadow their submodules: {shadowed}")
+
+    def __getattr__(name: str):
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(f".{submodule}", package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(exports))
+
+    namespace['__getattr__'] = __getattr__
+    namespace['__dir__'] = __dir__
@@ -0,0 +1,125 @@
+"""
+Merge artifact scanner for CAD data processing pipeline.
+
+Compiles the ``duplicate_detection.merge_artifact_patterns`` regexes into
+one case-insensitive alternation and scans each text column once. Columns
+with few distinct values are scanned over their distinct values only, and
+every flagged row records which pattern and column flagged it.
+"""
+
+import re
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+import logging
+
+from .unique_values import factorize_column
+
+
+class MergeArtifactScanner:
+    """Scans text columns for merge artifact patterns in one pass per column."""
+
+    def __init__(
+        self,
+        patterns: List[str],
+        columns: Optional[List[str]] = None,
+        exclude_columns: Optional[List[str]] = None,
+        low_cardinality_ratio: float = 0.5
+    ):
+        """
+        Initialize scanner.
+
+        Args:
+            patterns: Merge artifact regex patterns (matched case-insensitively)
+            columns: Columns to scan (defaults to all text columns)
+            exclude_columns: Columns never scanned (e.g. free-text notes)
+            low_cardinality_ratio: Columns with distinct/rows at or below this
+                ratio are scanned over their distinct values only
+        """
+        self.patterns = list(dict.fromkeys(patterns or []))
+        self.columns = list(columns) if columns else None
+        self.exclude_columns = set(exclude_columns or [])
+        self.low_cardinality_ratio = low_cardinality_ratio
+        self.logger = logging.getLogger(__name__)
+
+        alternatives = [f"(?P<p{i}>{pattern})" for i, pattern in enumerate(self.patterns)]
+        self._regex = re.compile('|'.join(alternatives), re.IGNORECASE) if alternatives else None
+
+    def _match_codes(self, values) -> np.ndarray:
+        """Return the index of the matching pattern for each value (-1 if none)."""
+        search = self._regex.search
+        result = np.full(len(values), -1, dtype=np.int16)
+        for i, value in enumerate(values):
+            match = search(value if isinstance(value, str) else str(value))
+            if match is not None:
+                result[i] = int(match.lastgroup[1:])
+        return result
+
+    def scan_column(self, series: pd.Series) -> np.ndarray:
+        """
+        Scan one column.
+
+        Args:
+            series: Column to scan
+
+        Returns:
+            int16 array with the matching pattern index per row (-1 if none)
+        """
+        result = np.full(len(series), -1, dtype=np.int16)
+        if self._regex is None or len(series) == 0:
+            return result
+
+        codes, uniques = factorize_column(series)
+        if len(uniques) <= self.low_cardinality_ratio * len(series):
+            # Scan distinct values and broadcast through the codes
+            unique_matches = np.append(self._match_codes(uniques), np.int16(-1))
+            return unique_matches[codes]
+
+        present = np.flatnonzero(codes >= 0)
+        result[present] = self._match_codes(series.to_numpy(dtype=object)[present])
+        return result
+
+    def _columns_to_scan(self, df: pd.DataFrame) -> List[str]:
+        if self.columns is not None:
+            candidates = [col for col in self.columns if col in df.columns]
+        else:
+            candidates = [
+                col for col in df.columns
+                if df[col].dtype == 'object' or isinstance(df[col].dtype, pd.StringDtype)
+                or (isinstance(df[col].dtype, pd.CategoricalDtype) and df[col].cat.categories.dtype == 'object')
+            ]
+        return [col for col in candidates if col not in self.exclude_columns]
+
+    def scan(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Scan a DataFrame for merge artifacts.
+
+        Args:
+            df: DataFrame to scan
+
+        Returns:
+            DataFrame aligned to ``df`` with columns 'merge_artifact_pattern'
+            and 'merge_artifact_column' (categorical; missing where the row
+            was not flagged). The first scanned column that matches wins.
+        """
+        pattern_codes = np.full(len(df), -1, dtype=np.int16)
+        column_codes = np.full(len(df), -1, dtype=np.int16)
+
+        columns = self._columns_to_scan(df)
+        for col_index, col in enumerate(columns):
+            matches = self.scan_column(df[col])
+            new_hits = (matches >= 0) & (pattern_codes < 0)
+            if new_hits.any():
+                pattern_codes[new_hits] = matches[new_hits]
+                column_codes[new_hits] = col_index
+                self.logger.info(f"Flagged {int(new_hits.sum()):,} merge artifacts in column '{col}'")
+
+        return pd.DataFrame({
+            'merge_artifact_pattern': pd.Categorical.from_codes(pattern_codes, categories=self.patterns),
+            'merge_artifact_column': pd.Categorical.from_codes(column_codes, categories=columns),
+        }, index=df.index)
+
+    def summary(self, result: pd.DataFrame) -> Dict[str, int]:
+        """Count flagged rows per pattern."""
+        counts = result['merge_artifact_pattern'].value_counts()
+        return {str(pattern): int(count) for pattern, count in counts.items() if count > 0}
@@ -0,0 +1,122 @@
+"""
+Multi-pattern value standardizer for CAD data processing pipeline.
+
+Compiles a ``{standard_value: [variations, ...]}`` mapping (e.g.
+``field_mappings.how_reported.patterns`` in config.yml) into one combined
+case-insensitive alternation and resolves each distinct column value to its
+standard value in a single pass.
+"""
+
+import re
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+
+from .unique_values import factorize_column
+
+
+class PatternStandardizer:
+    """
+    Substring-pattern standardizer with "first pattern wins" semantics.
+
+    A value containing any variation (case-insensitive substring) of a
+    standard value is replaced by that standard value; standard values are
+    tried in configuration order. This reproduces applying one
+    ``str.contains(variation, case=False, regex=False)`` pass per variation
+    in order, including later patterns matching an already-standardized
+    value.
+    """
+
+    def __init__(self, patterns: Dict[str, List[str]]):
+        """
+        Initialize standardizer.
+
+        Args:
+            patterns: Ordered mapping of standard value -> list of variations
+        """
+        self.standards = [str(standard) for standard in patterns]
+        variations = [[str(v).upper() for v in patterns[standard] if str(v)] for standard in patterns]
+
+        # Zero-width lookahead so overlapping matches are all visited; at each
+        # position the alternation reports the lowest-numbered group. One
+        # alternation per start index, so a standard before ``start`` cannot
+        # hide a later one matching at the same position.
+        alternatives = [
+            (i, f"(?P<g{i}>{'|'.join(re.escape(v) for v in group)})")
+            for i, group in enumerate(variations) if group
+        ]
+        self._regexes = []
+        for start in range(len(self.standards)):
+            tail = [alternative for i, alternative in alternatives if i >= start]
+            self._regexes.append(re.compile(f"(?=(?:{'|'.join(tail)}))") if tail else None)
+        self._group_index = {f"g{i}": i for i in range(len(self.standards))}
+
+        # Resolution of each standard value through the patterns that follow it
+        self._chain = [self._resolve_from(standard, i + 1) for i, standard in enumerate(self.standards)]
+
+    def _first_group(self, text: str, start: int = 0) -> Optional[int]:
+        """Return the index of the first standard (>= start) with a variation in ``text``."""
+        regex = self._regexes[start] if start < len(self._regexes) else None
+        if regex is None:
+            return None
+        best = None
+        for match in regex.finditer(text.upper()):
+            index = self._group_index[match.lastgroup]
+            if best is None or index < best:
+                best = index
+                if best == start:
+                    break
+        return best
+
+    def _resolve_from(self, value: str, start: int) -> str:
+        """Sequentially apply the standards from ``start`` onwards to ``value``."""
+        while start < len(self.standards):
+            group = self._first_group(value, start)
+            if group is None:
+                break
+            value = self.standards[group]
+            start = group + 1
+        return value
+
+    def resolve(self, value) -> Optional[str]:
+        """
+        Resolve one value to its standard value.
+
+        Args:
+            value: Raw value
+
+        Returns:
+            Standard value, or None if no pattern matches
+        """
+        if value is None or (isinstance(value, float) and np.isnan(value)):
+            return None
+        group = self._first_group(str(value))
+        if group is None:
+            return None
+        return self._chain[group]
+
+    def standardize(self, series: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Resolve a column over its distinct values.
+
+        Args:
+            series: Column to standardize
+
+        Returns:
+            Tuple of (row positions whose value changes, new values for those rows)
+        """
+        codes, uniques = factorize_column(series)
+        if len(uniques) == 0:
+            return np.array([], dtype=np.intp), np.array([], dtype=object)
+
+        resolved = np.array([self.resolve(value) for value in uniques], dtype=object)
+        changes = np.array([
+            standard is not None and str(standard) != str(value)
+            for standard, value in zip(resolved, uniques)
+        ], dtype=bool)
+
+        valid = codes >= 0
+        row_changes = np.zeros(len(codes), dtype=bool)
+        row_changes[valid] = changes[codes[valid]]
+        rows = np.flatnonzero(row_changes)
+        return rows, resolved[codes[rows]]
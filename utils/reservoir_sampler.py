@@ -0,0 +1,245 @@
+"""
+Stratified reservoir sampling for CAD data processing pipeline.
+
+Draws a proportionally allocated stratified sample in one pass over
+DataFrame chunks. Every row gets a deterministic priority derived from the
+seed and its global row position; each stratum keeps only the rows with the
+smallest priorities, so memory is bounded by the sample size per stratum
+instead of the row count. Because priorities depend only on row position,
+partitions sampled separately (e.g. in worker processes) merge into exactly
+the sample a single pass over the whole frame would draw.
+"""
+
+import numpy as np
+import pandas as pd
+from collections import Counter
+from typing import Dict, Optional
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+
+
+def row_priorities(positions: np.ndarray, seed: int = 42) -> np.ndarray:
+    """
+    Deterministic uniform priorities in [0, 1) for global row positions.
+
+    Uses the splitmix64 finalizer on (seed, position), so the priority of a
+    row does not depend on how the rows were chunked.
+
+    Args:
+        positions: Global row positions
+        seed: Sampling seed
+
+    Returns:
+        float64 array of priorities
+    """
+    base = np.uint64(((seed + 1) * _GOLDEN) & _MASK64)
+    with np.errstate(over='ignore'):
+        z = np.asarray(positions, dtype=np.uint64) + base
+        z = (z ^ (z >> np.uint64(30))) * _MIX1
+        z = (z ^ (z >> np.uint64(27))) * _MIX2
+        z = z ^ (z >> np.uint64(31))
+    return (z >> np.uint64(11)).astype(np.float64) * 2.0 ** -53
+
+
+def _bottom_k(codes: np.ndarray, priorities: np.ndarray, k) -> np.ndarray:
+    """Positions of the k smallest priorities within each code group (k: int or per-code array)."""
+    order = np.lexsort((priorities, codes))
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    group_start = np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+    rank = np.arange(len(order)) - group_start
+    limit = k if np.isscalar(k) else np.asarray(k)[sorted_codes]
+    return order[rank < limit]
+
+
+def allocate_proportional(counts: Dict, sample_size: int) -> Dict:
+    """
+    Split ``sample_size`` across strata in proportion to their sizes.
+
+    Largest-remainder allocation: every stratum gets the floor of its
+    share, the leftover rows go to the largest fractional parts.
+
+    Args:
+        counts: Stratum -> population size
+        sample_size: Total rows to allocate
+
+    Returns:
+        Stratum -> rows to sample
+    """
+    total = sum(counts.values())
+    if total == 0 or sample_size <= 0:
+        return {stratum: 0 for stratum in counts}
+    quotas = {stratum: sample_size * count / total for stratum, count in counts.items()}
+    allocation = {stratum: int(quota) for stratum, quota in quotas.items()}
+    leftover = sample_size - sum(allocation.values())
+    by_remainder = sorted(quotas, key=lambda stratum: allocation[stratum] - quotas[stratum])
+    for stratum in by_remainder[:leftover]:
+        allocation[stratum] += 1
+    return allocation
+
+
+class StratifiedReservoirSampler:
+    """
+    One-pass stratified sampler keyed on a low-cardinality column.
+
+    Values seen more than ``min_stratum_size`` times form their own stratum;
+    rarer and missing values share ``other_label``. Without the stratum
+    column every row falls in ``unknown_label``.
+    """
+
+    def __init__(
+        self,
+        sample_size: int,
+        stratum_column: str = 'Incident',
+        min_stratum_size: int = 50,
+        seed: int = 42,
+        other_label: str = 'Other',
+        unknown_label: str = 'Unknown'
+    ):
+        """
+        Initialize sampler.
+
+        Args:
+            sample_size: Rows to draw in total
+            stratum_column: Column whose values define the strata
+            min_stratum_size: Values need more rows than this to get their own stratum
+            seed: Sampling seed
+            other_label: Stratum for rare and missing values
+            unknown_label: Stratum used when the column is absent
+        """
+        self.sample_size = sample_size
+        self.stratum_column = stratum_column
+        self.min_stratum_size = min_stratum_size
+        self.seed = seed
+        self.other_label = other_label
+        self.unknown_label = unknown_label
+
+        self.rows_seen = 0
+        self.value_counts: Counter = Counter()
+        self.has_column = True
+        self._rows: Optional[pd.DataFrame] = None
+        self._keys = np.empty(0, dtype=object)
+        self._priorities = np.empty(0, dtype=np.float64)
+        self._positions = np.empty(0, dtype=np.int64)
+
+    def update(self, chunk: pd.DataFrame, offset: Optional[int] = None) -> 'StratifiedReservoirSampler':
+        """
+        Add a chunk of rows.
+
+        Args:
+            chunk: Rows to consider
+            offset: Global position of the chunk's first row (defaults to the
+                number of rows seen so far, i.e. chunks fed in order)
+
+        Returns:
+            The sampler
+        """
+        if offset is None:
+            offset = self.rows_seen
+        n = len(chunk)
+        positions = np.arange(offset, offset + n, dtype=np.int64)
+        if self.stratum_column in chunk.columns:
+            values = chunk[self.stratum_column].astype(object)
+            self.value_counts.update(values.value_counts().to_dict())
+            keys = values.where(values.notna(), None).to_numpy(dtype=object)
+        else:
+            self.has_column = False
+            keys = np.full(n, None, dtype=object)
+
+        self.rows_seen += n
+        self._add(chunk, keys, row_priorities(positions, self.seed), positions)
+        return self
+
+    def update_frame(self, df: pd.DataFrame, chunk_rows: int = 100_000) -> 'StratifiedReservoirSampler':
+        """
+        Feed an in-memory DataFrame in chunks.
+
+        Args:
+            df: Rows to consider
+            chunk_rows: Rows per chunk
+
+        Returns:
+            The sampler
+        """
+        for start in range(0, max(len(df), 1), chunk_rows):
+            self.update(df.iloc[start:start + chunk_rows])
+        return self
+
+    def merge(self, other: 'StratifiedReservoirSampler') -> 'StratifiedReservoirSampler':
+        """
+        Combine with a sampler that saw a disjoint set of row positions.
+
+        Args:
+            other: Sampler for another partition (fed with explicit offsets)
+
+        Returns:
+            The sampler
+        """
+        self.rows_seen += other.rows_seen
+        self.value_counts.update(other.value_counts)
+        self.has_column = self.has_column and other.has_column
+        if other._rows is not None:
+            self._add(other._rows, other._keys, other._priorities, other._positions)
+        return self
+
+    def _add(self, rows: pd.DataFrame, keys: np.ndarray, priorities: np.ndarray, positions: np.ndarray):
+        """Merge rows into the candidates, keeping the bottom sample_size per key."""
+        if self._rows is not None and len(self._rows):
+            rows = pd.concat([self._rows, rows])
+            keys = np.concatenate([self._keys, keys])
+            priorities = np.concatenate([self._priorities, priorities])
+            positions = np.concatenate([self._positions, positions])
+        codes, _ = pd.factorize(keys, use_na_sentinel=False)
+        keep = _bottom_k(codes, priorities, max(self.sample_size, 0))
+        self._rows = rows.iloc[keep]
+        self._keys = keys[keep]
+        self._priorities = priorities[keep]
+        self._positions = positions[keep]
+
+    def stratum_distribution(self) -> Dict:
+        """Population size of each stratum, largest first."""
+        if not self.has_column:
+            return {self.unknown_label: self.rows_seen} if self.rows_seen else {}
+        top = {value: count for value, count in self.value_counts.items() if count > self.min_stratum_size}
+        distribution = dict(top)
+        other = self.rows_seen - sum(top.values())
+        if other > 0:
+            distribution[self.other_label] = distribution.get(self.other_label, 0) + other
+        # Ties are ordered by label so the result does not depend on chunking
+        return dict(sorted(distribution.items(), key=lambda item: (-item[1], str(item[0]))))
+
+    def sample(self) -> pd.DataFrame:
+        """
+        Draw the stratified sample.
+
+        Returns:
+            Sampled rows in original order, with an 'incident_stratum' column;
+            attrs['stratum_distribution'] holds the population per stratum
+        """
+        distribution = self.stratum_distribution()
+        if self._rows is None:
+            sample_df = pd.DataFrame()
+        else:
+            key_codes, keys = pd.factorize(self._keys, use_na_sentinel=False)
+            if self.has_column:
+                top = {value for value, count in self.value_counts.items() if count > self.min_stratum_size}
+                key_labels = [key if not pd.isna(key) and key in top else self.other_label for key in keys]
+            else:
+                key_labels = [self.unknown_label] * len(keys)
+
+            allocation = allocate_proportional(distribution, min(self.sample_size, self.rows_seen))
+            label_codes = {label: i for i, label in enumerate(allocation)}
+            codes = np.array([label_codes[label] for label in key_labels], dtype=np.int64)[key_codes]
+            selected = _bottom_k(codes, self._priorities, list(allocation.values()))
+            selected = selected[np.argsort(self._positions[selected], kind='stable')]
+            labels = np.array(list(allocation), dtype=object)[codes]
+
+            sample_df = self._rows.iloc[selected].copy()
+            sample_df['incident_stratum'] = labels[selected]
+
+        sample_df.attrs['stratum_distribution'] = distribution
+        sample_df.attrs['stratification_method'] = 'incident_stratum'
+        return sample_df
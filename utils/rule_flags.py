@@ -0,0 +1,216 @@
+"""
+Per-row validation results as rule bit flags.
+
+Each validation rule gets one bit; every validated row gets one unsigned
+integer with the bits of the rules it fails. The flags are written to
+Parquet with the ReportNumberNew key and TimeOfCall, and the rule legend is
+kept in the file's schema metadata, so triage can ask "all rows failing
+rule X in 2023" with bit operations instead of re-validating the export.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .error_bitmap import ErrorBitmap
+
+# Parquet schema metadata key holding the rule legend
+LEGEND_KEY = b'cad_rule_flags'
+
+FLAGS_COLUMN = 'rule_flags'
+
+
+def flags_dtype(n_rules: int) -> np.dtype:
+    """Smallest unsigned flag type with a bit per rule (uint32 or uint64)."""
+    if n_rules > 64:
+        raise ValueError(f"{n_rules} rules do not fit in a 64-bit flag column")
+    return np.dtype(np.uint32) if n_rules <= 32 else np.dtype(np.uint64)
+
+
+def build_rule_flags(rule_bitmap: ErrorBitmap, n_rows: int) -> np.ndarray:
+    """
+    Combine per-rule bitmaps into one flag value per row.
+
+    Args:
+        rule_bitmap: Failing rows per rule; bit i is the i-th rule recorded
+        n_rows: Number of validated rows
+
+    Returns:
+        uint32/uint64 array of length n_rows
+    """
+    rules = rule_bitmap.fields
+    dtype = flags_dtype(len(rules))
+    flags = np.zeros(n_rows, dtype=dtype)
+    for bit, rule in enumerate(rules):
+        flags |= rule_bitmap.mask(rule).astype(dtype) << dtype.type(bit)
+    return flags
+
+
+def write_rule_flags(path: Union[str, Path], df: pd.DataFrame, rule_bitmap: ErrorBitmap,
+                     key: str = 'ReportNumberNew', time_column: str = 'TimeOfCall') -> Path:
+    """
+    Write the per-row rule flags to Parquet.
+
+    Args:
+        path: Output .parquet file
+        df: Validated DataFrame (same rows the bitmaps were recorded on)
+        rule_bitmap: Failing rows per rule
+        key: Record key column copied to the output
+        time_column: Datetime column copied for date filters (skipped if absent)
+
+    Returns:
+        Path written
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = Path(path)
+    columns = {'row': np.arange(len(df), dtype=np.int64)}
+    if key in df.columns:
+        columns[key] = df[key].astype(str).to_numpy()
+    if time_column in df.columns:
+        columns[time_column] = pd.to_datetime(df[time_column], errors='coerce').to_numpy()
+    columns[FLAGS_COLUMN] = build_rule_flags(rule_bitmap, len(df))
+
+    table = pa.table(columns)
+    legend = {
+        'rules': rule_bitmap.fields,
+        'key': key if key in df.columns else None,
+        'time_column': time_column if time_column in df.columns else None
+    }
+    table = table.replace_schema_metadata({LEGEND_KEY: json.dumps(legend).encode('utf-8')})
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, str(path))
+    return path
+
+
+class RuleFlagTable:
+    """
+    Query API over a rule-flag Parquet file.
+
+    Rules are named ``"<field>: <message>"`` (``"PDZone: Invalid zone (must be 5-9)"``)
+    and can be referred to by the full name or a unique prefix of either the
+    name or the message, e.g. ``"PDZone"`` or ``"ESRI_002"``.
+    """
+
+    def __init__(self, frame: pd.DataFrame, rules: List[str], key: Optional[str] = None,
+                 time_column: Optional[str] = None):
+        """
+        Initialize table.
+
+        Args:
+            frame: Rows with the ``rule_flags`` column
+            rules: Rule names in bit order
+            key: Record key column, if present
+            time_column: Datetime column used by year/date filters
+        """
+        self.frame = frame
+        self.rules = list(rules)
+        self.key = key
+        self.time_column = time_column
+        self.flags = frame[FLAGS_COLUMN].to_numpy()
+
+    @classmethod
+    def read(cls, path: Union[str, Path]) -> 'RuleFlagTable':
+        """Load a file written by ``write_rule_flags``."""
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(str(path))
+        legend = json.loads(table.schema.metadata[LEGEND_KEY])
+        return cls(table.to_pandas(), legend['rules'], legend.get('key'), legend.get('time_column'))
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def bit(self, rule: str) -> int:
+        """Bit position of a rule given by name or unique prefix."""
+        if rule in self.rules:
+            return self.rules.index(rule)
+        matches = [
+            i for i, name in enumerate(self.rules)
+            if name.startswith(rule) or name.partition(': ')[2].startswith(rule)
+        ]
+        if len(matches) != 1:
+            found = "no rule" if not matches else f"{len(matches)} rules"
+            raise KeyError(f"{found} matching {rule!r}; known rules: {self.rules}")
+        return matches[0]
+
+    def rule_mask(self, *rules: str) -> int:
+        """Flag value with the bits of the given rules set."""
+        mask = 0
+        for rule in rules:
+            mask |= 1 << self.bit(rule)
+        return mask
+
+    def matches(self, *rules: str, require_all: bool = False, year: Optional[int] = None,
+                start=None, end=None) -> np.ndarray:
+        """
+        Boolean mask of rows failing the given rules.
+
+        Args:
+            *rules: Rule names or prefixes (none = any rule)
+            require_all: Rows must fail every rule instead of any of them
+            year: Keep rows whose time column falls in this year
+            start: Keep rows at or after this time
+            end: Keep rows before this time
+
+        Returns:
+            Boolean numpy array over the table's rows
+        """
+        dtype = self.flags.dtype.type
+        mask = dtype(self.rule_mask(*rules)) if rules else dtype((1 << len(self.rules)) - 1)
+        if require_all:
+            selected = (self.flags & mask) == mask
+        else:
+            selected = (self.flags & mask) != 0
+
+        if year is not None or start is not None or end is not None:
+            if self.time_column is None:
+                raise KeyError("Rule flag file has no time column for date filters")
+            times = self.frame[self.time_column]
+            if year is not None:
+                selected &= (times.dt.year == year).to_numpy()
+            if start is not None:
+                selected &= (times >= pd.Timestamp(start)).to_numpy()
+            if end is not None:
+                selected &= (times < pd.Timestamp(end)).to_numpy()
+        return selected
+
+    def failing(self, *rules: str, **filters) -> pd.DataFrame:
+        """
+        Rows failing the given rules, e.g. ``failing('PDZone', year=2023)``.
+
+        Accepts the same arguments as ``matches``.
+        """
+        return self.frame[self.matches(*rules, **filters)]
+
+    def keys(self, *rules: str, **filters) -> List[str]:
+        """Record keys of rows failing the given rules."""
+        if self.key is None:
+            raise KeyError("Rule flag file has no key column")
+        return self.failing(*rules, **filters)[self.key].tolist()
+
+    def counts(self) -> Dict[str, int]:
+        """Failing rows per rule."""
+        dtype = self.flags.dtype.type
+        return {
+            rule: int(np.count_nonzero(self.flags & dtype(1 << bit)))
+            for bit, rule in enumerate(self.rules)
+        }
+
+    def describe(self, flags: int) -> List[str]:
+        """Rule names encoded in one flag value."""
+        return [rule for bit, rule in enumerate(self.rules) if int(flags) >> bit & 1]
+
+    def rules_for(self, key: str) -> List[str]:
+        """Rules failed by the row(s) with this record key."""
+        if self.key is None:
+            raise KeyError("Rule flag file has no key column")
+        flags = self.flags[(self.frame[self.key] == key).to_numpy()]
+        return self.describe(np.bitwise_or.reduce(flags) if len(flags) else 0)
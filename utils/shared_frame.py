@@ -0,0 +1,184 @@
+"""
+Zero-copy DataFrame hand-off between worker processes.
+
+Column-sharded validators pass their inputs and results through Arrow IPC
+files on a memory-backed filesystem (/dev/shm where available) instead of
+pickling them into the process pool. A worker memory-maps the file and
+reads only the columns it needs; untouched columns are never paged in.
+Object columns Arrow cannot hold (numbers mixed with text, as raw CAD exports
+often have) are pickled to a file of their own next to the Arrow file.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:  # optional: callers fall back to in-process execution
+    pa = None
+
+# Preferred location for shared frames (RAM-backed on Linux)
+SHARED_MEMORY_DIR = Path('/dev/shm')
+
+
+def shared_frames_available() -> bool:
+    """Whether pyarrow is installed so frames can be shared."""
+    return pa is not None
+
+
+def shared_frame_dir(prefix: str = 'cad_frames_') -> Path:
+    """
+    Create a private directory for shared frames.
+
+    Uses /dev/shm when it exists so the files never touch disk; the caller
+    removes the directory with ``release_shared_frames``.
+
+    Args:
+        prefix: Directory name prefix
+
+    Returns:
+        Path to the new directory
+    """
+    base = SHARED_MEMORY_DIR if SHARED_MEMORY_DIR.is_dir() and os.access(SHARED_MEMORY_DIR, os.W_OK) else None
+    return Path(tempfile.mkdtemp(prefix=prefix, dir=base))
+
+
+def release_shared_frames(directory: Union[str, Path]) -> None:
+    """Remove a directory created by ``shared_frame_dir``."""
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def _nan_rows(df: pd.DataFrame) -> Dict[str, Optional[np.ndarray]]:
+    """
+    Object columns holding float NaN as a missing value.
+
+    Arrow reads every missing object value back as None. Columns whose
+    missing values are all NaN map to None; columns mixing NaN and None map
+    to the positions of their NaN rows.
+    """
+    rows = {}
+    for col in df.columns:
+        series = df[col]
+        if series.dtype != object:
+            continue
+        missing = series.isna().to_numpy()
+        if not missing.any():
+            continue
+        is_nan = np.array([isinstance(value, float) for value in series.to_numpy()[missing]], dtype=bool)
+        if is_nan.all():
+            rows[col] = None
+        elif is_nan.any():
+            rows[col] = np.flatnonzero(missing)[is_nan]
+    return rows
+
+
+def _unarrowable_columns(df: pd.DataFrame, columns: List[str]) -> List[str]:
+    """Object columns Arrow cannot convert (e.g. a mix of numbers and text)."""
+    failing = []
+    for col in columns:
+        if df[col].dtype != object:
+            continue
+        try:
+            pa.array(df[col], from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            failing.append(col)
+    return failing
+
+
+def write_shared_frame(df: pd.DataFrame, path: Union[str, Path],
+                       columns: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Write a DataFrame as an Arrow IPC file for other processes to map.
+
+    Args:
+        df: DataFrame to share (column names must be strings)
+        path: Target file, normally inside ``shared_frame_dir()``
+        columns: Columns to share (default: all)
+
+    Returns:
+        Picklable handle for ``read_shared_frame``
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    if pa is None:
+        raise ImportError("pyarrow is required to share DataFrames between processes")
+
+    columns = list(df.columns) if columns is None else list(columns)
+    try:
+        table = pa.Table.from_pandas(df, columns=columns, preserve_index=False)
+        pickled = {}
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Only the columns Arrow rejects are pickled; the rest stay mappable
+        pickled = {
+            col: f"{path}.{i}.pkl" for i, col in enumerate(_unarrowable_columns(df, columns))
+        }
+        for col, pickle_path in pickled.items():
+            df[col].to_pickle(pickle_path)
+        arrow_columns = [col for col in columns if col not in pickled]
+        table = pa.Table.from_pandas(df, columns=arrow_columns, preserve_index=False)
+    with pa.OSFile(str(path), 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    index = df.index
+    default_index = isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1
+    return {
+        'path': str(path),
+        'rows': len(df),
+        'columns': columns,
+        'pickled': pickled,
+        'nan_rows': _nan_rows(df[[col for col in columns if col not in pickled]]),
+        'index': None if default_index else index
+    }
+
+
+def read_shared_frame(handle: Dict[str, Any], columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read a frame written by ``write_shared_frame``.
+
+    The file is memory-mapped, so only the selected columns are read. Object
+    values that were NaN come back as NaN rather than Arrow's None (row by
+    row where a column mixes the two), pickled columns are loaded from their
+    own files, and a non-default index is restored.
+
+    Args:
+        handle: Handle returned by ``write_shared_frame``
+        columns: Columns to read (default: all)
+
+    Returns:
+        DataFrame owning its data (the mapping is closed before returning)
+    """
+    if pa is None:
+        raise ImportError("pyarrow is required to share DataFrames between processes")
+
+    columns = handle['columns'] if columns is None else list(columns)
+    pickled = handle['pickled']
+    with pa.memory_map(handle['path'], 'r') as source:
+        table = pa.ipc.open_file(source).read_all()
+        table = table.select([col for col in columns if col not in pickled])
+        df = table.to_pandas()
+        del table
+
+    for col, positions in handle['nan_rows'].items():
+        if col not in df.columns:
+            continue
+        if positions is None:
+            df[col] = df[col].where(df[col].notna(), np.nan)
+        else:
+            values = df[col].to_numpy(dtype=object, copy=True)
+            values[positions] = np.nan
+            df[col] = values
+    for col in columns:
+        if col in pickled:
+            df[col] = pd.read_pickle(pickled[col]).to_numpy()
+    df = df[columns]
+    if handle['index'] is not None:
+        df.index = handle['index']
+    return df
@@ -0,0 +1,76 @@
+"""
+Unique-value text normalization kernel for CAD data processing pipeline.
+
+CAD text columns (Incident, How Reported, Disposition, Officer, ...) have a
+few hundred distinct values across hundreds of thousands of rows. The
+kernel factorizes a column, runs the normalizer once per distinct value and
+broadcasts the results back through the codes. Mojibake repair is skipped
+for pure-ASCII strings, which cannot contain mis-decoded UTF-8.
+"""
+
+import re
+import numpy as np
+import pandas as pd
+from typing import Callable, Optional
+
+from .unique_values import factorize_column
+
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_text(value, uppercase: bool = True, fix: Optional[Callable] = None):
+    """
+    Repair encoding, trim, collapse whitespace and (optionally) uppercase.
+
+    Args:
+        value: Value to normalize (missing values are returned as-is)
+        uppercase: Uppercase the result
+        fix: Optional mojibake fixer applied first (non-ASCII text only)
+
+    Returns:
+        Normalized string
+    """
+    if pd.isna(value):
+        return value
+    text = str(value)
+    if fix is not None and not text.isascii():
+        text = fix(text)
+    text = _WHITESPACE.sub(' ', text.strip())
+    return text.upper() if uppercase else text
+
+
+def normalize_unique(series: pd.Series, func: Callable, apply_missing: bool = False) -> pd.Series:
+    """
+    Apply ``func`` once per distinct value of ``series`` and broadcast back.
+
+    Equivalent to ``series.apply(func)`` for deterministic ``func``, returning
+    an object Series.
+
+    Args:
+        series: Column to normalize
+        func: Per-value normalizer
+        apply_missing: Also pass missing values through ``func`` (once per
+            kind of missing value); otherwise they are kept as-is
+
+    Returns:
+        Normalized Series aligned to ``series``
+    """
+    codes, uniques = factorize_column(series)
+    mapped = np.empty(len(uniques) + 1, dtype=object)
+    for i, value in enumerate(uniques):
+        mapped[i] = func(value)
+    result = mapped[codes]
+
+    missing = np.flatnonzero(codes < 0)
+    if len(missing):
+        originals = series.to_numpy(dtype=object)[missing]
+        if apply_missing:
+            memo = {}
+            for j, value in enumerate(originals):
+                key = (type(value), repr(value))
+                if key not in memo:
+                    memo[key] = func(value)
+                originals[j] = memo[key]
+        result[missing] = originals
+    return pd.Series(result, index=series.index, name=series.name)
@@ -0,0 +1,165 @@
+"""
+Derived time fields (cYear, cMonth, Hour, DayofWeek) from Time of Call.
+
+``dt.strftime('%B')``, ``'%H:%M'`` and ``'%A'`` format every row through
+Python strings. Here the fields are computed from the int64 epoch with
+NumPy arithmetic and returned as categoricals over fixed label tables
+(12 month names, 7 day names, 1440 HH:MM values), so checking a stored
+column against them compares integer codes instead of strings.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Same text as strftime('%B') / strftime('%A') in the C locale
+MONTH_NAMES = (
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+)
+DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# strftime('%H:%M') for every minute of the day
+HHMM_LABELS = tuple(f"{hour:02d}:{minute:02d}" for hour in range(24) for minute in range(60))
+
+_NS_PER_MINUTE = 60 * 1_000_000_000
+_MINUTES_PER_DAY = 24 * 60
+# 1970-01-01 was a Thursday (Monday = 0)
+_EPOCH_WEEKDAY = 3
+
+
+class TimeFields:
+    """
+    Calendar parts of a datetime Series, computed once.
+
+    Codes are -1 where the time is missing (NaT).
+    """
+
+    def __init__(self, times: pd.Series):
+        """
+        Initialize fields.
+
+        Args:
+            times: datetime64 Series (tz-aware values use their local wall time)
+        """
+        if isinstance(times.dtype, pd.DatetimeTZDtype):
+            times = times.dt.tz_localize(None)
+        self.index = times.index
+        stamps = times.to_numpy(dtype='datetime64[ns]')
+        self.valid = ~np.isnat(stamps)
+
+        epoch = np.where(self.valid, stamps.view(np.int64), 0)
+        minutes = np.floor_divide(epoch, _NS_PER_MINUTE)
+        days = np.floor_divide(minutes, _MINUTES_PER_DAY)
+        months = stamps.astype('datetime64[M]').view(np.int64)
+        months = np.where(self.valid, months, 0)
+
+        self.minute_of_day = minutes - days * _MINUTES_PER_DAY
+        self.weekday = (days + _EPOCH_WEEKDAY) % 7
+        self.month = months % 12
+        self.year = months // 12 + 1970
+
+    def _categorical(self, codes: np.ndarray, labels) -> pd.Categorical:
+        codes = np.where(self.valid, codes, -1)
+        return pd.Categorical.from_codes(codes, categories=pd.Index(labels, dtype=object))
+
+    def _series(self, values, name: str) -> pd.Series:
+        return pd.Series(values, index=self.index, name=name)
+
+    @property
+    def year_labels(self) -> list:
+        """cYear text for every year from the earliest to the latest time."""
+        if not self.valid.any():
+            return []
+        years = self.year[self.valid]
+        return [str(year) for year in range(int(years.min()), int(years.max()) + 1)]
+
+    def cyear(self) -> pd.Series:
+        """Year as text ('2024'), categorical."""
+        labels = self.year_labels
+        first = int(labels[0]) if labels else 0
+        return self._series(self._categorical(self.year - first, labels), 'cYear')
+
+    def cmonth(self) -> pd.Series:
+        """Month name ('January'), categorical."""
+        return self._series(self._categorical(self.month, MONTH_NAMES), 'cMonth')
+
+    def hour_minute(self) -> pd.Series:
+        """HH:MM ('07:05'), categorical."""
+        return self._series(self._categorical(self.minute_of_day, HHMM_LABELS), 'Hour')
+
+    def day_of_week(self) -> pd.Series:
+        """Weekday name ('Monday'), categorical."""
+        return self._series(self._categorical(self.weekday, DAY_NAMES), 'DayofWeek')
+
+    def hour(self) -> pd.Series:
+        """Hour of day as float64 (NaN where the time is missing)."""
+        hours = np.where(self.valid, self.minute_of_day // 60, np.nan).astype(np.float64)
+        return self._series(hours, 'Hour_Calc')
+
+    def field(self, name: str) -> pd.Series:
+        """Categorical for a derived field name (cYear, cMonth, Hour, DayofWeek)."""
+        builders = {
+            'cYear': self.cyear,
+            'cMonth': self.cmonth,
+            'Hour': self.hour_minute,
+            'DayofWeek': self.day_of_week
+        }
+        if name not in builders:
+            raise KeyError(f"Unknown derived time field: {name}")
+        return builders[name]()
+
+
+def derive_time_fields(times: pd.Series) -> TimeFields:
+    """Compute the calendar parts of a datetime Series."""
+    return TimeFields(times)
+
+
+def match_codes(values: pd.Series, categories: pd.Index, strip: bool = False) -> np.ndarray:
+    """
+    Codes of stored values within a categorical's categories.
+
+    Each distinct value is converted to text once (as ``astype(str)`` would),
+    so the per-row work is integer lookups.
+
+    Args:
+        values: Stored column
+        categories: Categories to match against
+        strip: Strip whitespace before matching
+
+    Returns:
+        int64 array, -1 where the value is missing or not a category
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes, uniques = values.cat.codes.to_numpy(), values.cat.categories
+    elif values.dtype == object and pd.api.types.infer_dtype(values, skipna=True).startswith('mixed'):
+        # factorize treats 2024 and 2024.0 as one value; their text differs
+        codes, uniques = pd.factorize(values.astype(str).where(values.notna()), use_na_sentinel=True)
+    else:
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    text = pd.Index(uniques, dtype=object).astype(str)
+    if strip:
+        text = text.str.strip()
+    lookup = pd.Index(categories).get_indexer(text)
+    # Missing values (code -1) never match
+    lookup = np.append(lookup, -1)
+    return lookup[codes].astype(np.int64)
+
+
+def mismatched_rows(fields: TimeFields, name: str, values: pd.Series,
+                    strip: bool = False) -> tuple:
+    """
+    Rows whose stored value differs from the derived one.
+
+    Args:
+        fields: Derived fields of the time column
+        name: Derived field name
+        values: Stored column (same rows)
+        strip: Strip whitespace from stored values before comparing
+
+    Returns:
+        (boolean mask over rows with a valid time, expected categorical Series)
+    """
+    expected = fields.field(name)
+    actual = match_codes(values, expected.cat.categories, strip=strip)
+    mismatch = fields.valid & (actual != expected.cat.codes.to_numpy())
+    return mismatch, expected
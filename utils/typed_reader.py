@@ -0,0 +1,314 @@
+"""
+Schema-driven typed reader for CAD exports.
+
+Builds a read plan from SchemaValidator.CAD_SCHEMA and
+cad_fields_schema_latest.json so that each stage loads only the columns it
+needs, with compact dtypes:
+- Low-cardinality code fields as categoricals
+- Free text as Arrow-backed strings (when pyarrow is installed)
+- Datetime fields parsed at read time with known formats
+
+``iter_cad_chunks`` streams the same typed frames in row chunks for the
+bounded-memory pipeline, so chunked and whole-file runs see identical data.
+"""
+
+import json
+import pandas as pd
+from itertools import islice
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Union
+import logging
+
+from .datetime_parser import DEFAULT_DATETIME_FORMATS, parse_datetimes
+from .validate_schema import SchemaValidator, DataType
+
+try:
+    import pyarrow  # noqa: F401
+    TEXT_DTYPE = "string[pyarrow]"
+except ImportError:
+    TEXT_DTYPE = "object"
+
+
+SCHEMA_JSON = Path(__file__).parent.parent / "cad_fields_schema_latest.json"
+
+# Fields with a small, repeating set of values
+CATEGORICAL_FIELDS = ["Disposition", "How Reported", "PDZone", "Grid", "Response Type", "Incident"]
+
+# Free-text fields stored as Arrow strings
+FREE_TEXT_FIELDS = ["FullAddress2", "CADNotes", "Narrative", "Officer"]
+
+# Columns each stage reads (None = all columns)
+STAGE_COLUMNS = {
+    "processor": None,
+    "pipeline_validator_input": ["ReportNumberNew"],
+    "pipeline_validator_output": None,
+}
+
+
+def _field_key(name: str) -> str:
+    """Normalize field names across schemas ('Time of Call' == 'TimeOfCall')."""
+    return "".join(ch for ch in str(name).lower() if ch.isalnum())
+
+
+def load_schema_formats(schema_json: Union[str, Path] = SCHEMA_JSON) -> Dict[str, List[str]]:
+    """
+    Load accepted datetime formats from cad_fields_schema_latest.json.
+
+    Args:
+        schema_json: Path to field schema JSON
+
+    Returns:
+        Mapping of normalized field key -> accepted formats
+    """
+    path = Path(schema_json)
+    if not path.exists():
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            fields = json.load(f).get("fields", [])
+    except (json.JSONDecodeError, OSError):
+        return {}
+    return {
+        _field_key(field["internal_field_name"]): list(field.get("accepted_formats") or [])
+        for field in fields
+        if field.get("internal_field_name") and field.get("output_type") == "datetime"
+    }
+
+
+def build_read_plan(
+    columns: List[str],
+    schema: Optional[Dict] = None,
+    schema_json: Union[str, Path] = SCHEMA_JSON
+) -> Dict[str, Dict]:
+    """
+    Decide the storage type of each column.
+
+    Args:
+        columns: Columns present in the file (in read order)
+        schema: Schema dictionary (defaults to SchemaValidator.CAD_SCHEMA)
+        schema_json: Field schema JSON with accepted datetime formats
+
+    Returns:
+        Mapping of column -> {"kind": category|text|datetime|string|infer, "formats": [...]}
+    """
+    schema = schema or SchemaValidator.CAD_SCHEMA
+    schema_by_key = {_field_key(name): spec for name, spec in schema.items()}
+    formats_by_key = load_schema_formats(schema_json)
+    categorical = {_field_key(name) for name in CATEGORICAL_FIELDS}
+    free_text = {_field_key(name) for name in FREE_TEXT_FIELDS}
+
+    plan = {}
+    for col in columns:
+        key = _field_key(col)
+        spec = schema_by_key.get(key)
+        if key in formats_by_key or (spec and spec["type"] == DataType.DATETIME):
+            plan[col] = {"kind": "datetime", "formats": formats_by_key.get(key) or DEFAULT_DATETIME_FORMATS}
+        elif key in categorical:
+            plan[col] = {"kind": "category"}
+        elif key in free_text:
+            plan[col] = {"kind": "text"}
+        elif spec and spec["type"] == DataType.STRING:
+            plan[col] = {"kind": "string"}
+        else:
+            plan[col] = {"kind": "infer"}
+    return plan
+
+
+def parse_datetime_column(series: pd.Series, formats: List[str]) -> pd.Series:
+    """
+    Parse a datetime column using the known format that fits best.
+
+    Args:
+        series: Raw column (strings or already-parsed datetimes)
+        formats: Candidate formats, tried against a sample of the column
+
+    Returns:
+        datetime64 Series (unparseable values -> NaT)
+    """
+    return parse_datetimes(series, formats)
+
+
+def _read_header(path: Path, source, sheet_name) -> List[str]:
+    if path.suffix.lower() == ".csv":
+        return list(pd.read_csv(source, nrows=0, encoding="utf-8-sig").columns)
+    return list(pd.read_excel(source, nrows=0, sheet_name=sheet_name).columns)
+
+
+def _rewind(source):
+    """Return the source positioned at the start (streams are re-read per pass)."""
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source
+
+
+def _read_dtypes(plan: Dict[str, Dict], categorical: bool, suffix: str) -> Dict:
+    """dtype argument for the pandas reader, from a read plan."""
+    dtypes = {}
+    for col, spec in plan.items():
+        if spec["kind"] == "category" and categorical:
+            dtypes[col] = "category"
+        elif spec["kind"] in ("string", "text") or (spec["kind"] == "category" and not categorical):
+            dtypes[col] = str
+        elif spec["kind"] == "datetime" and suffix == ".csv":
+            dtypes[col] = str
+    return dtypes
+
+
+def _excel_dtypes(dtypes: Dict) -> Dict:
+    return {col: dtype for col, dtype in dtypes.items() if dtype is str}
+
+
+def _finish_frame(df: pd.DataFrame, plan: Dict[str, Dict], dtypes: Dict, suffix: str,
+                  parse_dates: bool) -> pd.DataFrame:
+    """Apply the conversions the pandas reader does not (categoricals for Excel, text, datetimes)."""
+    if suffix != ".csv":
+        for col, dtype in dtypes.items():
+            if dtype == "category":
+                df[col] = df[col].astype("category")
+    for col, spec in plan.items():
+        if spec["kind"] == "text" and TEXT_DTYPE != "object":
+            df[col] = df[col].astype(TEXT_DTYPE)
+        elif spec["kind"] == "datetime" and parse_dates:
+            df[col] = parse_datetime_column(df[col], spec["formats"])
+    return df
+
+
+def _excel_cell(value):
+    """Convert an openpyxl cell value the way pandas.read_excel does."""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _iter_excel_blocks(path: Path, chunk_size: int, sheet_name: Union[int, str]) -> Iterator[tuple]:
+    """Yield (header, rows) blocks streamed from a worksheet in read-only mode."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[sheet_name] if isinstance(sheet_name, int) else workbook[sheet_name]
+        rows = sheet.iter_rows(values_only=True)
+        header = [_excel_cell(value) for value in next(rows, [])]
+        while True:
+            block = [[_excel_cell(value) for value in row] for row in islice(rows, chunk_size)]
+            if not block:
+                break
+            yield header, block
+    finally:
+        workbook.close()
+
+
+def iter_cad_chunks(
+    file_path: Union[str, Path],
+    chunk_size: int,
+    columns: Optional[List[str]] = None,
+    parse_dates: bool = True,
+    categorical: bool = True,
+    sheet_name: Union[int, str] = 0
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a CAD export in row chunks with the same dtypes as ``read_cad_file``.
+
+    Chunks carry a continuous RangeIndex across the file. Categorical
+    columns get per-chunk categories; their values match a whole-file read.
+
+    Args:
+        file_path: Input file (.csv or .xlsx)
+        chunk_size: Rows per chunk
+        columns: Columns to load (missing ones are skipped)
+        parse_dates: Parse schema datetime fields
+        categorical: Load low-cardinality fields as categoricals
+        sheet_name: Excel sheet to read
+
+    Yields:
+        DataFrame chunks
+    """
+    path = Path(file_path)
+    suffix = path.suffix.lower()
+    if suffix not in (".csv", ".xlsx"):
+        raise ValueError(f"Unsupported file format: {file_path}")
+
+    header = _read_header(path, path, sheet_name)
+    usecols = header if columns is None else [col for col in header if col in set(columns)]
+    plan = build_read_plan(usecols)
+    dtypes = _read_dtypes(plan, categorical, suffix)
+
+    if suffix == ".csv":
+        reader = pd.read_csv(path, usecols=usecols, dtype=dtypes, encoding="utf-8-sig",
+                             chunksize=chunk_size, low_memory=False)
+        for chunk in reader:
+            yield _finish_frame(chunk, plan, dtypes, suffix, parse_dates)
+        return
+
+    from pandas.io.parsers import TextParser
+
+    offset = 0
+    for file_header, block in _iter_excel_blocks(path, chunk_size, sheet_name):
+        # Same parser read_excel hands the sheet to (NA values, dtypes, blank rows)
+        chunk = TextParser(
+            [file_header] + block, header=0, usecols=usecols, dtype=_excel_dtypes(dtypes)
+        ).read()
+        chunk = chunk[usecols]
+        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+        offset += len(chunk)
+        yield _finish_frame(chunk, plan, dtypes, suffix, parse_dates)
+
+
+def read_cad_file(
+    file_path: Union[str, Path],
+    columns: Optional[List[str]] = None,
+    stage: Optional[str] = None,
+    parse_dates: bool = True,
+    categorical: bool = True,
+    sheet_name: Union[int, str] = 0,
+    logger: Optional[logging.Logger] = None,
+    stream: Optional[BinaryIO] = None
+) -> pd.DataFrame:
+    """
+    Read a CAD export (.csv or .xlsx) with schema-driven dtypes.
+
+    Args:
+        file_path: Input file
+        columns: Columns to load (missing ones are skipped); defaults to the
+            stage's declared columns, or all columns
+        stage: Stage name from STAGE_COLUMNS
+        parse_dates: Parse schema datetime fields at read time
+        categorical: Load low-cardinality fields as categoricals
+        sheet_name: Excel sheet to read
+        logger: Optional logger
+        stream: Open binary stream of ``file_path`` to read from instead of
+            the path (e.g. FileHashManager.hashing_reader)
+
+    Returns:
+        Loaded DataFrame
+    """
+    logger = logger or logging.getLogger(__name__)
+    path = Path(file_path)
+    suffix = path.suffix.lower()
+    if suffix not in (".csv", ".xlsx", ".xls"):
+        raise ValueError(f"Unsupported file format: {file_path}")
+
+    if columns is None and stage is not None:
+        columns = STAGE_COLUMNS.get(stage)
+
+    source = stream if stream is not None else path
+    header = _read_header(path, _rewind(source), sheet_name)
+    usecols = header if columns is None else [col for col in header if col in set(columns)]
+    plan = build_read_plan(usecols)
+
+    dtypes = _read_dtypes(plan, categorical, suffix)
+
+    if suffix == ".csv":
+        df = pd.read_csv(_rewind(source), usecols=usecols, dtype=dtypes, encoding="utf-8-sig", low_memory=False)
+    else:
+        # Excel cells are typed already; only force text where numbers would be inferred
+        df = pd.read_excel(_rewind(source), usecols=usecols, dtype=_excel_dtypes(dtypes), sheet_name=sheet_name)
+    df = _finish_frame(df, plan, dtypes, suffix, parse_dates)
+
+    logger.info(
+        f"Read {len(df):,} rows x {len(df.columns)} columns from {path.name} "
+        f"({df.memory_usage(deep=True).sum() / 1024**2:.1f} MB)"
+    )
+    return df
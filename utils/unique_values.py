@@ -0,0 +1,64 @@
+"""
+Unique-value evaluation helpers for CAD data processing pipeline.
+
+CAD columns have far fewer distinct values than rows. These helpers
+factorize a column once, evaluate a function over the distinct values
+only, and broadcast the results back to the rows through the codes.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Callable, Tuple
+
+
+def factorize_column(series: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """
+    Factorize a column into integer codes and distinct values.
+
+    Categorical columns reuse their existing codes. Missing values get
+    code -1 and are not included in the distinct values.
+
+    Args:
+        series: Column to factorize
+
+    Returns:
+        Tuple of (codes array, distinct values Index)
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), series.cat.categories
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    return codes, pd.Index(uniques)
+
+
+def broadcast_unique(codes: np.ndarray, mapped: np.ndarray, missing=np.nan) -> np.ndarray:
+    """
+    Broadcast per-distinct-value results back to rows.
+
+    Args:
+        codes: Row codes from factorize_column
+        mapped: One result per distinct value
+        missing: Result for rows with code -1
+
+    Returns:
+        Object array of per-row results
+    """
+    mapped = np.append(np.asarray(mapped, dtype=object), np.array([missing], dtype=object))
+    # code -1 indexes the appended missing slot
+    return mapped[codes]
+
+
+def map_unique(series: pd.Series, func: Callable, missing=np.nan) -> pd.Series:
+    """
+    Apply ``func`` to each distinct value of ``series`` and broadcast back.
+
+    Args:
+        series: Column to transform
+        func: Function applied once per distinct (non-missing) value
+        missing: Result for missing values
+
+    Returns:
+        Transformed Series aligned to ``series``
+    """
+    codes, uniques = factorize_column(series)
+    mapped = [func(value) for value in uniques]
+    return pd.Series(broadcast_unique(codes, mapped, missing), index=series.index, name=series.name)
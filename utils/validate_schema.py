@@ -181,7 +181,7 @@ class SchemaValidator:
         dtype_str = str(actual_dtype).lower()
 
         if expected_type == DataType.STRING:
-            return 'object' in dtype_str or 'string' in dtype_str
+            return 'object' in dtype_str or 'string' in dtype_str or 'category' in dtype_str
         elif expected_type == DataType.INTEGER:
             return 'int' in dtype_str
         elif expected_type == DataType.FLOAT:
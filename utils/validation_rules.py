@@ -0,0 +1,433 @@
+"""
+Declarative validation rules for CAD data processing pipeline.
+
+Rules are declared in YAML (config/validation_rules.yml) as a check type plus
+the columns it reads, and compiled into functions that return a boolean
+"row is valid" mask. Text checks run once per distinct value and are
+broadcast back through factorized codes; datetime, timedelta and numeric
+checks run on parsed columns. Rules that touch the same columns are
+evaluated together, sharing one parse of those columns, and every rule's
+run time is recorded so slow rules are visible.
+
+Check types:
+    regex                 field, pattern (``re.match`` on the value as text)
+    domain                field, values or values_from (a validation list),
+                          optional case_insensitive / allow_missing
+    not_null              field (blank strings count as missing)
+    ordering              fields (datetimes, each <= the next; missing values pass)
+    conditional_presence  field, when (field is required where ``when`` is not null)
+    range                 field, kind (datetime | timedelta | number), min / max
+"""
+
+import re
+import time
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from dataclasses import dataclass, field as dataclass_field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+import logging
+
+from .datetime_parser import cached_datetimes
+from .text_normalizer import normalize_unique
+from .unique_values import factorize_column
+
+try:
+    import numexpr
+except ImportError:  # optional: numpy evaluates the same expressions
+    numexpr = None
+
+
+VALIDATION_RULES_PATH = Path(__file__).parent.parent / "config" / "validation_rules.yml"
+
+CHECK_TYPES = ('regex', 'domain', 'not_null', 'ordering', 'conditional_presence', 'range')
+
+_NAT = np.iinfo(np.int64).min
+
+
+class RuleFrame:
+    """Shared intermediates for one validation pass over a DataFrame.
+
+    Rules that read the same column ask the frame instead of recomputing, so
+    each datetime column is parsed once and each text column is stringified
+    and stripped once per distinct value.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._cache: Dict[tuple, Any] = {}
+
+    def _cached(self, key: tuple, build):
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    def release(self, columns: Iterable[str]):
+        """Drop cached intermediates for ``columns``."""
+        columns = set(columns)
+        for key in [key for key in self._cache if key[1] in columns]:
+            del self._cache[key]
+
+    def datetimes(self, field: str) -> pd.Series:
+        """``df[field]`` as datetimes (all NaT if the column is missing), shared via ``cached_datetimes``."""
+        def build():
+            return cached_datetimes(self.df, field)
+        return self._cached(('datetime', field), build)
+
+    def timedeltas(self, field: str) -> pd.Series:
+        """``pd.to_timedelta(df[field], errors='coerce')``, parsed once per distinct value."""
+        def build():
+            series = self.df[field]
+            if pd.api.types.is_timedelta64_dtype(series):
+                return series
+            codes, uniques = factorize_column(series)
+            parsed = pd.to_timedelta(pd.Series(list(uniques) + [pd.NaT], dtype=object), errors='coerce')
+            return pd.Series(parsed.to_numpy()[codes], index=series.index, name=series.name)
+        return self._cached(('timedelta', field), build)
+
+    def numbers(self, field: str) -> pd.Series:
+        """``pd.to_numeric(df[field], errors='coerce')``."""
+        return self._cached(('number', field), lambda: pd.to_numeric(self.df[field], errors='coerce'))
+
+    def text(self, field: str) -> pd.Series:
+        """``df[field].astype(str)``, evaluated once per distinct value."""
+        return self._cached(('text', field), lambda: normalize_unique(self.df[field], str, apply_missing=True))
+
+    def stripped(self, field: str) -> pd.Series:
+        """``df[field].astype(str).str.strip()``, evaluated once per distinct value."""
+        return self._cached(
+            ('stripped', field),
+            lambda: normalize_unique(self.df[field], lambda value: str(value).strip(), apply_missing=True)
+        )
+
+    def upper(self, field: str) -> pd.Series:
+        """``df[field].astype(str).str.upper()``, evaluated once per distinct value."""
+        return self._cached(
+            ('upper', field),
+            lambda: normalize_unique(self.df[field], lambda value: str(value).upper(), apply_missing=True)
+        )
+
+    def present(self, field: str) -> pd.Series:
+        """Rows where ``field`` is non-null and not blank after stripping."""
+        return self._cached(('present', field), lambda: self.df[field].notna() & (self.stripped(field) != ''))
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """A declared rule compiled to a mask function."""
+    name: str
+    rule_id: str
+    check: str
+    columns: Tuple[str, ...]
+    mask: Callable[[RuleFrame, Dict[str, Iterable]], pd.Series]
+    optional_columns: Tuple[str, ...] = ()
+    spec: Dict[str, Any] = dataclass_field(default_factory=dict)
+
+    @property
+    def field(self) -> str:
+        """Column the rule reports on (the first column it reads)."""
+        return self.columns[0]
+
+
+@dataclass
+class RuleOutcome:
+    """Result of evaluating one rule against a DataFrame."""
+    rule: CompiledRule
+    valid: Optional[pd.Series]
+    elapsed: float
+    error: Optional[str] = None
+
+    @property
+    def passed(self) -> int:
+        return int(self.valid.sum()) if self.valid is not None else 0
+
+    @property
+    def failed(self) -> int:
+        return int((~self.valid).sum()) if self.valid is not None else 0
+
+
+def _value_mask(series: pd.Series, predicate: Callable[[Any], bool]) -> pd.Series:
+    """Evaluate ``predicate`` once per distinct value (missing values included) and broadcast."""
+    return normalize_unique(series, predicate, apply_missing=True).astype(bool)
+
+
+def _not_after(start: pd.Series, end: pd.Series) -> np.ndarray:
+    """``start <= end`` where both are set; rows with a missing side pass."""
+    a = start.to_numpy(dtype='datetime64[ns]').view(np.int64)
+    b = end.to_numpy(dtype='datetime64[ns]').view(np.int64)
+    if numexpr is not None:
+        return numexpr.evaluate('(a <= b) | (a == nat) | (b == nat)', local_dict={'a': a, 'b': b, 'nat': _NAT})
+    return (a <= b) | (a == _NAT) | (b == _NAT)
+
+
+def _parse_bound(kind: str, value):
+    if value is None:
+        return None
+    if kind == 'datetime':
+        return pd.Timestamp(value)
+    if kind == 'timedelta':
+        return pd.Timedelta(value)
+    return float(value)
+
+
+def _compile_regex(spec: dict):
+    field, pattern = spec['field'], re.compile(spec['pattern'])
+
+    def mask(frame: RuleFrame, lists) -> pd.Series:
+        return _value_mask(frame.df[field], lambda value: pattern.match(str(value)) is not None)
+    return (field,), (), mask
+
+
+def _compile_domain(spec: dict):
+    field = spec['field']
+    case_insensitive = bool(spec.get('case_insensitive', False))
+    allow_missing = bool(spec.get('allow_missing', False))
+    fixed_values = spec.get('values')
+    list_name = spec.get('values_from')
+    if fixed_values is None and list_name is None:
+        raise ValueError("domain check needs 'values' or 'values_from'")
+
+    def mask(frame: RuleFrame, lists) -> pd.Series:
+        values = fixed_values if fixed_values is not None else (lists or {}).get(list_name)
+        if values is None:
+            raise KeyError(f"Validation list '{list_name}' not found")
+        text = frame.stripped(field)
+        if case_insensitive:
+            allowed = {str(value).strip().casefold() for value in values}
+            valid = _value_mask(text, lambda value: value.casefold() in allowed)
+        else:
+            valid = text.isin(list(values))
+        if allow_missing:
+            valid |= ~frame.present(field)
+        return valid
+    return (field,), (), mask
+
+
+def _compile_not_null(spec: dict):
+    field = spec['field']
+
+    def mask(frame: RuleFrame, lists) -> pd.Series:
+        return frame.present(field)
+    return (field,), (), mask
+
+
+def _compile_ordering(spec: dict):
+    fields = tuple(spec['fields'])
+    if len(fields) < 2:
+        raise ValueError("ordering check needs at least two fields")
+
+    def mask(frame: RuleFrame, lists) -> pd.Series:
+        valid = np.ones(len(frame.df), dtype=bool)
+        for earlier, later in zip(fields, fields[1:]):
+            valid &= _not_after(frame.datetimes(earlier), frame.datetimes(later))
+        return pd.Series(valid, index=frame.df.index)
+    return fields, (), mask
+
+
+def _compile_conditional_presence(spec: dict):
+    field, when = spec['field'], spec['when']
+
+    def mask(frame: RuleFrame, lists) -> pd.Series:
+        # Without the condition column the field is required on every row
+        if when not in frame.df.columns:
+            return frame.present(field).copy()
+        return ~(frame.df[when].notna() & ~frame.present(field))
+    return (field,), (when,), mask
+
+
+def _compile_range(spec: dict):
+    field, kind = spec['field'], spec.get('kind', 'number')
+    if kind not in ('datetime', 'timedelta', 'number'):
+        raise ValueError(f"Unknown range kind '{kind}'")
+    lower, upper = _parse_bound(kind, spec.get('min')), _parse_bound(kind, spec.get('max'))
+
+    def mask(frame: RuleFrame, lists) -> pd.Series:
+        if kind == 'datetime':
+            values = frame.datetimes(field)
+        elif kind == 'timedelta':
+            values = frame.timedeltas(field)
+        else:
+            values = frame.numbers(field)
+        valid = values.notna()
+        if lower is not None:
+            valid &= values >= lower
+        if upper is not None:
+            valid &= values <= upper
+        return valid
+    return (field,), (), mask
+
+
+_COMPILERS = {
+    'regex': _compile_regex,
+    'domain': _compile_domain,
+    'not_null': _compile_not_null,
+    'ordering': _compile_ordering,
+    'conditional_presence': _compile_conditional_presence,
+    'range': _compile_range,
+}
+
+
+def compile_rule(name: str, spec: dict) -> CompiledRule:
+    """
+    Compile one declared rule.
+
+    Args:
+        name: Rule name (key in the rule file)
+        spec: Rule declaration with a 'check' type and its parameters
+
+    Returns:
+        CompiledRule
+
+    Raises:
+        ValueError: If the check type is unknown or its parameters are invalid
+    """
+    check = spec.get('check')
+    if check not in _COMPILERS:
+        raise ValueError(f"Rule '{name}': unknown check '{check}' (expected one of {', '.join(CHECK_TYPES)})")
+    try:
+        columns, optional_columns, mask = _COMPILERS[check](spec)
+    except (KeyError, ValueError, re.error) as e:
+        raise ValueError(f"Rule '{name}': invalid {check} check: {e}") from e
+    return CompiledRule(
+        name=name,
+        rule_id=spec.get('rule_id', name),
+        check=check,
+        columns=tuple(columns),
+        mask=mask,
+        optional_columns=tuple(optional_columns),
+        spec=dict(spec)
+    )
+
+
+class RuleSet:
+    """Compiled rules, evaluated in groups that share the columns they read."""
+
+    def __init__(self, rules: List[CompiledRule]):
+        """
+        Initialize rule set.
+
+        Args:
+            rules: Compiled rules in declaration order
+        """
+        self.rules = {rule.rule_id: rule for rule in rules}
+        self.logger = logging.getLogger(__name__)
+
+    def __len__(self):
+        return len(self.rules)
+
+    def __contains__(self, rule_id: str) -> bool:
+        return rule_id in self.rules
+
+    def __getitem__(self, rule_id: str) -> CompiledRule:
+        return self.rules[rule_id]
+
+    @classmethod
+    def from_spec(cls, rules: Dict[str, dict]) -> "RuleSet":
+        """
+        Compile the declared rules that have a 'check'.
+
+        Args:
+            rules: Rule name -> declaration (entries without 'check' are skipped)
+
+        Returns:
+            RuleSet
+        """
+        return cls([compile_rule(name, spec) for name, spec in rules.items() if spec.get('check')])
+
+    def groups(self, rule_ids: Optional[Iterable[str]] = None) -> Dict[Tuple[str, ...], List[CompiledRule]]:
+        """
+        Group rules by the set of columns they read, in first-declared order.
+
+        Args:
+            rule_ids: Restrict to these rules (default: all)
+
+        Returns:
+            Sorted column tuple -> rules reading exactly those columns
+        """
+        selected = self.rules if rule_ids is None else {rule_id: self.rules[rule_id] for rule_id in rule_ids}
+        grouped: Dict[Tuple[str, ...], List[CompiledRule]] = {}
+        for rule in selected.values():
+            key = tuple(sorted(set(rule.columns) | set(rule.optional_columns)))
+            grouped.setdefault(key, []).append(rule)
+        return grouped
+
+    def evaluate(
+        self,
+        df: pd.DataFrame,
+        frame: Optional[RuleFrame] = None,
+        lists: Optional[Dict[str, Iterable]] = None,
+        rule_ids: Optional[Iterable[str]] = None
+    ) -> Dict[str, RuleOutcome]:
+        """
+        Evaluate rules group by group.
+
+        Args:
+            df: DataFrame to validate
+            frame: Shared intermediates for ``df`` (a private frame is used,
+                and its columns released after their last group, if omitted)
+            lists: Named value lists for domain checks ('values_from')
+            rule_ids: Restrict to these rules (default: all)
+
+        Returns:
+            rule_id -> RuleOutcome, in group order
+        """
+        owns_frame = frame is None
+        frame = frame or RuleFrame(df)
+        grouped = list(self.groups(rule_ids).items())
+        outcomes: Dict[str, RuleOutcome] = {}
+        for position, (columns, rules) in enumerate(grouped):
+            for rule in rules:
+                start = time.perf_counter()
+                missing = [column for column in rule.columns if column not in df.columns]
+                if missing:
+                    outcomes[rule.rule_id] = RuleOutcome(
+                        rule, None, time.perf_counter() - start, error=f"Missing fields: {missing}"
+                    )
+                    continue
+                try:
+                    valid = rule.mask(frame, lists)
+                except Exception as e:
+                    self.logger.error(f"Rule {rule.rule_id} ({rule.name}) failed: {e}")
+                    outcomes[rule.rule_id] = RuleOutcome(rule, None, time.perf_counter() - start, error=str(e))
+                    continue
+                outcomes[rule.rule_id] = RuleOutcome(rule, valid, time.perf_counter() - start)
+            if owns_frame:
+                later = {column for later_columns, _ in grouped[position + 1:] for column in later_columns}
+                frame.release(set(columns) - later)
+        return outcomes
+
+
+def rule_timings(outcomes: Dict[str, RuleOutcome]) -> Dict[str, float]:
+    """rule_id -> seconds, slowest first."""
+    return dict(sorted(
+        ((rule_id, outcome.elapsed) for rule_id, outcome in outcomes.items()),
+        key=lambda item: item[1],
+        reverse=True
+    ))
+
+
+def load_rule_file(path: Union[str, Path, None] = None, section: Optional[str] = None) -> dict:
+    """
+    Load a validation rule file.
+
+    Args:
+        path: YAML rule file (default: config/validation_rules.yml)
+        section: Top-level section to return (e.g. 'cad_validation')
+
+    Returns:
+        Parsed rules (the section, if given)
+
+    Raises:
+        FileNotFoundError: If the rule file does not exist
+        KeyError: If the section is missing
+    """
+    import yaml
+
+    path = Path(path) if path is not None else VALIDATION_RULES_PATH
+    with open(path, 'r', encoding='utf-8') as f:
+        rules = yaml.safe_load(f) or {}
+    if section is None:
+        return rules
+    if section not in rules:
+        raise KeyError(f"Section '{section}' not found in {path}")
+    return rules[section] or {}
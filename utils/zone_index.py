@@ -0,0 +1,210 @@
+"""
+Zone/grid lookup index for CAD data processing pipeline.
+
+The zone master workbook maps cross-street names to Grid and PDZone. The
+index normalizes those names once, stores normalized key -> (Grid, PDZone)
+on disk keyed by the workbook's SHA256 hash, and is rebuilt only when the
+workbook changes. Backfills normalize each distinct CAD address once and
+fill PDZone/Grid in place through a dictionary lookup, without merging.
+"""
+
+import pickle
+import re
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Optional, Tuple, Union
+import logging
+
+from .hash_utils import compute_hash
+from .unique_values import factorize_column, broadcast_unique
+
+
+ZONE_CACHE_DIR = Path(__file__).parent.parent / "data" / "cache"
+
+# Full street words -> abbreviations used by the zone master
+SUFFIX_MAP = {
+    "Street": "St", "Avenue": "Ave", "Road": "Rd", "Place": "Pl",
+    "Drive": "Dr", "Court": "Ct", "Boulevard": "Blvd"
+}
+
+_SUFFIX_PATTERN = re.compile(r"\b(" + "|".join(SUFFIX_MAP) + r")\b", re.IGNORECASE)
+_SUFFIX_LOOKUP = {full.lower(): abbr for full, abbr in SUFFIX_MAP.items()}
+
+ZONE_FIELDS = ("Grid", "PDZone")
+
+
+def normalize_zone_address(addr):
+    """
+    Normalize an address for zone lookup matching.
+
+    Intersections use " / ", street suffixes are abbreviated and the
+    result is title-cased. Missing values are returned as-is.
+
+    Args:
+        addr: Address value
+
+    Returns:
+        Normalized address key
+    """
+    if pd.isna(addr):
+        return addr
+    s = str(addr).replace(" & ", " / ")
+    s = _SUFFIX_PATTERN.sub(lambda m: _SUFFIX_LOOKUP[m.group(1).lower()], s)
+    return s.title().strip()
+
+
+class ZoneIndex:
+    """Normalized address -> (Grid, PDZone) lookup built from the zone master."""
+
+    def __init__(self, lookup: Dict[str, Tuple], source_hash: Optional[str] = None):
+        """
+        Initialize index.
+
+        Args:
+            lookup: Mapping of normalized address -> (Grid, PDZone)
+            source_hash: SHA256 of the zone master the index was built from
+        """
+        self.lookup = lookup
+        self.source_hash = source_hash
+        self.logger = logging.getLogger(__name__)
+
+    def __len__(self):
+        return len(self.lookup)
+
+    @classmethod
+    def from_frame(cls, zone_df: pd.DataFrame, source_hash: Optional[str] = None) -> "ZoneIndex":
+        """
+        Build the index from zone master rows.
+
+        Args:
+            zone_df: Frame with CrossStreetName, Grid and PDZone columns
+            source_hash: Hash of the source workbook
+
+        Returns:
+            ZoneIndex (the first row wins when a key repeats)
+        """
+        rows = zone_df[["CrossStreetName", "Grid", "PDZone"]].drop_duplicates()
+        keys = rows["CrossStreetName"].map(normalize_zone_address)
+        lookup = {}
+        for key, grid, zone in zip(keys, rows["Grid"], rows["PDZone"]):
+            if not pd.isna(key) and key not in lookup:
+                lookup[key] = (grid, zone)
+        return cls(lookup, source_hash)
+
+    @classmethod
+    def load(
+        cls,
+        zone_master_path: Union[str, Path],
+        cache_dir: Union[str, Path, None] = ZONE_CACHE_DIR
+    ) -> "ZoneIndex":
+        """
+        Load the index for a zone master, rebuilding it if the workbook changed.
+
+        Args:
+            zone_master_path: Zone master Excel file
+            cache_dir: Directory for the persisted index (None disables caching)
+
+        Returns:
+            ZoneIndex for the current workbook contents
+        """
+        logger = logging.getLogger(__name__)
+        source_hash = compute_hash(str(zone_master_path))
+        cache_path = None
+        if cache_dir is not None:
+            cache_path = Path(cache_dir) / f"zone_index_{source_hash[:16]}.pkl"
+            if cache_path.exists():
+                try:
+                    with open(cache_path, "rb") as f:
+                        payload = pickle.load(f)
+                    if payload.get("source_hash") == source_hash:
+                        logger.debug(f"Loaded zone index from {cache_path}")
+                        return cls(payload["lookup"], source_hash)
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable zone index {cache_path}: {e}")
+
+        index = cls.from_frame(pd.read_excel(zone_master_path), source_hash)
+        logger.info(f"Built zone index with {len(index):,} keys from {Path(zone_master_path).name}")
+        if cache_path is not None:
+            index.save(cache_path)
+        return index
+
+    def save(self, cache_path: Union[str, Path]) -> Optional[Path]:
+        """
+        Persist the index.
+
+        Args:
+            cache_path: Output .pkl file
+
+        Returns:
+            Path written, or None if the cache could not be written
+        """
+        cache_path = Path(cache_path)
+        payload = {
+            "source_hash": self.source_hash,
+            "created": datetime.now().isoformat(),
+            "lookup": self.lookup
+        }
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(cache_path)
+        except OSError as e:
+            self.logger.warning(f"Could not write zone index {cache_path}: {e}")
+            return None
+        return cache_path
+
+    def lookup_zones(self, addresses: pd.Series) -> pd.DataFrame:
+        """
+        Look up Grid and PDZone for each address.
+
+        Args:
+            addresses: Raw address column (e.g. FullAddress2)
+
+        Returns:
+            DataFrame aligned to ``addresses`` with Grid and PDZone (NaN when unmatched)
+        """
+        codes, uniques = factorize_column(addresses)
+        grid = np.empty(len(uniques), dtype=object)
+        zone = np.empty(len(uniques), dtype=object)
+        for i, value in enumerate(uniques):
+            grid[i], zone[i] = self.lookup.get(normalize_zone_address(value), (np.nan, np.nan))
+        return pd.DataFrame(
+            {
+                "Grid": broadcast_unique(codes, grid),
+                "PDZone": broadcast_unique(codes, zone)
+            },
+            index=addresses.index
+        )
+
+    def backfill(self, df: pd.DataFrame, address_col: str = "FullAddress2") -> int:
+        """
+        Fill missing PDZone and Grid in place from the index.
+
+        Args:
+            df: CAD DataFrame (columns are added if absent)
+            address_col: Address column to look up
+
+        Returns:
+            Number of rows whose PDZone was filled
+        """
+        found = self.lookup_zones(df[address_col])
+        filled = 0
+        for field in ZONE_FIELDS:
+            values = found[field].infer_objects()
+            if field not in df.columns:
+                df[field] = values
+                if field == "PDZone":
+                    filled = int(values.notna().sum())
+                continue
+            current = df[field]
+            if isinstance(current.dtype, pd.CategoricalDtype):
+                current = current.astype(object)
+            missing = current.isna()
+            if field == "PDZone":
+                filled = int((missing & values.notna()).sum())
+            df[field] = current.fillna(values)
+        return filled
@@ -14,22 +14,66 @@ from pathlib import Path
 import json
 from typing import Dict, List, Tuple, Any
 import warnings
+import contextlib
+import io
+from concurrent.futures import ProcessPoolExecutor
 from multiprocessing import Pool, cpu_count
 from functools import partial
 import time
 
+from utils.column_profile import invalidate
+from utils.datetime_parser import cached_datetimes
+from utils.error_bitmap import ErrorBitmap, first_set_bits, pack_mask, popcount
+from utils.rule_flags import write_rule_flags
+from utils.shared_frame import (
+    read_shared_frame, release_shared_frames, shared_frame_dir,
+    shared_frames_available, write_shared_frame
+)
+from utils.time_fields import derive_time_fields, mismatched_rows
+from utils.validation_rules import RuleSet, load_rule_file, rule_timings
+
 warnings.filterwarnings('ignore')
 
 
 class CADValidatorParallel:
     """High-performance CAD validator using vectorized operations and parallel processing."""
     
-    def __init__(self, n_jobs: int = -1):
+    # Independent column validators: (method, args, columns read, columns written).
+    # validate_all runs them on a process pool and merges results in this order.
+    COLUMN_TASKS = [
+        ('validate_report_number_vectorized', (), ['ReportNumberNew'], ['ReportNumberNew']),
+        ('validate_incident_vectorized', (), ['Incident'], []),
+        ('validate_how_reported_vectorized', (), ['How Reported'], ['How Reported']),
+        ('validate_address_vectorized', (), ['FullAddress2'], []),
+        ('validate_zone_vectorized', (), ['PDZone'], ['PDZone']),
+        ('validate_datetime_vectorized', ('TimeOfCall', True), ['TimeOfCall'], ['TimeOfCall']),
+        ('validate_datetime_vectorized', ('Time Dispatched', False), ['Time Dispatched'], ['Time Dispatched']),
+        ('validate_datetime_vectorized', ('Time Out', False), ['Time Out'], ['Time Out']),
+        ('validate_datetime_vectorized', ('Time In', False), ['Time In'], ['Time In']),
+        # One task per derived field: the strftime passes dominate the run
+        ('validate_derived_fields_vectorized', (['cYear'],), ['TimeOfCall', 'cYear'], ['cYear']),
+        ('validate_derived_fields_vectorized', (['cMonth'],), ['TimeOfCall', 'cMonth'], ['cMonth']),
+        ('validate_derived_fields_vectorized', (['Hour'],), ['TimeOfCall', 'Hour'], ['Hour']),
+        ('validate_derived_fields_vectorized', (['DayofWeek'],), ['TimeOfCall', 'DayofWeek'], ['DayofWeek']),
+        ('validate_disposition_vectorized', (), ['Disposition'], ['Disposition']),
+    ]
+    
+    # Fields validate_derived_fields_vectorized recomputes from TimeOfCall
+    DERIVED_FIELDS = ('cYear', 'cMonth', 'Hour', 'DayofWeek')
+    
+    # Below this many rows process start-up costs more than the pool saves
+    MIN_PARALLEL_ROWS = 50_000
+    
+    def __init__(self, n_jobs: int = -1, rules_path: str = None, process_pool: bool = False):
         """
         Initialize validator.
         
         Args:
             n_jobs: Number of parallel jobs (-1 = all CPUs, -2 = all but one, or specific number)
+            rules_path: Declarative rule file (default: config/validation_rules.yml)
+            process_pool: Run the column validators on n_jobs worker processes
+                (opt-in: not yet shown to beat the serial run, see
+                PERFORMANCE_COMPARISON.md)
         """
         if n_jobs == -1:
             self.n_jobs = cpu_count()
@@ -38,17 +82,10 @@ class CADValidatorParallel:
         else:
             self.n_jobs = max(1, min(n_jobs, cpu_count()))
         
+        self.process_pool = process_pool
         print(f"Initialized validator with {self.n_jobs} parallel workers (CPU cores: {cpu_count()})")
         
-        self.errors = []
-        self.warnings = []
-        self.fixes = []
-        self.stats = {
-            'total_rows': 0,
-            'errors_by_field': {},
-            'fixes_by_field': {},
-            'rows_with_errors': set()
-        }
+        self._reset_results()
         
         # Valid domain values
         self.valid_how_reported = {
@@ -69,27 +106,66 @@ class CADValidatorParallel:
         
         # Regex patterns
         self.report_number_pattern = re.compile(r'^\d{2}-\d{6}([A-Z])?$')
+        
+        # Declarative rules (esri_export section) run after the field validators
+        try:
+            self.rule_set = RuleSet.from_spec(load_rule_file(rules_path, section='esri_export'))
+        except (FileNotFoundError, KeyError) as e:
+            print(f"[WARN] No declarative rules loaded: {e}")
+            self.rule_set = RuleSet([])
+    
+    def _reset_results(self):
+        """Start with empty errors, warnings, fixes and stats."""
+        self.errors = []
+        self.warnings = []
+        self.fixes = []
+        self.stats = {
+            'total_rows': 0,
+            'errors_by_field': {},
+            'fixes_by_field': {},
+            # Failing rows as packed per-field bitmaps; len() = rows with any error
+            'rows_with_errors': ErrorBitmap(),
+            # Failing rows per rule ("field: message"), for the per-row flag output
+            'rows_by_rule': ErrorBitmap()
+        }
     
     def log_errors_bulk(self, field: str, mask: pd.Series, df: pd.DataFrame, message: str):
         """Log errors in bulk using boolean mask."""
-        error_indices = mask[mask].index.tolist()
-        if len(error_indices) == 0:
+        if not mask.index.equals(df.index):
+            mask = mask.reindex(df.index, fill_value=False)
+        bits = pack_mask(mask)
+        error_count = popcount(bits)
+        if error_count == 0:
+            # The rule still gets its (empty) bit so flag queries know it
+            self.flag_rule_bulk(field, bits, df, message)
             return
         
         # Sample first 100 errors for detailed logging
-        for idx in error_indices[:100]:
+        positions = first_set_bits(bits, 100)
+        values = df[field].iloc[positions].tolist() if field in df.columns else ['N/A'] * len(positions)
+        for idx, value in zip(df.index[positions].tolist(), values):
             self.errors.append({
                 'row': idx,
                 'field': field,
                 'message': message,
-                'value': str(df.at[idx, field]) if field in df.columns else 'N/A'
+                'value': str(value)
             })
         
         # Update stats
-        self.stats['rows_with_errors'].update(error_indices)
+        self.stats['rows_with_errors'].bind(df.index).add(field, bits)
+        self.flag_rule_bulk(field, bits, df, message)
         if field not in self.stats['errors_by_field']:
             self.stats['errors_by_field'][field] = 0
-        self.stats['errors_by_field'][field] += len(error_indices)
+        self.stats['errors_by_field'][field] += error_count
+    
+    def flag_rule_bulk(self, field: str, mask, df: pd.DataFrame, message: str):
+        """
+        Record the rows failing a rule for the per-row flags (no error entries).
+
+        Called for every rule that is checked, failing rows or not, so each
+        checked rule has a bit.
+        """
+        self.stats['rows_by_rule'].bind(df.index).add(f"{field}: {message}", mask)
     
     def log_fixes_bulk(self, field: str, mask: pd.Series, reason: str, count: int = None):
         """Log fixes in bulk."""
@@ -113,17 +189,15 @@ class CADValidatorParallel:
         
         # Find nulls/blanks
         null_mask = df['ReportNumberNew'].isin(['', 'nan', 'None', '<NA>'])
-        if null_mask.any():
-            self.log_errors_bulk('ReportNumberNew', null_mask, df, 
-                                'Required field is null or blank')
+        self.log_errors_bulk('ReportNumberNew', null_mask, df,
+                             'Required field is null or blank')
         
         # Validate pattern using vectorized string operation
         valid_mask = df['ReportNumberNew'].str.match(self.report_number_pattern, na=False)
         invalid_mask = ~valid_mask & ~null_mask
         
-        if invalid_mask.any():
-            self.log_errors_bulk('ReportNumberNew', invalid_mask, df,
-                                'Does not match required pattern (##-######[A-Z]?)')
+        self.log_errors_bulk('ReportNumberNew', invalid_mask, df,
+                             'Does not match required pattern (##-######[A-Z]?)')
         
         elapsed = time.time() - start
         print(f"  [OK] Completed in {elapsed:.2f}s")
@@ -155,6 +229,7 @@ class CADValidatorParallel:
             if 'Incident' not in self.stats['errors_by_field']:
                 self.stats['errors_by_field']['Incident'] = 0
             self.stats['errors_by_field']['Incident'] += count
+        self.flag_rule_bulk('Incident', missing_separator, df, 'Missing " - " separator')
         
         elapsed = time.time() - start
         print(f"  [OK] Completed in {elapsed:.2f}s ({missing_separator.sum():,} records without separator)")
@@ -198,9 +273,10 @@ class CADValidatorParallel:
             if fixed_count > 0:
                 self.log_fixes_bulk('How Reported', None, 'Normalized to standard casing', fixed_count)
             
-            if invalid_mask_after.any():
-                self.log_errors_bulk('How Reported', invalid_mask_after, df,
-                                    'Invalid value (not in allowed list)')
+            invalid_mask = invalid_mask_after
+        
+        self.log_errors_bulk('How Reported', invalid_mask, df,
+                             'Invalid value (not in allowed list)')
         
         elapsed = time.time() - start
         print(f"  [OK] Completed in {elapsed:.2f}s")
@@ -228,6 +304,7 @@ class CADValidatorParallel:
             if 'FullAddress2' not in self.stats['errors_by_field']:
                 self.stats['errors_by_field']['FullAddress2'] = 0
             self.stats['errors_by_field']['FullAddress2'] += count
+        self.flag_rule_bulk('FullAddress2', null_mask, df, 'Address is null/blank')
         
         # Check for comma separator
         non_null = ~null_mask
@@ -260,9 +337,8 @@ class CADValidatorParallel:
         # Validate against domain
         invalid_mask = non_null & ~df['PDZone'].isin(self.valid_zones)
         
-        if invalid_mask.any():
-            self.log_errors_bulk('PDZone', invalid_mask, df,
-                                'Invalid zone (must be 5-9)')
+        self.log_errors_bulk('PDZone', invalid_mask, df,
+                             'Invalid zone (must be 5-9)')
         
         elapsed = time.time() - start
         print(f"  [OK] Completed in {elapsed:.2f}s")
@@ -280,9 +356,9 @@ class CADValidatorParallel:
                                   'message': 'Required column not found', 'value': 'N/A'})
             return df
         
-        # Convert to datetime
+        # Convert to datetime (dominant format detected once, parse shared per frame)
         if df[field_name].dtype != 'datetime64[ns]':
-            df[field_name] = pd.to_datetime(df[field_name], errors='coerce')
+            df[field_name] = cached_datetimes(df, field_name)
         
         # Check for nulls
         null_mask = df[field_name].isna()
@@ -297,22 +373,30 @@ class CADValidatorParallel:
             if field_name not in self.stats['errors_by_field']:
                 self.stats['errors_by_field'][field_name] = 0
             self.stats['errors_by_field'][field_name] += count
+        if required:
+            self.flag_rule_bulk(field_name, null_mask, df, 'Required datetime field is null/blank')
         
         # Check date range
         non_null = ~null_mask
-        if non_null.any():
-            out_of_range = non_null & ((df[field_name].dt.year < 1990) | (df[field_name].dt.year > 2030))
-            if out_of_range.any():
-                self.log_errors_bulk(field_name, out_of_range, df,
-                                    'Date out of reasonable range (1990-2030)')
+        out_of_range = non_null & ((df[field_name].dt.year < 1990) | (df[field_name].dt.year > 2030))
+        self.log_errors_bulk(field_name, out_of_range, df,
+                             'Date out of reasonable range (1990-2030)')
         
         elapsed = time.time() - start
         print(f"  [OK] Completed in {elapsed:.2f}s")
         return df
     
-    def validate_derived_fields_vectorized(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Validate fields derived from TimeOfCall using vectorized operations."""
-        print("Validating derived time fields (vectorized)...")
+    def validate_derived_fields_vectorized(self, df: pd.DataFrame, fields: List[str] = None) -> pd.DataFrame:
+        """
+        Validate fields derived from TimeOfCall using vectorized operations.
+        
+        Args:
+            df: DataFrame to validate
+            fields: Derived fields to check (default: all of DERIVED_FIELDS)
+        """
+        fields = self.DERIVED_FIELDS if fields is None else fields
+        label = "derived time fields" if fields == self.DERIVED_FIELDS else ", ".join(fields)
+        print(f"Validating {label} (vectorized)...")
         start = time.time()
         
         if 'TimeOfCall' not in df.columns:
@@ -321,61 +405,20 @@ class CADValidatorParallel:
         
         # Ensure TimeOfCall is datetime
         if df['TimeOfCall'].dtype != 'datetime64[ns]':
-            df['TimeOfCall'] = pd.to_datetime(df['TimeOfCall'], errors='coerce')
+            df['TimeOfCall'] = cached_datetimes(df, 'TimeOfCall')
         
-        valid_times = df['TimeOfCall'].notna()
+        # Expected values are computed once from the epoch and compared as category codes
+        derived = derive_time_fields(df['TimeOfCall'])
         
-        # Validate/fix cYear
-        if 'cYear' in df.columns:
-            expected = df.loc[valid_times, 'TimeOfCall'].dt.year.astype(str)
-            actual = df.loc[valid_times, 'cYear'].astype(str)
-            mismatch = expected != actual
-            
-            if mismatch.any():
-                count = mismatch.sum()
-                # Use direct indices to avoid any alignment issues
-                update_indices = mismatch[mismatch].index
-                df.loc[update_indices, 'cYear'] = expected[mismatch]
-                self.log_fixes_bulk('cYear', None, 'Derived from TimeOfCall', count)
-        
-        # Validate/fix cMonth
-        if 'cMonth' in df.columns:
-            expected = df.loc[valid_times, 'TimeOfCall'].dt.strftime('%B')
-            actual = df.loc[valid_times, 'cMonth'].astype(str)
-            mismatch = expected != actual
+        for field in fields:
+            if field not in df.columns:
+                continue
+            mismatch, expected = mismatched_rows(derived, field, df[field], strip=(field == 'Hour'))
             
             if mismatch.any():
-                count = mismatch.sum()
-                # Use direct indices to avoid any alignment issues
-                update_indices = mismatch[mismatch].index
-                df.loc[update_indices, 'cMonth'] = expected[mismatch]
-                self.log_fixes_bulk('cMonth', None, 'Derived from TimeOfCall', count)
-        
-        # Validate/fix Hour
-        if 'Hour' in df.columns:
-            expected = df.loc[valid_times, 'TimeOfCall'].dt.strftime('%H:%M')
-            actual = df.loc[valid_times, 'Hour'].astype(str).str.strip()
-            mismatch = expected != actual
-            
-            if mismatch.any():
-                count = mismatch.sum()
-                # Use direct indices to avoid any alignment issues
-                update_indices = mismatch[mismatch].index
-                df.loc[update_indices, 'Hour'] = expected[mismatch]
-                self.log_fixes_bulk('Hour', None, 'Derived from TimeOfCall', count)
-        
-        # Validate/fix DayofWeek
-        if 'DayofWeek' in df.columns:
-            expected = df.loc[valid_times, 'TimeOfCall'].dt.strftime('%A')
-            actual = df.loc[valid_times, 'DayofWeek'].astype(str)
-            mismatch = expected != actual
-            
-            if mismatch.any():
-                count = mismatch.sum()
-                # Use direct indices to avoid any alignment issues
-                update_indices = mismatch[mismatch].index
-                df.loc[update_indices, 'DayofWeek'] = expected[mismatch]
-                self.log_fixes_bulk('DayofWeek', None, 'Derived from TimeOfCall', count)
+                count = int(mismatch.sum())
+                df.loc[mismatch, field] = expected.to_numpy(dtype=object)[mismatch]
+                self.log_fixes_bulk(field, None, 'Derived from TimeOfCall', count)
         
         elapsed = time.time() - start
         print(f"  [OK] Completed in {elapsed:.2f}s")
@@ -417,16 +460,44 @@ class CADValidatorParallel:
             if fixed_count > 0:
                 self.log_fixes_bulk('Disposition', None, 'Normalized to standard casing', fixed_count)
             
-            if invalid_mask_after.any():
-                self.log_errors_bulk('Disposition', invalid_mask_after, df,
-                                    'Invalid value (not in allowed list)')
+            invalid_mask = invalid_mask_after
+        
+        self.log_errors_bulk('Disposition', invalid_mask, df,
+                             'Invalid value (not in allowed list)')
         
         elapsed = time.time() - start
         print(f"  [OK] Completed in {elapsed:.2f}s")
         return df
     
-    def validate_all(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Run all validation checks using optimized methods."""
+    def validate_declarative_rules(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Run the declarative esri_export rules, grouped by the columns they read."""
+        print(f"Validating {len(self.rule_set)} declarative rules (vectorized)...")
+        start = time.time()
+        
+        outcomes = self.rule_set.evaluate(df)
+        for rule_id, outcome in outcomes.items():
+            if outcome.error:
+                print(f"  [WARN] {rule_id} skipped: {outcome.error}")
+                continue
+            invalid_mask = ~outcome.valid
+            description = outcome.rule.spec.get('description', outcome.rule.name)
+            self.log_errors_bulk(outcome.rule.field, invalid_mask, df, f"{rule_id}: {description}")
+            print(f"  {rule_id:<10} {outcome.failed:>10,} failed  ({outcome.elapsed:.3f}s)")
+        self.stats['rule_timings'] = rule_timings(outcomes)
+        
+        elapsed = time.time() - start
+        print(f"  [OK] Completed in {elapsed:.2f}s")
+        return df
+    
+    def validate_all(self, df: pd.DataFrame, row_results_path: str = None) -> pd.DataFrame:
+        """
+        Run all validation checks using optimized methods.
+        
+        Args:
+            df: Export to validate (columns are fixed in place)
+            row_results_path: Also write per-row rule flags to this Parquet file
+                (see write_row_results)
+        """
         print(f"\n{'='*80}")
         print("CAD EXPORT VALIDATION - PARALLEL/VECTORIZED MODE")
         print(f"{'='*80}\n")
@@ -438,24 +509,17 @@ class CADValidatorParallel:
         
         overall_start = time.time()
         
-        # Run all validators (already vectorized)
-        df = self.validate_report_number_vectorized(df)
-        df = self.validate_incident_vectorized(df)
-        df = self.validate_how_reported_vectorized(df)
-        df = self.validate_address_vectorized(df)
-        df = self.validate_zone_vectorized(df)
-        
-        # Validate datetime fields
-        df = self.validate_datetime_vectorized(df, 'TimeOfCall', required=True)
-        df = self.validate_datetime_vectorized(df, 'Time Dispatched', required=False)
-        df = self.validate_datetime_vectorized(df, 'Time Out', required=False)
-        df = self.validate_datetime_vectorized(df, 'Time In', required=False)
-        
-        # Validate derived fields
-        df = self.validate_derived_fields_vectorized(df)
+        # Independent column validators (report number, incident, how reported,
+        # address, zone, datetimes, derived fields, disposition)
+        if self._use_process_pool(df):
+            df = self._validate_columns_parallel(df)
+        else:
+            df = self._validate_columns_serial(df)
+        # The column validators rewrote columns in place; cached datetimes are stale
+        invalidate(df)
         
-        # Validate other fields
-        df = self.validate_disposition_vectorized(df)
+        # Declarative rules from config/validation_rules.yml
+        df = self.validate_declarative_rules(df)
         
         overall_elapsed = time.time() - overall_start
         
@@ -464,8 +528,108 @@ class CADValidatorParallel:
         print(f"Average: {len(df) / overall_elapsed:,.0f} rows/second")
         print(f"{'='*80}\n")
         
+        if row_results_path is not None:
+            try:
+                path = self.write_row_results(df, row_results_path)
+                print(f"Per-row rule flags written to: {path}\n")
+            except ImportError as e:
+                print(f"[WARN] Per-row rule flags not written (pyarrow required): {e}\n")
+        
         return df
     
+    def write_row_results(self, df: pd.DataFrame, path: str) -> Path:
+        """
+        Write one rule bit-flag value per row, keyed by ReportNumberNew, to Parquet.
+        
+        Bit i is the i-th rule in stats['rows_by_rule']; the legend is stored
+        in the file. Query it with utils.rule_flags.RuleFlagTable, e.g.
+        ``RuleFlagTable.read(path).failing('PDZone', year=2023)``.
+        """
+        return write_rule_flags(path, df, self.stats['rows_by_rule'].bind(df.index))
+    
+    def _use_process_pool(self, df: pd.DataFrame) -> bool:
+        """Whether the column validators are worth running on worker processes."""
+        return (
+            self.process_pool and self.n_jobs > 1
+            and len(df) >= self.MIN_PARALLEL_ROWS and shared_frames_available()
+        )
+    
+    def _validate_columns_serial(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Run the column validators one after another on this process."""
+        for method, args, _, _ in self.COLUMN_TASKS:
+            df = getattr(self, method)(df, *args)
+        return df
+    
+    def _worker_state(self) -> Dict[str, Any]:
+        """Settings a worker needs to rebuild this validator (results and rules excluded)."""
+        skip = {'errors', 'warnings', 'fixes', 'stats', 'rule_set'}
+        return {key: value for key, value in self.__dict__.items() if key not in skip}
+    
+    def _validate_columns_parallel(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Run the column validators on a process pool.
+        
+        The columns they read are written once to an Arrow file in shared
+        memory; each worker maps it and reads only its own columns, then hands
+        back the columns it rewrote the same way. Results are merged in
+        COLUMN_TASKS order, so errors, fixes and stats match a serial run.
+        """
+        columns = [col for col in df.columns
+                   if any(col in read for _, _, read, _ in self.COLUMN_TASKS)]
+        directory = shared_frame_dir(prefix='cad_validate_')
+        try:
+            try:
+                handle = write_shared_frame(df, directory / 'input.arrow', columns=columns)
+            except Exception as e:
+                print(f"[WARN] Cannot share columns with worker processes ({e}); validating serially\n")
+                return self._validate_columns_serial(df)
+            
+            workers = min(self.n_jobs, len(self.COLUMN_TASKS))
+            print(f"Running {len(self.COLUMN_TASKS)} column validators on {workers} worker processes\n")
+            state = self._worker_state()
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = []
+                for i, (method, args, read, write) in enumerate(self.COLUMN_TASKS):
+                    read = [col for col in read if col in df.columns]
+                    if not read:
+                        # Nothing to ship; the validator only reports the missing column
+                        futures.append(None)
+                        continue
+                    write = [col for col in write if col in df.columns]
+                    futures.append(pool.submit(
+                        _run_column_task, state, handle, method, args, read, write,
+                        str(directory / f'task_{i:02d}.arrow')
+                    ))
+                
+                for (method, args, _, _), future in zip(self.COLUMN_TASKS, futures):
+                    if future is None:
+                        df = getattr(self, method)(df, *args)
+                    else:
+                        self._merge_task_result(df, future.result())
+        finally:
+            release_shared_frames(directory)
+        return df
+    
+    def _merge_task_result(self, df: pd.DataFrame, result: Dict[str, Any]):
+        """Fold one worker's output into this validator and write back its columns."""
+        print(result['output'], end='')
+        self.errors.extend(result['errors'])
+        self.warnings.extend(result['warnings'])
+        self.fixes.extend(result['fixes'])
+        for key in ('errors_by_field', 'fixes_by_field'):
+            totals = self.stats[key]
+            for field, count in result['stats'][key].items():
+                totals[field] = totals.get(field, 0) + count
+        self.stats['rows_with_errors'].bind(df.index).update(result['stats']['rows_with_errors'])
+        self.stats['rows_by_rule'].bind(df.index).update(result['stats']['rows_by_rule'])
+        
+        updated = result['columns']
+        if isinstance(updated, dict):
+            updated = read_shared_frame(updated)
+        if updated is not None:
+            for col in updated.columns:
+                df[col] = updated[col]
+    
     def generate_report(self) -> str:
         """Generate a validation summary report."""
         report = []
@@ -496,7 +660,22 @@ class CADValidatorParallel:
                                       key=lambda x: x[1], reverse=True):
                 report.append(f"  {field:30s} {count:>10,} errors")
             report.append("")
-        
+
+        # Distinct failing rows and overlaps, from the row bitmaps
+        row_bitmap = self.stats['rows_with_errors']
+        if row_bitmap.fields:
+            report.append("ROWS WITH ERRORS BY FIELD")
+            report.append("-" * 80)
+            for field in sorted(row_bitmap.fields, key=row_bitmap.count, reverse=True):
+                report.append(f"  {field:30s} {row_bitmap.count(field):>10,} rows")
+            overlaps = row_bitmap.overlaps(top=10)
+            if overlaps:
+                report.append("")
+                report.append("  Rows failing both fields:")
+                for field_a, field_b, rows in overlaps:
+                    report.append(f"  {field_a + ' & ' + field_b:40s} {rows:>10,} rows")
+            report.append("")
+
         # Fixes by field
         if self.stats['fixes_by_field']:
             report.append("FIXES APPLIED BY FIELD")
@@ -525,6 +704,41 @@ class CADValidatorParallel:
         return "\n".join(report)
 
 
+def _run_column_task(state: Dict[str, Any], handle: Dict[str, Any], method: str, args: tuple,
+                     read: List[str], write: List[str], output_path: str) -> Dict[str, Any]:
+    """
+    Process-pool entry point: run one column validator on shared columns.
+    
+    Returns the validator's errors, warnings, fixes, stats and printed output,
+    plus the columns it rewrote (an Arrow handle, or the frame itself when a
+    column cannot be stored in Arrow).
+    """
+    validator = CADValidatorParallel.__new__(CADValidatorParallel)
+    validator.__dict__.update(state)
+    validator._reset_results()
+    
+    df = read_shared_frame(handle, columns=read)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        df = getattr(validator, method)(df, *args)
+    
+    columns = None
+    if write:
+        try:
+            columns = write_shared_frame(df, output_path, columns=write)
+        except Exception:
+            columns = df[write]
+    
+    return {
+        'output': output.getvalue(),
+        'errors': validator.errors,
+        'warnings': validator.warnings,
+        'fixes': validator.fixes,
+        'stats': validator.stats,
+        'columns': columns
+    }
+
+
 def main():
     """Main execution function."""
     
@@ -536,6 +750,7 @@ def main():
     output_report = output_dir / "CAD_VALIDATION_SUMMARY.txt"
     output_errors = output_dir / "CAD_VALIDATION_ERRORS.csv"
     output_fixes = output_dir / "CAD_VALIDATION_FIXES.csv"
+    output_row_flags = output_dir / "CAD_VALIDATION_ROW_FLAGS.parquet"
     
     print(f"\n{'='*80}")
     print("CAD EXPORT VALIDATOR - HIGH PERFORMANCE MODE")
@@ -567,7 +782,7 @@ def main():
     
     # Run validation
     validation_start = time.time()
-    df_clean = validator.validate_all(df)
+    df_clean = validator.validate_all(df, row_results_path=output_row_flags)
     validation_time = time.time() - validation_start
     
     # Generate report
@@ -25,6 +25,9 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.logger import setup_logger, log_validation_result
 from utils.hash_utils import FileHashManager
+from utils.audit_store import read_audit_trail
+from utils.typed_reader import read_cad_file
+from utils.address_features import address_completeness
 
 
 class PipelineValidator:
@@ -123,11 +126,8 @@ class PipelineValidator:
         self.logger.info("-" * 80)
 
         try:
-            # Load input file
-            if self.input_file.suffix == '.xlsx':
-                self.input_df = pd.read_excel(self.input_file)
-            else:
-                self.input_df = pd.read_csv(self.input_file, encoding='utf-8-sig')
+            # Load input file (only the columns the checks use)
+            self.input_df = read_cad_file(self.input_file, stage="pipeline_validator_input", logger=self.logger)
 
             self.logger.info(f"Loaded input file: {len(self.input_df):,} records")
 
@@ -136,16 +136,13 @@ class PipelineValidator:
                 self.logger.error(f"Output file not found: {self.output_file}")
                 return False
 
-            if self.output_file.suffix == '.xlsx':
-                self.output_df = pd.read_excel(self.output_file)
-            else:
-                self.output_df = pd.read_csv(self.output_file, encoding='utf-8-sig')
+            self.output_df = read_cad_file(self.output_file, stage="pipeline_validator_output", logger=self.logger)
 
             self.logger.info(f"Loaded output file: {len(self.output_df):,} records")
 
             # Load audit file if exists
             if self.audit_file and self.audit_file.exists():
-                self.audit_df = pd.read_csv(self.audit_file, encoding='utf-8-sig')
+                self.audit_df = read_audit_trail(self.audit_file)
                 self.logger.info(f"Loaded audit file: {len(self.audit_df):,} entries")
 
             return True
@@ -251,7 +248,7 @@ class PipelineValidator:
 
         for pattern in merge_patterns:
             found_artifacts = 0
-            for col in self.output_df.select_dtypes(include=['object']).columns:
+            for col in self.output_df.select_dtypes(include=['object', 'category', 'string']).columns:
                 mask = self.output_df[col].astype(str).str.contains(pattern, case=False, na=False, regex=True)
                 found_artifacts += mask.sum()
 
@@ -572,40 +569,7 @@ class PipelineValidator:
             )
             return
 
-        import re
-        generic = {'UNKNOWN', 'NOT PROVIDED', 'N/A', 'NONE', '', 'TBD', 'TO BE DETERMINED'}
-        suffix_pattern = re.compile(
-            r'( STREET| AVENUE| ROAD| PLACE| DRIVE| COURT| BOULEVARD| LANE| WAY| HWY| HIGHWAY| ROUTE| AVE| ST| RD| BLVD| DR| CT| PL)'
-        )
-
-        def evaluate_address(value):
-            if pd.isna(value):
-                return False, ['missing_address']
-            text = str(value).upper().strip()
-            text = re.sub(r'\s+', ' ', text)
-            if text in generic:
-                return False, ['generic_placeholder']
-            issues = []
-            has_city_zip = text.endswith(', HACKENSACK, NJ, 07601')
-            if not has_city_zip:
-                issues.append('missing_city_state_zip')
-            is_intersection = ' & ' in text
-            if not is_intersection and not re.match(r'^\d+ ', text):
-                issues.append('missing_house_number')
-            if not suffix_pattern.search(text):
-                issues.append('missing_street_suffix')
-            if is_intersection and '&' not in text:
-                issues.append('invalid_intersection_format')
-            if issues:
-                return False, issues
-            return True, []
-
-        passes = []
-        for addr in self.output_df['FullAddress2']:
-            is_valid, _ = evaluate_address(addr)
-            passes.append(is_valid)
-
-        valid_series = pd.Series(passes, index=self.output_df.index)
+        valid_series = address_completeness(self.output_df['FullAddress2'])['valid']
         valid_count = valid_series.sum()
         invalid_count = (~valid_series).sum()
         pass_rate = valid_count / len(self.output_df) if len(self.output_df) > 0 else 0